@@ -16,10 +16,12 @@ from app.models.base import Base
 # Import all models to ensure they're registered
 from app.models import (  # noqa: F401
     Attachment,
+    AttachmentBlob,
     AuditLog,
     Department,
     District,
     Grievance,
+    GrievanceIdCounter,
     User,
     Verification,
 )
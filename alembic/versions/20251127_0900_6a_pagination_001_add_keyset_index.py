@@ -0,0 +1,40 @@
+"""Add keyset pagination index on grievances
+
+Revision ID: 6a_pagination_001
+Revises: 5a_verifier_001
+Create Date: 2025-11-27 09:00:00.000000
+
+Indexes Created:
+- idx_grievances_active_created_id: (created_at, id) on non-deleted rows,
+  backing cursor pagination in GET /api/v1/grievances
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '6a_pagination_001'
+down_revision = '5a_verifier_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_grievances_active_created_id',
+            'grievances',
+            ['created_at', 'id'],
+            postgresql_where=sa.text('deleted_at IS NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'idx_grievances_active_created_id',
+            table_name='grievances',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
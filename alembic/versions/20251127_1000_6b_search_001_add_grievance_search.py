@@ -0,0 +1,130 @@
+"""Add indexed full-text and trigram search on grievances
+
+Revision ID: 6b_search_001
+Revises: 6a_pagination_001
+Create Date: 2025-11-27 10:00:00.000000
+
+Changes:
+- pg_trgm extension
+- grievances.search_vector (tsvector) maintained by a BEFORE INSERT/UPDATE trigger
+- Batched backfill of search_vector for existing rows
+- GIN indexes: search_vector, subject trigram, grievance_text trigram
+
+Uses the 'simple' text search configuration: PostgreSQL ships no Telugu
+stemmer, and 'simple' keeps Telugu, Hindi and English tokens intact.
+Substring and partial-word matching is served by the trigram indexes.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+revision = '6b_search_001'
+down_revision = '6a_pagination_001'
+branch_labels = None
+depends_on = None
+
+# Rows updated per backfill transaction (keeps locks and WAL bursts short)
+BACKFILL_BATCH_SIZE = 5000
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.add_column('grievances', sa.Column('search_vector', TSVECTOR(), nullable=True))
+
+    op.execute("""
+    CREATE OR REPLACE FUNCTION grievances_search_vector_update()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('simple', coalesce(NEW.subject, '')), 'A') ||
+            setweight(to_tsvector('simple', coalesce(NEW.grievance_text, '')), 'B');
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute("""
+    CREATE TRIGGER grievances_search_vector_update
+    BEFORE INSERT OR UPDATE OF subject, grievance_text ON grievances
+    FOR EACH ROW EXECUTE FUNCTION grievances_search_vector_update();
+    """)
+
+    # Backfill existing rows in primary-key ranges, committing each batch.
+    # Each batch walks the id index from the previous batch's upper bound,
+    # so the whole backfill reads every row once. New and edited rows are
+    # already covered by the trigger created above.
+    with op.get_context().autocommit_block():
+        connection = op.get_bind()
+        lower = None
+        while True:
+            lower_bound = "id > :lower" if lower is not None else "TRUE"
+            bounds = {"lower": lower} if lower is not None else {}
+            upper = connection.execute(
+                sa.text(f"""
+                SELECT max(id) FROM (
+                    SELECT id FROM grievances
+                    WHERE {lower_bound}
+                    ORDER BY id
+                    LIMIT :batch_size
+                ) AS batch
+                """),
+                {**bounds, "batch_size": BACKFILL_BATCH_SIZE},
+            ).scalar()
+            if upper is None:
+                break
+
+            connection.execute(
+                sa.text(f"""
+                UPDATE grievances
+                SET search_vector =
+                    setweight(to_tsvector('simple', coalesce(subject, '')), 'A') ||
+                    setweight(to_tsvector('simple', coalesce(grievance_text, '')), 'B')
+                WHERE {lower_bound} AND id <= :upper
+                  AND search_vector IS NULL
+                """),
+                {**bounds, "upper": upper},
+            )
+            lower = upper
+
+        op.create_index(
+            'idx_grievances_search_vector',
+            'grievances',
+            ['search_vector'],
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'idx_grievances_subject_trgm',
+            'grievances',
+            ['subject'],
+            postgresql_using='gin',
+            postgresql_ops={'subject': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'idx_grievances_text_trgm',
+            'grievances',
+            ['grievance_text'],
+            postgresql_using='gin',
+            postgresql_ops={'grievance_text': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_grievances_text_trgm', table_name='grievances',
+                      postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_grievances_subject_trgm', table_name='grievances',
+                      postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_grievances_search_vector', table_name='grievances',
+                      postgresql_concurrently=True, if_exists=True)
+
+    op.execute("DROP TRIGGER IF EXISTS grievances_search_vector_update ON grievances")
+    op.execute("DROP FUNCTION IF EXISTS grievances_search_vector_update()")
+    op.drop_column('grievances', 'search_vector')
+    # pg_trgm is left installed; other objects may depend on it
@@ -0,0 +1,45 @@
+"""Add grievance ID counters for collision-free public IDs
+
+Revision ID: 6c_grievance_ids_001
+Revises: 6b_search_001
+Create Date: 2025-11-27 11:00:00.000000
+
+Tables Created:
+- grievance_id_counters: next free grievance number per (year, district),
+  advanced in blocks by app.services.grievance_id_generator
+
+Counters are seeded above the highest number already used by existing
+PGRS-YYYY-DD-NNNNN IDs, so new IDs never collide with legacy
+timestamp-derived ones.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '6c_grievance_ids_001'
+down_revision = '6b_search_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'grievance_id_counters',
+        sa.Column('year', sa.Integer(), primary_key=True),
+        sa.Column('district_code', sa.String(10), primary_key=True),
+        sa.Column('next_value', sa.BigInteger(), nullable=False),
+    )
+
+    op.execute(r"""
+    INSERT INTO grievance_id_counters (year, district_code, next_value)
+    SELECT
+        split_part(grievance_id, '-', 2)::int,
+        split_part(grievance_id, '-', 3),
+        max(split_part(grievance_id, '-', 4)::bigint) + 1
+    FROM grievances
+    WHERE grievance_id ~ '^PGRS-\d{4}-[^-]+-\d+$'
+    GROUP BY 1, 2
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('grievance_id_counters')
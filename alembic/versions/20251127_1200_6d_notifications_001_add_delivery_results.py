@@ -0,0 +1,47 @@
+"""Add delivery results to empowerment interactions
+
+Revision ID: 6d_notifications_001
+Revises: 6c_grievance_ids_001
+Create Date: 2025-11-27 12:00:00.000000
+
+Columns Added (empowerment_interactions):
+- channel: whatsapp or sms (the channel actually used)
+- delivery_status: sent or failed, as reported by the provider
+- message_sid: provider message ID
+- delivery_error: provider error for failed sends
+
+Indexes Created:
+- idx_interactions_phone_created: per-phone, per-day de-duplication in
+  app.services.notification_dispatcher
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '6d_notifications_001'
+down_revision = '6c_grievance_ids_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('empowerment_interactions', sa.Column('channel', sa.String(20), nullable=True))
+    op.add_column(
+        'empowerment_interactions', sa.Column('delivery_status', sa.String(20), nullable=True)
+    )
+    op.add_column(
+        'empowerment_interactions', sa.Column('message_sid', sa.String(64), nullable=True)
+    )
+    op.add_column('empowerment_interactions', sa.Column('delivery_error', sa.Text(), nullable=True))
+    op.create_index(
+        'idx_interactions_phone_created',
+        'empowerment_interactions',
+        ['citizen_phone', 'created_at'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_interactions_phone_created', table_name='empowerment_interactions')
+    op.drop_column('empowerment_interactions', 'delivery_error')
+    op.drop_column('empowerment_interactions', 'message_sid')
+    op.drop_column('empowerment_interactions', 'delivery_status')
+    op.drop_column('empowerment_interactions', 'channel')
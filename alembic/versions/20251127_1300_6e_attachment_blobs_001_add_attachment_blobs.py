@@ -0,0 +1,42 @@
+"""Add attachment blobs for content-addressed, de-duplicated uploads
+
+Revision ID: 6e_attachment_blobs_001
+Revises: 6d_notifications_001
+Create Date: 2025-11-27 13:00:00.000000
+
+Tables Created:
+- attachment_blobs: one row per stored file content (SHA-256), with the
+  number of attachments referencing it, maintained by
+  app.services.attachment_blobs
+
+Existing uploads keep their per-grievance paths (attachments.file_hash is
+NULL) until scripts/dedupe_uploads.py moves them into the blob layout.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '6e_attachment_blobs_001'
+down_revision = '6d_notifications_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'attachment_blobs',
+        sa.Column('file_hash', sa.String(64), primary_key=True),
+        sa.Column('file_path', sa.String(500), nullable=False),
+        sa.Column('file_size', sa.Integer(), nullable=False),
+        sa.Column('ref_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column(
+            'created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+        ),
+        sa.Column(
+            'updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+        ),
+        sa.CheckConstraint('ref_count >= 0', name='check_blob_ref_count_non_negative'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('attachment_blobs')
@@ -23,6 +23,10 @@ celery_app.conf.update(
     result_serializer="json",
     timezone="Asia/Kolkata",
     enable_utc=True,
+    # Same per-process connection cap as the API's shared Redis pools
+    broker_pool_limit=settings.REDIS_MAX_CONNECTIONS,
+    redis_max_connections=settings.REDIS_MAX_CONNECTIONS,
+    broker_transport_options={"max_connections": settings.REDIS_MAX_CONNECTIONS},
     # Beat schedule for proactive empowerment triggers
     beat_schedule={
         "check-proactive-triggers-hourly": {
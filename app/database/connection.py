@@ -1,10 +1,13 @@
 """PostgreSQL database connection service with async support."""
 
+import asyncio
+import logging
 import time
 from contextlib import asynccontextmanager
 from typing import Any, AsyncGenerator, Dict
 
 from sqlalchemy import text
+from sqlalchemy.exc import InterfaceError, OperationalError
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -16,19 +19,53 @@ from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.config import settings
 from app.models.base import Base
 
+logger = logging.getLogger(__name__)
+
+# Replica lag in seconds. An idle primary produces no WAL, so a replica that
+# has replayed everything it received is treated as fully caught up.
+_REPLICA_LAG_SQL = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+    """
+)
+
+# Upper bound on a single replica lag probe, so a hung replica cannot stall reads
+_REPLICA_CHECK_TIMEOUT_SECONDS = 2.0
+
 
 class PostgreSQLDatabaseService:
-    """PostgreSQL implementation of IDatabaseService with connection pooling."""
+    """PostgreSQL implementation of IDatabaseService with connection pooling.
+
+    Optionally holds a second engine for a streaming read replica. Read-only
+    callers use get_read_session(), which routes to the replica while it is
+    reachable and within DATABASE_REPLICA_MAX_LAG_SECONDS, and to the primary
+    otherwise.
+    """
 
-    def __init__(self, database_url: str) -> None:
+    def __init__(self, database_url: str, replica_url: str | None = None) -> None:
         """Initialize database service.
 
         Args:
             database_url: PostgreSQL connection string (must use asyncpg driver)
+            replica_url: Optional read replica connection string
         """
         self.database_url = database_url
+        self.replica_url = replica_url
         self.engine: AsyncEngine | None = None
         self.async_session_factory: async_sessionmaker[AsyncSession] | None = None
+        self.replica_engine: AsyncEngine | None = None
+        self.replica_session_factory: async_sessionmaker[AsyncSession] | None = None
+
+        # Replica routing state (refreshed at most every DATABASE_REPLICA_CHECK_INTERVAL)
+        self.replica_available = False
+        self.replica_lag_seconds: float | None = None
+        self.replica_last_error: str | None = None
+        self._replica_checked_at = 0.0
+        self._replica_check_lock = asyncio.Lock()
 
     async def connect(self) -> None:
         """Initialize connection pool with antifragile settings.
@@ -38,6 +75,9 @@ class PostgreSQLDatabaseService:
         - Pre-ping health checks
         - Automatic connection recycling
         - Graceful degradation on connection failures
+
+        When a replica URL is configured, a second pool is created for it.
+        Engines connect lazily, so an unreachable replica does not block startup.
         """
         self.engine = create_async_engine(
             self.database_url,
@@ -58,13 +98,37 @@ class PostgreSQLDatabaseService:
             autoflush=False,
         )
 
+        if self.replica_url:
+            self.replica_engine = create_async_engine(
+                self.replica_url,
+                echo=settings.DATABASE_ECHO,
+                poolclass=AsyncAdaptedQueuePool,
+                pool_size=settings.DATABASE_REPLICA_POOL_SIZE,
+                max_overflow=settings.DATABASE_REPLICA_MAX_OVERFLOW,
+                pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+                pool_recycle=settings.DATABASE_POOL_RECYCLE,
+                pool_pre_ping=True,
+            )
+            self.replica_session_factory = async_sessionmaker(
+                self.replica_engine,
+                class_=AsyncSession,
+                expire_on_commit=False,
+                autocommit=False,
+                autoflush=False,
+            )
+
         # Create tables only in development (in production, use Alembic migrations)
         if settings.ENVIRONMENT == "development":
             async with self.engine.begin() as conn:
                 await conn.run_sync(Base.metadata.create_all)
 
     async def disconnect(self) -> None:
-        """Close all connections gracefully and dispose of engine."""
+        """Close all connections gracefully and dispose of engines."""
+        if self.replica_engine is not None:
+            await self.replica_engine.dispose()
+            self.replica_engine = None
+            self.replica_session_factory = None
+            self.replica_available = False
         if self.engine is not None:
             await self.engine.dispose()
             self.engine = None
@@ -98,6 +162,110 @@ class PostgreSQLDatabaseService:
             finally:
                 await session.close()
 
+    @asynccontextmanager
+    async def get_read_session(self) -> AsyncGenerator[AsyncSession, None]:
+        """Get a session for read-only work, preferring the replica.
+
+        Falls back to the primary when no replica is configured, when the
+        last probe could not reach it, or when its replay lag exceeds
+        DATABASE_REPLICA_MAX_LAG_SECONDS. Nothing is committed; callers
+        must not write through this session.
+
+        Yields:
+            AsyncSession bound to the replica or the primary
+
+        Raises:
+            RuntimeError: If database not connected (call connect() first)
+        """
+        if self.async_session_factory is None:
+            raise RuntimeError("Database not connected. Call connect() first.")
+
+        use_replica = await self._should_use_replica()
+        factory = self.replica_session_factory if use_replica else self.async_session_factory
+        assert factory is not None
+
+        async with factory() as session:
+            try:
+                yield session
+            except (OperationalError, InterfaceError, OSError) as e:
+                if use_replica:
+                    # Stop routing to the replica until the next probe succeeds
+                    self._mark_replica_unavailable(str(e))
+                raise
+            finally:
+                await session.close()
+
+    async def _should_use_replica(self) -> bool:
+        """Decide whether reads go to the replica, re-probing when stale."""
+        if self.replica_session_factory is None:
+            return False
+
+        if time.monotonic() - self._replica_checked_at >= settings.DATABASE_REPLICA_CHECK_INTERVAL:
+            async with self._replica_check_lock:
+                # Another task may have probed while we waited for the lock
+                if time.monotonic() - self._replica_checked_at >= settings.DATABASE_REPLICA_CHECK_INTERVAL:
+                    await self._check_replica()
+
+        return self.replica_available
+
+    async def _check_replica(self) -> None:
+        """Probe the replica's reachability and replay lag."""
+        assert self.replica_session_factory is not None
+        self._replica_checked_at = time.monotonic()
+        try:
+            async with self.replica_session_factory() as session:
+                result = await asyncio.wait_for(
+                    session.execute(_REPLICA_LAG_SQL),
+                    timeout=_REPLICA_CHECK_TIMEOUT_SECONDS,
+                )
+                lag = float(result.scalar() or 0)
+        except Exception as e:
+            self._mark_replica_unavailable(str(e))
+            return
+
+        self.replica_lag_seconds = round(lag, 3)
+        self.replica_last_error = None
+        available = lag <= settings.DATABASE_REPLICA_MAX_LAG_SECONDS
+        if available != self.replica_available:
+            if available:
+                logger.info(f"Read replica in use (lag {lag:.1f}s)")
+            else:
+                logger.warning(
+                    f"Read replica lag {lag:.1f}s exceeds "
+                    f"{settings.DATABASE_REPLICA_MAX_LAG_SECONDS}s; reading from primary"
+                )
+        self.replica_available = available
+
+    def _mark_replica_unavailable(self, error: str) -> None:
+        """Route reads to the primary until the next successful probe."""
+        if self.replica_available or self.replica_last_error is None:
+            logger.warning(f"Read replica unavailable, reading from primary: {error}")
+        self.replica_available = False
+        self.replica_last_error = error
+        self._replica_checked_at = time.monotonic()
+
+    def replica_status(self) -> Dict[str, Any]:
+        """Get replica routing status for health reporting.
+
+        Returns:
+            Dictionary with configured/in-use flags, last measured lag,
+            last error and replica pool usage
+        """
+        if self.replica_engine is None:
+            return {"configured": False}
+
+        pool: Any = self.replica_engine.pool
+        return {
+            "configured": True,
+            "in_use": self.replica_available,
+            "lag_seconds": self.replica_lag_seconds,
+            "max_lag_seconds": settings.DATABASE_REPLICA_MAX_LAG_SECONDS,
+            "last_error": self.replica_last_error,
+            "connection_pool_size": pool.size() if hasattr(pool, "size") else 0,
+            "connections_in_use": pool.checkedout() if hasattr(pool, "checkedout") else 0,
+            "database_url": self._mask_db_url(self.replica_url or ""),
+        }
+
     async def health_check(self) -> Dict[str, Any]:
         """Check database health and measure latency.
 
@@ -132,6 +300,7 @@ class PostgreSQLDatabaseService:
                 "connection_pool_size": pool_size,
                 "connections_in_use": pool_checked_out,
                 "database_url": self._mask_db_url(self.database_url),
+                "replica": self.replica_status(),
             }
 
         except Exception as e:
@@ -167,7 +336,10 @@ async def init_db() -> None:
     Should be called from FastAPI lifespan context.
     """
     global _db_service
-    _db_service = PostgreSQLDatabaseService(settings.DATABASE_URL)
+    _db_service = PostgreSQLDatabaseService(
+        settings.DATABASE_URL,
+        replica_url=settings.DATABASE_REPLICA_URL,
+    )
     await _db_service.connect()
 
 
@@ -208,6 +380,31 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+async def get_read_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """FastAPI dependency for read-only database sessions.
+
+    Routes to the read replica when one is configured, reachable and not
+    lagging beyond DATABASE_REPLICA_MAX_LAG_SECONDS; otherwise uses the
+    primary. Only use this for endpoints that never write.
+
+    Yields:
+        AsyncSession instance
+
+    Raises:
+        RuntimeError: If database not initialized
+
+    Usage:
+        @router.get("/dashboard")
+        async def dashboard(db: AsyncSession = Depends(get_read_db_session)):
+            ...
+    """
+    if _db_service is None:
+        raise RuntimeError("Database not initialized. Call init_db() at startup.")
+
+    async with _db_service.get_read_session() as session:
+        yield session
+
+
 def get_db_service() -> PostgreSQLDatabaseService | None:
     """Get the current database service instance.
 
@@ -0,0 +1,133 @@
+"""Keyset (cursor) pagination helpers.
+
+Offset pagination degrades linearly with page depth because PostgreSQL has
+to walk and discard every skipped row. Keyset pagination instead remembers
+the sort key of the last row returned and asks for rows strictly "after" it,
+which is an index range scan regardless of how deep the client has paged.
+
+Cursors are opaque to clients: a URL-safe base64 encoding of the sort key
+(`created_at`, `id`), prefixed by the relevance score for ranked (search)
+listings. Clients must treat them as tokens and never build them.
+
+See PAGINATION_GUIDE.md for when to use which strategy.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, NamedTuple, Optional
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+from sqlalchemy.sql.selectable import Select
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+    pass
+
+
+class CursorPosition(NamedTuple):
+    """Keyset position of the last row on a page."""
+
+    created_at: datetime
+    record_id: UUID
+    rank: Optional[float] = None
+
+
+def encode_cursor(
+    created_at: datetime,
+    record_id: UUID,
+    rank: Optional[float] = None,
+) -> str:
+    """Encode a (created_at, id) keyset position as an opaque cursor.
+
+    Args:
+        created_at: Sort timestamp of the last row on the page
+        record_id: Primary key of the last row (tie-breaker)
+        rank: Relevance score of the last row, for ranked listings
+
+    Returns:
+        URL-safe cursor string without padding
+    """
+    position: dict[str, Any] = {"c": created_at.isoformat(), "i": str(record_id)}
+    if rank is not None:
+        position["r"] = rank
+    payload = json.dumps(position, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> CursorPosition:
+    """Decode an opaque cursor back into its keyset position.
+
+    Args:
+        cursor: Cursor previously returned by encode_cursor
+
+    Returns:
+        CursorPosition (rank is None for unranked cursors)
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or tampered with
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+        created_at = datetime.fromisoformat(payload["c"])
+        record_id = UUID(payload["i"])
+        rank = float(payload["r"]) if "r" in payload else None
+    except (ValueError, KeyError, TypeError) as e:
+        raise InvalidCursorError(f"Invalid pagination cursor: {cursor!r}") from e
+    return CursorPosition(created_at, record_id, rank)
+
+
+class _ExplainJSON(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) wrapper that keeps the statement's bind params."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Select[Any]) -> None:
+        self.statement = statement
+
+
+@compiles(_ExplainJSON, "postgresql")
+def _compile_explain_json(element: _ExplainJSON, compiler: Any, **kw: Any) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+async def count_exact(session: AsyncSession, stmt: Select[Any]) -> int:
+    """Count rows matched by a SELECT (full scan of the filtered set).
+
+    Args:
+        session: Database session
+        stmt: Filtered SELECT without ORDER BY / LIMIT
+
+    Returns:
+        Exact row count
+    """
+    result = await session.execute(select(func.count()).select_from(stmt.subquery()))
+    return int(result.scalar() or 0)
+
+
+async def count_estimated(session: AsyncSession, stmt: Select[Any]) -> int:
+    """Estimate rows matched by a SELECT from the planner's row estimate.
+
+    Runs EXPLAIN only (the query is not executed), so cost is constant
+    regardless of table size. Accuracy depends on table statistics being
+    reasonably fresh (autovacuum ANALYZE).
+
+    Args:
+        session: Database session
+        stmt: Filtered SELECT without ORDER BY / LIMIT
+
+    Returns:
+        Planner's estimated row count
+    """
+    result = await session.execute(_ExplainJSON(stmt))
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
@@ -21,7 +21,10 @@ async def init_database() -> None:
             await init_database()
     """
     global _db_service
-    _db_service = PostgreSQLDatabaseService(settings.DATABASE_URL)
+    _db_service = PostgreSQLDatabaseService(
+        settings.DATABASE_URL,
+        replica_url=settings.DATABASE_REPLICA_URL,
+    )
     await _db_service.connect()
 
 
@@ -5,6 +5,9 @@ Provides dependency injection functions for:
 - Getting the current authenticated user
 - Role-based access control
 - Token blacklist checking for logout support
+
+Resolved users are served from the per-process principal cache
+(app.services.principal_cache) when fresh, skipping the user query.
 """
 
 from typing import Awaitable, Callable, List, Optional
@@ -19,6 +22,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.config import settings
 from app.database.connection import get_db_session
 from app.models.user import User
+from app.services.principal_cache import get_principal_cache
 from app.services.token_blacklist import is_token_blacklisted
 from app.utils.jwt import TokenData, decode_token
 
@@ -45,7 +49,7 @@ async def get_current_user(
     1. Extracts the JWT token from the Authorization header
     2. Validates and decodes the token
     3. Checks if token is blacklisted (logout check)
-    4. Retrieves the user from the database
+    4. Retrieves the user from the principal cache or the database
     5. Validates the user is active and not deleted
 
     Args:
@@ -93,15 +97,21 @@ async def get_current_user(
     except ValueError:
         raise credentials_exception
 
-    stmt = select(User).where(
-        User.id == user_id,
-        User.deleted_at.is_(None),  # Not soft-deleted
-    )
-    result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
+    principal_cache = get_principal_cache()
+    user = principal_cache.get(user_id)
 
     if user is None:
-        raise credentials_exception
+        stmt = select(User).where(
+            User.id == user_id,
+            User.deleted_at.is_(None),  # Not soft-deleted
+        )
+        result = await db.execute(stmt)
+        user = result.scalar_one_or_none()
+
+        if user is None:
+            raise credentials_exception
+
+        principal_cache.put(user)
 
     # Check if user is active
     if not user.is_active:
@@ -177,13 +187,23 @@ async def get_optional_user(
     if await is_token_blacklisted(token):
         return None
 
-    stmt = select(User).where(
-        User.id == user_id,
-        User.deleted_at.is_(None),
-        User.is_active.is_(True),
-    )
-    result = await db.execute(stmt)
-    return result.scalar_one_or_none()
+    principal_cache = get_principal_cache()
+    user = principal_cache.get(user_id)
+
+    if user is None:
+        stmt = select(User).where(
+            User.id == user_id,
+            User.deleted_at.is_(None),
+        )
+        result = await db.execute(stmt)
+        user = result.scalar_one_or_none()
+
+        if user is None:
+            return None
+
+        principal_cache.put(user)
+
+    return user if user.is_active else None
 
 
 def require_role(allowed_roles: List[str]) -> Callable[[User], Awaitable[User]]:
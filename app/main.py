@@ -5,12 +5,10 @@ Build: 2024-11-27-refresh
 """
 
 import logging
-from collections.abc import Awaitable, Callable
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
-from uuid import uuid4
+from typing import AsyncGenerator, Awaitable, Callable, List, Tuple
 
-from fastapi import FastAPI, Request, Response
+from fastapi import FastAPI
 
 from app.config import settings
 from app.database.connection import close_db, init_db
@@ -18,6 +16,16 @@ from app.middleware.cors import configure_cors
 from app.middleware.deprecation import configure_deprecation_middleware
 from app.middleware.error_handler import configure_error_handlers
 from app.middleware.rate_limit import configure_rate_limiting
+from app.middleware.request_id import configure_request_id
+from app.services.classification_pipeline import get_classification_pipeline
+from app.services.local_nlp_service import get_local_nlp_service
+from app.services.nlp_service import get_nlp_service
+from app.services.principal_cache import get_principal_cache
+from app.services.sms_service import get_sms_service
+from app.services.whatsapp_service import get_whatsapp_service
+from app.services.redis_manager import get_redis_manager
+from app.services.storage_service import get_storage_service
+from app.utils.password import get_password_hash_pool
 
 # Configure logging
 logging.basicConfig(
@@ -45,15 +53,55 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except Exception as e:
         logger.warning(f"Database initialization failed (will retry on first request): {e}")
 
+    # Shared Redis pools for the limiter, blacklist, OTP and caches
+    await get_redis_manager().start()
+
+    if settings.NLP_ENABLED and settings.NLP_LOCAL_MODE in ("primary", "fallback"):
+        # Load the local classifier now rather than on the first outage
+        await get_local_nlp_service().start()
+
+    if settings.NLP_CLASSIFICATION_MODE == "async":
+        pipeline = get_classification_pipeline()
+        await pipeline.start()
+        # Re-queue grievances whose jobs were lost in the last shutdown or crash
+        try:
+            await pipeline.recover()
+        except Exception as e:
+            logger.warning(f"Classification recovery sweep failed at startup: {e}")
+
+    # Apply user invalidations broadcast by other workers
+    await get_principal_cache().start()
+
     yield
 
     # Shutdown
     logger.info("Shutting down...")
-    try:
-        await close_db()
-        logger.info("Database connection closed")
-    except Exception as e:
-        logger.warning(f"Error closing database: {e}")
+    await _shutdown()
+
+
+async def _shutdown() -> None:
+    """Stop background work and release connections.
+
+    Each step runs on its own, so one failing close() still lets the
+    database, hashing pool and Redis pools be released.
+    """
+    steps: List[Tuple[str, Callable[[], Awaitable[None]]]] = [
+        ("classification pipeline", lambda: get_classification_pipeline().stop()),
+        ("principal cache", lambda: get_principal_cache().stop()),
+        ("NLP service", lambda: get_nlp_service().close()),  # flushes pending batches
+        ("SMS service", lambda: get_sms_service().close()),
+        ("WhatsApp service", lambda: get_whatsapp_service().close()),
+        ("storage service", lambda: get_storage_service().close()),
+        ("database", close_db),
+        ("password hashing pool", lambda: get_password_hash_pool().close()),
+        ("Redis pools", lambda: get_redis_manager().close()),
+    ]
+    for name, step in steps:
+        try:
+            await step()
+        except Exception as e:
+            logger.warning(f"Error closing {name}: {e}")
+    logger.info("Shutdown complete")
 
 
 # Create FastAPI app
@@ -70,17 +118,7 @@ app = FastAPI(
 
 
 # Request ID middleware (must be first)
-@app.middleware("http")
-async def add_request_id(request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
-    """Add unique request ID to each request."""
-    request_id = request.headers.get("X-Request-ID", str(uuid4()))
-    request.state.request_id = request_id
-
-    response = await call_next(request)
-    response.headers["X-Request-ID"] = request_id
-
-    return response
-
+configure_request_id(app)
 
 # Configure middleware (order matters!)
 # 1. CORS (must be early to handle preflight)
@@ -5,16 +5,21 @@ This module contains FastAPI middleware for:
 - Rate Limiting: Request rate limiting with Redis
 - Error Handling: Global exception handling
 - Deprecation: API versioning and deprecation headers
+- Request ID: Per-request ID header and request.state.request_id
+
+All request/response middleware is pure ASGI (no BaseHTTPMiddleware).
 """
 
 from app.middleware.cors import configure_cors
 from app.middleware.error_handler import configure_error_handlers
 from app.middleware.rate_limit import RateLimitMiddleware
 from app.middleware.deprecation import DeprecationMiddleware
+from app.middleware.request_id import RequestIDMiddleware
 
 __all__ = [
     "configure_cors",
     "configure_error_handlers",
     "RateLimitMiddleware",
     "DeprecationMiddleware",
+    "RequestIDMiddleware",
 ]
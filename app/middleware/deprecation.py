@@ -6,11 +6,12 @@ Adds Deprecation, Sunset, and Link headers for deprecated endpoints.
 
 import logging
 from datetime import datetime, timezone
-from typing import Awaitable, Callable, Dict, Optional, Tuple
+from typing import Dict, Optional, Tuple
 
-from fastapi import FastAPI, Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import FastAPI
+from starlette.datastructures import MutableHeaders
 from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
@@ -32,36 +33,57 @@ SUNSET_ENDPOINTS: Dict[str, str] = {
 }
 
 
-class DeprecationMiddleware(BaseHTTPMiddleware):
+def _deprecation_headers(endpoint_key: str) -> Dict[str, str]:
+    """Build deprecation headers for an endpoint (empty if not deprecated)."""
+    if endpoint_key not in DEPRECATED_ENDPOINTS:
+        return {}
+
+    sunset_date, replacement, message = DEPRECATED_ENDPOINTS[endpoint_key]
+
+    # Add Deprecation and Warning headers
+    headers = {
+        "Deprecation": "true",
+        "Warning": f'299 - "{message}"',
+    }
+
+    # Add Sunset header if date is set
+    if sunset_date:
+        headers["Sunset"] = sunset_date.strftime("%a, %d %b %Y %H:%M:%S GMT")
+
+    # Add Link header to replacement
+    if replacement:
+        headers["Link"] = f'<{replacement}>; rel="successor-version"'
+
+    logger.info(f"Deprecated endpoint accessed: {endpoint_key}")
+    return headers
+
+
+class DeprecationMiddleware:
     """Middleware for API versioning and deprecation.
 
     Adds deprecation headers to deprecated endpoints.
     Returns 410 Gone for sunset endpoints.
+
+    Pure ASGI: headers are added to the response start message as it
+    passes through, so streaming responses are not buffered.
     """
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
-        """Process request with deprecation handling.
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-        Args:
-            request: Incoming request
-            call_next: Next middleware/handler
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process request with deprecation handling."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        Returns:
-            Response with deprecation headers
-        """
-        method = request.method
-        path = request.url.path
-        endpoint_key = f"{method}:{path}"
+        endpoint_key = f"{scope['method']}:{scope['path']}"
 
         # Check for sunset (removed) endpoints
         if endpoint_key in SUNSET_ENDPOINTS:
             message = SUNSET_ENDPOINTS[endpoint_key]
             logger.warning(f"Request to sunset endpoint: {endpoint_key}")
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=410,
                 content={
                     "error": "Gone",
@@ -69,35 +91,20 @@ class DeprecationMiddleware(BaseHTTPMiddleware):
                     "status_code": 410,
                 },
             )
+            await response(scope, receive, send)
+            return
 
-        # Process request
-        response = await call_next(request)
-
-        # Check for deprecated endpoints
-        if endpoint_key in DEPRECATED_ENDPOINTS:
-            sunset_date, replacement, message = DEPRECATED_ENDPOINTS[endpoint_key]
-
-            # Add Deprecation header
-            response.headers["Deprecation"] = "true"
-
-            # Add Warning header
-            response.headers["Warning"] = f'299 - "{message}"'
-
-            # Add Sunset header if date is set
-            if sunset_date:
-                sunset_str = sunset_date.strftime("%a, %d %b %Y %H:%M:%S GMT")
-                response.headers["Sunset"] = sunset_str
-
-            # Add Link header to replacement
-            if replacement:
-                response.headers["Link"] = f'<{replacement}>; rel="successor-version"'
-
-            logger.info(f"Deprecated endpoint accessed: {endpoint_key}")
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                for name, value in _deprecation_headers(endpoint_key).items():
+                    headers[name] = value
 
-        # Always add API version header
-        response.headers["X-API-Version"] = "v1"
+                # Always add API version header
+                headers["X-API-Version"] = "v1"
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_with_headers)
 
 
 def configure_deprecation_middleware(app: FastAPI) -> None:
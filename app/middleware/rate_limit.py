@@ -5,14 +5,16 @@ Uses Redis-based rate limiter with in-memory fallback.
 """
 
 import logging
-from typing import Awaitable, Callable, Dict, Optional, Tuple
+import re
+from typing import Dict, Optional, Pattern, Tuple
 
-from fastapi import FastAPI, Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import FastAPI, Request
+from starlette.datastructures import MutableHeaders
 from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.config import settings
-from app.services.rate_limiter import get_rate_limiter, RateLimitResult
+from app.services.rate_limiter import get_rate_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +23,7 @@ logger = logging.getLogger(__name__)
 ENDPOINT_RATE_LIMITS: Dict[str, Tuple[int, int]] = {
     # (limit, window_seconds)
     "POST:/api/v1/grievances": (settings.RATE_LIMIT_GRIEVANCE_SUBMIT, 3600),  # 10/hour
+    "POST:/api/v1/grievances/ingest": (settings.RATE_LIMIT_DEFAULT_REQUESTS, settings.RATE_LIMIT_DEFAULT_WINDOW),
     "POST:/api/v1/grievances/public/": (settings.RATE_LIMIT_OTP_REQUEST, 300),  # 3/5min
     "POST:/api/v1/auth/login": (10, 300),  # 10/5min per IP
 }
@@ -52,80 +55,107 @@ def get_rate_limit_key(request: Request) -> str:
 
     # Include method and path
     method = request.method
-    path = request.url.path
+    path = request.scope["path"]
 
     return f"{method}:{path}:{identifier}"
 
 
-def get_endpoint_limits(request: Request) -> Tuple[int, int]:
+class EndpointLimits:
+    """Precompiled "METHOD:PATH" -> (limit, window_seconds) lookup.
+
+    Exact keys are a dict hit. Every key also acts as a prefix; all of them
+    are compiled into one regex alternation, longest first, so a lookup is
+    a single match returning the most specific prefix.
+    """
+
+    def __init__(
+        self,
+        limits: Dict[str, Tuple[int, int]],
+        default: Tuple[int, int],
+    ) -> None:
+        self._exact = dict(limits)
+        self._default = default
+        prefixes = sorted(limits, key=len, reverse=True)
+        self._prefix_re: Optional[Pattern[str]] = (
+            re.compile("|".join(re.escape(prefix) for prefix in prefixes))
+            if prefixes else None
+        )
+
+    def lookup(self, method: str, path: str) -> Tuple[int, int]:
+        """Return (limit, window_seconds) for an endpoint."""
+        key = f"{method}:{path}"
+        limits = self._exact.get(key)
+        if limits is not None:
+            return limits
+
+        if self._prefix_re is not None:
+            match = self._prefix_re.match(key)
+            if match:
+                return self._exact[match.group()]
+
+        return self._default
+
+
+_endpoint_limits = EndpointLimits(
+    ENDPOINT_RATE_LIMITS,
+    (settings.RATE_LIMIT_DEFAULT_REQUESTS, settings.RATE_LIMIT_DEFAULT_WINDOW),
+)
+
+
+def get_endpoint_limits(method: str, path: str) -> Tuple[int, int]:
     """Get rate limits for endpoint.
 
     Args:
-        request: FastAPI request
+        method: HTTP method
+        path: URL path
 
     Returns:
         Tuple of (limit, window_seconds)
     """
-    method = request.method
-    path = request.url.path
+    return _endpoint_limits.lookup(method, path)
 
-    # Check for exact match first
-    key = f"{method}:{path}"
-    if key in ENDPOINT_RATE_LIMITS:
-        return ENDPOINT_RATE_LIMITS[key]
 
-    # Check for prefix matches
-    for endpoint_key, limits in ENDPOINT_RATE_LIMITS.items():
-        if key.startswith(endpoint_key):
-            return limits
+# Paths never rate limited
+EXEMPT_PATHS = frozenset({"/health", "/health/database", "/"})
 
-    # Default limits
-    return (settings.RATE_LIMIT_DEFAULT_REQUESTS, settings.RATE_LIMIT_DEFAULT_WINDOW)
 
-
-class RateLimitMiddleware(BaseHTTPMiddleware):
+class RateLimitMiddleware:
     """Rate limiting middleware.
 
     Checks rate limits before processing requests.
     Adds X-RateLimit-* headers to all responses.
+
+    Pure ASGI: the downstream app runs in the caller's task and its
+    messages pass straight through, so streaming responses are not buffered.
     """
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
-        """Process request with rate limiting.
-
-        Args:
-            request: Incoming request
-            call_next: Next middleware/handler
-
-        Returns:
-            Response with rate limit headers
-        """
-        # Skip rate limiting if disabled
-        if not settings.RATE_LIMIT_ENABLED:
-            response = await call_next(request)
-            return response
-
-        # Skip rate limiting for health checks
-        if request.url.path in ["/health", "/health/database", "/"]:
-            response = await call_next(request)
-            return response
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process request with rate limiting."""
+        # Skip rate limiting if disabled, and for health checks
+        if (
+            scope["type"] != "http"
+            or not settings.RATE_LIMIT_ENABLED
+            or scope["path"] in EXEMPT_PATHS
+        ):
+            await self.app(scope, receive, send)
+            return
 
         # Get rate limit key and limits
-        key = get_rate_limit_key(request)
-        limit, window = get_endpoint_limits(request)
+        key = get_rate_limit_key(Request(scope))
+        limit, window = get_endpoint_limits(scope["method"], scope["path"])
 
         # Check rate limit
         rate_limiter = get_rate_limiter()
         result = await rate_limiter.check_rate_limit(key, limit, window)
+        headers = result.to_headers()
 
         if not result.allowed:
             # Rate limit exceeded
             logger.warning(f"Rate limit exceeded for key: {key}")
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=429,
                 content={
                     "error": "Too Many Requests",
@@ -133,17 +163,20 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                     "status_code": 429,
                     "retry_after": result.retry_after,
                 },
-                headers=result.to_headers(),
+                headers=headers,
             )
-
-        # Process request
-        response = await call_next(request)
-
-        # Add rate limit headers to response
-        for header_name, header_value in result.to_headers().items():
-            response.headers[header_name] = header_value
-
-        return response
+            await response(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            # Add rate limit headers to response
+            if message["type"] == "http.response.start":
+                response_headers = MutableHeaders(scope=message)
+                for header_name, header_value in headers.items():
+                    response_headers[header_name] = header_value
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
 
 
 def configure_rate_limiting(app: FastAPI) -> None:
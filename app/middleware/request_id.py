@@ -0,0 +1,50 @@
+"""Request ID Middleware.
+
+Tags every request with a unique ID, taken from the X-Request-ID header
+when the client sends one. The ID is exposed as request.state.request_id
+and echoed back in the X-Request-ID response header.
+"""
+
+from uuid import uuid4
+
+from fastapi import FastAPI
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class RequestIDMiddleware:
+    """Pure ASGI request ID middleware.
+
+    Runs in the caller's task and passes messages straight through, so
+    streaming responses are not buffered.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = Headers(scope=scope).get("x-request-id")
+        if request_id is None:
+            request_id = str(uuid4())
+        # Backing store of request.state
+        scope.setdefault("state", {})["request_id"] = request_id
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["X-Request-ID"] = request_id
+            await send(message)
+
+        await self.app(scope, receive, send_with_request_id)
+
+
+def configure_request_id(app: FastAPI) -> None:
+    """Configure request ID middleware.
+
+    Args:
+        app: FastAPI application
+    """
+    app.add_middleware(RequestIDMiddleware)
@@ -5,7 +5,9 @@ from app.models.district import District
 from app.models.department import Department
 from app.models.user import User
 from app.models.grievance import Grievance
+from app.models.grievance_id_counter import GrievanceIdCounter
 from app.models.attachment import Attachment
+from app.models.attachment_blob import AttachmentBlob
 from app.models.audit_log import AuditLog
 from app.models.verification import Verification
 # ML Training Models
@@ -42,7 +44,9 @@ __all__ = [
     "Department",
     "User",
     "Grievance",
+    "GrievanceIdCounter",
     "Attachment",
+    "AttachmentBlob",
     "AuditLog",
     "Verification",
     # ML Models
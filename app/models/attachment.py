@@ -1,6 +1,6 @@
 """Attachment model for grievance documents."""
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 from uuid import UUID as UUID_Type
 
 from sqlalchemy import CheckConstraint, ForeignKey, Integer, String
@@ -40,6 +40,12 @@ class Attachment(Base, UUIDMixin, TimestampMixin):
         Integer,
         nullable=False,
     )
+    # SHA-256 of the content; set for content-addressed blobs (see AttachmentBlob)
+    file_hash: Mapped[Optional[str]] = mapped_column(
+        String(64),
+        nullable=True,
+        index=True,
+    )
 
     # Relationships
     grievance: Mapped["Grievance"] = relationship(
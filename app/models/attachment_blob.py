@@ -0,0 +1,42 @@
+"""Attachment blob model for content-addressed file storage."""
+
+from sqlalchemy import CheckConstraint, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base, TimestampMixin
+
+
+class AttachmentBlob(Base, TimestampMixin):
+    """Stored file content shared by attachments with the same SHA-256.
+
+    ref_count is the number of attachments pointing at the blob; the file is
+    removed when it drops to zero (see app.services.attachment_blobs).
+    """
+
+    __tablename__ = "attachment_blobs"
+
+    file_hash: Mapped[str] = mapped_column(
+        String(64),
+        primary_key=True,
+    )
+    file_path: Mapped[str] = mapped_column(
+        String(500),
+        nullable=False,
+    )
+    file_size: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+    )
+    ref_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+
+    __table_args__ = (
+        CheckConstraint('ref_count >= 0', name='check_blob_ref_count_non_negative'),
+    )
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<AttachmentBlob(hash={self.file_hash[:12]}, refs={self.ref_count})>"
@@ -1,5 +1,6 @@
 """Audit log model for tracking all changes."""
 
+import hashlib
 from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID as UUID_Type
@@ -77,6 +78,42 @@ class AuditLog(Base, UUIDMixin):
         ),
     )
 
+    @staticmethod
+    def compute_hash(
+        previous_hash: str | None,
+        grievance_id: UUID_Type,
+        user_id: UUID_Type,
+        action: str,
+        details: str,
+        timestamp: datetime,
+    ) -> str:
+        """Compute the chained hash for an audit entry.
+
+        Each entry hashes its own content together with the previous entry's
+        hash for the same grievance, so altering or removing any entry breaks
+        every hash after it.
+
+        Args:
+            previous_hash: current_hash of the grievance's latest entry, if any
+            grievance_id: Internal grievance UUID
+            user_id: Acting user UUID
+            action: Action name
+            details: Serialized details
+            timestamp: Entry timestamp
+
+        Returns:
+            SHA-256 hex digest
+        """
+        content = "|".join([
+            previous_hash or "",
+            str(grievance_id),
+            str(user_id),
+            action,
+            details,
+            timestamp.isoformat(),
+        ])
+        return hashlib.sha256(content.encode()).hexdigest()
+
     def __repr__(self) -> str:
         """String representation."""
         return f"<AuditLog(action={self.action}, timestamp={self.timestamp}, hash={self.current_hash[:8]}...)>"
@@ -154,6 +154,11 @@ class EmpowermentInteraction(Base):
     trigger_reason: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     citizen_response: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     message_sent: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Delivery results recorded by the notification dispatcher
+    channel: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
+    delivery_status: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
+    message_sid: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    delivery_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
@@ -167,6 +172,7 @@ class EmpowermentInteraction(Base):
         Index("idx_interactions_phone", "citizen_phone"),
         Index("idx_interactions_grievance", "grievance_id"),
         Index("idx_interactions_type", "interaction_type"),
+        Index("idx_interactions_phone_created", "citizen_phone", "created_at"),
     )
 
     def __repr__(self) -> str:
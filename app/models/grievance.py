@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Any
 from uuid import UUID as UUID_Type
 
 from sqlalchemy import (
+    DDL,
     CheckConstraint,
     DateTime,
     Float,
@@ -13,9 +14,10 @@ from sqlalchemy import (
     Integer,
     String,
     Text,
+    event,
     text,
 )
-from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, SoftDeleteMixin, TimestampMixin, UUIDMixin
@@ -215,6 +217,15 @@ class Grievance(Base, UUIDMixin, TimestampMixin, SoftDeleteMixin):
         nullable=True,
     )
 
+    # Full-text search document over subject + grievance_text.
+    # Maintained by the grievances_search_vector_update trigger; never set
+    # from Python. Deferred so ORM loads don't pull it.
+    search_vector: Mapped[Any | None] = mapped_column(
+        TSVECTOR,
+        nullable=True,
+        deferred=True,
+    )
+
     # Extra data (JSONB for extensibility)
     extra_data: Mapped[dict[str, Any] | None] = mapped_column(
         JSONB,
@@ -245,22 +256,24 @@ class Grievance(Base, UUIDMixin, TimestampMixin, SoftDeleteMixin):
         back_populates="grievances",
         lazy="selectin",
     )
+    # Heavy collections are never loaded implicitly: list paths use a column
+    # projection, and the detail endpoint opts in with selectinload().
     attachments: Mapped[list["Attachment"]] = relationship(
         "Attachment",
         back_populates="grievance",
-        lazy="selectin",
+        lazy="raise_on_sql",
         cascade="all, delete-orphan",
     )
     audit_logs: Mapped[list["AuditLog"]] = relationship(
         "AuditLog",
         back_populates="grievance",
-        lazy="selectin",
+        lazy="raise_on_sql",
         cascade="all, delete-orphan",
     )
     verifications: Mapped[list["Verification"]] = relationship(
         "Verification",
         back_populates="grievance",
-        lazy="selectin",
+        lazy="raise_on_sql",
         cascade="all, delete-orphan",
     )
 
@@ -275,6 +288,30 @@ class Grievance(Base, UUIDMixin, TimestampMixin, SoftDeleteMixin):
             'idx_grievances_department_created',
             'department_id', 'created_at',
         ),
+        # Search: full-text (tsvector) and substring/Telugu-script (trigram)
+        Index(
+            'idx_grievances_search_vector',
+            'search_vector',
+            postgresql_using='gin',
+        ),
+        Index(
+            'idx_grievances_subject_trgm',
+            'subject',
+            postgresql_using='gin',
+            postgresql_ops={'subject': 'gin_trgm_ops'},
+        ),
+        Index(
+            'idx_grievances_text_trgm',
+            'grievance_text',
+            postgresql_using='gin',
+            postgresql_ops={'grievance_text': 'gin_trgm_ops'},
+        ),
+        # Keyset pagination: ORDER BY created_at DESC, id DESC (backward scan)
+        Index(
+            'idx_grievances_active_created_id',
+            'created_at', 'id',
+            postgresql_where=text("deleted_at IS NULL")
+        ),
         Index(
             'idx_grievances_officer_status',
             'assigned_officer_id', 'status',
@@ -339,3 +376,41 @@ class Grievance(Base, UUIDMixin, TimestampMixin, SoftDeleteMixin):
     def __repr__(self) -> str:
         """String representation."""
         return f"<Grievance(id={self.grievance_id}, status={self.status}, priority={self.priority})>"
+
+
+# Keep metadata.create_all() (development startup, tests) in step with the
+# search migration: trigram indexes need pg_trgm, and search_vector is
+# maintained by a trigger rather than by the ORM.
+GRIEVANCE_SEARCH_VECTOR_FUNCTION = """
+CREATE OR REPLACE FUNCTION grievances_search_vector_update()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('simple', coalesce(NEW.subject, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(NEW.grievance_text, '')), 'B');
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+GRIEVANCE_SEARCH_VECTOR_TRIGGER = """
+CREATE TRIGGER grievances_search_vector_update
+BEFORE INSERT OR UPDATE OF subject, grievance_text ON grievances
+FOR EACH ROW EXECUTE FUNCTION grievances_search_vector_update();
+"""
+
+event.listen(
+    Grievance.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+event.listen(
+    Grievance.__table__,
+    "after_create",
+    DDL(GRIEVANCE_SEARCH_VECTOR_FUNCTION).execute_if(dialect="postgresql"),
+)
+event.listen(
+    Grievance.__table__,
+    "after_create",
+    DDL(GRIEVANCE_SEARCH_VECTOR_TRIGGER).execute_if(dialect="postgresql"),
+)
@@ -0,0 +1,33 @@
+"""Grievance ID counter model for public ID allocation."""
+
+from sqlalchemy import BigInteger, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class GrievanceIdCounter(Base):
+    """High-water mark of allocated grievance numbers per district and year.
+
+    Workers reserve blocks of numbers by advancing next_value (see
+    app.services.grievance_id_generator) and hand them out from memory.
+    """
+
+    __tablename__ = "grievance_id_counters"
+
+    year: Mapped[int] = mapped_column(
+        Integer,
+        primary_key=True,
+    )
+    district_code: Mapped[str] = mapped_column(
+        String(10),
+        primary_key=True,
+    )
+    next_value: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<GrievanceIdCounter(year={self.year}, district={self.district_code}, next={self.next_value})>"
@@ -13,7 +13,7 @@ from typing import Literal
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database.connection import get_db_session
+from app.database.connection import get_read_db_session
 from app.dependencies.auth import require_admin
 from app.models.user import User
 from app.schemas.admin import (
@@ -44,7 +44,7 @@ router = APIRouter(prefix="/admin")
 )
 async def get_fraud_metrics(
     current_user: User = Depends(require_admin()),
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_read_db_session),
 ) -> FraudMetricsResponse:
     """Get fraud detection metrics.
 
@@ -92,7 +92,7 @@ async def get_fraud_metrics(
 )
 async def get_nlp_metrics(
     current_user: User = Depends(require_admin()),
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_read_db_session),
 ) -> NLPMetricsResponse:
     """Get NLP performance metrics.
 
@@ -141,7 +141,7 @@ async def get_department_analytics(
         description="Time period for analytics (30 days, 90 days, or 1 year)",
     ),
     current_user: User = Depends(require_admin()),
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_read_db_session),
 ) -> DepartmentAnalyticsResponse:
     """Get department analytics with SLA and satisfaction metrics.
 
@@ -193,7 +193,7 @@ async def get_department_analytics(
 )
 async def get_system_metrics(
     current_user: User = Depends(require_admin()),
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_read_db_session),
 ) -> SystemMetricsResponse:
     """Get system-wide overview metrics.
 
@@ -24,7 +24,7 @@ from app.models.user import User
 from app.schemas.auth import DepartmentResponse, DistrictResponse, LoginRequest, LoginResponse, UserResponse, UserRole
 from app.services.token_blacklist import blacklist_token, get_token_blacklist
 from app.utils.jwt import create_access_token, decode_token
-from app.utils.password import verify_password
+from app.utils.password import PasswordHashBusyError, verify_and_update_password
 
 logger = logging.getLogger(__name__)
 
@@ -66,6 +66,7 @@ async def login(
     Raises:
         HTTPException 401: Invalid credentials
         HTTPException 403: User account is disabled
+        HTTPException 503: Password hashing pool saturated (Retry-After)
     """
     # Find user by username
     stmt = select(User).where(
@@ -83,8 +84,21 @@ async def login(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Verify password
-    if not user.password_hash or not verify_password(form_data.password, user.password_hash):
+    # Verify password (bcrypt runs on the hashing pool, off the event loop)
+    valid, new_hash = False, None
+    if user.password_hash:
+        try:
+            valid, new_hash = await verify_and_update_password(
+                form_data.password, user.password_hash
+            )
+        except PasswordHashBusyError:
+            logger.warning(f"Login deferred: password hashing saturated - {form_data.username}")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Login is temporarily busy, please retry",
+                headers={"Retry-After": "1"},
+            )
+    if not valid:
         logger.warning(f"Login failed: invalid password - {form_data.username}")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -100,6 +114,11 @@ async def login(
             detail="User account is disabled",
         )
 
+    # Upgrade hashes made with other PASSWORD_HASH_ROUNDS
+    if new_hash is not None:
+        user.password_hash = new_hash
+        logger.info(f"Password rehashed on login: {user.username}")
+
     # Update last login timestamp
     user.last_login_at = datetime.now(timezone.utc)
     await db.commit()
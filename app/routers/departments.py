@@ -14,7 +14,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
-from app.database.connection import get_db_session
+from app.database.connection import get_read_db_session
 from app.models.department import Department
 
 logger = logging.getLogger(__name__)
@@ -92,7 +92,7 @@ def _clear_cache() -> None:
 )
 async def list_departments(
     response: Response,
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_read_db_session),
 ) -> DepartmentListResponse:
     """Get all departments.
 
@@ -162,7 +162,7 @@ async def list_departments(
 )
 async def get_department_by_code(
     department_code: str,
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_read_db_session),
 ) -> DepartmentResponse:
     """Get department by code.
 
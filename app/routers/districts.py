@@ -14,7 +14,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
-from app.database.connection import get_db_session
+from app.database.connection import get_read_db_session
 from app.models.district import District
 
 logger = logging.getLogger(__name__)
@@ -83,7 +83,7 @@ def _clear_cache() -> None:
 )
 async def list_districts(
     response: Response,
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_read_db_session),
 ) -> DistrictListResponse:
     """Get all districts.
 
@@ -150,7 +150,7 @@ async def list_districts(
 )
 async def get_district_by_code(
     district_code: str,
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_read_db_session),
 ) -> DistrictResponse:
     """Get district by code.
 
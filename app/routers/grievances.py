@@ -7,27 +7,52 @@ Provides grievance CRUD endpoints:
 - PATCH /grievances/{id} - Update grievance
 - DELETE /grievances/{id} - Soft delete grievance
 - PATCH /grievances/bulk - Bulk update grievances
+- POST /grievances/ingest - Bulk ingest grievances (NDJSON/CSV stream)
 """
 
 import hashlib
+import json
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, List, Optional, Union
 from uuid import UUID, uuid4
 
-from fastapi import APIRouter, Depends, File, HTTPException, Header, Query, UploadFile, status
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, File, HTTPException, Header, Query, Request, UploadFile, status
+from fastapi.responses import FileResponse, JSONResponse
 from pydantic import BaseModel, Field
-from sqlalchemy import func, or_, select
+from sqlalchemy import (
+    ARRAY,
+    Row,
+    Select,
+    String,
+    any_,
+    bindparam,
+    func,
+    insert,
+    or_,
+    select,
+    tuple_,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app.config import settings
-from app.database.connection import get_db_session
+from app.database.connection import get_db_session, get_read_db_session
+from app.database.pagination import (
+    InvalidCursorError,
+    count_estimated,
+    count_exact,
+    decode_cursor,
+    encode_cursor,
+)
 from app.dependencies.auth import (
     get_current_active_user,
     get_optional_user,
     require_role,
 )
+from app.middleware.error_handler import create_error_response
+from app.models.audit_log import AuditLog
 from app.models.department import Department
 from app.models.district import District
 from app.models.grievance import Grievance
@@ -37,12 +62,29 @@ from app.schemas.grievance import (
     BulkUpdateResponse,
     GrievanceCreateRequest,
     GrievanceDetailResponse,
+    GrievanceIngestResponse,
     GrievanceListResponse,
     GrievanceResponse,
+    GrievanceStatus,
     GrievanceUpdateRequest,
 )
-from app.services.nlp_service import classify_grievance
-from app.services.storage_service import get_storage_service
+from app.services.classification_pipeline import (
+    ClassificationJob,
+    classify_department,
+    get_classification_pipeline,
+)
+from app.services.grievance_id_generator import get_grievance_id_generator
+from app.services.grievance_ingest import GrievanceIngestor, iter_records
+from app.services.grievance_search import GrievanceSearch
+from app.services.idempotency_store import IdempotencyClaim, get_idempotency_store
+from app.services.attachment_blobs import (
+    acquire_blob,
+    blob_needs_rewrite,
+    repoint_blob,
+    release_blob,
+    remove_unreferenced_blob,
+)
+from app.services.storage_service import IStorageService, S3StorageService, get_storage_service
 from app.services.empathy_service import get_empathy_service
 from app.schemas.empathy import GrievanceSentimentResponse
 from app.models.attachment import Attachment
@@ -52,25 +94,6 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/grievances")
 
 
-# In-memory idempotency cache (for development - use Redis in production)
-_idempotency_cache: Dict[str, Dict[str, Any]] = {}
-
-
-def _generate_grievance_id(district_code: str) -> str:
-    """Generate public grievance ID.
-
-    Format: PGRS-YYYY-DD-NNNNN
-    Where DD is district code and NNNNN is a sequential number.
-    """
-    now = datetime.now(timezone.utc)
-    year = now.year
-
-    # Generate unique number using timestamp + random
-    unique_part = int(now.timestamp() * 1000) % 100000
-
-    return f"PGRS-{year}-{district_code}-{unique_part:05d}"
-
-
 def _hash_for_duplicate_detection(
     phone: str,
     text: str,
@@ -85,38 +108,6 @@ def _hash_for_duplicate_detection(
     return hashlib.sha256(content.encode()).hexdigest()
 
 
-async def _check_idempotency(
-    key: str,
-) -> Optional[Dict[str, Any]]:
-    """Check if request was already processed (idempotency).
-
-    Args:
-        key: Idempotency key
-
-    Returns:
-        Cached response if found, None otherwise
-    """
-    if key in _idempotency_cache:
-        cached = _idempotency_cache[key]
-        # Check if not expired (1 hour TTL)
-        if (datetime.now(timezone.utc) - cached["time"]).total_seconds() < settings.IDEMPOTENCY_KEY_TTL:
-            return cast(Dict[str, Any], cached["response"])
-    return None
-
-
-def _store_idempotency(key: str, response: Dict[str, Any]) -> None:
-    """Store response for idempotency.
-
-    Args:
-        key: Idempotency key
-        response: Response to cache
-    """
-    _idempotency_cache[key] = {
-        "time": datetime.now(timezone.utc),
-        "response": response,
-    }
-
-
 @router.post(
     "",
     response_model=GrievanceResponse,
@@ -147,26 +138,70 @@ async def create_grievance(
     Raises:
         HTTPException 400: Validation error
         HTTPException 404: District not found
+        HTTPException 409: Same submission is still being processed
         HTTPException 429: Rate limit exceeded
     """
-    # Check idempotency
-    if idempotency_key:
-        cached = await _check_idempotency(idempotency_key)
-        if cached:
-            logger.info(f"Idempotency hit for key: {idempotency_key}")
-            return GrievanceResponse(**cached)
-
-    # Hash-based duplicate detection
+    # Claim idempotency key and duplicate hash (atomic across workers)
     duplicate_hash = _hash_for_duplicate_detection(
         request.citizen_phone,
         request.grievance_text,
         request.district_code,
     )
-    cached = await _check_idempotency(f"hash:{duplicate_hash}")
-    if cached:
-        logger.info("Duplicate grievance detected by hash")
-        return GrievanceResponse(**cached)
+    keys = [idempotency_key] if idempotency_key else []
+    keys.append(f"hash:{duplicate_hash}")
+
+    store = get_idempotency_store()
+    claims: List[IdempotencyClaim] = []
+    for key in keys:
+        claim = await store.claim(key)
+        if claim.acquired:
+            claims.append(claim)
+            continue
+
+        for held in claims:
+            await store.release(held)
+        if claim.response is not None:
+            logger.info(f"Idempotent replay for key: {key}")
+            return GrievanceResponse(**claim.response)
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="An identical grievance submission is already being processed",
+        )
+
+    try:
+        response_data = await _create_grievance_record(request, db, current_user)
+    except BaseException:
+        for held in claims:
+            await store.release(held)
+        raise
+
+    for held in claims:
+        await store.complete(held, response_data)
 
+    return GrievanceResponse(**response_data)
+
+
+async def _create_grievance_record(
+    request: GrievanceCreateRequest,
+    db: AsyncSession,
+    current_user: Optional[User],
+) -> Dict[str, Any]:
+    """Classify, persist and build the response for a new grievance.
+
+    In async classification mode the grievance is stored unassigned and
+    queued for the classification pipeline after commit.
+
+    Args:
+        request: Grievance creation request
+        db: Database session
+        current_user: Optional authenticated user
+
+    Returns:
+        Grievance response dict
+
+    Raises:
+        HTTPException 404: District not found
+    """
     # Validate district exists
     district_stmt = select(District).where(District.district_code == request.district_code)
     district_result = await db.execute(district_stmt)
@@ -178,53 +213,33 @@ async def create_grievance(
             detail=f"District with code '{request.district_code}' not found",
         )
 
-    # NLP classification
+    # Department: manual, inline NLP (sync mode) or background NLP (async mode)
     department = None
     department_id = None
     sla_days = 7  # Default SLA
+    classify_later = False
 
     if request.department_id:
         # Manual department assignment
         dept_stmt = select(Department).where(Department.id == request.department_id)
         dept_result = await db.execute(dept_stmt)
         department = dept_result.scalar_one_or_none()
-        if department:
-            department_id = department.id
-            sla_days = department.sla_days
+    elif settings.NLP_CLASSIFICATION_MODE == "async":
+        classify_later = True
     else:
-        # Automatic NLP classification
-        try:
-            classification = await classify_grievance(
-                text=request.grievance_text,
-                language=request.language.value,
-                district_code=request.district_code,
-            )
+        department = await classify_department(
+            db,
+            request.grievance_text,
+            request.language.value,
+            request.district_code,
+        )
 
-            if classification.is_confident():
-                # Find department by ID from NLP response
-                if classification.department_code:
-                    dept_stmt = select(Department).where(
-                        Department.dept_code == classification.department_code
-                    )
-                    dept_result = await db.execute(dept_stmt)
-                    department = dept_result.scalar_one_or_none()
-                    if department:
-                        department_id = department.id
-                        sla_days = department.sla_days
-                        logger.info(
-                            f"NLP classified to {department.dept_code} "
-                            f"(confidence: {classification.confidence:.2f})"
-                        )
-            else:
-                logger.info(
-                    f"NLP confidence too low: {classification.confidence:.2f}. "
-                    "Manual assignment needed."
-                )
-        except Exception as e:
-            logger.warning(f"NLP classification failed: {e}. Manual assignment needed.")
+    if department:
+        department_id = department.id
+        sla_days = department.sla_days
 
     # Generate grievance ID
-    grievance_id = _generate_grievance_id(request.district_code)
+    grievance_id = await get_grievance_id_generator().next_id(db, request.district_code)
 
     # Calculate due date
     due_date = datetime.now(timezone.utc) + timedelta(days=sla_days)
@@ -259,33 +274,136 @@ async def create_grievance(
 
     logger.info(f"Grievance created: {grievance_id}")
 
-    # Build response
-    response_data = _build_grievance_response(grievance, district, department)
+    if classify_later:
+        get_classification_pipeline().submit(ClassificationJob(
+            grievance_id=grievance.id,
+            text=grievance.grievance_text,
+            language=grievance.language,
+            district_code=request.district_code,
+            submitted_at=grievance.submitted_at,
+        ))
 
-    # Store for idempotency
-    if idempotency_key:
-        _store_idempotency(idempotency_key, response_data)
-    _store_idempotency(f"hash:{duplicate_hash}", response_data)
+    return _build_grievance_response(grievance, district, department)
 
-    return GrievanceResponse(**response_data)
+
+def _build_list_filters(
+    current_user: User,
+    status_filter: Optional[str] = None,
+    district_id: Optional[UUID] = None,
+    department_id: Optional[UUID] = None,
+    assigned_officer_id: Optional[UUID] = None,
+    grievance_search: Optional[GrievanceSearch] = None,
+) -> List[Any]:
+    """WHERE clauses for a grievance listing.
+
+    Args:
+        current_user: Authenticated user (scopes officers and supervisors)
+        status_filter: Filter by status
+        district_id: Filter by district
+        department_id: Filter by department
+        assigned_officer_id: Filter by officer
+        grievance_search: Parsed search text
+
+    Returns:
+        Filters shared by the count and the page query
+    """
+    filters: List[Any] = [Grievance.deleted_at.is_(None)]
+
+    # Apply authorization filters
+    if current_user.role == "officer":
+        # Officers see only grievances assigned to them or in their department
+        filters.append(
+            or_(
+                Grievance.assigned_officer_id == current_user.id,
+                Grievance.department_id == current_user.department_id,
+            )
+        )
+    elif current_user.role == "supervisor" and current_user.department_id:
+        # Supervisors see all in their department
+        filters.append(Grievance.department_id == current_user.department_id)
+
+    # Apply the requested filters
+    column_filters = [
+        (Grievance.status, status_filter),
+        (Grievance.district_id, district_id),
+        (Grievance.department_id, department_id),
+        (Grievance.assigned_officer_id, assigned_officer_id),
+    ]
+    filters.extend(column == value for column, value in column_filters if value)
+    if grievance_search:
+        filters.append(grievance_search.predicate())
+    return filters
+
+
+def _keyset_predicate(cursor: str, sort_key: List[Any], ranked: bool) -> Any:
+    """Keyset predicate selecting the rows after a cursor.
+
+    Args:
+        cursor: Opaque cursor from a previous next_cursor
+        sort_key: Columns the listing is ordered by (descending)
+        ranked: Whether the listing is ordered by search relevance first
+
+    Returns:
+        (sort_key) < (cursor position) row comparison
+
+    Raises:
+        HTTPException 400: Malformed cursor, or one from a different ordering
+    """
+    try:
+        position = decode_cursor(cursor)
+    except InvalidCursorError:
+        position = None
+    # A cursor is only valid for the ordering that produced it
+    if position is None or (position.rank is None) == ranked:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        )
+    cursor_key: List[Any] = [position.created_at, position.record_id]
+    if ranked:
+        cursor_key.insert(0, position.rank)
+    return tuple_(*sort_key) < tuple_(*cursor_key)
+
+
+async def _count_grievances(db: AsyncSession, filters: List[Any], count_mode: str) -> Optional[int]:
+    """Total for a grievance listing in the given count mode (None for "none")."""
+    if count_mode == "none":
+        return None
+    count_stmt = select(Grievance.id).where(*filters)
+    if count_mode == "exact":
+        return await count_exact(db, count_stmt)
+    return await count_estimated(db, count_stmt)
 
 
 @router.get(
     "",
     response_model=GrievanceListResponse,
     summary="List grievances",
-    description="List grievances with pagination and filters. Officers see only their assigned grievances.",
+    description=(
+        "List grievances with pagination and filters. Officers see only their assigned grievances. "
+        "Pass `cursor` (from a previous `next_cursor`) for keyset pagination on large result sets."
+    ),
 )
 async def list_grievances(
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_read_db_session),
     current_user: User = Depends(require_role(["officer", "supervisor", "admin"])),
-    page: int = Query(1, ge=1, description="Page number"),
+    page: int = Query(1, ge=1, description="Page number (ignored when cursor is given)"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Opaque keyset cursor from a previous next_cursor"),
+    count: Optional[str] = Query(
+        None,
+        pattern=r"^(exact|estimated|none)$",
+        description="Total count mode: exact, estimated or none (default: exact for pages, none for cursors)",
+    ),
     status_filter: Optional[str] = Query(None, alias="status", description="Filter by status"),
     district_id: Optional[UUID] = Query(None, description="Filter by district"),
     department_id: Optional[UUID] = Query(None, description="Filter by department"),
     assigned_officer_id: Optional[UUID] = Query(None, description="Filter by assigned officer"),
-    search: Optional[str] = Query(None, description="Search in subject/description"),
+    search: Optional[str] = Query(
+        None,
+        max_length=200,
+        description="Search in subject/description (ranked by relevance)",
+    ),
 ) -> GrievanceListResponse:
     """List grievances with filters.
 
@@ -293,11 +411,18 @@ async def list_grievances(
     Supervisors see all in their department.
     Admins see all grievances.
 
+    Two pagination modes share the same ordering (created_at DESC, id DESC,
+    preceded by relevance DESC when searching):
+    - Page mode (default): OFFSET-based, kept for existing clients.
+    - Cursor mode: keyset on the ordering key, constant cost at any depth.
+
     Args:
         db: Database session
         current_user: Authenticated user
         page: Page number (1-indexed)
         page_size: Items per page
+        cursor: Keyset cursor (switches to cursor mode)
+        count: Total count mode
         status_filter: Filter by status
         district_id: Filter by district
         department_id: Filter by department
@@ -306,70 +431,71 @@ async def list_grievances(
 
     Returns:
         Paginated grievance list
+
+    Raises:
+        HTTPException 400: Malformed cursor
     """
-    # Build base query
-    stmt = select(Grievance).where(Grievance.deleted_at.is_(None))
+    # Collect filters once; they apply to both the count and the page query
+    grievance_search = GrievanceSearch.from_query(search)
+    filters = _build_list_filters(
+        current_user,
+        status_filter=status_filter,
+        district_id=district_id,
+        department_id=department_id,
+        assigned_officer_id=assigned_officer_id,
+        grievance_search=grievance_search,
+    )
 
-    # Apply authorization filters
-    if current_user.role == "officer":
-        # Officers see only grievances assigned to them or in their department
-        stmt = stmt.where(
-            or_(
-                Grievance.assigned_officer_id == current_user.id,
-                Grievance.department_id == current_user.department_id,
-            )
-        )
-    elif current_user.role == "supervisor":
-        # Supervisors see all in their department
-        if current_user.department_id:
-            stmt = stmt.where(Grievance.department_id == current_user.department_id)
-
-    # Apply filters
-    if status_filter:
-        stmt = stmt.where(Grievance.status == status_filter)
-    if district_id:
-        stmt = stmt.where(Grievance.district_id == district_id)
-    if department_id:
-        stmt = stmt.where(Grievance.department_id == department_id)
-    if assigned_officer_id:
-        stmt = stmt.where(Grievance.assigned_officer_id == assigned_officer_id)
-    if search:
-        search_term = f"%{search}%"
-        stmt = stmt.where(
-            or_(
-                Grievance.subject.ilike(search_term),
-                Grievance.grievance_text.ilike(search_term),
-            )
+    # Count total (over the filtered set, before the keyset predicate)
+    count_mode = count or ("none" if cursor else "exact")
+    total = await _count_grievances(db, filters, count_mode)
+
+    # Apply pagination and ordering (id breaks ties between equal timestamps)
+    stmt = _grievance_list_query().where(*filters)
+    sort_key: List[Any] = [Grievance.created_at, Grievance.id]
+    if grievance_search:
+        rank = grievance_search.rank()
+        stmt = stmt.add_columns(rank.label("rank"))
+        sort_key.insert(0, rank)
+    stmt = stmt.order_by(*[column.desc() for column in sort_key])
+
+    if cursor:
+        stmt = stmt.where(_keyset_predicate(cursor, sort_key, ranked=bool(grievance_search)))
+    else:
+        stmt = stmt.offset((page - 1) * page_size)
+
+    # Fetch one extra row to learn whether another page exists
+    result = await db.execute(stmt.limit(page_size + 1))
+    rows = list(result.all())
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+
+    next_cursor = None
+    if has_more:
+        last = rows[-1]
+        next_cursor = encode_cursor(
+            last.created_at,
+            last.id,
+            rank=last.rank if grievance_search else None,
         )
 
-    # Count total
-    count_stmt = select(func.count()).select_from(stmt.subquery())
-    total_result = await db.execute(count_stmt)
-    total = total_result.scalar() or 0
-
-    # Apply pagination and ordering
-    offset = (page - 1) * page_size
-    stmt = stmt.order_by(Grievance.created_at.desc()).offset(offset).limit(page_size)
-
-    # Execute query
-    result = await db.execute(stmt)
-    grievances = result.scalars().all()
-
     # Build response
-    items = []
-    for g in grievances:
-        items.append(_build_grievance_response(g, g.district, g.department))
-
-    total_pages = (total + page_size - 1) // page_size
+    items = [_build_grievance_list_item(row) for row in rows]
+
+    pagination: Dict[str, Any] = {
+        "page_size": page_size,
+        "total_items": total,
+        "total_pages": (total + page_size - 1) // page_size if total is not None else None,
+        "total_is_estimate": count_mode == "estimated",
+        "has_more": has_more,
+        "next_cursor": next_cursor,
+    }
+    if not cursor:
+        pagination["page"] = page
 
     return GrievanceListResponse(
         data=[GrievanceResponse(**item) for item in items],
-        pagination={
-            "page": page,
-            "page_size": page_size,
-            "total_items": total,
-            "total_pages": total_pages,
-        },
+        pagination=pagination,
     )
 
 
@@ -398,9 +524,18 @@ async def get_grievance(
         HTTPException 404: Grievance not found
         HTTPException 403: Not authorized
     """
-    stmt = select(Grievance).where(
-        Grievance.grievance_id == grievance_id,
-        Grievance.deleted_at.is_(None),
+    # Heavy collections are only loaded here, never on list paths
+    stmt = (
+        select(Grievance)
+        .where(
+            Grievance.grievance_id == grievance_id,
+            Grievance.deleted_at.is_(None),
+        )
+        .options(
+            selectinload(Grievance.attachments),
+            selectinload(Grievance.audit_logs),
+            selectinload(Grievance.verifications),
+        )
     )
     result = await db.execute(stmt)
     grievance = result.scalar_one_or_none()
@@ -435,13 +570,14 @@ async def get_grievance(
     response_data = _build_grievance_response(grievance, grievance.district, grievance.department)
 
     # Add relationships
+    storage = get_storage_service()
     response_data["attachments"] = [
         {
             "id": str(a.id),
             "file_name": a.file_name,
             "file_type": a.file_type,
             "file_size_bytes": a.file_size,
-            "file_url": f"/uploads/{a.file_path}",
+            "file_url": _attachment_url(storage, a.file_path),
             "uploaded_at": a.created_at.isoformat(),
         }
         for a in grievance.attachments
@@ -634,6 +770,18 @@ async def delete_grievance(
     logger.info(f"Grievance deleted: {grievance_id} by {current_user.username}")
 
 
+def _attachment_url(storage: IStorageService, file_path: str) -> str:
+    """Download URL for a stored attachment.
+
+    S3 objects get a presigned URL (signed locally, no request) so clients
+    fetch straight from the bucket; local files keep their static /uploads/
+    path without touching the filesystem.
+    """
+    if isinstance(storage, S3StorageService):
+        return storage.presigned_url(file_path)
+    return f"/uploads/{file_path}"
+
+
 @router.post(
     "/{grievance_id}/attachments",
     status_code=status.HTTP_201_CREATED,
@@ -681,7 +829,10 @@ async def upload_attachment(
         )
 
     # Check attachment count
-    attachment_count = len(grievance.attachments) if grievance.attachments else 0
+    count_result = await db.execute(
+        select(func.count()).where(Attachment.grievance_id == grievance.id)
+    )
+    attachment_count = count_result.scalar() or 0
     if attachment_count >= 5:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -700,17 +851,25 @@ async def upload_attachment(
             detail=f"File type not allowed: {content_type}. Allowed: {allowed_types}",
         )
 
-    # Upload file
+    # Reject early when the multipart part already tells us the size
+    max_bytes = settings.MAX_FILE_SIZE_MB * 1024 * 1024
+    if file.size is not None and file.size > max_bytes:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File too large: {file.size} bytes. Max: {settings.MAX_FILE_SIZE_MB}MB",
+        )
+
+    # Upload file (streamed in chunks; UploadFile reads spooled data off the loop)
     storage = get_storage_service()
     upload_result = await storage.upload_file(
-        file=file.file,
+        file=file,
         file_name=file_name,
         file_type=content_type,
         grievance_id=grievance_id,
     )
 
     if not upload_result.success:
-        if "too large" in (upload_result.error or "").lower():
+        if upload_result.too_large:
             raise HTTPException(
                 status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
                 detail=upload_result.error,
@@ -720,6 +879,24 @@ async def upload_attachment(
             detail=upload_result.error or "Upload failed",
         )
 
+    # Reference the shared blob; store it again if a concurrent delete of its
+    # last reference removed it after upload_file found it
+    ref_count = await acquire_blob(db, upload_result)
+    if await blob_needs_rewrite(storage, upload_result, ref_count):
+        await file.seek(0)
+        upload_result = await storage.upload_file(
+            file=file,
+            file_name=file_name,
+            file_type=content_type,
+            grievance_id=grievance_id,
+        )
+        if not upload_result.success:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=upload_result.error or "Upload failed",
+            )
+        await repoint_blob(db, upload_result)
+
     # Create attachment record
     attachment = Attachment(
         grievance_id=grievance.id,
@@ -727,6 +904,7 @@ async def upload_attachment(
         file_path=upload_result.file_path or "",
         file_type=content_type,
         file_size=upload_result.file_size_bytes,
+        file_hash=upload_result.file_hash,
     )
     db.add(attachment)
     await db.commit()
@@ -781,16 +959,23 @@ async def list_attachments(
             detail=f"Grievance '{grievance_id}' not found",
         )
 
+    attachments_result = await db.execute(
+        select(Attachment)
+        .where(Attachment.grievance_id == grievance.id)
+        .order_by(Attachment.created_at)
+    )
+
+    storage = get_storage_service()
     return [
         {
             "id": str(a.id),
             "file_name": a.file_name,
             "file_type": a.file_type,
             "file_size_bytes": a.file_size,
-            "file_url": f"/uploads/{a.file_path}",
+            "file_url": _attachment_url(storage, a.file_path),
             "uploaded_at": a.created_at.isoformat() if a.created_at else None,
         }
-        for a in grievance.attachments
+        for a in attachments_result.scalars().all()
     ]
 
 
@@ -853,14 +1038,18 @@ async def delete_attachment(
             detail=f"Attachment '{attachment_id}' not found",
         )
 
-    # Delete file from storage
-    storage = get_storage_service()
-    await storage.delete_file(attachment.file_path)
-
-    # Delete database record
+    # Drop the blob reference with the record; shared blobs go with their last one
+    blob_path = await release_blob(db, attachment.file_hash) if attachment.file_hash else None
     await db.delete(attachment)
     await db.commit()
 
+    # Remove the file only once the delete is committed
+    storage = get_storage_service()
+    if attachment.file_hash is None:
+        await storage.delete_file(attachment.file_path)
+    elif blob_path:
+        await remove_unreferenced_blob(db, storage, attachment.file_hash, blob_path)
+
     logger.info(f"Attachment deleted: {attachment_id} from {grievance_id} by {current_user.username}")
 
 
@@ -877,7 +1066,8 @@ async def bulk_update_grievances(
 ) -> BulkUpdateResponse:
     """Bulk update grievances.
 
-    Apply updates to multiple grievances in a single transaction.
+    Apply updates to multiple grievances in a single transaction using
+    one set-based UPDATE and one multi-row audit INSERT.
 
     Args:
         request: Bulk update request with grievance IDs and updates
@@ -885,7 +1075,11 @@ async def bulk_update_grievances(
         current_user: Authenticated supervisor/admin
 
     Returns:
-        BulkUpdateResponse with results
+        BulkUpdateResponse with per-ID results
+
+    Raises:
+        HTTPException 400: More than 100 grievance IDs
+        HTTPException 422: Invalid officer ID or status in updates
     """
     if len(request.grievance_ids) > 100:
         raise HTTPException(
@@ -893,52 +1087,35 @@ async def bulk_update_grievances(
             detail="Cannot update more than 100 grievances at once",
         )
 
-    results = []
-    updated_count = 0
-    failed_count = 0
+    values = _bulk_update_values(request.updates)
+    grievance_ids = list(dict.fromkeys(request.grievance_ids))
 
-    for gid in request.grievance_ids:
-        try:
-            stmt = select(Grievance).where(
-                Grievance.grievance_id == gid,
-                Grievance.deleted_at.is_(None),
-            )
-            result = await db.execute(stmt)
-            grievance = result.scalar_one_or_none()
-
-            if grievance is None:
-                results.append({
-                    "grievance_id": gid,
-                    "status": "failed",
-                    "error": "Not found",
-                })
-                failed_count += 1
-                continue
-
-            # Apply updates from request.updates dict
-            updates = request.updates
-            if "assigned_officer_id" in updates:
-                grievance.assigned_officer_id = UUID(updates["assigned_officer_id"])
-                grievance.assigned_at = datetime.now(timezone.utc)
-            if "status" in updates:
-                grievance.status = updates["status"]
-
-            results.append({
-                "grievance_id": gid,
-                "status": "success",
-            })
-            updated_count += 1
-
-        except Exception as e:
-            results.append({
-                "grievance_id": gid,
-                "status": "failed",
-                "error": str(e),
-            })
-            failed_count += 1
+    # One UPDATE for the whole batch; RETURNING tells us which IDs matched
+    if values:
+        stmt: Any = _bulk_update_statement(grievance_ids, values)
+    else:
+        stmt = select(Grievance.id, Grievance.grievance_id).where(
+            Grievance.grievance_id == any_(_text_array(grievance_ids)),
+            Grievance.deleted_at.is_(None),
+        )
+    matched: Dict[str, UUID] = {
+        row.grievance_id: row.id for row in (await db.execute(stmt)).all()
+    }
+
+    if values and matched:
+        await _insert_bulk_audit_logs(db, list(matched.values()), current_user, request.updates)
 
     await db.commit()
 
+    results = [
+        {"grievance_id": gid, "status": "success"}
+        if gid in matched
+        else {"grievance_id": gid, "status": "failed", "error": "Not found"}
+        for gid in request.grievance_ids
+    ]
+    updated_count = sum(1 for r in results if r["status"] == "success")
+    failed_count = len(results) - updated_count
+
     logger.info(
         f"Bulk update: {updated_count} updated, {failed_count} failed "
         f"by {current_user.username}"
@@ -952,45 +1129,296 @@ async def bulk_update_grievances(
     )
 
 
+@router.post(
+    "/ingest",
+    response_model=GrievanceIngestResponse,
+    summary="Bulk ingest grievances",
+    description=(
+        "Stream NDJSON (one GrievanceCreateRequest object per line, plus optional "
+        "department_code and submitted_at) or CSV with a header row. Rows are validated "
+        "individually and inserted in batches; invalid rows are reported, not fatal. "
+        "Supervisor/Admin only."
+    ),
+)
+async def ingest_grievances(
+    request: Request,
+    fmt: Optional[str] = Query(
+        None,
+        alias="format",
+        pattern=r"^(ndjson|csv)$",
+        description="Body format (default: from Content-Type, text/csv or NDJSON)",
+    ),
+    db: AsyncSession = Depends(get_db_session),
+    current_user: User = Depends(require_role(["supervisor", "admin"])),
+) -> Union[GrievanceIngestResponse, JSONResponse]:
+    """Bulk ingest grievances from a streamed NDJSON or CSV body.
+
+    Args:
+        request: Raw request (body is streamed, never buffered whole)
+        fmt: ndjson or csv (`format` query parameter)
+        db: Database session
+        current_user: Authenticated supervisor/admin
+
+    Returns:
+        GrievanceIngestResponse with counts and per-row errors. If the body
+        stops being valid UTF-8 partway through, a 400 error whose details
+        hold the same report: rows before `stopped_at_line` are committed,
+        so the client resumes from that line instead of resending everything.
+    """
+    if fmt is None:
+        content_type = request.headers.get("content-type", "")
+        fmt = "csv" if "csv" in content_type else "ndjson"
+
+    ingestor = GrievanceIngestor(db)
+    report = await ingestor.ingest(iter_records(fmt, request.stream()))
+
+    logger.info(
+        f"Ingest by {current_user.username}: {report.inserted} inserted, "
+        f"{report.failed} failed of {report.total_rows}"
+    )
+
+    response = GrievanceIngestResponse(
+        message=f"Ingested {report.inserted} of {report.total_rows} rows",
+        total_rows=report.total_rows,
+        inserted_count=report.inserted,
+        failed_count=report.failed,
+        errors=report.errors,
+        errors_truncated=report.errors_truncated,
+        stopped_at_line=report.stopped_at_line,
+    )
+    if report.stopped_at_line is not None:
+        return create_error_response(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            error="Bad Request",
+            message=f"{report.stop_error}; rows before it were ingested",
+            details=response.model_dump(),
+            request_id=getattr(request.state, "request_id", None),
+        )
+    return response
+
+
+def _text_array(items: List[str]) -> Any:
+    """Bind a list as a single text[] parameter (for `= ANY(:ids)`)."""
+    return bindparam("ids", items, type_=ARRAY(String))
+
+
+def _bulk_update_values(updates: Dict[str, Any]) -> Dict[str, Any]:
+    """Translate a bulk `updates` payload into column values.
+
+    Args:
+        updates: BulkUpdateRequest.updates
+
+    Returns:
+        Column values for the UPDATE (empty if nothing applicable)
+
+    Raises:
+        HTTPException 422: Invalid officer ID or status
+    """
+    values: Dict[str, Any] = {}
+    if "assigned_officer_id" in updates:
+        try:
+            values["assigned_officer_id"] = UUID(str(updates["assigned_officer_id"]))
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Invalid assigned_officer_id: {updates['assigned_officer_id']!r}",
+            )
+        values["assigned_at"] = func.now()
+    if "status" in updates:
+        if updates["status"] not in {s.value for s in GrievanceStatus}:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Invalid status: {updates['status']!r}",
+            )
+        values["status"] = updates["status"]
+    return values
+
+
+def _bulk_update_statement(grievance_ids: List[str], values: Dict[str, Any]) -> Any:
+    """Build the set-based bulk UPDATE.
+
+    Args:
+        grievance_ids: Public grievance IDs (deduplicated)
+        values: Column values from _bulk_update_values
+
+    Returns:
+        UPDATE ... WHERE grievance_id = ANY(:ids) RETURNING id, grievance_id
+    """
+    return (
+        update(Grievance)
+        .where(
+            Grievance.grievance_id == any_(_text_array(grievance_ids)),
+            Grievance.deleted_at.is_(None),
+        )
+        .values(**values)
+        .returning(Grievance.id, Grievance.grievance_id)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def _insert_bulk_audit_logs(
+    db: AsyncSession,
+    grievance_ids: List[UUID],
+    user: User,
+    updates: Dict[str, Any],
+) -> None:
+    """Write one audit entry per updated grievance in a single INSERT.
+
+    Fetches the tail of each grievance's hash chain in one query so the
+    new entries chain onto it.
+
+    Args:
+        db: Database session
+        grievance_ids: Internal UUIDs of updated grievances
+        user: Acting user
+        updates: Applied updates (recorded as details)
+    """
+    previous_stmt = (
+        select(AuditLog.grievance_id, AuditLog.current_hash)
+        .where(AuditLog.grievance_id.in_(grievance_ids))
+        .distinct(AuditLog.grievance_id)
+        .order_by(AuditLog.grievance_id, AuditLog.timestamp.desc())
+    )
+    previous = {row.grievance_id: row.current_hash for row in (await db.execute(previous_stmt)).all()}
+
+    action = "bulk_update"
+    details = json.dumps(updates, sort_keys=True, default=str)
+    timestamp = datetime.now(timezone.utc)
+    rows = [
+        {
+            "id": uuid4(),
+            "grievance_id": gid,
+            "user_id": user.id,
+            "action": action,
+            "details": details,
+            "previous_hash": previous.get(gid),
+            "current_hash": AuditLog.compute_hash(
+                previous.get(gid), gid, user.id, action, details, timestamp
+            ),
+            "timestamp": timestamp,
+        }
+        for gid in grievance_ids
+    ]
+    await db.execute(insert(AuditLog).values(rows))
+
+
+def _grievance_list_query() -> Select[Any]:
+    """Build the projection used by list endpoints.
+
+    Selects only the columns the list response needs and joins district and
+    department names in the same statement, so a page is one round-trip and
+    no relationship loaders fire.
+    """
+    return (
+        select(
+            Grievance.id,
+            Grievance.grievance_id,
+            Grievance.citizen_name,
+            Grievance.citizen_phone,
+            Grievance.citizen_email,
+            Grievance.citizen_address,
+            Grievance.status,
+            Grievance.priority,
+            Grievance.district_id,
+            Grievance.department_id,
+            Grievance.assigned_officer_id,
+            Grievance.sla_days,
+            Grievance.due_date,
+            Grievance.grievance_text,
+            Grievance.language,
+            Grievance.channel,
+            Grievance.created_at,
+            Grievance.updated_at,
+            Grievance.resolved_at,
+            Grievance.verified_at,
+            District.district_code,
+            District.district_name,
+            Department.dept_code,
+            Department.dept_name,
+            Department.name_telugu.label("dept_name_telugu"),
+        )
+        .join(District, District.id == Grievance.district_id)
+        .outerjoin(Department, Department.id == Grievance.department_id)
+    )
+
+
+def _grievance_dict(
+    source: Any,
+    department: Optional[Dict[str, Any]],
+    district: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Build grievance response dict.
+
+    Args:
+        source: Grievance, or a _grievance_list_query row (same attribute
+            names for the grievance columns)
+        department: Department sub-object, or None if unassigned
+        district: District sub-object
+    """
+    return {
+        "id": str(source.id),
+        "grievance_id": source.grievance_id,
+        "citizen_name": source.citizen_name,
+        "citizen_phone": source.citizen_phone,
+        "citizen_email": source.citizen_email,
+        "citizen_address": source.citizen_address,
+        "status": source.status,
+        "priority": source.priority,
+        "department": department,
+        "district": district,
+        "assigned_officer": {
+            "id": str(source.assigned_officer_id),
+        } if source.assigned_officer_id else None,
+        "sla_days": source.sla_days,
+        "due_date": source.due_date.isoformat() if source.due_date else None,
+        "grievance_text": source.grievance_text,
+        "language": source.language,
+        "channel": source.channel,
+        "created_at": source.created_at.isoformat() if source.created_at else None,
+        "updated_at": source.updated_at.isoformat() if source.updated_at else None,
+        "resolved_at": source.resolved_at.isoformat() if source.resolved_at else None,
+        "verified_at": source.verified_at.isoformat() if source.verified_at else None,
+    }
+
+
+def _build_grievance_list_item(row: Row[Any]) -> Dict[str, Any]:
+    """Build grievance response dict from a _grievance_list_query row."""
+    return _grievance_dict(
+        row,
+        department={
+            "id": str(row.department_id),
+            "code": row.dept_code,
+            "name": row.dept_name,
+            "name_telugu": row.dept_name_telugu,
+        } if row.department_id and row.dept_code else None,
+        district={
+            "id": str(row.district_id),
+            "code": row.district_code,
+            "name": row.district_name,
+        },
+    )
+
+
 def _build_grievance_response(
     grievance: Grievance,
     district: Optional[District],
     department: Optional[Department],
 ) -> Dict[str, Any]:
-    """Build grievance response dict."""
-    return {
-        "id": str(grievance.id),
-        "grievance_id": grievance.grievance_id,
-        "citizen_name": grievance.citizen_name,
-        "citizen_phone": grievance.citizen_phone,
-        "citizen_email": grievance.citizen_email,
-        "citizen_address": grievance.citizen_address,
-        "status": grievance.status,
-        "priority": grievance.priority,
-        "department": {
+    """Build grievance response dict from loaded models."""
+    return _grievance_dict(
+        grievance,
+        department={
             "id": str(department.id),
             "code": department.dept_code,
             "name": department.dept_name,
             "name_telugu": department.name_telugu,
         } if department else None,
-        "district": {
+        district={
             "id": str(district.id),
             "code": district.district_code,
             "name": district.district_name,
         } if district else None,
-        "assigned_officer": {
-            "id": str(grievance.assigned_officer_id),
-        } if grievance.assigned_officer_id else None,
-        "sla_days": grievance.sla_days,
-        "due_date": grievance.due_date.isoformat() if grievance.due_date else None,
-        "grievance_text": grievance.grievance_text,
-        "language": grievance.language,
-        "channel": grievance.channel,
-        "created_at": grievance.created_at.isoformat() if grievance.created_at else None,
-        "updated_at": grievance.updated_at.isoformat() if grievance.updated_at else None,
-        "resolved_at": grievance.resolved_at.isoformat() if grievance.resolved_at else None,
-        "verified_at": grievance.verified_at.isoformat() if grievance.verified_at else None,
-    }
+    )
 
 
 @router.get(
@@ -6,7 +6,13 @@ from fastapi import APIRouter
 
 from app.config import settings
 from app.database.connection import get_db_service
+from app.services.classification_pipeline import get_classification_pipeline
+from app.services.nlp_service import get_nlp_service
+from app.services.principal_cache import get_principal_cache
 from app.services.rate_limiter import get_rate_limiter
+from app.services.redis_manager import get_redis_manager
+from app.services.storage_service import get_storage_service
+from app.utils.password import get_password_hash_pool
 
 router = APIRouter()
 
@@ -60,10 +66,36 @@ async def database_health_check() -> Dict[str, Any]:
     return health
 
 
+async def _redis_health() -> Dict[str, Any]:
+    """Redis health with shared pool usage, never raising."""
+    try:
+        redis_health = await get_rate_limiter().health_check()
+    except Exception as e:
+        redis_health = {"status": "unhealthy", "error": str(e)}
+    redis_health["pools"] = get_redis_manager().stats()
+    return redis_health
+
+
+async def _nlp_health() -> Dict[str, Any]:
+    """NLP service health, never raising."""
+    try:
+        return await get_nlp_service().health_check()
+    except Exception as e:
+        return {"status": "unhealthy", "error": str(e)}
+
+
+async def _storage_health() -> Dict[str, Any]:
+    """Attachment storage health, never raising."""
+    try:
+        return await get_storage_service().health_check()
+    except Exception as e:
+        return {"status": "unhealthy", "error": str(e)}
+
+
 @router.get("/health/full")
 async def general_health_check() -> Dict[str, Any]:
     """
-    Full application health check (database + redis).
+    Full application health check (database + redis + NLP + classification queue).
 
     Note: Use /health for basic health check (Railway/load balancers).
 
@@ -72,6 +104,10 @@ async def general_health_check() -> Dict[str, Any]:
             "status": "healthy" | "degraded" | "unhealthy",
             "database": {...database health...},
             "redis": {...redis health...},
+            "nlp": {...NLP service health, circuit breaker state and trips...},
+            "classification": {...queue depth, wait times, rejections...},
+            "password_hashing": {...bcrypt pool queue depth and wait times...},
+            "storage": {...upload storage backend health...},
             "version": "1.0.0",
             "environment": "development" | "production"
         }
@@ -94,24 +130,32 @@ async def general_health_check() -> Dict[str, Any]:
         overall_status = "degraded"
         db_health = {"connected": False, "error": "Database not initialized", "status": "unhealthy"}
 
-    # Check Redis health
-    redis_health: Dict[str, Any] = {"status": "unknown"}
-    try:
-        rate_limiter = get_rate_limiter()
-        redis_health = await rate_limiter.health_check()
-        if redis_health.get("status") == "unhealthy":
-            # Redis unhealthy is degraded, not critical (we have in-memory fallback)
-            if overall_status == "healthy":
-                overall_status = "degraded"
-    except Exception as e:
-        redis_health = {"status": "unhealthy", "error": str(e)}
-        if overall_status == "healthy":
-            overall_status = "degraded"
+    # Redis unhealthy is degraded, not critical (we have in-memory fallback),
+    # as are the NLP service (circuit breaker open = submissions fall back
+    # immediately), background classification back-pressure (async
+    # classification mode) and attachment storage (S3 unreachable = uploads
+    # and downloads fail)
+    redis_health = await _redis_health()
+    nlp_health = await _nlp_health()
+    classification = get_classification_pipeline().stats()
+    storage_health = await _storage_health()
+    if overall_status == "healthy" and (
+        redis_health.get("status") == "unhealthy"
+        or nlp_health.get("status") not in ("healthy", "disabled")
+        or classification["status"] == "saturated"
+        or storage_health["status"] != "healthy"
+    ):
+        overall_status = "degraded"
 
     return {
         "status": overall_status,
         "database": db_health,
         "redis": redis_health,
+        "nlp": nlp_health,
+        "classification": classification,
+        "principal_cache": get_principal_cache().stats(),
+        "password_hashing": get_password_hash_pool().stats(),
+        "storage": storage_health,
         "version": settings.APP_VERSION,
         "environment": settings.ENVIRONMENT,
     }
@@ -131,7 +175,8 @@ async def redis_health_check() -> Dict[str, Any]:
         {
             "status": "healthy" | "unhealthy" | "disabled",
             "backend": "redis" | "in_memory",
-            "enabled": bool
+            "enabled": bool,
+            "pools": {...shared connection pool usage...}
         }
 
     Example Response (Healthy):
@@ -152,4 +197,5 @@ async def redis_health_check() -> Dict[str, Any]:
     """
     rate_limiter = get_rate_limiter()
     health = await rate_limiter.health_check()
+    health["pools"] = get_redis_manager().stats()
     return health
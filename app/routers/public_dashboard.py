@@ -20,7 +20,7 @@ from pydantic import BaseModel, Field
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database.connection import get_db_session
+from app.database.connection import get_read_db_session
 from app.models.department import Department
 from app.models.district import District
 from app.models.grievance import Grievance
@@ -313,7 +313,7 @@ async def get_dashboard(
     district: Optional[str] = Query(
         None, description="Filter by district name (case-insensitive)"
     ),
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_read_db_session),
 ) -> DashboardResponse:
     """Get complete public dashboard data."""
     # Get district if specified
@@ -343,7 +343,7 @@ async def get_dashboard(
 )
 async def get_kpis(
     district: Optional[str] = Query(None, description="Filter by district name"),
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_read_db_session),
 ) -> List[KPIMetric]:
     """Get key performance indicators."""
     district_obj = await get_district_by_name(db, district)
@@ -359,7 +359,7 @@ async def get_kpis(
 )
 async def get_empathy_metrics(
     district: Optional[str] = Query(None, description="Filter by district name"),
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_read_db_session),
 ) -> Dict[str, float]:
     """Get empathy metrics."""
     district_obj = await get_district_by_name(db, district)
@@ -382,7 +382,7 @@ async def get_empathy_metrics(
 )
 async def get_department_stats(
     district: Optional[str] = Query(None, description="Filter by district name"),
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_read_db_session),
 ) -> List[DepartmentStat]:
     """Get department statistics."""
     district_obj = await get_district_by_name(db, district)
@@ -398,7 +398,7 @@ async def get_department_stats(
 )
 async def get_trends(
     district: Optional[str] = Query(None, description="Filter by district name"),
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_read_db_session),
 ) -> List[TrendDataPoint]:
     """Get monthly trends."""
     district_obj = await get_district_by_name(db, district)
@@ -413,7 +413,7 @@ async def get_trends(
     description="Returns list of all districts for filter dropdown.",
 )
 async def get_districts(
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_read_db_session),
 ) -> List[DistrictInfo]:
     """Get list of all districts."""
     stmt = select(District).order_by(District.district_name)
@@ -171,7 +171,7 @@ class GrievanceUpdateRequest(BaseModel):
 class GrievanceResponse(BaseModel):
     """Response schema for grievance (basic)"""
     id: str = Field(..., description="Grievance UUID")
-    grievance_id: str = Field(..., pattern=r'^PGRS-\d{4}-\d{2}-\d{5}$', description="Public grievance ID")
+    grievance_id: str = Field(..., pattern=r'^PGRS-\d{4}-\d{2}-\d{5,}$', description="Public grievance ID")
     citizen_name: str
     citizen_phone: str
     citizen_email: Optional[str] = None
@@ -310,7 +310,10 @@ class GrievanceListResponse(BaseModel):
                     "page": 1,
                     "page_size": 50,
                     "total_items": 1234,
-                    "total_pages": 25
+                    "total_pages": 25,
+                    "total_is_estimate": False,
+                    "has_more": True,
+                    "next_cursor": "eyJjIjoiMjAyNS0xMS0yNFQxMDozMDowMCswMDowMCIsImkiOiI1NTBlODQwMC1lMjliLTQxZDQtYTcxNi00NDY2NTU0NDAwMDAifQ"
                 }
             }
         }
@@ -319,7 +322,7 @@ class GrievanceListResponse(BaseModel):
 
 class GrievancePublicResponse(BaseModel):
     """Public grievance response (no PII)"""
-    grievance_id: str = Field(..., pattern=r'^PGRS-\d{4}-\d{2}-\d{5}$')
+    grievance_id: str = Field(..., pattern=r'^PGRS-\d{4}-\d{2}-\d{5,}$')
     status: GrievanceStatus
     submitted_at: datetime
     estimated_resolution_date: Optional[datetime] = None
@@ -406,6 +409,38 @@ class BulkUpdateResponse(BaseModel):
     )
 
 
+class GrievanceIngestRow(GrievanceCreateRequest):
+    """One record of a bulk ingest (NDJSON line or CSV row)"""
+    department_code: Optional[str] = Field(None, max_length=20, description="Department code (alternative to department_id)")
+    submitted_at: Optional[datetime] = Field(None, description="Original submission time (legacy imports); defaults to now")
+
+
+class GrievanceIngestResponse(BaseModel):
+    """Bulk ingest response"""
+    message: str
+    total_rows: int
+    inserted_count: int
+    failed_count: int
+    errors: List[Dict[str, Any]]
+    errors_truncated: bool = False
+    stopped_at_line: Optional[int] = None
+
+    model_config = ConfigDict(
+        json_schema_extra = {
+            "example": {
+                "message": "Ingested 2 of 3 rows",
+                "total_rows": 3,
+                "inserted_count": 2,
+                "failed_count": 1,
+                "errors": [
+                    {"line": 3, "error": "citizen_phone: String should match pattern '^\\+91[6-9]\\d{9}$'"}
+                ],
+                "errors_truncated": False
+            }
+        }
+    )
+
+
 class OTPResponse(BaseModel):
     """OTP request response"""
     message: str = Field(..., description="Confirmation message with masked phone")
@@ -16,7 +16,7 @@ from app.services.whatsapp_service import (
     TwilioWhatsAppService,
     MockWhatsAppService,
 )
-from app.services.storage_service import IStorageService, LocalStorageService
+from app.services.storage_service import IStorageService, LocalStorageService, S3StorageService
 from app.services.rate_limiter import IRateLimiter, RedisRateLimiter, InMemoryRateLimiter
 from app.services.otp_service import IOTPService, RedisOTPService, InMemoryOTPService
 
@@ -36,6 +36,7 @@ __all__ = [
     # Storage
     "IStorageService",
     "LocalStorageService",
+    "S3StorageService",
     # Rate Limiter
     "IRateLimiter",
     "RedisRateLimiter",
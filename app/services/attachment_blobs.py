@@ -0,0 +1,174 @@
+"""Reference counting for content-addressed attachment blobs.
+
+Every attachment with a file_hash holds one reference on the
+attachment_blobs row for that hash:
+
+- acquire_blob increments (or creates) the row with one upsert.
+- release_blob decrements it and, at zero, deletes the row and returns the
+  blob path. The caller removes the file with remove_unreferenced_blob only
+  after its transaction commits, so a failed commit never leaves an
+  attachment pointing at a deleted file.
+
+An upload that had to store its blob again records the new path with
+repoint_blob.
+
+acquire_blob and remove_unreferenced_blob both take a transaction-scoped
+advisory lock on the hash. A blob is therefore only unlinked while no
+upload can be taking a new reference on it, and an upload that found the
+blob already stored checks it still exists once it holds the lock (see
+blob_needs_rewrite).
+"""
+
+import logging
+from typing import Optional
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.attachment_blob import AttachmentBlob
+from app.services.storage_service import IStorageService, StorageResult
+
+logger = logging.getLogger(__name__)
+
+
+async def _lock_blob(db: AsyncSession, file_hash: str) -> None:
+    """Take the blob's advisory lock until the transaction ends."""
+    await db.execute(select(func.pg_advisory_xact_lock(func.hashtext(file_hash))))
+
+
+async def acquire_blob(db: AsyncSession, upload: StorageResult) -> int:
+    """Add a reference to the blob for an upload.
+
+    Args:
+        db: Database session (the blob stays locked until it commits)
+        upload: Successful upload result with file_hash and file_path
+
+    Returns:
+        Reference count including this one
+
+    Raises:
+        ValueError: Upload result has no file_hash
+    """
+    if upload.file_hash is None:
+        raise ValueError("Upload result has no file_hash")
+    await _lock_blob(db, upload.file_hash)
+    stmt = (
+        insert(AttachmentBlob)
+        .values(
+            file_hash=upload.file_hash,
+            file_path=upload.file_path,
+            file_size=upload.file_size_bytes,
+            ref_count=1,
+        )
+        .on_conflict_do_update(
+            index_elements=[AttachmentBlob.file_hash],
+            set_={"ref_count": AttachmentBlob.ref_count + 1},
+        )
+        .returning(AttachmentBlob.ref_count)
+    )
+    return int((await db.execute(stmt)).scalar_one())
+
+
+async def blob_needs_rewrite(
+    storage: IStorageService,
+    upload: StorageResult,
+    ref_count: int,
+) -> bool:
+    """Check whether a de-duplicated upload lost its blob to a concurrent delete.
+
+    A first reference (ref_count == 1) on content that was already stored
+    means the blob was unreferenced when uploaded. If the file is gone now,
+    it was removed by the delete that dropped the previous last reference,
+    and the upload must be written again.
+
+    Args:
+        storage: Storage service holding the blob
+        upload: Upload result
+        ref_count: Count returned by acquire_blob
+
+    Returns:
+        True if the caller must store the content again
+    """
+    if not upload.deduplicated or ref_count != 1 or upload.file_path is None:
+        return False
+    return not await storage.file_exists(upload.file_path)
+
+
+async def repoint_blob(db: AsyncSession, upload: StorageResult) -> None:
+    """Record the path a blob was written again to (see blob_needs_rewrite).
+
+    The new copy takes the extension of this upload's file name, which may
+    differ from the lost blob's. Call it in the transaction that acquired
+    the blob, while its lock is held.
+
+    Args:
+        db: Database session
+        upload: Result of the second upload_file
+    """
+    await db.execute(
+        update(AttachmentBlob)
+        .where(AttachmentBlob.file_hash == upload.file_hash)
+        .values(file_path=upload.file_path)
+    )
+
+
+async def release_blob(db: AsyncSession, file_hash: str) -> Optional[str]:
+    """Drop a reference to a blob.
+
+    Args:
+        db: Database session
+        file_hash: SHA-256 of the attachment's content
+
+    Returns:
+        Path of the blob to remove (with remove_unreferenced_blob, after
+        commit) if this was its last reference, else None
+    """
+    stmt = (
+        update(AttachmentBlob)
+        .where(AttachmentBlob.file_hash == file_hash)
+        .values(ref_count=AttachmentBlob.ref_count - 1)
+        .returning(AttachmentBlob.ref_count, AttachmentBlob.file_path)
+    )
+    row = (await db.execute(stmt)).one_or_none()
+    if row is None:
+        logger.warning(f"No blob row for attachment hash {file_hash}")
+        return None
+
+    ref_count, file_path = row
+    if ref_count > 0:
+        return None
+
+    await db.execute(delete(AttachmentBlob).where(AttachmentBlob.file_hash == file_hash))
+    return str(file_path)
+
+
+async def remove_unreferenced_blob(
+    db: AsyncSession,
+    storage: IStorageService,
+    file_hash: str,
+    file_path: str,
+) -> bool:
+    """Delete a blob file whose last reference was released and committed.
+
+    Runs in its own short transaction: under the blob's advisory lock, the
+    file is only removed if no upload has re-created the blob row since.
+
+    Args:
+        db: Database session with no pending changes
+        storage: Storage service holding the blob
+        file_hash: SHA-256 of the blob
+        file_path: Path returned by release_blob
+
+    Returns:
+        True if the file was deleted
+    """
+    try:
+        await _lock_blob(db, file_hash)
+        referenced = (await db.execute(
+            select(AttachmentBlob.file_hash).where(AttachmentBlob.file_hash == file_hash)
+        )).first() is not None
+        deleted = False if referenced else await storage.delete_file(file_path)
+    finally:
+        await db.commit()  # releases the advisory lock
+    return deleted
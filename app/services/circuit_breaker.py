@@ -0,0 +1,190 @@
+"""Circuit breaker for external service calls.
+
+Tracks the outcome and latency of the most recent calls in a sliding
+window. The circuit opens when, over at least `min_calls` calls, the error
+rate reaches `error_rate_threshold` or the latency percentile reaches
+`latency_threshold_ms`. While open, callers fail fast instead of waiting
+for a timeout. After `open_seconds` the circuit is half-open: a limited
+number of trial calls go through; a fast success closes it, a failure or
+slow response opens it again.
+"""
+
+import logging
+import math
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Deque, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Error-rate and latency driven circuit breaker (single event loop)."""
+
+    def __init__(
+        self,
+        name: str,
+        window_size: int = 20,
+        min_calls: int = 10,
+        error_rate_threshold: float = 0.5,
+        latency_threshold_ms: Optional[float] = None,
+        latency_percentile: float = 0.95,
+        open_seconds: float = 30.0,
+        half_open_max_calls: int = 1,
+    ):
+        self.name = name
+        self.window_size = window_size
+        self.min_calls = min_calls
+        self.error_rate_threshold = error_rate_threshold
+        self.latency_threshold_ms = latency_threshold_ms
+        self.latency_percentile = latency_percentile
+        self.open_seconds = open_seconds
+        self.half_open_max_calls = half_open_max_calls
+
+        # (succeeded, latency_ms) of the most recent calls
+        self._calls: Deque[Tuple[bool, float]] = deque(maxlen=window_size)
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._half_open_since = 0.0
+        self._half_open_in_flight = 0
+
+        self.trips = 0
+        self.rejected = 0
+        self.last_trip_reason: Optional[str] = None
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state (an expired open circuit reports half-open)."""
+        if (
+            self._state == CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self.open_seconds
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._half_open_since = time.monotonic()
+            self._half_open_in_flight = 0
+            logger.info(f"Circuit '{self.name}' half-open, allowing trial calls")
+        elif (
+            self._state == CircuitState.HALF_OPEN
+            and time.monotonic() - self._half_open_since >= self.open_seconds
+        ):
+            # Trial calls never reported back (e.g. cancelled); allow new ones
+            self._half_open_since = time.monotonic()
+            self._half_open_in_flight = 0
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Check whether a call may proceed, reserving a trial slot if half-open.
+
+        Returns:
+            False if the caller should fail fast
+        """
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return True
+        if state == CircuitState.HALF_OPEN and self._half_open_in_flight < self.half_open_max_calls:
+            self._half_open_in_flight += 1
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self, latency_ms: float) -> None:
+        """Record a completed call.
+
+        Args:
+            latency_ms: Call duration
+        """
+        slow = self.latency_threshold_ms is not None and latency_ms >= self.latency_threshold_ms
+        if self._state == CircuitState.HALF_OPEN:
+            if slow:
+                self._trip(f"trial call took {latency_ms:.0f}ms")
+            else:
+                self._close()
+            return
+
+        self._calls.append((True, latency_ms))
+        self._evaluate()
+
+    def record_failure(self, latency_ms: float = 0.0) -> None:
+        """Record a failed call (error, timeout or bad status).
+
+        Args:
+            latency_ms: Time spent before the failure
+        """
+        if self._state == CircuitState.HALF_OPEN:
+            self._trip("trial call failed")
+            return
+
+        self._calls.append((False, latency_ms))
+        self._evaluate()
+
+    def _latency_percentile(self) -> float:
+        latencies = sorted(latency for _, latency in self._calls)
+        index = max(0, math.ceil(self.latency_percentile * len(latencies)) - 1)
+        return latencies[index]
+
+    def _error_rate(self) -> float:
+        return sum(1 for ok, _ in self._calls if not ok) / len(self._calls)
+
+    def _evaluate(self) -> None:
+        """Open the circuit if the window breaches a threshold."""
+        if self._state != CircuitState.CLOSED or len(self._calls) < self.min_calls:
+            return
+
+        error_rate = self._error_rate()
+        if error_rate >= self.error_rate_threshold:
+            self._trip(f"error rate {error_rate:.0%}")
+            return
+
+        if self.latency_threshold_ms is not None:
+            latency = self._latency_percentile()
+            if latency >= self.latency_threshold_ms:
+                self._trip(f"p{self.latency_percentile * 100:g} latency {latency:.0f}ms")
+
+    def _trip(self, reason: str) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        self._half_open_in_flight = 0
+        self.trips += 1
+        self.last_trip_reason = reason
+        logger.warning(
+            f"Circuit '{self.name}' opened ({reason}); failing fast for {self.open_seconds:g}s"
+        )
+
+    def _close(self) -> None:
+        self._state = CircuitState.CLOSED
+        self._calls.clear()
+        self._half_open_in_flight = 0
+        logger.info(f"Circuit '{self.name}' closed")
+
+    def stats(self) -> Dict[str, Any]:
+        """Get breaker state and counters.
+
+        Returns:
+            Dict with state, trips, rejections and window metrics
+        """
+        state = self.state
+        stats: Dict[str, Any] = {
+            "state": state.value,
+            "trips": self.trips,
+            "rejected": self.rejected,
+            "last_trip_reason": self.last_trip_reason,
+            "window_calls": len(self._calls),
+            "error_rate": round(self._error_rate(), 4) if self._calls else 0.0,
+            "latency_percentile": self.latency_percentile,
+            "latency_percentile_ms": (
+                round(self._latency_percentile(), 2) if self._calls else 0.0
+            ),
+        }
+        if state == CircuitState.OPEN:
+            remaining = self.open_seconds - (time.monotonic() - self._opened_at)
+            stats["retry_in_seconds"] = round(max(0.0, remaining), 1)
+        return stats
@@ -6,9 +6,9 @@ providing opt-in management, rights information, and proactive triggers.
 
 import logging
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
@@ -31,6 +31,11 @@ from app.schemas.citizen_empowerment import (
     TriggerResponse,
 )
 from app.services.interfaces.empowerment_service import ICitizenEmpowermentService
+from app.services.notification_dispatcher import (
+    DispatchReport,
+    Notification,
+    NotificationDispatcher,
+)
 from app.templates.empowerment_messages import (
     OPT_IN_PROMPT_EN,
     OPT_IN_PROMPT_TE,
@@ -288,46 +293,58 @@ class CitizenEmpowermentService(ICitizenEmpowermentService):
     async def check_proactive_triggers(self) -> List[Dict[str, Any]]:
         """Check all grievances for proactive trigger conditions.
 
+        Messages for all triggers go out as one batch through the
+        notification dispatcher, at most one per citizen per day.
+
         Returns:
             List of triggered actions
         """
-        triggers_fired: List[Dict[str, Any]] = []
+        dispatcher = NotificationDispatcher(self._db)
+        candidates: List[Tuple[Grievance, ProactiveTriggerConfig]] = []
 
         # Get enabled trigger configs
         configs = await self._get_enabled_triggers()
 
         for config in configs:
-            grievances = await self._get_grievances_for_trigger(config)
-
-            for grievance in grievances:
-                # Check if citizen opted in
-                if not grievance.citizen_phone:
-                    continue
-
-                pref = await self._get_preference(grievance.citizen_phone)
-                if pref is None or not pref.opted_in:
-                    continue
+            dispatcher.register_template(
+                config.trigger_type,
+                te=config.message_template_te,
+                en=config.message_template_en,
+            )
+            for grievance in await self._get_grievances_for_trigger(config):
+                if grievance.citizen_phone:
+                    candidates.append((grievance, config))
 
-                # Check if we already sent this trigger today
-                already_sent = await self._check_trigger_sent_today(
-                    grievance.grievance_id, config.trigger_type
-                )
-                if already_sent:
-                    continue
+        # Only citizens who opted in
+        languages = await self._get_opted_in_languages(
+            {g.citizen_phone for g, _ in candidates if g.citizen_phone}
+        )
 
-                # Send proactive message
-                result = await self.send_proactive_empowerment(
-                    grievance.grievance_id,
-                    config.trigger_type,
-                )
+        notifications = [
+            Notification(
+                phone=grievance.citizen_phone,
+                template=config.trigger_type,
+                params=self._proactive_params(grievance),
+                language=languages[grievance.citizen_phone],
+                interaction_type=InteractionType.PROACTIVE_TRIGGER,
+                grievance_id=grievance.grievance_id,
+                trigger_reason=config.trigger_type,
+            )
+            for grievance, config in candidates
+            if grievance.citizen_phone in languages
+        ]
 
-                triggers_fired.append({
-                    "grievance_id": grievance.grievance_id,
-                    "trigger_type": config.trigger_type,
-                    "success": result.success,
-                })
+        report = await dispatcher.dispatch(notifications)
 
-        return triggers_fired
+        return [
+            {
+                "grievance_id": r.notification.grievance_id,
+                "trigger_type": r.notification.trigger_reason,
+                "success": r.status == "sent",
+            }
+            for r in report.results
+            if r.status != "skipped"
+        ]
 
     async def send_proactive_empowerment(
         self,
@@ -382,17 +399,7 @@ class CitizenEmpowermentService(ICitizenEmpowermentService):
             else config.message_template_en
         )
 
-        # Calculate days
-        days_elapsed = (datetime.utcnow() - grievance.created_at).days
-        sla_days = grievance.sla_days or 30
-        days_remaining = sla_days - days_elapsed
-
-        message = template.format(
-            case_id=grievance_id,
-            days_elapsed=days_elapsed,
-            days_remaining=max(0, days_remaining),
-            status=grievance.status,
-        )
+        message = template.format(**self._proactive_params(grievance))
 
         # Log interaction
         await self._log_interaction(
@@ -444,6 +451,31 @@ class CitizenEmpowermentService(ICitizenEmpowermentService):
         # Send via WhatsApp
         return await self._send_message(citizen_phone, message)
 
+    async def send_opt_in_prompts(
+        self,
+        prompts: Sequence[Tuple[str, str, str, str]],
+    ) -> DispatchReport:
+        """Send opt-in prompts as one batch.
+
+        Args:
+            prompts: (grievance_id, citizen_phone, department, language) tuples
+
+        Returns:
+            DispatchReport with one result per prompt, in order
+        """
+        notifications = [
+            Notification(
+                phone=citizen_phone,
+                template="OPT_IN_PROMPT",
+                params={"case_id": grievance_id, "department": department},
+                language=language,
+                interaction_type=InteractionType.OPT_IN_PROMPT,
+                grievance_id=grievance_id,
+            )
+            for grievance_id, citizen_phone, department, language in prompts
+        ]
+        return await NotificationDispatcher(self._db).dispatch(notifications)
+
     async def list_knowledge_base(
         self,
         department: Optional[str] = None,
@@ -680,21 +712,38 @@ class CitizenEmpowermentService(ICitizenEmpowermentService):
         result = await self._db.execute(stmt)
         return list(result.scalars().all())
 
-    async def _check_trigger_sent_today(
-        self, grievance_id: str, trigger_type: str
-    ) -> bool:
-        """Check if trigger was already sent today."""
-        today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-        stmt = select(func.count(EmpowermentInteraction.id)).where(
-            and_(
-                EmpowermentInteraction.grievance_id == grievance_id,
-                EmpowermentInteraction.trigger_reason == trigger_type,
-                EmpowermentInteraction.created_at >= today_start,
+    async def _get_opted_in_languages(self, phones: Iterable[str]) -> Dict[str, str]:
+        """Preferred language of each opted-in citizen among phones."""
+        languages: Dict[str, str] = {}
+        ordered = sorted(phones)
+        for start in range(0, len(ordered), 1000):
+            stmt = select(
+                CitizenEmpowermentPreference.citizen_phone,
+                CitizenEmpowermentPreference.preferred_language,
+            ).where(
+                and_(
+                    CitizenEmpowermentPreference.citizen_phone.in_(ordered[start:start + 1000]),
+                    CitizenEmpowermentPreference.opted_in.is_(True),
+                )
             )
-        )
-        result = await self._db.execute(stmt)
-        count = result.scalar() or 0
-        return count > 0
+            result = await self._db.execute(stmt)
+            languages.update((phone, language) for phone, language in result.all())
+        return languages
+
+    def _proactive_params(self, grievance: Grievance) -> Dict[str, Any]:
+        """Template parameters for a proactive trigger message."""
+        created_at = grievance.created_at
+        now = datetime.now(created_at.tzinfo) if created_at.tzinfo else datetime.utcnow()
+        days_elapsed = (now - created_at).days
+        sla_days = grievance.sla_days or 30
+        days_remaining = sla_days - days_elapsed
+
+        return {
+            "case_id": grievance.grievance_id,
+            "days_elapsed": days_elapsed,
+            "days_remaining": max(0, days_remaining),
+            "status": grievance.status,
+        }
 
     async def _send_message(self, phone: str, message: str) -> bool:
         """Send message via WhatsApp with SMS fallback.
@@ -0,0 +1,202 @@
+"""Classification cache for NLP department predictions.
+
+Citizens often resubmit the same grievance, and SMS/WhatsApp templates
+produce many identical texts, so predictions are cached by a hash of the
+normalized text, language and district.
+
+Two tiers:
+- an in-process LRU with TTL (always on, bounded by NLP_CACHE_MAX_ENTRIES)
+- an optional Redis tier on REDIS_CACHE_DB shared by all workers
+
+Entries are namespaced by the model version reported by the NLP service.
+When the version changes the local tier is cleared and Redis entries of the
+old version are no longer read (they expire by TTL).
+"""
+
+import hashlib
+import json
+import logging
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from app.config import settings
+from app.services.redis_manager import CheckedRedisClient
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Normalize grievance text for cache lookups.
+
+    NFKC-normalizes (so visually identical Telugu/Devanagari sequences
+    match), case-folds and collapses whitespace.
+    """
+    text = unicodedata.normalize("NFKC", text).casefold()
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def classification_cache_key(
+    text: str,
+    language: str,
+    district_code: Optional[str] = None,
+) -> str:
+    """Hash normalized text, language and district into a cache key.
+
+    Returns:
+        SHA-256 hex digest
+    """
+    material = "\x1f".join((language, district_code or "", normalize_text(text)))
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class ClassificationCache:
+    """Two-tier (LRU + optional Redis) cache of classification results.
+
+    Values are the JSON-serializable dicts produced by
+    ClassificationResult.to_dict().
+    """
+
+    KEY_PREFIX = "nlp:classification:"
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[int] = None,
+        redis_enabled: Optional[bool] = None,
+    ):
+        self.max_entries = max_entries or settings.NLP_CACHE_MAX_ENTRIES
+        self.ttl_seconds = ttl_seconds or settings.NLP_CACHE_TTL
+        if redis_enabled is None:
+            redis_enabled = settings.NLP_CACHE_REDIS_ENABLED
+        self.redis_enabled = redis_enabled
+
+        self.model_version: Optional[str] = None
+        # key -> (expires_at monotonic, value)
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._redis = CheckedRedisClient("classification cache", db=settings.REDIS_CACHE_DB)
+
+        self.hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def _redis_key(self, key: str) -> str:
+        return f"{self.KEY_PREFIX}{self.model_version or 'unversioned'}:{key}"
+
+    def _get_local(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _set_local(self, key: str, value: Dict[str, Any]) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a cached result (local tier first, then Redis).
+
+        Args:
+            key: Key from classification_cache_key()
+
+        Returns:
+            Cached result dict, or None on a miss
+        """
+        value = self._get_local(key)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        if self.redis_enabled:
+            try:
+                client = await self._redis.get()
+                raw = await client.get(self._redis_key(key))
+                if raw is not None:
+                    value = json.loads(raw)
+                    self._set_local(key, value)
+                    self.hits += 1
+                    self.redis_hits += 1
+                    return value
+            except Exception as e:
+                logger.warning(f"Classification cache Redis read failed: {e}")
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store a result in both tiers.
+
+        Args:
+            key: Key from classification_cache_key()
+            value: ClassificationResult.to_dict()
+        """
+        self._set_local(key, value)
+
+        if self.redis_enabled:
+            try:
+                client = await self._redis.get()
+                await client.set(self._redis_key(key), json.dumps(value), ex=self.ttl_seconds)
+            except Exception as e:
+                logger.warning(f"Classification cache Redis write failed: {e}")
+
+    def observe_model_version(self, version: Optional[str]) -> bool:
+        """Record the model version reported by the NLP service.
+
+        Args:
+            version: Reported version (None if the service does not report one)
+
+        Returns:
+            True if the version changed from a previously seen one
+        """
+        if not version or version == self.model_version:
+            return False
+
+        previous = self.model_version
+        self.model_version = version
+        self._entries.clear()
+        if previous is None:
+            return False  # first version seen, not a model change
+
+        self.invalidations += 1
+        logger.info(
+            f"NLP model version changed {previous} -> {version}; classification cache cleared"
+        )
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dict with hit/miss counters and sizes
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "model_version": self.model_version,
+            "redis_enabled": self.redis_enabled,
+        }
+
+    async def close(self) -> None:
+        """Release the Redis client."""
+        self._redis.release()
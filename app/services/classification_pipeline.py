@@ -0,0 +1,438 @@
+"""Post-submit grievance classification pipeline.
+
+In `async` classification mode (NLP_CLASSIFICATION_MODE=async) a new
+grievance is persisted immediately with status `submitted` and no
+department, and a job is queued here. A pool of worker tasks classifies
+queued grievances and assigns department, SLA and due date, so submit
+latency no longer depends on the NLP service.
+
+The queue is bounded (NLP_CLASSIFICATION_QUEUE_SIZE). When it is full the
+job is rejected; `stats()` exposes queue depth, wait times and rejection
+counts as back-pressure signals.
+
+Queued jobs live only in this process, so jobs rejected by a full queue,
+dropped by stop() or lost in a restart or crash are picked up again by a
+recovery sweep (on startup and every NLP_CLASSIFICATION_RECOVERY_INTERVAL
+seconds): grievances still `submitted` with no department, submitted
+within the recovery window, are re-queued. Each is re-queued at most once
+per process, so one the classifier cannot place is left for manual triage
+instead of being retried on every sweep. The UPDATE in process() only
+touches unassigned grievances, so a job recovered by more than one worker
+process is assigned once.
+
+In `sync` mode (the default, used by tests) create_grievance calls
+classify_department inline instead.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Set
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.department import Department
+from app.models.district import District
+from app.models.grievance import Grievance
+from app.services.nlp_service import classify_grievance
+
+logger = logging.getLogger(__name__)
+
+SessionProvider = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+
+
+async def classify_department(
+    db: AsyncSession,
+    text: str,
+    language: str,
+    district_code: Optional[str] = None,
+) -> Optional[Department]:
+    """Classify grievance text and resolve the department it maps to.
+
+    Args:
+        db: Database session
+        text: Grievance text
+        language: Language code
+        district_code: Optional district code for context
+
+    Returns:
+        Department, or None when classification failed, was not confident
+        or named an unknown department (manual assignment needed)
+    """
+    try:
+        classification = await classify_grievance(
+            text=text,
+            language=language,
+            district_code=district_code,
+        )
+    except Exception as e:
+        logger.warning(f"NLP classification failed: {e}. Manual assignment needed.")
+        return None
+
+    if not classification.is_confident():
+        logger.info(
+            f"NLP confidence too low: {classification.confidence:.2f}. "
+            "Manual assignment needed."
+        )
+        return None
+
+    if not classification.department_code:
+        return None
+
+    dept_stmt = select(Department).where(
+        Department.dept_code == classification.department_code
+    )
+    dept_result = await db.execute(dept_stmt)
+    department: Optional[Department] = dept_result.scalar_one_or_none()
+    if department:
+        logger.info(
+            f"NLP classified to {department.dept_code} "
+            f"(confidence: {classification.confidence:.2f})"
+        )
+    return department
+
+
+@dataclass(frozen=True)
+class ClassificationJob:
+    """A persisted grievance awaiting classification.
+
+    Attributes:
+        grievance_id: Internal grievance UUID
+        text: Grievance text
+        language: Language code
+        district_code: District code for classification context
+        submitted_at: Submission time (due date is computed from it)
+        enqueued_at: Monotonic enqueue time (for queue wait metrics)
+    """
+
+    grievance_id: UUID
+    text: str
+    language: str
+    district_code: Optional[str]
+    submitted_at: datetime
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+def _default_session_provider() -> AbstractAsyncContextManager[AsyncSession]:
+    """Open a committing session on the application database."""
+    from app.database.connection import get_db_service
+
+    db_service = get_db_service()
+    if db_service is None:
+        raise RuntimeError("Database not initialized. Call init_db() at startup.")
+    return db_service.get_session()
+
+
+class ClassificationPipeline:
+    """Bounded queue plus worker pool that classifies submitted grievances."""
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        max_queue_size: Optional[int] = None,
+        session_provider: Optional[SessionProvider] = None,
+        recovery_interval: Optional[float] = None,
+    ):
+        self.workers = workers or settings.NLP_CLASSIFICATION_WORKERS
+        self.max_queue_size = max_queue_size or settings.NLP_CLASSIFICATION_QUEUE_SIZE
+        self.session_provider = session_provider or _default_session_provider
+        self.recovery_interval = (
+            recovery_interval or settings.NLP_CLASSIFICATION_RECOVERY_INTERVAL_SECONDS
+        )
+        self._queue: Optional[asyncio.Queue[ClassificationJob]] = None
+        self._tasks: List[asyncio.Task[None]] = []
+        self._sweeper: Optional[asyncio.Task[None]] = None
+        self._in_flight = 0
+        # Grievances queued or in flight, and those re-queued by a sweep
+        # (id -> submitted_at, pruned once outside the recovery window)
+        self._pending_ids: Set[UUID] = set()
+        self._recovered: Dict[UUID, datetime] = {}
+        self._counters: Dict[str, int] = {
+            "enqueued": 0,
+            "rejected": 0,
+            "recovered": 0,
+            "classified": 0,
+            "unclassified": 0,
+            "failed": 0,
+        }
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._total_processing = 0.0
+
+    @property
+    def running(self) -> bool:
+        """Whether workers are accepting jobs."""
+        return bool(self._tasks)
+
+    async def start(self) -> None:
+        """Create the queue and start the worker tasks."""
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"classification-worker-{i}")
+            for i in range(self.workers)
+        ]
+        self._sweeper = asyncio.create_task(self._sweep(), name="classification-recovery")
+        logger.info(
+            f"Classification pipeline started: {self.workers} workers, "
+            f"queue size {self.max_queue_size}"
+        )
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Drain the queue (up to timeout) and stop the workers.
+
+        Jobs still queued after the timeout are dropped; the recovery sweep
+        of the next start re-queues their grievances.
+
+        Args:
+            timeout: Seconds to wait for queued jobs to finish
+        """
+        if not self.running:
+            return
+        assert self._queue is not None
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            await asyncio.gather(self._sweeper, return_exceptions=True)
+            self._sweeper = None
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Classification pipeline stopped with {self._queue.qsize()} "
+                "jobs pending; the next recovery sweep re-queues them"
+            )
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+
+    def submit(self, job: ClassificationJob) -> bool:
+        """Queue a job without waiting.
+
+        Args:
+            job: Classification job for a committed grievance
+
+        Returns:
+            True if queued, False if the pipeline is stopped or full
+        """
+        if self._queue is None:
+            self._counters["rejected"] += 1
+            logger.warning(f"Classification pipeline not running; {job.grievance_id} left for recovery")
+            return False
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            self._counters["rejected"] += 1
+            logger.warning(f"Classification queue full; {job.grievance_id} left for recovery")
+            return False
+        self._pending_ids.add(job.grievance_id)
+        self._counters["enqueued"] += 1
+        return True
+
+    async def join(self) -> None:
+        """Wait until every queued job has been processed."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def _worker(self) -> None:
+        """Process jobs until cancelled."""
+        assert self._queue is not None
+        queue = self._queue
+        while True:
+            job = await queue.get()
+            wait = time.monotonic() - job.enqueued_at
+            self._total_wait += wait
+            self._max_wait = max(self._max_wait, wait)
+            self._in_flight += 1
+            started = time.monotonic()
+            try:
+                await self.process(job)
+            except Exception as e:
+                self._counters["failed"] += 1
+                logger.error(f"Classification of {job.grievance_id} failed: {e}")
+            finally:
+                self._total_processing += time.monotonic() - started
+                self._in_flight -= 1
+                self._pending_ids.discard(job.grievance_id)
+                queue.task_done()
+
+    async def _sweep(self) -> None:
+        """Run the recovery sweep every recovery_interval seconds until cancelled."""
+        while True:
+            await asyncio.sleep(self.recovery_interval)
+            try:
+                await self.recover()
+            except Exception as e:
+                logger.error(f"Classification recovery sweep failed: {e}")
+
+    async def recover(self) -> int:
+        """Re-queue submitted grievances whose classification job was lost.
+
+        Selects grievances still `submitted` with no department, submitted
+        between NLP_CLASSIFICATION_RECOVERY_WINDOW_HOURS and
+        NLP_CLASSIFICATION_RECOVERY_GRACE_SECONDS ago, that are not queued
+        here and were not re-queued by an earlier sweep. At most the free
+        queue capacity is taken per sweep.
+
+        Returns:
+            Number of jobs re-queued
+        """
+        if self._queue is None:
+            return 0
+        now = datetime.now(timezone.utc)
+        window_start = now - timedelta(hours=settings.NLP_CLASSIFICATION_RECOVERY_WINDOW_HOURS)
+        self._recovered = {
+            grievance_id: submitted_at
+            for grievance_id, submitted_at in self._recovered.items()
+            if submitted_at >= window_start
+        }
+        free = self.max_queue_size - self._queue.qsize()
+        if free <= 0:
+            return 0
+
+        skip = self._pending_ids.union(self._recovered)
+        stmt = (
+            select(
+                Grievance.id,
+                Grievance.grievance_text,
+                Grievance.language,
+                Grievance.submitted_at,
+                District.district_code,
+            )
+            .join(District, District.id == Grievance.district_id)
+            .where(
+                Grievance.status == "submitted",
+                Grievance.department_id.is_(None),
+                Grievance.deleted_at.is_(None),
+                Grievance.submitted_at >= window_start,
+                Grievance.submitted_at
+                < now - timedelta(seconds=settings.NLP_CLASSIFICATION_RECOVERY_GRACE_SECONDS),
+            )
+            .order_by(Grievance.submitted_at)
+            .limit(free)
+        )
+        if skip:
+            stmt = stmt.where(Grievance.id.notin_(list(skip)))
+        async with self.session_provider() as session:
+            rows = (await session.execute(stmt)).all()
+
+        queued = 0
+        for row in rows:
+            job = ClassificationJob(
+                grievance_id=row.id,
+                text=row.grievance_text,
+                language=row.language,
+                district_code=row.district_code,
+                submitted_at=row.submitted_at,
+            )
+            if not self.submit(job):
+                break
+            self._recovered[row.id] = row.submitted_at
+            queued += 1
+
+        self._counters["recovered"] += queued
+        if queued:
+            logger.info(f"Classification recovery re-queued {queued} grievances")
+        return queued
+
+    async def process(self, job: ClassificationJob) -> bool:
+        """Classify one grievance and assign its department.
+
+        Only updates grievances that are still `submitted` without a
+        department, so a manual assignment made meanwhile is never
+        overwritten.
+
+        Args:
+            job: Classification job
+
+        Returns:
+            True if a department was assigned
+        """
+        async with self.session_provider() as session:
+            department = await classify_department(
+                session, job.text, job.language, job.district_code
+            )
+            if department is None:
+                self._counters["unclassified"] += 1
+                return False
+
+            result = await session.execute(
+                update(Grievance)
+                .where(
+                    Grievance.id == job.grievance_id,
+                    Grievance.department_id.is_(None),
+                    Grievance.status == "submitted",
+                )
+                .values(
+                    department_id=department.id,
+                    sla_days=department.sla_days,
+                    due_date=job.submitted_at + timedelta(days=department.sla_days),
+                )
+                .execution_options(synchronize_session=False)
+            )
+            assigned = bool(result.rowcount)
+
+        self._counters["classified" if assigned else "unclassified"] += 1
+        return assigned
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue and throughput metrics.
+
+        Returns:
+            Dict with queue depth/capacity, in-flight jobs, counters and
+            average/max queue wait and average processing time (ms)
+        """
+        depth = self._queue.qsize() if self._queue is not None else 0
+        started = sum(
+            self._counters[k] for k in ("classified", "unclassified", "failed")
+        )
+        if not self.running:
+            status = "stopped"
+        elif depth >= self.max_queue_size:
+            status = "saturated"
+        else:
+            status = "healthy"
+        return {
+            "status": status,
+            "mode": settings.NLP_CLASSIFICATION_MODE,
+            "workers": len(self._tasks),
+            "queue_depth": depth,
+            "queue_capacity": self.max_queue_size,
+            "in_flight": self._in_flight,
+            **self._counters,
+            "avg_wait_ms": round(self._total_wait / started * 1000, 2) if started else 0.0,
+            "max_wait_ms": round(self._max_wait * 1000, 2),
+            "avg_processing_ms": round(self._total_processing / started * 1000, 2) if started else 0.0,
+        }
+
+
+# Singleton instance
+_pipeline: Optional[ClassificationPipeline] = None
+
+
+def get_classification_pipeline() -> ClassificationPipeline:
+    """Get the classification pipeline instance.
+
+    Returns:
+        ClassificationPipeline (started from the app lifespan in async mode)
+    """
+    global _pipeline
+
+    if _pipeline is None:
+        _pipeline = ClassificationPipeline()
+
+    return _pipeline
+
+
+def reset_classification_pipeline() -> None:
+    """Reset the pipeline singleton (for testing)."""
+    global _pipeline
+    _pipeline = None
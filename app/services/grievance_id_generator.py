@@ -0,0 +1,134 @@
+"""Grievance public ID generator.
+
+Allocates public grievance IDs of the form PGRS-YYYY-DD-NNNNN, where DD is
+the district code and NNNNN a number unique within that district and year
+(zero-padded to five digits and growing wider past 99999).
+
+Numbers come from the grievance_id_counters table in blocks: a worker
+advances the (year, district) counter by GRIEVANCE_ID_BLOCK_SIZE in one
+upsert and then hands out that range from memory, so most submissions
+allocate an ID without a database round-trip. Blocks are never shared
+between workers, so IDs cannot collide; numbers left in a worker's block
+when it exits are skipped (IDs are unique, not gapless).
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.config import settings
+from app.models.grievance_id_counter import GrievanceIdCounter
+
+logger = logging.getLogger(__name__)
+
+
+def format_grievance_id(year: int, district_code: str, number: int) -> str:
+    """Format a public grievance ID.
+
+    Args:
+        year: Submission year
+        district_code: District code (e.g. "05")
+        number: Allocated number (>= 1)
+
+    Returns:
+        ID like PGRS-2025-05-00042
+    """
+    return f"PGRS-{year}-{district_code}-{number:05d}"
+
+
+class GrievanceIdGenerator:
+    """Block-allocating grievance ID generator (one per worker process)."""
+
+    def __init__(self, block_size: Optional[int] = None):
+        self.block_size = block_size or settings.GRIEVANCE_ID_BLOCK_SIZE
+        # (year, district_code) -> (next number, end of block exclusive)
+        self._blocks: Dict[Tuple[int, str], Tuple[int, int]] = {}
+        self._locks: Dict[Tuple[int, str], asyncio.Lock] = {}
+
+    async def next_id(
+        self,
+        db: AsyncSession,
+        district_code: str,
+        now: Optional[datetime] = None,
+    ) -> str:
+        """Allocate the next grievance ID for a district.
+
+        Args:
+            db: Database session (used only when a new block is needed)
+            district_code: District code
+            now: Submission time (defaults to current UTC time)
+
+        Returns:
+            Unique public grievance ID
+        """
+        year = (now or datetime.now(timezone.utc)).year
+        key = (year, district_code)
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            current, end = self._blocks.get(key, (0, 0))
+            if current >= end:
+                end = await self._reserve_block(db, year, district_code)
+                current = end - self.block_size
+            self._blocks[key] = (current + 1, end)
+
+        return format_grievance_id(year, district_code, current)
+
+    async def _reserve_block(self, db: AsyncSession, year: int, district_code: str) -> int:
+        """Advance the counter by one block.
+
+        Args:
+            db: Database session
+            year: Submission year
+            district_code: District code
+
+        Returns:
+            Exclusive end of the reserved range [end - block_size, end)
+        """
+        stmt = (
+            insert(GrievanceIdCounter)
+            .values(year=year, district_code=district_code, next_value=1 + self.block_size)
+            .on_conflict_do_update(
+                index_elements=[GrievanceIdCounter.year, GrievanceIdCounter.district_code],
+                set_={"next_value": GrievanceIdCounter.next_value + self.block_size},
+            )
+            .returning(GrievanceIdCounter.next_value)
+        )
+
+        bind = db.bind
+        if isinstance(bind, AsyncEngine):
+            # Commit the reservation on its own connection: if the caller's
+            # transaction rolled back, the counter would rewind and another
+            # worker could be handed the block this worker still holds.
+            async with bind.begin() as conn:
+                end = (await conn.execute(stmt)).scalar_one()
+        else:
+            end = (await db.execute(stmt)).scalar_one()
+
+        logger.debug(
+            f"Reserved grievance numbers {end - self.block_size}-{end - 1} "
+            f"for district {district_code}/{year}"
+        )
+        return int(end)
+
+
+# Singleton instance
+_generator: Optional[GrievanceIdGenerator] = None
+
+
+def get_grievance_id_generator() -> GrievanceIdGenerator:
+    """Get the grievance ID generator instance.
+
+    Returns:
+        GrievanceIdGenerator for this worker process
+    """
+    global _generator
+
+    if _generator is None:
+        _generator = GrievanceIdGenerator()
+
+    return _generator
@@ -0,0 +1,368 @@
+"""Bulk grievance ingest for call-center and legacy PGRS imports.
+
+Streams NDJSON or CSV records, validates each against
+GrievanceIngestRow (GrievanceCreateRequest plus department_code and
+submitted_at), resolves district and department codes from maps loaded
+once per ingest, and writes valid rows with one multi-row INSERT per batch.
+
+A batch that fails in the database (e.g. a constraint the schema does not
+check) is rolled back to its savepoint and retried row by row, so one bad
+row is reported without losing the rest of the batch. Each batch is
+committed before the next is read, keeping memory flat on large files.
+
+Because earlier batches are already committed, a body that stops being
+valid UTF-8 partway through does not fail the whole ingest: reading stops
+at that line, rows before it are still written, and the report records
+where it stopped so the client can resume from there.
+
+No NLP call is made during ingest: rows without a department code are
+stored unassigned for triage.
+"""
+
+import csv
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
+
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.department import Department
+from app.models.district import District
+from app.models.grievance import Grievance
+from app.schemas.grievance import GrievanceIngestRow
+from app.services.grievance_id_generator import get_grievance_id_generator
+
+logger = logging.getLogger(__name__)
+
+# Default SLA when a row has no department (matches create_grievance)
+DEFAULT_SLA_DAYS = 7
+
+INGEST_FORMATS = ("ndjson", "csv")
+
+# (line number, parsed record or None, parse error or None)
+RawRecord = Tuple[int, Optional[Dict[str, Any]], Optional[str]]
+
+
+class IngestDecodeError(ValueError):
+    """Raised when a line of the ingest body is not valid UTF-8."""
+
+    def __init__(self, line: int):
+        super().__init__(f"Line {line} is not valid UTF-8")
+        self.line = line
+
+
+@dataclass
+class IngestReport:
+    """Outcome of an ingest run.
+
+    Attributes:
+        total_rows: Records read (blank lines excluded)
+        inserted: Rows written
+        failed: Rows rejected (validation, unknown codes or database errors)
+        errors: Per-row errors as {"line": n, "error": message}
+        max_errors: Errors kept in `errors`; later ones are only counted
+        stopped_at_line: Line where reading stopped early (None if the
+            whole body was read); nothing from this line on was ingested
+        stop_error: Why reading stopped
+    """
+
+    total_rows: int = 0
+    inserted: int = 0
+    failed: int = 0
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+    max_errors: int = 1000
+    stopped_at_line: Optional[int] = None
+    stop_error: Optional[str] = None
+
+    def add_error(self, line: int, error: str) -> None:
+        """Record a failed row."""
+        self.failed += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append({"line": line, "error": error})
+
+    @property
+    def errors_truncated(self) -> bool:
+        """Whether some errors were counted but not listed."""
+        return self.failed > len(self.errors)
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Split a byte stream into decoded lines (UTF-8, BOM and CR stripped).
+
+    Args:
+        chunks: Raw body chunks
+
+    Yields:
+        Text lines without line terminators
+
+    Raises:
+        IngestDecodeError: A line is not valid UTF-8
+    """
+    buffer = b""
+    line_number = 0
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for raw in lines:
+            line_number += 1
+            yield _decode_line(raw, line_number)
+    if buffer:
+        yield _decode_line(buffer, line_number + 1)
+
+
+def _decode_line(raw: bytes, line_number: int) -> str:
+    """Decode one line, dropping CR and (on the first line) the BOM."""
+    try:
+        line = raw.decode("utf-8").rstrip("\r")
+    except UnicodeDecodeError:
+        raise IngestDecodeError(line_number) from None
+    return line.lstrip("\ufeff") if line_number == 1 else line
+
+
+async def iter_ndjson_records(lines: AsyncIterator[str]) -> AsyncIterator[RawRecord]:
+    """Parse one JSON object per line.
+
+    Args:
+        lines: Text lines
+
+    Yields:
+        (line number, record, error)
+    """
+    line_number = 0
+    async for line in lines:
+        line_number += 1
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_number, None, f"Invalid JSON: {e.msg}"
+            continue
+        if not isinstance(record, dict):
+            yield line_number, None, "Expected a JSON object"
+            continue
+        yield line_number, record, None
+
+
+async def iter_csv_records(lines: AsyncIterator[str]) -> AsyncIterator[RawRecord]:
+    """Parse CSV with a header row; quoted fields may span lines.
+
+    Empty cells are treated as missing values.
+
+    Args:
+        lines: Text lines
+
+    Yields:
+        (line number of the record's first line, record, error)
+    """
+    header: Optional[List[str]] = None
+    pending: List[str] = []
+    start_line = 0
+    line_number = 0
+
+    async for line in lines:
+        line_number += 1
+        if not pending:
+            if not line.strip():
+                continue
+            start_line = line_number
+        pending.append(line)
+        text = "\n".join(pending)
+        if text.count('"') % 2:
+            continue  # inside a quoted field
+        pending = []
+
+        values = next(csv.reader([text]))
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        if len(values) != len(header):
+            yield start_line, None, f"Expected {len(header)} columns, got {len(values)}"
+            continue
+        yield start_line, {k: v for k, v in zip(header, values) if v != ""}, None
+
+    if pending:
+        yield start_line, None, "Unterminated quoted field"
+
+
+def _validation_message(error: ValidationError) -> str:
+    """Flatten a pydantic ValidationError into one line."""
+    return "; ".join(
+        f"{'.'.join(str(p) for p in e['loc']) or 'row'}: {e['msg']}" for e in error.errors()
+    )
+
+
+def _db_error_message(error: Exception) -> str:
+    """First line of the driver error (drops SQL and parameters)."""
+    return str(getattr(error, "orig", error)).splitlines()[0]
+
+
+class GrievanceIngestor:
+    """Validates and batch-inserts streamed grievance records."""
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        batch_size: Optional[int] = None,
+        max_errors: Optional[int] = None,
+    ):
+        self.db = db
+        self.batch_size = batch_size or settings.GRIEVANCE_INGEST_BATCH_SIZE
+        self.report = IngestReport(max_errors=max_errors or settings.GRIEVANCE_INGEST_MAX_ERRORS)
+        self._districts: Dict[str, UUID] = {}
+        self._departments_by_code: Dict[str, Tuple[UUID, int]] = {}
+        self._departments_by_id: Dict[UUID, int] = {}
+
+    async def load_reference_maps(self) -> None:
+        """Load district and department codes once for the whole ingest."""
+        districts = await self.db.execute(select(District.district_code, District.id))
+        self._districts = {code: district_id for code, district_id in districts.all()}
+
+        departments = await self.db.execute(
+            select(Department.dept_code, Department.id, Department.sla_days)
+        )
+        for code, dept_id, sla_days in departments.all():
+            self._departments_by_code[code] = (dept_id, sla_days)
+            self._departments_by_id[dept_id] = sla_days
+
+    async def ingest(self, records: AsyncIterator[RawRecord]) -> IngestReport:
+        """Validate and insert all records.
+
+        Args:
+            records: Output of iter_ndjson_records / iter_csv_records
+
+        Returns:
+            IngestReport with counts and per-row errors; stopped_at_line is
+            set if the body turned out not to be UTF-8 partway through
+        """
+        await self.load_reference_maps()
+
+        batch: List[Tuple[int, Dict[str, Any]]] = []
+        try:
+            async for line, record, error in records:
+                self.report.total_rows += 1
+                if error is None:
+                    row, error = await self._build_row(record or {})
+                if error is not None:
+                    self.report.add_error(line, error)
+                    continue
+                batch.append((line, row))
+                if len(batch) >= self.batch_size:
+                    await self._flush(batch)
+                    batch = []
+        except IngestDecodeError as e:
+            # Rows before the bad line are kept (earlier batches are committed)
+            self.report.stopped_at_line = e.line
+            self.report.stop_error = str(e)
+            logger.warning(f"Grievance ingest stopped: {e}")
+
+        if batch:
+            await self._flush(batch)
+
+        logger.info(
+            f"Grievance ingest: {self.report.inserted} inserted, "
+            f"{self.report.failed} failed of {self.report.total_rows} rows"
+        )
+        return self.report
+
+    async def _build_row(
+        self, record: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """Validate a record and map it to grievance column values.
+
+        Returns:
+            (column values, None) or ({}, error message)
+        """
+        try:
+            item = GrievanceIngestRow.model_validate(record)
+        except ValidationError as e:
+            return {}, _validation_message(e)
+
+        district_id = self._districts.get(item.district_code)
+        if district_id is None:
+            return {}, f"Unknown district code '{item.district_code}'"
+
+        department_id: Optional[UUID] = None
+        sla_days = DEFAULT_SLA_DAYS
+        if item.department_code:
+            if item.department_code not in self._departments_by_code:
+                return {}, f"Unknown department code '{item.department_code}'"
+            department_id, sla_days = self._departments_by_code[item.department_code]
+        elif item.department_id:
+            if item.department_id not in self._departments_by_id:
+                return {}, f"Unknown department_id '{item.department_id}'"
+            department_id = item.department_id
+            sla_days = self._departments_by_id[department_id]
+
+        submitted_at = item.submitted_at or datetime.now(timezone.utc)
+        if submitted_at.tzinfo is None:
+            submitted_at = submitted_at.replace(tzinfo=timezone.utc)
+
+        grievance_id = await get_grievance_id_generator().next_id(
+            self.db, item.district_code, now=submitted_at
+        )
+        return {
+            "id": uuid4(),
+            "grievance_id": grievance_id,
+            "citizen_name": item.citizen_name,
+            "citizen_phone": item.citizen_phone,
+            "citizen_email": item.citizen_email,
+            "citizen_address": item.citizen_address,
+            "district_id": district_id,
+            "department_id": department_id,
+            "subject": item.subject or item.grievance_text[:100],
+            "grievance_text": item.grievance_text,
+            "language": item.language.value,
+            "channel": item.channel.value,
+            "status": "submitted",
+            "priority": "normal",
+            "sla_days": sla_days,
+            "due_date": submitted_at + timedelta(days=sla_days),
+            "submitted_at": submitted_at,
+            "latitude": item.latitude,
+            "longitude": item.longitude,
+            "extra_data": item.extra_data,
+        }, None
+
+    async def _flush(self, batch: List[Tuple[int, Dict[str, Any]]]) -> None:
+        """Insert a batch in one statement, isolating bad rows on failure."""
+        try:
+            async with self.db.begin_nested():
+                await self.db.execute(insert(Grievance).values([row for _, row in batch]))
+            self.report.inserted += len(batch)
+        except Exception as e:
+            logger.warning(f"Ingest batch of {len(batch)} failed ({_db_error_message(e)}); retrying per row")
+            for line, row in batch:
+                try:
+                    async with self.db.begin_nested():
+                        await self.db.execute(insert(Grievance).values(row))
+                    self.report.inserted += 1
+                except Exception as row_error:
+                    self.report.add_error(line, _db_error_message(row_error))
+        await self.db.commit()
+
+
+def iter_records(fmt: str, chunks: AsyncIterator[bytes]) -> AsyncIterator[RawRecord]:
+    """Build the record iterator for an ingest format.
+
+    Args:
+        fmt: "ndjson" or "csv"
+        chunks: Raw body chunks
+
+    Returns:
+        Async iterator of (line, record, error)
+
+    Raises:
+        ValueError: Unknown format
+    """
+    if fmt == "ndjson":
+        return iter_ndjson_records(iter_lines(chunks))
+    if fmt == "csv":
+        return iter_csv_records(iter_lines(chunks))
+    raise ValueError(f"Unsupported ingest format '{fmt}' (expected one of {INGEST_FORMATS})")
@@ -0,0 +1,83 @@
+"""Grievance text search.
+
+Builds the WHERE predicate and ranking expression for grievance search so
+list endpoints can combine it with their own filters and pagination.
+
+Two indexed access paths are OR-ed together and PostgreSQL answers them
+with a BitmapOr over GIN indexes instead of a sequential scan:
+- Full-text: `search_vector @@ websearch_to_tsquery('simple', term)` for
+  whole-word queries (supports quotes, OR and -exclusion).
+- Trigram: `subject/grievance_text ILIKE '%term%'` via pg_trgm for partial
+  words and Telugu-script substrings that the tokenizer does not split.
+
+Ranking combines ts_rank_cd (subject matches weigh more, see migration
+6b_search_001) with trigram similarity of the subject.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import Float, cast, func, literal_column, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.models.grievance import Grievance
+
+# Text search configuration; must match grievances_search_vector_update().
+# Rendered inline as a regconfig literal so the planner sees a constant.
+SEARCH_CONFIG = literal_column("'simple'::regconfig")
+
+
+def _escape_like(term: str) -> str:
+    """Escape LIKE wildcards so user input is matched literally."""
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+@dataclass(frozen=True)
+class GrievanceSearch:
+    """A normalized grievance search term.
+
+    Attributes:
+        term: Search text as entered (whitespace-trimmed)
+    """
+
+    term: str
+
+    @classmethod
+    def from_query(cls, raw: str | None) -> "GrievanceSearch | None":
+        """Build a search from a query parameter.
+
+        Args:
+            raw: Raw `search` query parameter
+
+        Returns:
+            GrievanceSearch, or None when the parameter is missing or blank
+        """
+        if raw is None:
+            return None
+        term = " ".join(raw.split())
+        return cls(term) if term else None
+
+    def tsquery(self) -> ColumnElement[Any]:
+        """Full-text query; websearch syntax never raises on user input."""
+        return func.websearch_to_tsquery(SEARCH_CONFIG, self.term)
+
+    def predicate(self) -> ColumnElement[bool]:
+        """WHERE clause matching grievances by full-text or substring."""
+        pattern = f"%{_escape_like(self.term)}%"
+        return or_(
+            Grievance.search_vector.op("@@")(self.tsquery()),
+            Grievance.subject.ilike(pattern, escape="\\"),
+            Grievance.grievance_text.ilike(pattern, escape="\\"),
+        )
+
+    def rank(self) -> ColumnElement[float]:
+        """Relevance score (higher is better) for ORDER BY.
+
+        Cast to double precision so the value round-trips exactly through
+        a pagination cursor.
+        """
+        return cast(
+            func.coalesce(func.ts_rank_cd(Grievance.search_vector, self.tsquery()), 0)
+            + func.similarity(func.coalesce(Grievance.subject, ""), self.term),
+            Float,
+        )
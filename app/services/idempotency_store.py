@@ -0,0 +1,322 @@
+"""Idempotency Store Service.
+
+Remembers the response of a completed request under an idempotency key
+(client `Idempotency-Key` header or a content hash for duplicate
+submissions) so retries return the original result instead of creating
+a second record.
+
+A request first *claims* its key. The claim atomically writes an
+"in-flight" marker, so of two concurrent retries only one proceeds; the
+other sees the marker (or, once finished, the stored response). The
+marker has a short TTL so a crashed worker never blocks the key for
+longer than IDEMPOTENCY_IN_FLIGHT_TTL.
+
+Backends:
+- Redis: SET NX EX for the claim, native TTL for expiry; shared by all
+  workers. Falls back to the in-memory store while Redis is unreachable.
+- In-memory: per-process, bounded to IDEMPOTENCY_MAX_ENTRIES with
+  LRU + TTL eviction.
+"""
+
+import json
+import logging
+import secrets
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, Optional, Tuple
+
+from app.config import settings
+from app.services.redis_manager import CheckedRedisClient
+
+logger = logging.getLogger(__name__)
+
+# Compare-and-delete: only release a marker we still own
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class ClaimState(str, Enum):
+    """Outcome of claiming an idempotency key."""
+
+    ACQUIRED = "acquired"
+    IN_FLIGHT = "in_flight"
+    COMPLETED = "completed"
+
+
+@dataclass(frozen=True)
+class IdempotencyClaim:
+    """Result of IIdempotencyStore.claim.
+
+    Attributes:
+        key: The claimed idempotency key
+        state: ACQUIRED (caller must process and complete/release),
+            IN_FLIGHT (another request holds the key) or COMPLETED
+        response: Stored response when state is COMPLETED
+        token: Ownership token of an ACQUIRED claim
+    """
+
+    key: str
+    state: ClaimState
+    response: Optional[Dict[str, Any]] = None
+    token: Optional[str] = None
+
+    @property
+    def acquired(self) -> bool:
+        """Whether the caller owns the key and should process the request."""
+        return self.state == ClaimState.ACQUIRED
+
+
+class IIdempotencyStore(ABC):
+    """Interface for idempotency store."""
+
+    @abstractmethod
+    async def claim(self, key: str) -> IdempotencyClaim:
+        """Atomically claim a key or return its current state.
+
+        Args:
+            key: Idempotency key
+
+        Returns:
+            IdempotencyClaim
+        """
+        pass
+
+    @abstractmethod
+    async def complete(self, claim: IdempotencyClaim, response: Dict[str, Any]) -> bool:
+        """Store the response for a claimed key (replaces the in-flight marker).
+
+        Args:
+            claim: Claim returned by claim()
+            response: JSON-serializable response to replay
+
+        Returns:
+            True if stored
+        """
+        pass
+
+    @abstractmethod
+    async def release(self, claim: IdempotencyClaim) -> bool:
+        """Drop an in-flight marker so the request can be retried.
+
+        Called when processing fails. Does nothing if the marker expired
+        and was re-claimed by another request.
+
+        Args:
+            claim: Claim returned by claim()
+
+        Returns:
+            True if the marker was removed
+        """
+        pass
+
+    @abstractmethod
+    async def health_check(self) -> Dict[str, Any]:
+        """Check idempotency store health."""
+        pass
+
+
+class InMemoryIdempotencyStore(IIdempotencyStore):
+    """Bounded in-memory idempotency store with LRU + TTL eviction.
+
+    Claims are atomic within a process because no await happens between
+    the lookup and the write. Not shared across workers.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[int] = None,
+        in_flight_ttl_seconds: Optional[int] = None,
+    ) -> None:
+        self.max_entries = max_entries or settings.IDEMPOTENCY_MAX_ENTRIES
+        self.ttl_seconds = ttl_seconds or settings.IDEMPOTENCY_KEY_TTL
+        self.in_flight_ttl_seconds = in_flight_ttl_seconds or settings.IDEMPOTENCY_IN_FLIGHT_TTL
+        # key -> (expires_at, token, response); response None while in flight
+        self._entries: "OrderedDict[str, Tuple[float, Optional[str], Optional[Dict[str, Any]]]]" = (
+            OrderedDict()
+        )
+        self.evictions = 0
+
+    def _get(self, key: str) -> Optional[Tuple[float, Optional[str], Optional[Dict[str, Any]]]]:
+        """Return a live entry and mark it recently used."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _set(
+        self,
+        key: str,
+        ttl_seconds: int,
+        token: Optional[str],
+        response: Optional[Dict[str, Any]],
+    ) -> None:
+        """Insert or replace an entry, evicting the least recently used."""
+        self._entries[key] = (time.monotonic() + ttl_seconds, token, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def claim(self, key: str) -> IdempotencyClaim:
+        """Claim key in memory."""
+        entry = self._get(key)
+        if entry is not None:
+            _, _, response = entry
+            if response is not None:
+                return IdempotencyClaim(key, ClaimState.COMPLETED, response=response)
+            return IdempotencyClaim(key, ClaimState.IN_FLIGHT)
+
+        token = secrets.token_hex(8)
+        self._set(key, self.in_flight_ttl_seconds, token, None)
+        return IdempotencyClaim(key, ClaimState.ACQUIRED, token=token)
+
+    async def complete(self, claim: IdempotencyClaim, response: Dict[str, Any]) -> bool:
+        """Store response in memory."""
+        self._set(claim.key, self.ttl_seconds, None, response)
+        return True
+
+    async def release(self, claim: IdempotencyClaim) -> bool:
+        """Remove our in-flight marker from memory."""
+        entry = self._get(claim.key)
+        if entry is None or entry[1] != claim.token:
+            return False
+        del self._entries[claim.key]
+        return True
+
+    async def health_check(self) -> Dict[str, Any]:
+        """In-memory is always healthy."""
+        return {
+            "status": "healthy",
+            "backend": "in_memory",
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "evictions": self.evictions,
+        }
+
+
+class RedisIdempotencyStore(IIdempotencyStore):
+    """Redis-based idempotency store shared by all workers.
+
+    Keys are stored as: idempotency:{key}
+    Values are the in-flight token while processing, then the JSON response.
+    """
+
+    KEY_PREFIX = "idempotency:"
+    IN_FLIGHT_PREFIX = "inflight:"
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        fallback: Optional[IIdempotencyStore] = None,
+    ):
+        self.redis_url = redis_url or settings.REDIS_URL
+        self.ttl_seconds = settings.IDEMPOTENCY_KEY_TTL
+        self.in_flight_ttl_seconds = settings.IDEMPOTENCY_IN_FLIGHT_TTL
+        self.fallback = fallback or InMemoryIdempotencyStore()
+        self._redis = CheckedRedisClient("idempotency store", url=self.redis_url)
+
+    def _key(self, key: str) -> str:
+        return f"{self.KEY_PREFIX}{key}"
+
+    async def claim(self, key: str) -> IdempotencyClaim:
+        """Claim key with SET NX, falling back to memory if Redis fails."""
+        try:
+            client = await self._redis.get()
+            token = f"{self.IN_FLIGHT_PREFIX}{secrets.token_hex(8)}"
+            redis_key = self._key(key)
+
+            if await client.set(redis_key, token, nx=True, ex=self.in_flight_ttl_seconds):
+                return IdempotencyClaim(key, ClaimState.ACQUIRED, token=token)
+
+            value = await client.get(redis_key)
+            if value is None:
+                # Expired between SET and GET; treat as in flight, client retries
+                return IdempotencyClaim(key, ClaimState.IN_FLIGHT)
+            if value.startswith(self.IN_FLIGHT_PREFIX):
+                return IdempotencyClaim(key, ClaimState.IN_FLIGHT)
+            return IdempotencyClaim(key, ClaimState.COMPLETED, response=json.loads(value))
+
+        except Exception as e:
+            logger.warning(f"Idempotency claim failed, using in-memory store: {e}")
+            return await self.fallback.claim(key)
+
+    async def complete(self, claim: IdempotencyClaim, response: Dict[str, Any]) -> bool:
+        """Replace the in-flight marker with the response."""
+        try:
+            client = await self._redis.get()
+            await client.set(self._key(claim.key), json.dumps(response), ex=self.ttl_seconds)
+            return True
+        except Exception as e:
+            logger.warning(f"Idempotency store failed, using in-memory store: {e}")
+            return await self.fallback.complete(claim, response)
+
+    async def release(self, claim: IdempotencyClaim) -> bool:
+        """Delete the in-flight marker if we still own it."""
+        try:
+            client = await self._redis.get()
+            removed = await client.eval(_RELEASE_SCRIPT, 1, self._key(claim.key), claim.token)
+            return bool(removed)
+        except Exception as e:
+            logger.warning(f"Idempotency release failed, using in-memory store: {e}")
+            return await self.fallback.release(claim)
+
+    async def health_check(self) -> Dict[str, Any]:
+        """Check Redis connection health."""
+        try:
+            client = await self._redis.get()
+            await client.ping()
+
+            return {
+                "status": "healthy",
+                "backend": "redis",
+            }
+
+        except Exception as e:
+            return {
+                "status": "degraded",
+                "backend": "redis",
+                "fallback": await self.fallback.health_check(),
+                "error": str(e),
+            }
+
+    async def close(self) -> None:
+        """Release the Redis client."""
+        self._redis.release()
+
+
+# Singleton instance
+_idempotency_store: Optional[IIdempotencyStore] = None
+
+
+def get_idempotency_store() -> IIdempotencyStore:
+    """Get idempotency store instance.
+
+    Uses Redis (with in-memory fallback while Redis is unreachable).
+
+    Returns:
+        IIdempotencyStore instance
+    """
+    global _idempotency_store
+
+    if _idempotency_store is None:
+        _idempotency_store = RedisIdempotencyStore()
+
+    return _idempotency_store
+
+
+def reset_idempotency_store() -> None:
+    """Reset the idempotency store singleton (for testing)."""
+    global _idempotency_store
+    _idempotency_store = None
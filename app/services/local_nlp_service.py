@@ -0,0 +1,332 @@
+"""In-process department classifier using the bundled ml/models artifacts.
+
+Runs the TF-IDF + logistic regression department classifier shipped in
+ml/models (telugu_classifier_v2 by default) without the external model
+server. The pickles are loaded once per worker and inference runs in a
+bounded thread or process pool, so the event loop never executes sklearn
+code.
+
+The model spreads probability over 34 departments (uniform is ~0.03), so
+its top-class probabilities sit far below NLP_CONFIDENCE_THRESHOLD; its
+results carry NLP_LOCAL_CONFIDENCE_THRESHOLD instead.
+
+Usable as the primary INLPService (NLP_LOCAL_MODE=primary) or as a
+fallback tier behind IndicBERT (NLP_LOCAL_MODE=fallback, see
+TieredNLPService in app.services.nlp_service), which keeps auto-routing
+available during model-server outages.
+"""
+
+import asyncio
+import logging
+import pickle
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from app.config import settings
+from app.services.nlp_service import ClassificationResult, INLPService
+
+logger = logging.getLogger(__name__)
+
+# Classifier labels -> departments.dept_code (labels as in the model metadata)
+MODEL_LABEL_DEPT_CODES: Dict[str, str] = {
+    "Agriculture": "AGRI",
+    "Animal Husbandry": "ANI_HUSB",
+    "BC Welfare": "BC_WELF",
+    "Civil Supplies": "CIVIL_SUP",
+    "Disaster Management": "DISASTER",
+    "Education": "EDUCATIO",
+    "Employment And Training": "TRAIN",
+    "Energy": "ENERGY",
+    "Environment & Forest": "ENVIRON",
+    "Excise": "EXCISE",
+    "Finance": "FINANCE",
+    "General Administration": "GENEADMI",
+    "Handlooms": "HANDLOOM",
+    "Health": "HEALTH",
+    "Higher Education": "HUMARESO",
+    "Housing": "HOUSING",
+    "Industries": "INDUST",
+    "Labour": "LABOUR",
+    "Law": "LAW",
+    "Minorities Welfare": "MINOR",
+    "Municipal Administration": "MUNI",
+    "Panchayat Raj": "PNCHRAJ",
+    "Planning": "PLANNING",
+    "Police": "POLICE",
+    "Registration And Stamps": "REG",
+    "Revenue": "REVENUE",
+    "Skills & Training": "SKILLS",
+    "Social Welfare": "SOC_WELF",
+    "Tourism & Culture": "YATAC",
+    "Transport": "TRANS",
+    "Tribal Welfare": "TRIBAL",
+    "Village Secretariat": "GVVAVSS",
+    "Water Resources": "WATER",
+    "Women & Child Welfare": "WOMEN",
+}
+
+# Recent inference latencies kept for percentiles
+LATENCY_WINDOW = 500
+
+
+def _unavailable(error: str) -> ClassificationResult:
+    """Fallback result when local inference cannot run."""
+    return ClassificationResult(
+        department_id=None,
+        confidence=0.0,
+        fallback_used=True,
+        error=error,
+    )
+
+
+# (classifier, vectorizer, label encoder) loaded in this process
+_model: Optional[Tuple[Any, Any, Any]] = None
+
+
+def load_model(classifier_path: str, vectorizer_path: str, label_encoder_path: str) -> None:
+    """Load the model pickles into this process (pool initializer).
+
+    Args:
+        classifier_path: Fitted classifier with predict_proba
+        vectorizer_path: Fitted TF-IDF vectorizer
+        label_encoder_path: LabelEncoder mapping class indices to labels
+    """
+    global _model
+
+    if _model is not None:
+        return
+
+    loaded = []
+    for path in (classifier_path, vectorizer_path, label_encoder_path):
+        with open(path, "rb") as f:
+            loaded.append(pickle.load(f))  # bundled, trusted artifacts
+    _model = (loaded[0], loaded[1], loaded[2])
+
+
+def predict(texts: List[str]) -> List[Tuple[str, float]]:
+    """Classify texts with the loaded model (runs in the pool).
+
+    Args:
+        texts: Grievance texts
+
+    Returns:
+        (label, probability) of the top class per text
+    """
+    if _model is None:
+        raise RuntimeError("Local classifier model not loaded")
+
+    classifier, vectorizer, label_encoder = _model
+    probabilities = classifier.predict_proba(vectorizer.transform(texts))
+    best = probabilities.argmax(axis=1)
+    labels = label_encoder.inverse_transform(classifier.classes_[best])
+    return [
+        (str(label), float(probabilities[row, column]))
+        for row, (label, column) in enumerate(zip(labels, best))
+    ]
+
+
+class LocalNLPService(INLPService):
+    """INLPService backed by the bundled scikit-learn classifier."""
+
+    def __init__(
+        self,
+        model_dir: Optional[str] = None,
+        executor: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+    ):
+        model_dir_path = Path(model_dir or settings.NLP_LOCAL_MODEL_DIR)
+        self.model_paths = (
+            str(model_dir_path / settings.NLP_LOCAL_CLASSIFIER),
+            str(model_dir_path / settings.NLP_LOCAL_VECTORIZER),
+            str(model_dir_path / settings.NLP_LOCAL_LABEL_ENCODER),
+        )
+        self.model_version = f"local:{Path(settings.NLP_LOCAL_CLASSIFIER).stem}"
+        self.executor_kind = executor or settings.NLP_LOCAL_EXECUTOR
+        self.max_workers = max_workers or settings.NLP_LOCAL_WORKERS
+        self.max_pending = max_pending or settings.NLP_LOCAL_MAX_PENDING
+
+        self._executor: Optional[Executor] = None
+        self._ready = False
+        self._load_error: Optional[str] = None
+        self._load_lock = asyncio.Lock()
+        self._pending = 0
+
+        self._latencies_ms: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self.requests = 0
+        self.errors = 0
+        self.rejected = 0
+
+    def _create_executor(self) -> Executor:
+        if self.executor_kind == "process":
+            # spawn: forking a process with a running event loop is unsafe
+            return ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=get_context("spawn"),
+                initializer=load_model,
+                initargs=self.model_paths,
+            )
+        return ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="local-nlp",
+        )
+
+    async def start(self) -> bool:
+        """Create the pool and load the model (idempotent).
+
+        Returns:
+            True if the model is ready
+        """
+        async with self._load_lock:
+            if self._ready:
+                return True
+            if self._load_error is not None:
+                return False  # bundled artifacts don't change; needs a restart
+            if self._executor is None:
+                self._executor = self._create_executor()
+            loop = asyncio.get_running_loop()
+            try:
+                # Threads share this process's model; each process worker
+                # loads its own copy in the pool initializer
+                if self.executor_kind == "process":
+                    await loop.run_in_executor(self._executor, predict, ["warm up"])
+                else:
+                    await loop.run_in_executor(self._executor, load_model, *self.model_paths)
+                self._ready = True
+                self._load_error = None
+                logger.info(
+                    f"Local classifier {self.model_version} loaded "
+                    f"({self.max_workers} {self.executor_kind} workers)"
+                )
+            except Exception as e:
+                self._load_error = str(e)
+                logger.error(f"Local classifier failed to load: {e}")
+            return self._ready
+
+    async def close(self) -> None:
+        """Shut down the inference pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            self._ready = False
+
+    async def classify_text(
+        self,
+        text: str,
+        language: str = "te",
+        district_code: Optional[str] = None,
+    ) -> ClassificationResult:
+        """Classify grievance text with the local model.
+
+        The model is language-agnostic (character n-grams), so language and
+        district are not used.
+
+        Args:
+            text: Grievance text to classify
+            language: Language code (unused)
+            district_code: Optional district code (unused)
+
+        Returns:
+            ClassificationResult, or a fallback result if the model is
+            unavailable or the pool is saturated
+        """
+        if not self._ready and not await self.start():
+            return _unavailable(f"Local classifier unavailable: {self._load_error}")
+
+        if self._pending >= self.max_pending:
+            self.rejected += 1
+            return _unavailable("Local classifier busy")
+
+        self._pending += 1
+        self.requests += 1
+        start = time.monotonic()
+        try:
+            loop = asyncio.get_running_loop()
+            [(label, confidence)] = await loop.run_in_executor(self._executor, predict, [text])
+        except Exception as e:
+            self.errors += 1
+            logger.error(f"Local classifier inference failed: {e}")
+            return _unavailable(str(e))
+        finally:
+            self._pending -= 1
+            self._latencies_ms.append((time.monotonic() - start) * 1000)
+
+        return ClassificationResult(
+            department_id=None,
+            confidence=confidence,
+            department_code=MODEL_LABEL_DEPT_CODES.get(label),
+            department_name=label,
+            fallback_used=False,
+            model_version=self.model_version,
+            confidence_threshold=settings.NLP_LOCAL_CONFIDENCE_THRESHOLD,
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """Get inference latency and load statistics.
+
+        Returns:
+            Dict with request counters and latency percentiles
+        """
+        latencies = sorted(self._latencies_ms)
+
+        def percentile(p: float) -> float:
+            if not latencies:
+                return 0.0
+            return round(latencies[min(len(latencies) - 1, int(p * len(latencies)))], 2)
+
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "rejected": self.rejected,
+            "pending": self._pending,
+            "avg_latency_ms": round(sum(latencies) / len(latencies), 2) if latencies else 0.0,
+            "p50_latency_ms": percentile(0.50),
+            "p95_latency_ms": percentile(0.95),
+            "executor": self.executor_kind,
+            "workers": self.max_workers,
+        }
+
+    async def health_check(self) -> Dict[str, Any]:
+        """Report model readiness and latency metrics.
+
+        Returns:
+            Dict with status, model version and inference stats
+        """
+        if self._load_error is not None:
+            status = "unhealthy"
+        elif self._pending >= self.max_pending:
+            status = "saturated"
+        else:
+            # Not loaded yet is fine: the first request loads it
+            status = "healthy"
+
+        return {
+            "status": status,
+            "backend": "local",
+            "model_version": self.model_version,
+            "loaded": self._ready,
+            "error": self._load_error,
+            **self.stats(),
+        }
+
+
+# Singleton instance
+_local_nlp_service: Optional[LocalNLPService] = None
+
+
+def get_local_nlp_service() -> LocalNLPService:
+    """Get the local classifier instance.
+
+    Returns:
+        LocalNLPService for this worker process
+    """
+    global _local_nlp_service
+
+    if _local_nlp_service is None:
+        _local_nlp_service = LocalNLPService()
+
+    return _local_nlp_service
@@ -2,15 +2,33 @@
 
 Provides automatic department classification for grievance text.
 Includes interface-first design with graceful degradation on failure.
+
+With NLP_BATCHING_ENABLED, concurrent classify_text calls are coalesced
+for up to NLP_BATCH_MAX_WAIT_MS (or NLP_BATCH_MAX_SIZE texts) and sent as
+one /api/nlp/classify/batch request; each caller receives its own result.
+
+A circuit breaker (app.services.circuit_breaker) guards the HTTP calls:
+while the service is erroring or slow, classification returns the
+fallback result immediately instead of waiting for the timeout.
+
+With NLP_CACHE_ENABLED, get_nlp_service() wraps the service in
+CachedNLPService so repeated texts are answered from the classification
+cache (app.services.classification_cache). With NLP_LOCAL_MODE the bundled
+local classifier (app.services.local_nlp_service) is used as the primary
+service or as a fallback tier.
 """
 
+import asyncio
 import logging
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
 import httpx
 
 from app.config import settings
+from app.services.circuit_breaker import CircuitBreaker, CircuitState
+from app.services.classification_cache import ClassificationCache, classification_cache_key
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +44,8 @@ class ClassificationResult:
         department_name: Optional[str] = None,
         fallback_used: bool = False,
         error: Optional[str] = None,
+        model_version: Optional[str] = None,
+        confidence_threshold: Optional[float] = None,
     ):
         self.department_id = department_id
         self.confidence = confidence
@@ -33,12 +53,23 @@ class ClassificationResult:
         self.department_name = department_name
         self.fallback_used = fallback_used
         self.error = error
+        self.model_version = model_version
+        # Models whose probabilities are on a different scale (the local
+        # classifier) carry their own threshold
+        self.confidence_threshold = confidence_threshold
 
     def is_confident(self, threshold: Optional[float] = None) -> bool:
-        """Check if classification meets confidence threshold."""
+        """Check if classification meets confidence threshold.
+
+        Routing resolves the department by code, so a result naming only a
+        department_code (the local classifier) is routable.
+        """
+        if threshold is None:
+            threshold = self.confidence_threshold
         if threshold is None:
             threshold = settings.NLP_CONFIDENCE_THRESHOLD
-        return self.confidence >= threshold and self.department_id is not None
+        routable = self.department_id is not None or self.department_code is not None
+        return self.confidence >= threshold and routable
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -49,6 +80,8 @@ class ClassificationResult:
             "department_name": self.department_name,
             "fallback_used": self.fallback_used,
             "error": self.error,
+            "model_version": self.model_version,
+            "confidence_threshold": self.confidence_threshold,
         }
 
 
@@ -86,6 +119,156 @@ class INLPService(ABC):
         """
         pass
 
+    async def close(self) -> None:
+        """Release connections held by the service (called on shutdown).
+
+        No-op by default; implementations holding connections override it.
+        """
+        pass
+
+
+CIRCUIT_OPEN_ERROR = "Circuit open"
+
+
+def _fallback_result(error: str) -> ClassificationResult:
+    """Build the result returned when classification is unavailable."""
+    return ClassificationResult(
+        department_id=None,
+        confidence=0.0,
+        fallback_used=True,
+        error=error,
+    )
+
+
+def _result_from_data(data: Dict[str, Any]) -> ClassificationResult:
+    """Build a result from one model server response object."""
+    return ClassificationResult(
+        department_id=data.get("department_id"),
+        confidence=data.get("confidence", 0.0),
+        department_code=data.get("department_code"),
+        department_name=data.get("department_name"),
+        fallback_used=False,
+        model_version=data.get("model_version"),
+    )
+
+
+def _elapsed_ms(start: float) -> float:
+    """Milliseconds since a time.monotonic() start."""
+    return (time.monotonic() - start) * 1000
+
+
+BatchSender = Callable[[List[Dict[str, Any]]], Awaitable[List[ClassificationResult]]]
+
+# A queued payload and the future its caller awaits
+PendingRequest = Tuple[Dict[str, Any], asyncio.Future[ClassificationResult]]
+
+
+class ClassificationBatcher:
+    """Coalesces concurrent classification requests into batch calls.
+
+    The first request of a batch starts a max_wait timer; the batch is sent
+    when the timer fires or max_size requests are pending, whichever comes
+    first. Results are fanned back out to the waiting callers in order.
+    """
+
+    def __init__(
+        self,
+        send_batch: BatchSender,
+        max_size: Optional[int] = None,
+        max_wait_ms: Optional[int] = None,
+    ):
+        self._send_batch = send_batch
+        self.max_size = max_size or settings.NLP_BATCH_MAX_SIZE
+        self.max_wait = (
+            max_wait_ms if max_wait_ms is not None else settings.NLP_BATCH_MAX_WAIT_MS
+        ) / 1000
+        self._pending: List[PendingRequest] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._in_flight: Set[asyncio.Task[None]] = set()
+
+        self.batches_sent = 0
+        self.items_sent = 0
+        self.largest_batch = 0
+
+    async def submit(self, payload: Dict[str, Any]) -> ClassificationResult:
+        """Queue one classification and wait for its result.
+
+        Args:
+            payload: Single-item request payload (text, language, district_code)
+
+        Returns:
+            ClassificationResult for this payload
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[ClassificationResult] = loop.create_future()
+        self._pending.append((payload, future))
+
+        if len(self._pending) >= self.max_size:
+            self._dispatch()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._dispatch)
+
+        return await future
+
+    def _dispatch(self) -> None:
+        """Send everything pending as one batch."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, []
+        task = asyncio.create_task(self._send(batch))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _send(self, batch: List[PendingRequest]) -> None:
+        """Send one batch and resolve its callers' futures."""
+        self.batches_sent += 1
+        self.items_sent += len(batch)
+        self.largest_batch = max(self.largest_batch, len(batch))
+
+        try:
+            results = await self._send_batch([payload for payload, _ in batch])
+            if len(results) != len(batch):
+                logger.warning(
+                    f"NLP batch returned {len(results)} results for {len(batch)} texts"
+                )
+                results = [_fallback_result("Batch response size mismatch")] * len(batch)
+        except Exception as e:
+            logger.error(f"NLP batch send failed: {e}")
+            results = [_fallback_result(str(e))] * len(batch)
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():  # caller may have been cancelled
+                future.set_result(result)
+
+    async def flush(self) -> None:
+        """Send pending requests now and wait for all in-flight batches."""
+        self._dispatch()
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get batching statistics.
+
+        Returns:
+            Dict with pending, in-flight and batch size counters
+        """
+        return {
+            "pending": len(self._pending),
+            "in_flight_batches": len(self._in_flight),
+            "batches_sent": self.batches_sent,
+            "items_sent": self.items_sent,
+            "avg_batch_size": (
+                round(self.items_sent / self.batches_sent, 2) if self.batches_sent else 0.0
+            ),
+            "largest_batch": self.largest_batch,
+            "max_size": self.max_size,
+            "max_wait_ms": self.max_wait * 1000,
+        }
+
 
 class IndicBERTNLPService(INLPService):
     """Production NLP service using IndicBERT for department classification.
@@ -98,22 +281,49 @@ class IndicBERTNLPService(INLPService):
         self,
         base_url: Optional[str] = None,
         timeout: Optional[int] = None,
+        batching: Optional[bool] = None,
     ):
         self.base_url = base_url or settings.NLP_SERVICE_URL
         self.timeout = timeout or settings.NLP_SERVICE_TIMEOUT
         self._client: Optional[httpx.AsyncClient] = None
+        if batching is None:
+            batching = settings.NLP_BATCHING_ENABLED
+        self._batcher: Optional[ClassificationBatcher] = (
+            ClassificationBatcher(self._classify_batch) if batching else None
+        )
+        self.circuit = CircuitBreaker(
+            "nlp",
+            window_size=settings.NLP_CIRCUIT_WINDOW,
+            min_calls=settings.NLP_CIRCUIT_MIN_CALLS,
+            error_rate_threshold=settings.NLP_CIRCUIT_ERROR_RATE,
+            latency_threshold_ms=settings.NLP_CIRCUIT_P95_LATENCY_MS,
+            open_seconds=settings.NLP_CIRCUIT_OPEN_SECONDS,
+            half_open_max_calls=settings.NLP_CIRCUIT_HALF_OPEN_CALLS,
+        )
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
+        """Get or create HTTP client.
+
+        The pool is bounded so a burst of submissions queues for a
+        connection instead of opening hundreds of sockets to the model
+        server; idle connections are kept alive for reuse.
+        """
         if self._client is None or self._client.is_closed:
             self._client = httpx.AsyncClient(
                 base_url=self.base_url,
                 timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=settings.NLP_HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.NLP_HTTP_MAX_KEEPALIVE,
+                    keepalive_expiry=settings.NLP_HTTP_KEEPALIVE_EXPIRY,
+                ),
             )
         return self._client
 
     async def close(self) -> None:
-        """Close HTTP client."""
+        """Flush pending batches and close HTTP client."""
+        if self._batcher is not None:
+            await self._batcher.flush()
         if self._client is not None and not self._client.is_closed:
             await self._client.aclose()
             self._client = None
@@ -127,7 +337,8 @@ class IndicBERTNLPService(INLPService):
         """Classify grievance text using IndicBERT service.
 
         Makes POST request to NLP service API.
-        Returns fallback result on any failure.
+        Returns fallback result on any failure, and immediately while the
+        circuit breaker is open.
 
         Args:
             text: Grievance text to classify
@@ -145,20 +356,28 @@ class IndicBERTNLPService(INLPService):
                 error="NLP service disabled",
             )
 
+        payload = {
+            "text": text,
+            "language": language,
+        }
+        if district_code:
+            payload["district_code"] = district_code
+
+        if self._batcher is not None:
+            return await self._batcher.submit(payload)
+
+        if not self.circuit.allow_request():
+            return _fallback_result(CIRCUIT_OPEN_ERROR)
+
+        start = time.monotonic()
         try:
             client = await self._get_client()
 
-            payload = {
-                "text": text,
-                "language": language,
-            }
-            if district_code:
-                payload["district_code"] = district_code
-
             response = await client.post(
                 "/api/nlp/classify",
                 json=payload,
             )
+            self._record_response(response.status_code, start)
 
             if response.status_code != 200:
                 logger.warning(
@@ -171,17 +390,10 @@ class IndicBERTNLPService(INLPService):
                     error=f"Service returned {response.status_code}",
                 )
 
-            data = response.json()
-
-            return ClassificationResult(
-                department_id=data.get("department_id"),
-                confidence=data.get("confidence", 0.0),
-                department_code=data.get("department_code"),
-                department_name=data.get("department_name"),
-                fallback_used=False,
-            )
+            return _result_from_data(response.json())
 
         except httpx.TimeoutException:
+            self.circuit.record_failure(_elapsed_ms(start))
             logger.warning("NLP service timeout")
             return ClassificationResult(
                 department_id=None,
@@ -191,6 +403,7 @@ class IndicBERTNLPService(INLPService):
             )
 
         except httpx.RequestError as e:
+            self.circuit.record_failure(_elapsed_ms(start))
             logger.error(f"NLP service request error: {e}")
             return ClassificationResult(
                 department_id=None,
@@ -208,11 +421,64 @@ class IndicBERTNLPService(INLPService):
                 error=str(e),
             )
 
+    async def _classify_batch(
+        self, payloads: List[Dict[str, Any]]
+    ) -> List[ClassificationResult]:
+        """Classify several texts in one request to the batch endpoint.
+
+        Args:
+            payloads: Single-item payloads, in order
+
+        Returns:
+            One ClassificationResult per payload (fallbacks on failure)
+        """
+        if not self.circuit.allow_request():
+            return [_fallback_result(CIRCUIT_OPEN_ERROR) for _ in payloads]
+
+        start = time.monotonic()
+        try:
+            client = await self._get_client()
+            response = await client.post(
+                "/api/nlp/classify/batch",
+                json={"items": payloads},
+            )
+            self._record_response(response.status_code, start)
+
+            if response.status_code != 200:
+                logger.warning(
+                    f"NLP batch endpoint returned {response.status_code}: {response.text}"
+                )
+                error = f"Service returned {response.status_code}"
+                return [_fallback_result(error) for _ in payloads]
+
+            return [_result_from_data(item) for item in response.json()["results"]]
+
+        except httpx.TimeoutException:
+            self.circuit.record_failure(_elapsed_ms(start))
+            logger.warning(f"NLP service timeout (batch of {len(payloads)})")
+            return [_fallback_result("Service timeout") for _ in payloads]
+
+        except httpx.RequestError as e:
+            self.circuit.record_failure(_elapsed_ms(start))
+            logger.error(f"NLP service request error: {e}")
+            return [_fallback_result(str(e)) for _ in payloads]
+
+    def _record_response(self, status_code: int, start: float) -> None:
+        """Feed an HTTP response into the circuit breaker.
+
+        Server errors and 429 count as failures; other statuses mean the
+        service answered, so only their latency counts.
+        """
+        if status_code >= 500 or status_code == 429:
+            self.circuit.record_failure(_elapsed_ms(start))
+        else:
+            self.circuit.record_success(_elapsed_ms(start))
+
     async def health_check(self) -> Dict[str, Any]:
         """Check NLP service health.
 
         Returns:
-            Dict with status and latency
+            Dict with status, latency and circuit breaker state
         """
         if not settings.NLP_ENABLED:
             return {
@@ -220,9 +486,16 @@ class IndicBERTNLPService(INLPService):
                 "enabled": False,
             }
 
-        try:
-            import time
+        if self.circuit.state == CircuitState.OPEN:
+            # Don't wait on a service the breaker already considers down
+            return {
+                "status": "circuit_open",
+                "enabled": True,
+                "url": self.base_url,
+                "circuit": self.circuit.stats(),
+            }
 
+        try:
             client = await self._get_client()
             start = time.time()
 
@@ -230,18 +503,29 @@ class IndicBERTNLPService(INLPService):
             latency_ms = (time.time() - start) * 1000
 
             if response.status_code == 200:
-                return {
+                health = {
                     "status": "healthy",
                     "enabled": True,
                     "latency_ms": round(latency_ms, 2),
                     "url": self.base_url,
                 }
+                try:
+                    data = response.json()
+                except ValueError:
+                    data = None
+                if isinstance(data, dict) and isinstance(data.get("model_version"), str):
+                    health["model_version"] = data["model_version"]
+                if self._batcher is not None:
+                    health["batching"] = self._batcher.stats()
+                health["circuit"] = self.circuit.stats()
+                return health
             else:
                 return {
                     "status": "unhealthy",
                     "enabled": True,
                     "latency_ms": round(latency_ms, 2),
                     "error": f"Status code: {response.status_code}",
+                    "circuit": self.circuit.stats(),
                 }
 
         except Exception as e:
@@ -250,6 +534,7 @@ class IndicBERTNLPService(INLPService):
                 "enabled": True,
                 "error": str(e),
                 "url": self.base_url,
+                "circuit": self.circuit.stats(),
             }
 
 
@@ -331,6 +616,97 @@ class MockNLPService(INLPService):
         }
 
 
+class CachedNLPService(INLPService):
+    """Classification cache in front of another INLPService.
+
+    Only real predictions are cached; fallback results (service down,
+    timeout, disabled) always go back to the wrapped service. The model
+    version seen in responses and health checks is passed to the cache,
+    which drops its entries when the version changes.
+    """
+
+    def __init__(self, service: INLPService, cache: Optional[ClassificationCache] = None):
+        self.service = service
+        self.cache = cache or ClassificationCache()
+
+    async def classify_text(
+        self,
+        text: str,
+        language: str = "te",
+        district_code: Optional[str] = None,
+    ) -> ClassificationResult:
+        """Return a cached classification or classify and cache it."""
+        key = classification_cache_key(text, language, district_code)
+
+        cached = await self.cache.get(key)
+        if cached is not None:
+            return ClassificationResult(**cached)
+
+        result = await self.service.classify_text(text, language, district_code)
+        if not result.fallback_used:
+            self.cache.observe_model_version(result.model_version)
+            await self.cache.set(key, result.to_dict())
+        return result
+
+    async def health_check(self) -> Dict[str, Any]:
+        """Wrapped service health plus cache statistics."""
+        health = await self.service.health_check()
+        self.cache.observe_model_version(health.get("model_version"))
+        return {**health, "cache": self.cache.stats()}
+
+    async def close(self) -> None:
+        """Close the wrapped service and the cache's Redis connection."""
+        await self.service.close()
+        await self.cache.close()
+
+
+class TieredNLPService(INLPService):
+    """Primary INLPService with a fallback tier.
+
+    When the primary returns a fallback result (service down, circuit
+    open, timeout), the text is classified by the fallback service instead
+    so grievances can still be auto-routed.
+    """
+
+    def __init__(self, primary: INLPService, fallback: INLPService):
+        self.primary = primary
+        self.fallback = fallback
+        self.fallback_calls = 0
+
+    async def classify_text(
+        self,
+        text: str,
+        language: str = "te",
+        district_code: Optional[str] = None,
+    ) -> ClassificationResult:
+        """Classify with the primary, falling back to the second tier."""
+        result = await self.primary.classify_text(text, language, district_code)
+        if not result.fallback_used or not settings.NLP_ENABLED:
+            return result
+
+        self.fallback_calls += 1
+        fallback_result = await self.fallback.classify_text(text, language, district_code)
+        return result if fallback_result.fallback_used else fallback_result
+
+    async def health_check(self) -> Dict[str, Any]:
+        """Primary health plus the fallback tier's health and usage."""
+        health = await self.primary.health_check()
+        fallback_health = await self.fallback.health_check()
+        status = health.get("status")
+        if status not in ("healthy", "disabled") and fallback_health.get("status") == "healthy":
+            status = "degraded"  # primary down, but classification still available
+        return {
+            **health,
+            "status": status,
+            "fallback": {**fallback_health, "calls": self.fallback_calls},
+        }
+
+    async def close(self) -> None:
+        """Close both tiers."""
+        for service in (self.primary, self.fallback):
+            await service.close()
+
+
 # Singleton instance for the application
 _nlp_service: Optional[INLPService] = None
 
@@ -339,6 +715,10 @@ def get_nlp_service() -> INLPService:
     """Get the NLP service instance.
 
     Returns production service by default, or mock if NLP_ENABLED=false.
+    The production service is wrapped in CachedNLPService when
+    NLP_CACHE_ENABLED is set. NLP_LOCAL_MODE=primary replaces IndicBERT
+    with the bundled local classifier; NLP_LOCAL_MODE=fallback puts the
+    local classifier behind it.
 
     Returns:
         INLPService instance
@@ -347,7 +727,19 @@ def get_nlp_service() -> INLPService:
 
     if _nlp_service is None:
         if settings.NLP_ENABLED:
-            _nlp_service = IndicBERTNLPService()
+            from app.services.local_nlp_service import get_local_nlp_service
+
+            service: INLPService
+            if settings.NLP_LOCAL_MODE == "primary":
+                service = get_local_nlp_service()
+            else:
+                service = IndicBERTNLPService()
+            if settings.NLP_CACHE_ENABLED:
+                service = CachedNLPService(service)
+            if settings.NLP_LOCAL_MODE == "fallback":
+                # Local results are not cached: the cache holds primary-model answers
+                service = TieredNLPService(service, get_local_nlp_service())
+            _nlp_service = service
         else:
             _nlp_service = MockNLPService()
 
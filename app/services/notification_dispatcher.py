@@ -0,0 +1,322 @@
+"""Bulk outbound notification dispatcher.
+
+Sends batches of templated messages (proactive empowerment triggers,
+opt-in prompt retries) without a database round-trip per message:
+
+1. De-duplicates the batch per (phone, interaction type, day), both within
+   the batch and against today's logged interactions (one query per chunk
+   of phones). Failed sends do not count, so the next run retries them.
+2. Renders each message from the cached templates in
+   app.templates.empowerment_messages, or from templates registered on the
+   dispatcher (e.g. trigger configs loaded from the database).
+3. Sends through a pool of NOTIFY_WORKERS tasks, spacing sends on each
+   provider channel to NOTIFY_WHATSAPP_RATE / NOTIFY_SMS_RATE per second.
+4. Records every delivery result with one bulk INSERT into
+   empowerment_interactions and one commit.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import and_, insert, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.citizen_empowerment import EmpowermentInteraction
+from app.schemas.citizen_empowerment import InteractionType
+from app.services.sms_service import ISMSService, get_sms_service
+from app.services.whatsapp_service import IWhatsAppService, get_whatsapp_service
+from app.templates.empowerment_messages import get_template
+
+logger = logging.getLogger(__name__)
+
+CHANNELS = ("whatsapp", "sms")
+
+# Phones per IN (...) list in the de-duplication query
+DEDUP_CHUNK_SIZE = 1000
+
+
+@dataclass
+class Notification:
+    """One outbound message.
+
+    Attributes:
+        phone: Recipient phone number
+        template: Template name (see MESSAGE_TEMPLATES or register_template)
+        params: Template parameters
+        channel: "whatsapp" (falls back to SMS) or "sms"
+        language: Template language ("te" or "en")
+        interaction_type: Logged interaction type (also the de-duplication scope)
+        grievance_id: Related grievance, if any
+        trigger_reason: Logged trigger reason, if any
+    """
+
+    phone: str
+    template: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    channel: str = "whatsapp"
+    language: str = "te"
+    interaction_type: InteractionType = InteractionType.PROACTIVE_TRIGGER
+    grievance_id: Optional[str] = None
+    trigger_reason: Optional[str] = None
+
+
+@dataclass
+class DeliveryResult:
+    """Outcome for one notification.
+
+    Attributes:
+        notification: The notification
+        status: "sent", "failed" or "skipped" (duplicate for the day)
+        channel: Channel actually used (SMS after a WhatsApp fallback)
+        message: Rendered text (None if skipped or rendering failed)
+        message_sid: Provider message ID
+        error: Failure or skip reason
+    """
+
+    notification: Notification
+    status: str
+    channel: Optional[str] = None
+    message: Optional[str] = None
+    message_sid: Optional[str] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class DispatchReport:
+    """Outcome of a dispatch run, in input order."""
+
+    results: List[DeliveryResult] = field(default_factory=list)
+
+    def count(self, status: str) -> int:
+        """Number of results with status."""
+        return sum(1 for r in self.results if r.status == status)
+
+    @property
+    def sent(self) -> int:
+        return self.count("sent")
+
+    @property
+    def failed(self) -> int:
+        return self.count("failed")
+
+    @property
+    def skipped(self) -> int:
+        return self.count("skipped")
+
+
+class RateShaper:
+    """Spaces calls to at most `rate` per second, allowing short bursts.
+
+    Each acquire reserves the next free slot before sleeping, so concurrent
+    callers on one event loop are spread out rather than released together.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self.burst = max(1, burst)
+        self._next_slot = 0.0
+
+    async def acquire(self) -> None:
+        """Wait for the next slot."""
+        if not self.interval:
+            return
+        now = time.monotonic()
+        slot = max(self._next_slot, now - (self.burst - 1) * self.interval)
+        self._next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+def _chunks(items: Sequence[str], size: int) -> Iterator[Sequence[str]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+class NotificationDispatcher:
+    """Concurrent, rate-shaped sender for batches of notifications."""
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        whatsapp: Optional[IWhatsAppService] = None,
+        sms: Optional[ISMSService] = None,
+        workers: Optional[int] = None,
+        rates: Optional[Dict[str, float]] = None,
+    ):
+        self._db = db
+        self._whatsapp = whatsapp
+        self._sms = sms
+        self.workers = workers or settings.NOTIFY_WORKERS
+        rates = rates or {
+            "whatsapp": settings.NOTIFY_WHATSAPP_RATE,
+            "sms": settings.NOTIFY_SMS_RATE,
+        }
+        self._shapers = {channel: RateShaper(rates.get(channel, 0)) for channel in CHANNELS}
+        self._templates: Dict[Tuple[str, str], str] = {}
+
+    def register_template(self, name: str, te: str, en: str) -> None:
+        """Use these texts for template `name`, overriding the registry."""
+        self._templates[(name, "te")] = te
+        self._templates[(name, "en")] = en
+
+    def render(self, notification: Notification) -> str:
+        """Render a notification's message.
+
+        Raises:
+            KeyError: Unknown template or missing parameter
+        """
+        language = "te" if notification.language == "te" else "en"
+        template = self._templates.get((notification.template, language))
+        if template is None:
+            template = get_template(notification.template, language)
+        return template.format(**notification.params)
+
+    async def dispatch(self, notifications: Sequence[Notification]) -> DispatchReport:
+        """De-duplicate, render, send and record a batch.
+
+        Args:
+            notifications: Messages to send
+
+        Returns:
+            DispatchReport with one result per notification
+        """
+        report = DispatchReport(
+            [DeliveryResult(n, status="pending") for n in notifications]
+        )
+        if not notifications:
+            return report
+
+        already_sent = await self._sent_today(notifications)
+        to_send: List[DeliveryResult] = []
+        for result in report.results:
+            n = result.notification
+            key = (n.phone, n.interaction_type.value)
+            if key in already_sent:
+                result.status = "skipped"
+                result.error = "Already notified today"
+                continue
+            already_sent.add(key)
+            try:
+                result.message = self.render(n)
+            except (KeyError, IndexError, ValueError) as e:
+                result.status = "failed"
+                result.error = f"Template error: {e!r}"
+                continue
+            to_send.append(result)
+
+        await self._send_all(to_send)
+        await self._record(r for r in report.results if r.status != "skipped")
+
+        logger.info(
+            f"Dispatched {len(notifications)} notifications: {report.sent} sent, "
+            f"{report.failed} failed, {report.skipped} skipped"
+        )
+        return report
+
+    async def _sent_today(self, notifications: Sequence[Notification]) -> Set[Tuple[str, str]]:
+        """(phone, interaction type) pairs already notified today."""
+        today_start = datetime.now(timezone.utc).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        phones = sorted({n.phone for n in notifications})
+        types = sorted({n.interaction_type.value for n in notifications})
+        seen: Set[Tuple[str, str]] = set()
+
+        for chunk in _chunks(phones, DEDUP_CHUNK_SIZE):
+            stmt = select(
+                EmpowermentInteraction.citizen_phone,
+                EmpowermentInteraction.interaction_type,
+            ).where(
+                and_(
+                    EmpowermentInteraction.citizen_phone.in_(chunk),
+                    EmpowermentInteraction.interaction_type.in_(types),
+                    EmpowermentInteraction.created_at >= today_start,
+                    or_(
+                        EmpowermentInteraction.delivery_status.is_(None),
+                        EmpowermentInteraction.delivery_status != "failed",
+                    ),
+                )
+            ).distinct()
+            result = await self._db.execute(stmt)
+            seen.update((phone, kind) for phone, kind in result.all())
+
+        return seen
+
+    async def _send_all(self, results: List[DeliveryResult]) -> None:
+        """Send through the worker pool, filling in each result."""
+        queue: "asyncio.Queue[DeliveryResult]" = asyncio.Queue()
+        for result in results:
+            queue.put_nowait(result)
+
+        async def worker() -> None:
+            while True:
+                try:
+                    result = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                await self._send_one(result)
+
+        await asyncio.gather(*(worker() for _ in range(min(self.workers, len(results)))))
+
+    async def _send_one(self, result: DeliveryResult) -> None:
+        """Send one rendered notification on its channel."""
+        n = result.notification
+        channel = n.channel if n.channel in CHANNELS else "whatsapp"
+        if result.message is None:
+            result.channel = channel
+            result.status = "failed"
+            result.error = "No rendered message"
+            return
+
+        await self._shapers[channel].acquire()
+
+        try:
+            if channel == "sms":
+                sms = await (self._sms or get_sms_service()).send_sms(n.phone, result.message)
+                result.channel = "sms"
+                result.message_sid = sms.message_sid
+                sent, error = sms.success, sms.error
+            else:
+                wa = await (self._whatsapp or get_whatsapp_service()).send_message(
+                    to_phone=n.phone,
+                    message=result.message,
+                    fallback_to_sms=True,
+                )
+                result.channel = "sms" if wa.fallback_to_sms else "whatsapp"
+                result.message_sid = wa.message_sid or (
+                    wa.sms_result.message_sid if wa.sms_result else None
+                )
+                sent, error = wa.success, wa.error
+        except Exception as e:
+            logger.error(f"Failed to send notification to {n.phone}: {e}")
+            result.channel = channel
+            sent, error = False, str(e)
+
+        result.status = "sent" if sent else "failed"
+        result.error = None if sent else error
+
+    async def _record(self, results: Iterable[DeliveryResult]) -> None:
+        """Log results with one bulk INSERT and one commit."""
+        rows = [
+            {
+                "grievance_id": r.notification.grievance_id,
+                "citizen_phone": r.notification.phone,
+                "interaction_type": r.notification.interaction_type.value,
+                "trigger_reason": r.notification.trigger_reason,
+                "message_sent": r.message,
+                "channel": r.channel,
+                "delivery_status": r.status,
+                "message_sid": r.message_sid,
+                "delivery_error": r.error,
+            }
+            for r in results
+        ]
+        if not rows:
+            return
+        await self._db.execute(insert(EmpowermentInteraction), rows)
+        await self._db.commit()
@@ -5,18 +5,80 @@ Manages OTP lifecycle with Redis storage:
 - Storage with TTL in Redis
 - Verification with attempt tracking
 - Rate limiting integration
+
+RedisOTPService runs generate and verify as Lua scripts, so each is one
+atomic round-trip and concurrent verifications cannot overrun the attempt
+limit.
 """
 
 import logging
 import secrets
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from app.config import settings
+from app.services.redis_manager import get_redis_manager
 
 logger = logging.getLogger(__name__)
 
+# Store a new OTP and reset its attempt counter.
+# KEYS[1] = OTP key, KEYS[2] = attempts key; ARGV[1] = "phone:otp", ARGV[2] = TTL
+GENERATE_OTP_SCRIPT = """
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+redis.call('SET', KEYS[2], '0', 'EX', ARGV[2])
+return 1
+"""
+
+# Verify statuses returned by VERIFY_OTP_SCRIPT
+OTP_NOT_FOUND = 0
+OTP_LOCKED = 1
+OTP_PHONE_MISMATCH = 2
+OTP_INVALID = 3
+OTP_VERIFIED = 4
+
+# Check, count and consume an OTP in one step. The code comparison does not
+# stop at the first differing byte.
+# KEYS[1] = OTP key, KEYS[2] = attempts key; ARGV[1] = phone, ARGV[2] = OTP,
+# ARGV[3] = max attempts. Returns {status, attempts remaining}.
+VERIFY_OTP_SCRIPT = """
+local data = redis.call('GET', KEYS[1])
+if not data then
+    return {0, 0}
+end
+local max_attempts = tonumber(ARGV[3])
+local attempts = tonumber(redis.call('GET', KEYS[2])) or 0
+if attempts >= max_attempts then
+    redis.call('DEL', KEYS[1], KEYS[2])
+    return {1, 0}
+end
+attempts = redis.call('INCR', KEYS[2])
+if redis.call('PTTL', KEYS[2]) < 0 then
+    local ttl = redis.call('PTTL', KEYS[1])
+    if ttl > 0 then
+        redis.call('PEXPIRE', KEYS[2], ttl)
+    end
+end
+local remaining = max_attempts - attempts
+local sep = string.find(data, ':', 1, true)
+if ARGV[1] ~= string.sub(data, 1, sep - 1) then
+    return {2, remaining}
+end
+local stored = string.sub(data, sep + 1)
+local candidate = ARGV[2]
+local diff = (#candidate == #stored) and 0 or 1
+for i = 1, #stored do
+    if string.byte(candidate, i) ~= string.byte(stored, i) then
+        diff = 1
+    end
+end
+if diff ~= 0 then
+    return {3, remaining}
+end
+redis.call('DEL', KEYS[1], KEYS[2])
+return {4, 0}
+"""
+
 
 class OTPResult:
     """Result of OTP operations."""
@@ -129,30 +191,37 @@ class RedisOTPService(IOTPService):
     """Production OTP service using Redis.
 
     Stores OTPs in Redis with TTL and tracks verification attempts.
+    Generate and verify are each one EVALSHA of a Lua script.
     """
 
     def __init__(self, redis_client: Optional[Any] = None) -> None:
         self._redis = redis_client
         self._otp_prefix = "otp:"
         self._attempts_prefix = "otp_attempts:"
+        self._scripts_client: Optional[Any] = None
+        self._generate_script: Optional[Any] = None
+        self._verify_script: Optional[Any] = None
 
     async def _get_redis(self) -> Any:
-        """Get or create Redis client."""
-        if self._redis is None:
-            try:
-                import redis.asyncio as aioredis
-
-                # Use OTP-specific Redis DB
-                redis_url = settings.REDIS_URL.rsplit("/", 1)[0]
-                self._redis = aioredis.from_url(  # type: ignore[no-untyped-call]
-                    f"{redis_url}/{settings.REDIS_OTP_DB}",
-                    encoding="utf-8",
-                    decode_responses=True,
-                )
-            except ImportError:
-                logger.error("Redis library not installed")
-                raise RuntimeError("Redis library required for OTP service")
-        return self._redis
+        """Get the Redis client (shared pool on the OTP-specific DB)."""
+        if self._redis is not None:
+            return self._redis
+        try:
+            return get_redis_manager().client(db=settings.REDIS_OTP_DB)
+        except ImportError:
+            logger.error("Redis library not installed")
+            raise RuntimeError("Redis library required for OTP service")
+
+    def _get_scripts(self, redis: Any) -> Tuple[Any, Any]:
+        """Get the (generate, verify) scripts registered on a client.
+
+        Script objects run EVALSHA, loading the script on NOSCRIPT.
+        """
+        if redis is not self._scripts_client:
+            self._generate_script = redis.register_script(GENERATE_OTP_SCRIPT)
+            self._verify_script = redis.register_script(VERIFY_OTP_SCRIPT)
+            self._scripts_client = redis
+        return self._generate_script, self._verify_script
 
     def _generate_otp_code(self) -> str:
         """Generate a secure random OTP code.
@@ -191,27 +260,18 @@ class RedisOTPService(IOTPService):
         """
         try:
             redis = await self._get_redis()
+            generate_script, _ = self._get_scripts(redis)
 
             # Generate OTP
             otp = self._generate_otp_code()
 
-            # Store OTP with phone for verification
-            otp_key = self._get_otp_key(identifier)
-            otp_data = f"{phone}:{otp}"
-
-            # Set with TTL
-            await redis.setex(
-                otp_key,
-                settings.OTP_EXPIRY_SECONDS,
-                otp_data,
-            )
-
-            # Reset attempt counter
-            attempts_key = self._get_attempts_key(identifier)
-            await redis.setex(
-                attempts_key,
-                settings.OTP_EXPIRY_SECONDS,
-                "0",
+            # Store OTP with phone for verification and reset attempt counter
+            await generate_script(
+                keys=[
+                    self._get_otp_key(identifier),
+                    self._get_attempts_key(identifier),
+                ],
+                args=[f"{phone}:{otp}", settings.OTP_EXPIRY_SECONDS],
             )
 
             expires_at = datetime.now(timezone.utc)
@@ -253,30 +313,27 @@ class RedisOTPService(IOTPService):
         """
         try:
             redis = await self._get_redis()
+            _, verify_script = self._get_scripts(redis)
+
+            # Check, count and consume the attempt atomically
+            status, remaining = await verify_script(
+                keys=[
+                    self._get_otp_key(identifier),
+                    self._get_attempts_key(identifier),
+                ],
+                args=[phone, otp, settings.OTP_MAX_ATTEMPTS],
+            )
+            status, remaining = int(status), int(remaining)
 
-            otp_key = self._get_otp_key(identifier)
-            attempts_key = self._get_attempts_key(identifier)
-
-            # Get stored OTP data
-            stored_data = await redis.get(otp_key)
-
-            if stored_data is None:
+            if status == OTP_NOT_FOUND:
                 return OTPResult(
                     success=False,
                     message="OTP expired or not found",
                     error="OTP not found",
                 )
 
-            # Parse stored data
-            stored_phone, stored_otp = stored_data.split(":", 1)
-
-            # Check attempts
-            current_attempts = await redis.get(attempts_key)
-            attempts = int(current_attempts) if current_attempts else 0
-
-            if attempts >= settings.OTP_MAX_ATTEMPTS:
-                # Max attempts reached, invalidate OTP
-                await self.invalidate_otp(identifier)
+            if status == OTP_LOCKED:
+                # Max attempts reached, OTP invalidated by the script
                 return OTPResult(
                     success=False,
                     message="Maximum verification attempts exceeded",
@@ -284,18 +341,8 @@ class RedisOTPService(IOTPService):
                     error="Max attempts exceeded",
                 )
 
-            # Increment attempt counter
-            attempts += 1
-            await redis.setex(
-                attempts_key,
-                settings.OTP_EXPIRY_SECONDS,
-                str(attempts),
-            )
-
-            remaining = settings.OTP_MAX_ATTEMPTS - attempts
-
             # Verify phone matches
-            if phone != stored_phone:
+            if status == OTP_PHONE_MISMATCH:
                 logger.warning(
                     f"OTP verification failed - phone mismatch for {identifier[:8]}..."
                 )
@@ -306,8 +353,7 @@ class RedisOTPService(IOTPService):
                     error="Phone mismatch",
                 )
 
-            # Verify OTP (constant time comparison)
-            if not secrets.compare_digest(otp, stored_otp):
+            if status == OTP_INVALID:
                 logger.warning(
                     f"OTP verification failed - invalid code for {identifier[:8]}..."
                 )
@@ -318,9 +364,7 @@ class RedisOTPService(IOTPService):
                     error="Invalid OTP",
                 )
 
-            # OTP verified successfully - invalidate it
-            await self.invalidate_otp(identifier)
-
+            # OTP verified successfully - invalidated by the script
             logger.info(f"OTP verified successfully for {identifier[:8]}...")
 
             return OTPResult(
@@ -0,0 +1,279 @@
+"""Principal cache for authenticated users.
+
+get_current_user resolves the JWT subject to a User on every request;
+dashboards polling several endpoints make that one of the hottest queries.
+This cache keeps the resolved users per worker for AUTH_PRINCIPAL_CACHE_TTL
+seconds, bounded to AUTH_PRINCIPAL_CACHE_MAX_ENTRIES with LRU eviction.
+
+Cached values are detached snapshots (columns plus department and district)
+rather than the instance loaded by the request, so a rollback or close of
+that request's session can never expire a user other requests are holding.
+Other relationships are not loaded on a snapshot.
+
+Invalidation:
+- Any committed ORM change to a User (role, is_active, password_hash,
+  deleted_at, ...) drops the entry locally and is published on
+  PRINCIPAL_INVALIDATION_CHANNEL; every worker's subscriber drops it too.
+- Core UPDATE statements bypass the ORM; call invalidate_principal().
+- If the subscriber loses Redis the whole cache is cleared, since
+  broadcasts may have been missed. The TTL bounds staleness regardless.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.config import settings
+from app.models.user import User
+from app.services.redis_manager import get_redis_manager
+
+logger = logging.getLogger(__name__)
+
+# Redis channel carrying user IDs whose cached principal must be dropped
+PRINCIPAL_INVALIDATION_CHANNEL = "auth:principal:invalidate"
+
+# Seconds to wait before resubscribing after a Redis failure
+REDIS_RETRY_INTERVAL = 5
+
+# Relationships copied into snapshots (read by /auth/me)
+SNAPSHOT_RELATIONSHIPS = ("department", "district")
+
+# session.info key collecting users changed in the current transaction
+_SESSION_INFO_KEY = "principal_cache_invalidations"
+
+
+def _detached_copy(instance: Any, relationships: Tuple[str, ...] = ()) -> Any:
+    """Copy loaded column values (and the given relationships) of an ORM
+    instance into a new detached instance, without firing backrefs."""
+    mapper = inspect(instance).mapper
+    copy = mapper.class_manager.new_instance()
+    for attr in mapper.column_attrs:
+        set_committed_value(copy, attr.key, getattr(instance, attr.key))
+    for name in relationships:
+        related = getattr(instance, name)
+        set_committed_value(
+            copy, name, _detached_copy(related) if related is not None else None
+        )
+    make_transient_to_detached(copy)
+    return copy
+
+
+class PrincipalCache:
+    """Per-process TTL + LRU cache of User snapshots keyed by user ID."""
+
+    def __init__(
+        self,
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        enabled: Optional[bool] = None,
+    ):
+        self.ttl_seconds = ttl_seconds or settings.AUTH_PRINCIPAL_CACHE_TTL
+        self.max_entries = max_entries or settings.AUTH_PRINCIPAL_CACHE_MAX_ENTRIES
+        if enabled is None:
+            enabled = settings.AUTH_PRINCIPAL_CACHE_ENABLED
+        self.enabled = enabled
+
+        # user_id -> (expires_at monotonic, snapshot)
+        self._entries: "OrderedDict[UUID, Tuple[float, User]]" = OrderedDict()
+        self._task: Optional[asyncio.Task[None]] = None
+        self._subscribed = False
+        self._publish_tasks: Set[asyncio.Task[None]] = set()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, user_id: UUID) -> Optional[User]:
+        """Return the cached user snapshot, or None on a miss."""
+        if not self.enabled:
+            return None
+        entry = self._entries.get(user_id)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._entries[user_id]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(user_id)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, user: User) -> None:
+        """Cache a snapshot of a user loaded by the current request."""
+        if not self.enabled:
+            return
+        self._entries[user.id] = (
+            time.monotonic() + self.ttl_seconds,
+            _detached_copy(user, SNAPSHOT_RELATIONSHIPS),
+        )
+        self._entries.move_to_end(user.id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate_local(self, user_id: UUID) -> None:
+        """Drop a user from this worker's cache."""
+        if self._entries.pop(user_id, None) is not None:
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        """Drop every cached user."""
+        self._entries.clear()
+
+    async def publish(self, user_id: UUID) -> None:
+        """Broadcast an invalidation to every worker (including this one)."""
+        try:
+            client = get_redis_manager().client()
+            await client.publish(PRINCIPAL_INVALIDATION_CHANNEL, str(user_id))
+        except Exception as e:
+            logger.warning(f"Principal invalidation broadcast failed for {user_id}: {e}")
+
+    async def invalidate(self, user_id: UUID) -> None:
+        """Drop a user here and broadcast the invalidation."""
+        self.invalidate_local(user_id)
+        await self.publish(user_id)
+
+    def invalidate_soon(self, user_id: UUID) -> None:
+        """Drop a user here and broadcast from a background task.
+
+        For synchronous callers (ORM events); without a running loop only
+        the local entry is dropped.
+        """
+        self.invalidate_local(user_id)
+        try:
+            task = asyncio.get_running_loop().create_task(self.publish(user_id))
+        except RuntimeError:
+            return
+        self._publish_tasks.add(task)
+        task.add_done_callback(self._publish_tasks.discard)
+
+    def handle_message(self, message: Dict[str, Any]) -> None:
+        """Apply one pub/sub message."""
+        if message.get("type") != "message":
+            return
+        try:
+            self.invalidate_local(UUID(message["data"]))
+        except (KeyError, TypeError, ValueError):
+            logger.warning(f"Ignoring malformed principal invalidation: {message!r}")
+
+    async def _listen(self) -> None:
+        """Apply invalidations from other workers until cancelled."""
+        while True:
+            try:
+                pubsub = get_redis_manager().client().pubsub()
+                await pubsub.subscribe(PRINCIPAL_INVALIDATION_CHANNEL)
+                try:
+                    self._subscribed = True
+                    while True:
+                        # Short polls stay under the pool's socket timeout
+                        message = await pubsub.get_message(timeout=1.0)
+                        if message is not None:
+                            self.handle_message(message)
+                finally:
+                    self._subscribed = False
+                    await pubsub.close()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Principal invalidation subscriber lost Redis: {e}")
+            # Broadcasts may have been missed while disconnected
+            self.clear()
+            await asyncio.sleep(REDIS_RETRY_INTERVAL)
+
+    async def start(self) -> None:
+        """Start the invalidation subscriber."""
+        if self.enabled and self._task is None:
+            self._task = asyncio.create_task(self._listen(), name="principal-cache-subscriber")
+
+    async def stop(self) -> None:
+        """Stop the subscriber and wait for pending broadcasts."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._publish_tasks:
+            await asyncio.gather(*self._publish_tasks, return_exceptions=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache size, hit/miss counters and subscriber state."""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "subscribed": self._subscribed,
+        }
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_user_changes(session: Session, flush_context: Any) -> None:
+    """Remember users updated or deleted in this transaction."""
+    # Still the pre-flush dirty/deleted lists and attribute history here
+    changed = {
+        obj.id for obj in session.dirty
+        if isinstance(obj, User) and session.is_modified(obj)
+    }
+    changed.update(obj.id for obj in session.deleted if isinstance(obj, User))
+    if changed:
+        session.info.setdefault(_SESSION_INFO_KEY, set()).update(changed)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_user_changes(session: Session) -> None:
+    """Invalidate users whose changes were just committed."""
+    for user_id in session.info.pop(_SESSION_INFO_KEY, ()):
+        get_principal_cache().invalidate_soon(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_user_changes(session: Session) -> None:
+    session.info.pop(_SESSION_INFO_KEY, None)
+
+
+# Singleton instance
+_principal_cache: Optional[PrincipalCache] = None
+
+
+def get_principal_cache() -> PrincipalCache:
+    """Get the principal cache instance.
+
+    Returns:
+        PrincipalCache (subscriber started from the app lifespan)
+    """
+    global _principal_cache
+
+    if _principal_cache is None:
+        _principal_cache = PrincipalCache()
+
+    return _principal_cache
+
+
+def reset_principal_cache() -> None:
+    """Reset the principal cache singleton (for testing)."""
+    global _principal_cache
+    _principal_cache = None
+
+
+async def invalidate_principal(user_id: UUID) -> None:
+    """Invalidate a cached user on every worker.
+
+    Call after changing a user with a Core UPDATE (ORM changes are
+    invalidated automatically on commit).
+
+    Args:
+        user_id: User UUID
+    """
+    await get_principal_cache().invalidate(user_id)
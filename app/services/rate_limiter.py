@@ -1,19 +1,77 @@
 """Rate Limiter Service using Redis.
 
 Provides request rate limiting with Redis backend and in-memory fallback.
-Implements sliding window rate limiting algorithm.
+Implements GCRA (generic cell rate algorithm), a sliding-window limiter
+that keeps one timestamp per key: the theoretical arrival time (TAT) of the
+next request. A limit of N per window admits requests spaced window/N
+apart, with bursts of up to N; unlike a fixed window it cannot admit 2N
+requests across a window boundary.
 """
 
 import logging
+import math
 import time
 from abc import ABC, abstractmethod
-from collections import defaultdict
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 from app.config import settings
+from app.services.redis_manager import CheckedRedisClient
 
 logger = logging.getLogger(__name__)
 
+# Seconds between in-memory sweeps of idle keys
+IDLE_SWEEP_INTERVAL = 60
+
+# GCRA in one round-trip. Times are milliseconds from the Redis clock so all
+# workers agree on "now"; 1ms of slack absorbs float rounding of the stored TAT.
+# KEYS[1] = rate key; ARGV[1] = emission interval (window / limit);
+# ARGV[2] = window. Returns {allowed, remaining, retry_after, reset}.
+GCRA_SCRIPT = """
+if redis.replicate_commands then redis.replicate_commands() end
+local emission = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = clock[1] * 1000 + math.floor(clock[2] / 1000)
+local ahead = math.max((tonumber(redis.call('GET', KEYS[1])) or now) - now, 0)
+local new_ahead = ahead + emission
+if new_ahead > window + 1 then
+    return {0, 0, math.ceil(new_ahead - window), math.ceil(ahead)}
+end
+redis.call('SET', KEYS[1], tostring(now + new_ahead), 'PX', math.ceil(new_ahead))
+local remaining = math.max(math.floor((window - new_ahead) / emission + 1e-6), 0)
+return {1, remaining, 0, math.ceil(new_ahead)}
+"""
+
+# Relative tolerance for float rounding in gcra()
+GCRA_EPSILON = 1e-9
+
+
+def gcra(
+    tat: float,
+    now: float,
+    limit: int,
+    window_seconds: float,
+) -> Tuple[bool, float, int, float, float]:
+    """Apply GCRA to one request (in-memory twin of GCRA_SCRIPT).
+
+    Args:
+        tat: Stored theoretical arrival time (0 if none)
+        now: Current time
+        limit: Requests allowed per window
+        window_seconds: Window length
+
+    Returns:
+        (allowed, new tat, remaining, retry_after, reset) with times in seconds
+    """
+    emission = window_seconds / limit
+    # How far the key's TAT runs ahead of now; the allowance used up
+    ahead = max(tat - now, 0.0)
+    new_ahead = ahead + emission
+    if new_ahead > window_seconds * (1 + GCRA_EPSILON):
+        return False, tat, 0, new_ahead - window_seconds, ahead
+    remaining = max(int((window_seconds - new_ahead) / emission + GCRA_EPSILON), 0)
+    return True, now + new_ahead, remaining, 0.0, new_ahead
+
 
 class RateLimitResult:
     """Result of rate limit check."""
@@ -89,41 +147,23 @@ class IRateLimiter(ABC):
 
 
 class RedisRateLimiter(IRateLimiter):
-    """Redis-based rate limiter using sliding window algorithm.
+    """Redis-based rate limiter using GCRA.
 
-    Uses Redis INCR with expiry for efficient rate limiting.
+    Each check is one EVALSHA of GCRA_SCRIPT against a single key holding
+    the TAT, which expires once the key is idle for a full window.
     Falls back to allowing requests if Redis is unavailable.
     """
 
     def __init__(self, redis_url: Optional[str] = None):
         self.redis_url = redis_url or settings.REDIS_URL
-        self._client = None
-        self._connection_error = False
-
-    async def _get_client(self) -> Any:
-        """Get or create Redis client."""
-        if self._client is None:
-            try:
-                import redis.asyncio as redis
-
-                self._client = redis.from_url(  # type: ignore[no-untyped-call]
-                    self.redis_url,
-                    encoding="utf-8",
-                    decode_responses=True,
-                    socket_connect_timeout=5,
-                    socket_timeout=5,
-                )
-                # Test connection
-                assert self._client is not None
-                await self._client.ping()
-                self._connection_error = False
-            except Exception as e:
-                logger.error(f"Redis connection failed: {e}")
-                self._connection_error = True
-                self._client = None
-                raise
-
-        return self._client
+        self._script: Optional[Any] = None
+        self._redis = CheckedRedisClient(
+            "rate limiter", url=self.redis_url, on_connect=self._register_script
+        )
+
+    def _register_script(self, client: Any) -> None:
+        """Script object: EVALSHA, loading the script on NOSCRIPT."""
+        self._script = client.register_script(GCRA_SCRIPT)
 
     async def check_rate_limit(
         self,
@@ -133,7 +173,7 @@ class RedisRateLimiter(IRateLimiter):
     ) -> RateLimitResult:
         """Check rate limit using Redis.
 
-        Uses atomic INCR with expiry for sliding window.
+        Runs GCRA atomically in one EVALSHA round-trip.
 
         Args:
             key: Rate limit key
@@ -151,37 +191,30 @@ class RedisRateLimiter(IRateLimiter):
                 reset_seconds=0,
             )
 
-        redis_key = f"rate:{key}:{int(time.time()) // window_seconds}"
-
         try:
-            client = await self._get_client()
-
-            # Atomic increment with expiry
-            pipe = client.pipeline()
-            pipe.incr(redis_key)
-            pipe.expire(redis_key, window_seconds)
-            results = await pipe.execute()
+            await self._redis.get()
+            assert self._script is not None
 
-            current_count = results[0]
-            remaining = max(0, limit - current_count)
-
-            # Calculate reset time
-            window_start = (int(time.time()) // window_seconds) * window_seconds
-            reset_seconds = window_start + window_seconds - int(time.time())
+            window_ms = window_seconds * 1000
+            allowed, remaining, retry_after_ms, reset_ms = await self._script(
+                keys=[f"rate:{key}"],
+                args=[window_ms / limit, window_ms],
+            )
 
-            if current_count > limit:
+            reset_seconds = math.ceil(int(reset_ms) / 1000)
+            if not allowed:
                 return RateLimitResult(
                     allowed=False,
                     limit=limit,
                     remaining=0,
                     reset_seconds=reset_seconds,
-                    retry_after=reset_seconds,
+                    retry_after=max(1, math.ceil(int(retry_after_ms) / 1000)),
                 )
 
             return RateLimitResult(
                 allowed=True,
                 limit=limit,
-                remaining=remaining,
+                remaining=int(remaining),
                 reset_seconds=reset_seconds,
             )
 
@@ -205,13 +238,8 @@ class RedisRateLimiter(IRateLimiter):
             True if successful
         """
         try:
-            client = await self._get_client()
-
-            # Delete all windows for this key
-            pattern = f"rate:{key}:*"
-            async for redis_key in client.scan_iter(match=pattern):
-                await client.delete(redis_key)
-
+            client = await self._redis.get()
+            await client.delete(f"rate:{key}")
             return True
 
         except Exception as e:
@@ -227,7 +255,7 @@ class RedisRateLimiter(IRateLimiter):
             }
 
         try:
-            client = await self._get_client()
+            client = await self._redis.get()
             await client.ping()
 
             return {
@@ -246,21 +274,33 @@ class RedisRateLimiter(IRateLimiter):
             }
 
     async def close(self) -> None:
-        """Close Redis connection."""
-        if self._client is not None:
-            await self._client.close()
-            self._client = None
+        """Release the Redis client."""
+        self._redis.release()
 
 
 class InMemoryRateLimiter(IRateLimiter):
     """In-memory rate limiter for testing or fallback.
 
-    Uses dict-based storage. Not suitable for multi-process deployments.
+    Uses GCRA with one float (the TAT) per key. Keys whose TAT has passed
+    are back at their full allowance, so they are dropped by a sweep every
+    IDLE_SWEEP_INTERVAL seconds without changing any outcome.
+    Not suitable for multi-process deployments.
     """
 
-    def __init__(self) -> None:
-        # Dict of key -> list of timestamps
-        self._requests: Dict[str, List[float]] = defaultdict(list)
+    def __init__(self, sweep_interval: float = IDLE_SWEEP_INTERVAL) -> None:
+        # key -> theoretical arrival time (monotonic seconds)
+        self._tats: Dict[str, float] = {}
+        self.sweep_interval = sweep_interval
+        self._next_sweep = time.monotonic() + sweep_interval
+        self.evicted_keys = 0
+
+    def _sweep(self, now: float) -> None:
+        """Drop keys that are idle (TAT in the past)."""
+        idle = [key for key, tat in self._tats.items() if tat <= now]
+        for key in idle:
+            del self._tats[key]
+        self.evicted_keys += len(idle)
+        self._next_sweep = now + self.sweep_interval
 
     async def check_rate_limit(
         self,
@@ -286,41 +326,29 @@ class InMemoryRateLimiter(IRateLimiter):
                 reset_seconds=0,
             )
 
-        now = time.time()
-        window_start = now - window_seconds
-
-        # Clean old requests
-        self._requests[key] = [
-            ts for ts in self._requests[key]
-            if ts > window_start
-        ]
-
-        current_count = len(self._requests[key])
-        remaining = max(0, limit - current_count)
+        now = time.monotonic()
+        if now >= self._next_sweep:
+            self._sweep(now)
 
-        # Calculate reset time
-        if self._requests[key]:
-            oldest = min(self._requests[key])
-            reset_seconds = int(oldest + window_seconds - now)
-        else:
-            reset_seconds = window_seconds
+        allowed, tat, remaining, retry_after, reset = gcra(
+            self._tats.get(key, 0.0), now, limit, window_seconds
+        )
+        reset_seconds = math.ceil(reset)
 
-        if current_count >= limit:
+        if not allowed:
             return RateLimitResult(
                 allowed=False,
                 limit=limit,
                 remaining=0,
                 reset_seconds=reset_seconds,
-                retry_after=reset_seconds,
+                retry_after=max(1, math.ceil(retry_after)),
             )
 
-        # Record this request
-        self._requests[key].append(now)
-
+        self._tats[key] = tat
         return RateLimitResult(
             allowed=True,
             limit=limit,
-            remaining=remaining - 1,  # Account for this request
+            remaining=remaining,
             reset_seconds=reset_seconds,
         )
 
@@ -333,8 +361,7 @@ class InMemoryRateLimiter(IRateLimiter):
         Returns:
             True if successful
         """
-        if key in self._requests:
-            del self._requests[key]
+        self._tats.pop(key, None)
         return True
 
     async def health_check(self) -> Dict[str, Any]:
@@ -343,7 +370,8 @@ class InMemoryRateLimiter(IRateLimiter):
             "status": "healthy",
             "enabled": settings.RATE_LIMIT_ENABLED,
             "backend": "in_memory",
-            "tracked_keys": len(self._requests),
+            "tracked_keys": len(self._tats),
+            "evicted_keys": self.evicted_keys,
         }
 
 
@@ -0,0 +1,299 @@
+"""Shared Redis connection pools.
+
+Every Redis-backed service (rate limiter, token blacklist, OTP, idempotency
+store, classification cache, principal cache) gets its client here instead
+of calling redis.from_url, so a worker holds one bounded pool per logical
+DB rather than one unbounded pool per service.
+
+Pools are BlockingConnectionPools capped at REDIS_MAX_CONNECTIONS: when all
+connections are busy a command waits up to REDIS_POOL_TIMEOUT seconds for
+one instead of opening another. Clients are thin wrappers over the pool and
+are cached per DB.
+
+Pools are bound to the event loop that first uses them. If called from a
+different loop (e.g. Celery tasks that asyncio.run each task) the manager
+starts fresh pools for that loop.
+
+Services hold a CheckedRedisClient rather than the raw client: it pings a
+client before first use and, after a failure, backs off for
+REDIS_RETRY_INTERVAL seconds so an outage costs one connect timeout per
+interval instead of one per request.
+"""
+
+import asyncio
+import functools
+import logging
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Seconds to skip Redis after a connection failure before retrying
+REDIS_RETRY_INTERVAL = 30
+
+
+def redis_db_url(db: Optional[int] = None, url: Optional[str] = None) -> str:
+    """Build the URL of a logical DB.
+
+    Args:
+        db: DB number (default: the DB in the URL)
+        url: Redis URL (default: REDIS_URL)
+
+    Returns:
+        Redis URL
+    """
+    url = url or settings.REDIS_URL
+    if db is None:
+        return url
+    return f"{url.rsplit('/', 1)[0]}/{db}"
+
+
+def _mask(url: str) -> str:
+    """host:port/db of a Redis URL, without credentials."""
+    parts = urlsplit(url)
+    return f"{parts.hostname}:{parts.port or 6379}{parts.path or '/0'}"
+
+
+@functools.lru_cache(maxsize=None)
+def _bounded_pool_class() -> Any:
+    """BlockingConnectionPool that connects outside the pool lock.
+
+    redis-py 5.0 opens connections while holding the pool's condition, so a
+    failed connect deadlocks release() until the pool timeout and every
+    connect is serialized. Here the slot is reserved under the lock and the
+    connection is established after releasing it.
+    """
+    from redis.asyncio import BlockingConnectionPool
+    from redis.asyncio.connection import AbstractConnection
+    from redis.exceptions import ConnectionError
+
+    class BoundedConnectionPool(BlockingConnectionPool):
+        def make_connection(self) -> AbstractConnection:
+            return self.connection_class(**self.connection_kwargs)
+
+        async def _reserve(self) -> AbstractConnection:
+            async with self._condition:
+                await self._condition.wait_for(self.can_get_connection)
+                try:
+                    connection = self._available_connections.pop()
+                except IndexError:
+                    connection = self.make_connection()
+                self._in_use_connections.add(connection)
+                return connection
+
+        async def get_connection(self, command_name: Any, *keys: Any, **options: Any) -> Any:
+            try:
+                connection = await asyncio.wait_for(self._reserve(), self.timeout)
+            except asyncio.TimeoutError as err:
+                raise ConnectionError("No connection available.") from err
+            try:
+                await self.ensure_connection(connection)
+            except BaseException:
+                await self.release(connection)
+                raise
+            return connection
+
+    return BoundedConnectionPool
+
+
+class RedisClientManager:
+    """One bounded connection pool (and client) per Redis URL/DB."""
+
+    def __init__(
+        self,
+        max_connections: Optional[int] = None,
+        pool_timeout: Optional[float] = None,
+    ):
+        self.max_connections = max_connections or settings.REDIS_MAX_CONNECTIONS
+        self.pool_timeout = pool_timeout or settings.REDIS_POOL_TIMEOUT
+        # url -> (pool, client)
+        self._pools: Dict[str, Tuple[Any, Any]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def client(self, db: Optional[int] = None, url: Optional[str] = None) -> Any:
+        """Get the shared client for a logical DB.
+
+        Args:
+            db: DB number (default: the DB in the URL)
+            url: Redis URL (default: REDIS_URL)
+
+        Returns:
+            redis.asyncio.Redis bound to the shared pool
+        """
+        import redis.asyncio as redis
+
+        try:
+            loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is not self._loop:
+            # Connections of another (possibly closed) loop cannot be reused
+            self._pools = {}
+            self._loop = loop
+
+        key = redis_db_url(db, url)
+        entry = self._pools.get(key)
+        if entry is None:
+            pool = _bounded_pool_class().from_url(
+                key,
+                max_connections=self.max_connections,
+                timeout=self.pool_timeout,
+                encoding="utf-8",
+                decode_responses=True,
+                socket_connect_timeout=5,
+                socket_timeout=5,
+                health_check_interval=30,
+            )
+            entry = (pool, redis.Redis(connection_pool=pool))
+            self._pools[key] = entry
+            logger.info(
+                f"Redis pool created for {_mask(key)} "
+                f"(max {self.max_connections} connections)"
+            )
+        return entry[1]
+
+    async def start(self) -> None:
+        """Create the default pool and check that Redis is reachable.
+
+        Services degrade on their own when Redis is down, so a failure is
+        only logged.
+        """
+        try:
+            await self.client().ping()
+        except Exception as e:
+            logger.warning(f"Redis not reachable at startup: {e}")
+
+    async def close(self) -> None:
+        """Disconnect every pool."""
+        pools, self._pools = self._pools, {}
+        for pool, _ in pools.values():
+            try:
+                await pool.disconnect()
+            except Exception as e:
+                logger.warning(f"Error closing Redis pool: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Connection usage per pool.
+
+        Returns:
+            Dict with the per-pool cap and, per host:port/db, connections
+            in use, idle and created
+        """
+        pools = {}
+        for url, (pool, _) in self._pools.items():
+            in_use = len(pool._in_use_connections)
+            idle = len(pool._available_connections)
+            pools[_mask(url)] = {
+                "in_use": in_use,
+                "idle": idle,
+                "created": in_use + idle,
+                "max_connections": pool.max_connections,
+            }
+        return {
+            "max_connections_per_pool": self.max_connections,
+            "pool_timeout": self.pool_timeout,
+            "pools": pools,
+        }
+
+
+# Singleton instance
+_redis_manager: Optional[RedisClientManager] = None
+
+
+def get_redis_manager() -> RedisClientManager:
+    """Get the Redis client manager instance.
+
+    Returns:
+        RedisClientManager (started and closed by the app lifespan)
+    """
+    global _redis_manager
+
+    if _redis_manager is None:
+        _redis_manager = RedisClientManager()
+
+    return _redis_manager
+
+
+def reset_redis_manager() -> None:
+    """Reset the manager singleton (for testing)."""
+    global _redis_manager
+    _redis_manager = None
+
+
+def get_redis(db: Optional[int] = None, url: Optional[str] = None) -> Any:
+    """Convenience function for the shared client of a logical DB.
+
+    Args:
+        db: DB number (default: the DB in the URL)
+        url: Redis URL (default: REDIS_URL)
+
+    Returns:
+        redis.asyncio.Redis
+    """
+    return get_redis_manager().client(db, url)
+
+
+class CheckedRedisClient:
+    """A service's handle on the shared client for one logical DB.
+
+    The client is pinged whenever the manager hands out a different one
+    (first use, or fresh pools for a new event loop). After a failed ping,
+    get() raises without contacting Redis until retry_interval has passed.
+
+    Args:
+        name: Service name for log messages
+        db: DB number (default: the DB in the URL)
+        url: Redis URL (default: REDIS_URL)
+        retry_interval: Seconds to back off after a failed ping
+        on_connect: Called with each newly checked client (e.g. to register
+            scripts)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        db: Optional[int] = None,
+        url: Optional[str] = None,
+        retry_interval: float = REDIS_RETRY_INTERVAL,
+        on_connect: Optional[Callable[[Any], None]] = None,
+    ):
+        self.name = name
+        self.db = db
+        self.url = url
+        self.retry_interval = retry_interval
+        self.on_connect = on_connect
+        self.client: Optional[Any] = None
+        self._retry_at = 0.0
+
+    async def get(self) -> Any:
+        """Get the shared client, checking it whenever it changes.
+
+        Returns:
+            redis.asyncio.Redis
+
+        Raises:
+            ConnectionError: While backing off after a recent failure
+        """
+        client = get_redis_manager().client(self.db, self.url)
+        if client is not self.client:
+            if time.monotonic() < self._retry_at:
+                raise ConnectionError("Redis unavailable, retry pending")
+            try:
+                await client.ping()
+            except Exception as e:
+                logger.error(f"Redis connection failed for {self.name}: {e}")
+                self.client = None
+                self._retry_at = time.monotonic() + self.retry_interval
+                raise
+            if self.on_connect is not None:
+                self.on_connect(client)
+            self.client = client
+
+        return client
+
+    def release(self) -> None:
+        """Forget the client (the pool is closed by the Redis manager)."""
+        self.client = None
@@ -0,0 +1,378 @@
+"""Async client for S3-compatible object storage.
+
+Signs requests with AWS Signature Version 4 and sends them over one pooled
+httpx client (up to S3_MAX_CONNECTIONS keep-alive connections), so storage
+calls never block the event loop or tie up executor threads. Works against
+AWS S3 and S3-compatible servers such as MinIO or moto's server mode: with
+S3_ENDPOINT_URL set, objects are addressed path-style on that endpoint.
+
+Only the calls the storage service needs are implemented: object PUT,
+multipart upload, HEAD, server-side copy, DELETE and presigned GET URLs.
+"""
+
+import hashlib
+import hmac
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import quote
+from xml.etree import ElementTree
+
+import httpx
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+ALGORITHM = "AWS4-HMAC-SHA256"
+UNSIGNED_PAYLOAD = "UNSIGNED-PAYLOAD"
+
+# S3 rejects multipart parts other than the last below 5 MiB
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+
+class S3Error(Exception):
+    """An S3 request failed."""
+
+    def __init__(
+        self,
+        message: str,
+        status_code: Optional[int] = None,
+        code: Optional[str] = None,
+    ):
+        super().__init__(message)
+        self.status_code = status_code
+        self.code = code
+
+
+def _uri_encode(value: str, safe: str = "-_.~") -> str:
+    """Percent-encode as SigV4 requires (RFC 3986 unreserved kept)."""
+    return quote(value, safe=safe)
+
+
+def _canonical_query(query: Dict[str, str]) -> str:
+    """Canonical (and wire) form of a query string."""
+    return "&".join(
+        f"{_uri_encode(k)}={_uri_encode(v)}" for k, v in sorted(query.items())
+    )
+
+
+def _hmac_sha256(key: bytes, message: str) -> bytes:
+    return hmac.new(key, message.encode(), hashlib.sha256).digest()
+
+
+def _error_from_body(body: bytes) -> Tuple[Optional[str], Optional[str]]:
+    """(Code, Message) from an S3 <Error> document, if the body is one."""
+    try:
+        root = ElementTree.fromstring(body)
+    except ElementTree.ParseError:
+        return None, None
+    if root.tag.rsplit("}", 1)[-1] != "Error":
+        return None, None
+    return root.findtext("Code"), root.findtext("Message")
+
+
+def _find_text(body: bytes, name: str) -> Optional[str]:
+    """Text of the first element called `name` (namespace ignored)."""
+    for element in ElementTree.fromstring(body).iter():
+        if element.tag.rsplit("}", 1)[-1] == name:
+            return element.text
+    return None
+
+
+class S3Client:
+    """Pooled async client for one S3 bucket."""
+
+    def __init__(
+        self,
+        bucket: str,
+        region: str,
+        access_key: str,
+        secret_key: str,
+        endpoint_url: Optional[str] = None,
+        max_connections: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ):
+        self.bucket = bucket
+        self.region = region
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self.max_connections = max_connections or settings.S3_MAX_CONNECTIONS
+        self.timeout = timeout or settings.S3_HTTP_TIMEOUT
+        self._client: Optional[httpx.AsyncClient] = None
+
+        if endpoint_url:
+            # MinIO, moto and other stand-ins: path-style on the endpoint
+            origin = httpx.URL(endpoint_url.rstrip("/"))
+            self._path_prefix = f"/{bucket}"
+        else:
+            host = "s3.amazonaws.com" if region == "us-east-1" else f"s3.{region}.amazonaws.com"
+            origin = httpx.URL(f"https://{bucket}.{host}")
+            self._path_prefix = ""
+        self._origin = f"{origin.scheme}://{origin.host}" + (f":{origin.port}" if origin.port else "")
+        self._host = origin.host + (f":{origin.port}" if origin.port else "")
+
+        self.requests = 0
+        self.errors = 0
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get or create the pooled HTTP client."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """Close the HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _object_path(self, key: str) -> str:
+        """URI-encoded request path for an object key."""
+        return f"{self._path_prefix}/{_uri_encode(key, safe='/-_.~')}"
+
+    def _scope(self, now: datetime) -> str:
+        return f"{now.strftime('%Y%m%d')}/{self.region}/s3/aws4_request"
+
+    def _signature(
+        self,
+        method: str,
+        path: str,
+        query: Dict[str, str],
+        canonical_headers: str,
+        signed_headers: str,
+        payload_hash: str,
+        now: datetime,
+    ) -> str:
+        """SigV4 signature of a canonical request."""
+        canonical_request = "\n".join([
+            method,
+            path,
+            _canonical_query(query),
+            canonical_headers,
+            signed_headers,
+            payload_hash,
+        ])
+        string_to_sign = "\n".join([
+            ALGORITHM,
+            now.strftime("%Y%m%dT%H%M%SZ"),
+            self._scope(now),
+            hashlib.sha256(canonical_request.encode()).hexdigest(),
+        ])
+        key = _hmac_sha256(f"AWS4{self.secret_key}".encode(), now.strftime("%Y%m%d"))
+        for part in (self.region, "s3", "aws4_request"):
+            key = _hmac_sha256(key, part)
+        return hmac.new(key, string_to_sign.encode(), hashlib.sha256).hexdigest()
+
+    def _sign(
+        self,
+        method: str,
+        path: str,
+        query: Dict[str, str],
+        headers: Dict[str, str],
+        payload_hash: str,
+        now: datetime,
+    ) -> Dict[str, str]:
+        """Headers for a request, including the Authorization header."""
+        signed = {k.lower(): v.strip() for k, v in headers.items()}
+        signed.update({
+            "host": self._host,
+            "x-amz-content-sha256": payload_hash,
+            "x-amz-date": now.strftime("%Y%m%dT%H%M%SZ"),
+        })
+        names = sorted(signed)
+        signed_headers = ";".join(names)
+        canonical_headers = "".join(f"{name}:{signed[name]}\n" for name in names)
+        signature = self._signature(
+            method, path, query, canonical_headers, signed_headers, payload_hash, now
+        )
+        signed["authorization"] = (
+            f"{ALGORITHM} Credential={self.access_key}/{self._scope(now)}, "
+            f"SignedHeaders={signed_headers}, Signature={signature}"
+        )
+        return signed
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        query: Optional[Dict[str, str]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        content: bytes = b"",
+    ) -> httpx.Response:
+        """Make one signed request.
+
+        Raises:
+            S3Error: Error response (including 200 responses carrying an
+                <Error> document, as CompleteMultipartUpload and CopyObject
+                can return) or connection failure
+        """
+        query = query or {}
+        signed = self._sign(
+            method,
+            path,
+            query,
+            headers or {},
+            hashlib.sha256(content).hexdigest(),
+            datetime.now(timezone.utc),
+        )
+        url = self._origin + path + (f"?{_canonical_query(query)}" if query else "")
+
+        self.requests += 1
+        try:
+            response = await self._get_client().request(
+                method, url, headers=signed, content=content
+            )
+        except httpx.RequestError as e:
+            self.errors += 1
+            raise S3Error(f"S3 request failed: {e}")
+
+        code, message = (None, None)
+        if method != "HEAD" and response.content:
+            code, message = _error_from_body(response.content)
+        if response.status_code >= 300 or code is not None:
+            self.errors += 1
+            raise S3Error(
+                message or f"S3 returned HTTP {response.status_code}",
+                status_code=response.status_code,
+                code=code,
+            )
+        return response
+
+    async def create_bucket(self) -> None:
+        """Create the bucket (for local stand-ins and test setup)."""
+        content = b""
+        if self.region != "us-east-1":
+            content = (
+                '<CreateBucketConfiguration xmlns="http://s3.amazonaws.com/doc/2006-03-01/">'
+                f"<LocationConstraint>{self.region}</LocationConstraint>"
+                "</CreateBucketConfiguration>"
+            ).encode()
+        await self._request("PUT", self._path_prefix or "/", content=content)
+
+    async def head_bucket(self) -> None:
+        """Check the bucket is reachable with these credentials.
+
+        Raises:
+            S3Error: Bucket missing, forbidden or unreachable
+        """
+        await self._request("HEAD", self._path_prefix or "/")
+
+    async def put_object(self, key: str, body: bytes, content_type: str) -> None:
+        """Store an object in one request."""
+        await self._request(
+            "PUT", self._object_path(key), headers={"content-type": content_type}, content=body
+        )
+
+    async def object_exists(self, key: str) -> bool:
+        """Check whether an object exists.
+
+        Raises:
+            S3Error: Any failure other than 404
+        """
+        try:
+            await self._request("HEAD", self._object_path(key))
+        except S3Error as e:
+            if e.status_code == 404:
+                return False
+            raise
+        return True
+
+    async def copy_object(self, source_key: str, key: str) -> None:
+        """Copy an object within the bucket (server-side)."""
+        source = _uri_encode(f"{self.bucket}/{source_key}", safe="/-_.~")
+        await self._request(
+            "PUT", self._object_path(key), headers={"x-amz-copy-source": source}
+        )
+
+    async def delete_object(self, key: str) -> None:
+        """Delete an object (succeeds if it does not exist)."""
+        await self._request("DELETE", self._object_path(key))
+
+    async def create_multipart_upload(self, key: str, content_type: str) -> str:
+        """Start a multipart upload.
+
+        Returns:
+            Upload ID
+        """
+        response = await self._request(
+            "POST",
+            self._object_path(key),
+            query={"uploads": ""},
+            headers={"content-type": content_type},
+        )
+        upload_id = _find_text(response.content, "UploadId")
+        if not upload_id:
+            raise S3Error("S3 returned no UploadId")
+        return upload_id
+
+    async def upload_part(self, key: str, upload_id: str, part_number: int, body: bytes) -> str:
+        """Upload one part of a multipart upload.
+
+        Returns:
+            The part's ETag (needed to complete the upload)
+        """
+        response = await self._request(
+            "PUT",
+            self._object_path(key),
+            query={"partNumber": str(part_number), "uploadId": upload_id},
+            content=body,
+        )
+        return response.headers["etag"]
+
+    async def complete_multipart_upload(self, key: str, upload_id: str, etags: List[str]) -> None:
+        """Assemble uploaded parts (numbered from 1 in `etags` order)."""
+        parts = "".join(
+            f"<Part><PartNumber>{number}</PartNumber><ETag>{etag}</ETag></Part>"
+            for number, etag in enumerate(etags, start=1)
+        )
+        await self._request(
+            "POST",
+            self._object_path(key),
+            query={"uploadId": upload_id},
+            content=f"<CompleteMultipartUpload>{parts}</CompleteMultipartUpload>".encode(),
+        )
+
+    async def abort_multipart_upload(self, key: str, upload_id: str) -> None:
+        """Discard a multipart upload and its parts."""
+        await self._request("DELETE", self._object_path(key), query={"uploadId": upload_id})
+
+    def presign_get(self, key: str, expires_in: int, now: Optional[datetime] = None) -> str:
+        """Presigned URL that lets anyone holding it GET the object.
+
+        Args:
+            key: Object key
+            expires_in: Validity in seconds (S3 allows up to 7 days)
+            now: Signing time (defaults to current UTC time)
+
+        Returns:
+            Absolute URL on the S3 endpoint
+        """
+        now = now or datetime.now(timezone.utc)
+        path = self._object_path(key)
+        query = {
+            "X-Amz-Algorithm": ALGORITHM,
+            "X-Amz-Credential": f"{self.access_key}/{self._scope(now)}",
+            "X-Amz-Date": now.strftime("%Y%m%dT%H%M%SZ"),
+            "X-Amz-Expires": str(expires_in),
+            "X-Amz-SignedHeaders": "host",
+        }
+        query["X-Amz-Signature"] = self._signature(
+            "GET", path, query, f"host:{self._host}\n", "host", UNSIGNED_PAYLOAD, now
+        )
+        return f"{self._origin}{path}?{_canonical_query(query)}"
+
+    def stats(self) -> Dict[str, Any]:
+        """Get request counters and pool size."""
+        return {
+            "bucket": self.bucket,
+            "max_connections": self.max_connections,
+            "requests": self.requests,
+            "errors": self.errors,
+        }
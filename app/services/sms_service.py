@@ -1,6 +1,8 @@
 """SMS Service for sending OTP and notifications via Twilio.
 
 Provides SMS sending capability with retry logic and graceful degradation.
+TwilioSMSService sends through the async Messages API client
+(app.services.twilio_client), so OTP bursts never block the event loop.
 """
 
 import logging
@@ -8,6 +10,7 @@ from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional
 
 from app.config import settings
+from app.services.twilio_client import TwilioError, TwilioMessagesClient
 
 logger = logging.getLogger(__name__)
 
@@ -94,11 +97,19 @@ class ISMSService(ABC):
         """
         pass
 
+    async def close(self) -> None:
+        """Release connections held by the service (called on shutdown).
+
+        No-op by default; implementations holding connections override it.
+        """
+        pass
+
 
 class TwilioSMSService(ISMSService):
     """Production SMS service using Twilio.
 
-    Sends SMS via Twilio API with retry logic.
+    Sends SMS via the Twilio Messages API with retry logic, at most
+    TWILIO_SMS_MAX_CONCURRENCY requests in flight.
     """
 
     def __init__(
@@ -110,20 +121,24 @@ class TwilioSMSService(ISMSService):
         self.account_sid = account_sid or settings.TWILIO_ACCOUNT_SID
         self.auth_token = auth_token or settings.TWILIO_AUTH_TOKEN
         self.from_number = from_number or settings.TWILIO_PHONE_NUMBER
-        self._client = None
+        self._client: Optional[TwilioMessagesClient] = None
 
-    def _get_client(self) -> Any:
-        """Get or create Twilio client."""
+    def _get_client(self) -> TwilioMessagesClient:
+        """Get or create the Twilio Messages client."""
         if self._client is None:
-            try:
-                from twilio.rest import Client
-
-                self._client = Client(self.account_sid, self.auth_token)
-            except ImportError:
-                logger.error("Twilio library not installed")
-                raise RuntimeError("Twilio library not installed")
+            self._client = TwilioMessagesClient(
+                self.account_sid,
+                self.auth_token,
+                max_concurrency=settings.TWILIO_SMS_MAX_CONCURRENCY,
+                name="sms",
+            )
         return self._client
 
+    async def close(self) -> None:
+        """Close the Twilio HTTP client."""
+        if self._client is not None:
+            await self._client.close()
+
     async def send_sms(
         self,
         to_phone: str,
@@ -132,6 +147,9 @@ class TwilioSMSService(ISMSService):
     ) -> SMSResult:
         """Send SMS via Twilio with retry logic.
 
+        Throttling (429), 5xx and connection errors are retried with
+        exponential backoff; other errors fail at once.
+
         Args:
             to_phone: Recipient phone (E.164 format)
             message: Message content
@@ -154,48 +172,30 @@ class TwilioSMSService(ISMSService):
                 error="Twilio credentials not configured",
             )
 
-        import asyncio
-
-        last_error = None
-        for attempt in range(retry_count):
-            try:
-                client = self._get_client()
-
-                # Twilio is synchronous, run in executor
-                loop = asyncio.get_event_loop()
-                message_obj = await loop.run_in_executor(
-                    None,
-                    lambda: client.messages.create(
-                        body=message,
-                        from_=self.from_number,
-                        to=to_phone,
-                    ),
-                )
-
-                return SMSResult(
-                    success=True,
-                    message_sid=message_obj.sid,
-                    to_phone=to_phone,
-                    status=message_obj.status,
-                    retry_count=attempt,
-                )
-
-            except Exception as e:
-                last_error = str(e)
-                logger.warning(
-                    f"SMS send attempt {attempt + 1}/{retry_count} failed: {e}"
-                )
-
-                if attempt < retry_count - 1:
-                    # Exponential backoff: 1s, 2s, 4s
-                    await asyncio.sleep(2**attempt)
+        try:
+            message_obj = await self._get_client().send_message(
+                to=to_phone,
+                from_=self.from_number,
+                body=message,
+                retry_count=retry_count,
+            )
 
-        return SMSResult(
-            success=False,
-            to_phone=to_phone,
-            error=last_error,
-            retry_count=retry_count,
-        )
+            return SMSResult(
+                success=True,
+                message_sid=message_obj.sid,
+                to_phone=to_phone,
+                status=message_obj.status,
+                retry_count=message_obj.attempts - 1,
+            )
+
+        except TwilioError as e:
+            logger.warning(f"SMS send failed after {e.attempts} attempt(s): {e}")
+            return SMSResult(
+                success=False,
+                to_phone=to_phone,
+                error=str(e),
+                retry_count=e.attempts,
+            )
 
     async def send_otp(
         self,
@@ -233,30 +233,25 @@ class TwilioSMSService(ISMSService):
                 "error": "Twilio credentials missing",
             }
 
+        client = self._get_client()
         try:
-            import asyncio
-
-            client = self._get_client()
-            loop = asyncio.get_event_loop()
-
             # Fetch account info as health check
-            account = await loop.run_in_executor(
-                None,
-                lambda: client.api.accounts(self.account_sid).fetch(),
-            )
+            account = await client.fetch_account()
 
             return {
                 "status": "healthy",
                 "enabled": True,
-                "account_status": account.status,
+                "account_status": account.get("status"),
                 "from_number": self.from_number,
+                "transport": client.stats(),
             }
 
-        except Exception as e:
+        except TwilioError as e:
             return {
                 "status": "unhealthy",
                 "enabled": True,
                 "error": str(e),
+                "transport": client.stats(),
             }
 
 
@@ -2,24 +2,80 @@
 
 Provides file upload handling with local storage (and S3-ready interface).
 Includes file validation, hash generation, and secure storage.
+
+Uploads are streamed in UPLOAD_CHUNK_SIZE chunks: the SHA-256 is updated
+and MAX_FILE_SIZE_MB enforced as bytes arrive, and local files are written
+to a temp file that is renamed into place, so memory per upload does not
+grow with file size and partial files are never visible.
+
+Files are content-addressed: each distinct content is stored once under
+blobs/ab/cd/<sha256>.<ext>, and an upload whose blob already exists is not
+written again. Local blobs keep the extension of the first upload's file
+name so a static file server picks the right Content-Type; a later upload
+of the same content reuses that blob whatever its name. Attachments
+sharing a blob are reference counted in the attachment_blobs table
+(app.services.attachment_blobs).
+
+With STORAGE_BACKEND=s3 the same layout is kept as object keys in
+S3_BUCKET_NAME, without the extension (objects carry their Content-Type),
+and file URLs are presigned GET URLs so clients download straight from S3
+instead of through the API.
 """
 
+import asyncio
 import hashlib
+import inspect
 import logging
 import os
+import re
 from abc import ABC, abstractmethod
 from datetime import datetime
 from pathlib import Path
-from typing import Any, BinaryIO, Dict, List, Optional
+from typing import Any, AsyncIterator, BinaryIO, Dict, Iterable, List, Optional, Protocol, Set, Tuple, Union
 from uuid import uuid4
 
 import aiofiles  # type: ignore[import-untyped]
 import aiofiles.os  # type: ignore[import-untyped]
 
 from app.config import settings
+from app.services.s3_client import MIN_PART_SIZE, S3Client, S3Error
 
 logger = logging.getLogger(__name__)
 
+# Bytes read from an upload per iteration
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Directory under the upload root for content-addressed files
+BLOB_DIR_NAME = "blobs"
+
+# File name extensions kept on blob paths (anything else is dropped)
+_BLOB_EXTENSION = re.compile(r"\.[a-z0-9]{1,8}")
+
+# Directory under the upload root for in-progress writes (same filesystem,
+# so the final rename is atomic)
+TEMP_DIR_NAME = ".tmp"
+
+
+class AsyncReadable(Protocol):
+    """File object with an async read(), e.g. FastAPI's UploadFile."""
+
+    async def read(self, size: int = -1) -> bytes:
+        ...
+
+
+# What upload_file accepts
+UploadSource = Union[BinaryIO, AsyncReadable]
+
+
+class FileTooLargeError(ValueError):
+    """Upload exceeded MAX_FILE_SIZE_MB while streaming."""
+
+    def __init__(self) -> None:
+        max_bytes = settings.MAX_FILE_SIZE_MB * 1024 * 1024
+        super().__init__(
+            f"File too large: more than {max_bytes} bytes. Max: {settings.MAX_FILE_SIZE_MB}MB"
+        )
+
 
 class StorageResult:
     """Result of file storage operation."""
@@ -34,6 +90,8 @@ class StorageResult:
         file_name: Optional[str] = None,
         file_type: Optional[str] = None,
         error: Optional[str] = None,
+        deduplicated: bool = False,
+        too_large: bool = False,
     ):
         self.success = success
         self.file_path = file_path
@@ -43,6 +101,8 @@ class StorageResult:
         self.file_name = file_name
         self.file_type = file_type
         self.error = error
+        self.deduplicated = deduplicated
+        self.too_large = too_large
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -55,6 +115,8 @@ class StorageResult:
             "file_name": self.file_name,
             "file_type": self.file_type,
             "error": self.error,
+            "deduplicated": self.deduplicated,
+            "too_large": self.too_large,
         }
 
 
@@ -64,7 +126,7 @@ class IStorageService(ABC):
     @abstractmethod
     async def upload_file(
         self,
-        file: BinaryIO,
+        file: UploadSource,
         file_name: str,
         file_type: str,
         grievance_id: str,
@@ -72,7 +134,7 @@ class IStorageService(ABC):
         """Upload a file.
 
         Args:
-            file: File object to upload
+            file: File object to upload, read in chunks
             file_name: Original file name
             file_type: MIME type
             grievance_id: Associated grievance ID
@@ -94,6 +156,18 @@ class IStorageService(ABC):
         """
         pass
 
+    @abstractmethod
+    async def file_exists(self, file_path: str) -> bool:
+        """Check whether a stored file exists.
+
+        Args:
+            file_path: Stored file path
+
+        Returns:
+            True if the file exists
+        """
+        pass
+
     @abstractmethod
     async def delete_file(self, file_path: str) -> bool:
         """Delete a file.
@@ -111,6 +185,13 @@ class IStorageService(ABC):
         """Check storage service health."""
         pass
 
+    async def close(self) -> None:
+        """Release connections held by the service (called on shutdown).
+
+        No-op by default; implementations holding connections override it.
+        """
+        pass
+
 
 def validate_file_type(file_type: str) -> bool:
     """Validate file MIME type is allowed.
@@ -149,9 +230,130 @@ def generate_file_hash(content: bytes) -> str:
     return hashlib.sha256(content).hexdigest()
 
 
+async def read_chunks(
+    file: UploadSource,
+    chunk_size: int = UPLOAD_CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    """Yield a file's content in chunks.
+
+    Accepts a plain binary file object or one with an async read() such as
+    FastAPI's UploadFile, which reads spooled uploads off the event loop.
+
+    Args:
+        file: File object to read
+        chunk_size: Maximum bytes per chunk
+
+    Yields:
+        Non-empty chunks of content
+    """
+    while True:
+        data = file.read(chunk_size)
+        chunk = await data if inspect.isawaitable(data) else data
+        if not chunk:
+            return
+        yield chunk
+
+
+async def stream_to_temp_file(
+    file: UploadSource,
+    temp_dir: str,
+    chunk_size: int = UPLOAD_CHUNK_SIZE,
+) -> Tuple[str, str, int]:
+    """Stream a file to a new temp file, hashing and size-checking as it goes.
+
+    The temp file is removed if the upload is too large or fails.
+
+    Args:
+        file: File object to read (see read_chunks)
+        temp_dir: Directory for the temp file
+        chunk_size: Maximum bytes per chunk
+
+    Returns:
+        (temp file path, hex SHA-256, size in bytes)
+
+    Raises:
+        FileTooLargeError: Content exceeded MAX_FILE_SIZE_MB
+    """
+    await aiofiles.os.makedirs(temp_dir, exist_ok=True)
+    temp_path = os.path.join(temp_dir, f"{uuid4().hex}.part")
+    digest = hashlib.sha256()
+    size = 0
+
+    try:
+        async with aiofiles.open(temp_path, 'wb') as out:
+            async for chunk in read_chunks(file, chunk_size):
+                size += len(chunk)
+                if not validate_file_size(size):
+                    raise FileTooLargeError()
+                digest.update(chunk)
+                await out.write(chunk)
+    except BaseException:
+        try:
+            await aiofiles.os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+    return temp_path, digest.hexdigest(), size
+
+
+def blob_extension(file_name: Optional[str]) -> str:
+    """Lower-cased extension of a file name for its blob path.
+
+    Returns:
+        Extension with the dot, or "" if missing or not short alphanumeric
+    """
+    suffix = Path(file_name or "").suffix.lower()
+    return suffix if _BLOB_EXTENSION.fullmatch(suffix) else ""
+
+
+def generate_blob_path(file_hash: str, extension: str = "") -> str:
+    """Generate the content-addressed storage path for a file.
+
+    Format: blobs/ab/cd/<sha256><extension> (two levels of fan-out by hash
+    prefix)
+
+    Args:
+        file_hash: Hex-encoded SHA-256 of the content
+        extension: Extension from blob_extension ("" for none)
+
+    Returns:
+        Storage path string
+    """
+    return os.path.join(BLOB_DIR_NAME, file_hash[:2], file_hash[2:4], file_hash + extension)
+
+
+def find_blob(paths: Iterable[str], file_hash: str) -> Optional[str]:
+    """Pick the blob for a hash, with any extension, out of candidate paths."""
+    for path in paths:
+        if os.path.basename(path).partition(".")[0] == file_hash:
+            return path
+    return None
+
+
+def find_local_blob(upload_dir: str, file_hash: str) -> Optional[str]:
+    """Storage path of the local blob for a hash, whatever its extension.
+
+    Args:
+        upload_dir: Upload root
+        file_hash: Hex-encoded SHA-256 of the content
+
+    Returns:
+        Storage path, or None if the content is not stored
+    """
+    blob_dir = os.path.dirname(generate_blob_path(file_hash))
+    try:
+        names = os.listdir(os.path.join(upload_dir, blob_dir))
+    except FileNotFoundError:
+        return None
+    return find_blob((os.path.join(blob_dir, name) for name in names), file_hash)
+
+
 def generate_storage_path(grievance_id: str, file_name: str) -> str:
     """Generate organized storage path.
 
+    Legacy per-grievance layout; new uploads use generate_blob_path.
+
     Format: YYYY/MM/DD/grievance_id/uuid_filename
 
     Args:
@@ -180,8 +382,10 @@ class LocalStorageService(IStorageService):
     Stores files in the local filesystem with organized directory structure.
     """
 
-    def __init__(self, upload_dir: Optional[str] = None):
+    def __init__(self, upload_dir: Optional[str] = None, chunk_size: int = UPLOAD_CHUNK_SIZE):
         self.upload_dir = upload_dir or settings.UPLOAD_DIR
+        self.temp_dir = os.path.join(self.upload_dir, TEMP_DIR_NAME)
+        self.chunk_size = chunk_size
         self._ensure_upload_dir()
 
     def _ensure_upload_dir(self) -> None:
@@ -190,7 +394,7 @@ class LocalStorageService(IStorageService):
 
     async def upload_file(
         self,
-        file: BinaryIO,
+        file: UploadSource,
         file_name: str,
         file_type: str,
         grievance_id: str,
@@ -214,33 +418,40 @@ class LocalStorageService(IStorageService):
             )
 
         try:
-            # Read file content
-            content = file.read()
-            file_size = len(content)
-
-            # Validate file size
-            if not validate_file_size(file_size):
-                return StorageResult(
-                    success=False,
-                    error=f"File too large: {file_size} bytes. Max: {settings.MAX_FILE_SIZE_MB}MB",
-                )
-
-            # Generate storage path and hash
-            storage_path = generate_storage_path(grievance_id, file_name)
-            full_path = os.path.join(self.upload_dir, storage_path)
-            file_hash = generate_file_hash(content)
-
-            # Create directory structure
-            await aiofiles.os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            # Stream to a temp file, hashing and checking size per chunk
+            temp_path, file_hash, file_size = await stream_to_temp_file(
+                file, self.temp_dir, self.chunk_size
+            )
+        except FileTooLargeError as e:
+            return StorageResult(success=False, error=str(e), too_large=True)
+        except Exception as e:
+            logger.error(f"File upload failed: {e}")
+            return StorageResult(
+                success=False,
+                error=str(e),
+            )
 
-            # Write file
-            async with aiofiles.open(full_path, 'wb') as f:
-                await f.write(content)
+        try:
+            existing = await asyncio.to_thread(find_local_blob, self.upload_dir, file_hash)
+            deduplicated = existing is not None
+            if existing is not None:
+                # Same content is already stored; drop the temp copy
+                storage_path = existing
+                await aiofiles.os.remove(temp_path)
+            else:
+                # Create directory structure and move the complete file into place
+                storage_path = generate_blob_path(file_hash, blob_extension(file_name))
+                full_path = os.path.join(self.upload_dir, storage_path)
+                await aiofiles.os.makedirs(os.path.dirname(full_path), exist_ok=True)
+                await aiofiles.os.replace(temp_path, full_path)
 
             # Generate URL (for local, it's the relative path)
             file_url = f"/uploads/{storage_path}"
 
-            logger.info(f"File uploaded: {storage_path} ({file_size} bytes)")
+            logger.info(
+                f"File uploaded: {storage_path} ({file_size} bytes"
+                f"{', deduplicated' if deduplicated else ''})"
+            )
 
             return StorageResult(
                 success=True,
@@ -250,10 +461,15 @@ class LocalStorageService(IStorageService):
                 file_size_bytes=file_size,
                 file_name=file_name,
                 file_type=file_type,
+                deduplicated=deduplicated,
             )
 
         except Exception as e:
             logger.error(f"File upload failed: {e}")
+            try:
+                await aiofiles.os.remove(temp_path)
+            except OSError:
+                pass
             return StorageResult(
                 success=False,
                 error=str(e),
@@ -273,6 +489,17 @@ class LocalStorageService(IStorageService):
             return f"/uploads/{file_path}"
         return None
 
+    async def file_exists(self, file_path: str) -> bool:
+        """Check whether a local file exists.
+
+        Args:
+            file_path: Stored file path
+
+        Returns:
+            True if the file exists
+        """
+        return bool(await aiofiles.os.path.exists(os.path.join(self.upload_dir, file_path)))
+
     async def delete_file(self, file_path: str) -> bool:
         """Delete file from local storage.
 
@@ -316,16 +543,263 @@ class LocalStorageService(IStorageService):
             }
 
 
+class _S3Upload:
+    """One S3 upload in progress.
+
+    Buffers chunks and ships each full part of a multipart upload to a
+    temporary key; content that never fills a part stays in the buffer for
+    a single PUT.
+    """
+
+    def __init__(self, client: S3Client, temp_key: str, content_type: str, part_size: int):
+        self.client = client
+        self.temp_key = temp_key
+        self.content_type = content_type
+        self.part_size = part_size
+        self.buffer = bytearray()
+        self.upload_id: Optional[str] = None
+        self.etags: List[str] = []
+
+    async def write(self, chunk: bytes) -> None:
+        """Buffer a chunk, uploading every full part."""
+        self.buffer += chunk
+        while len(self.buffer) >= self.part_size:
+            await self._upload_part(bytes(self.buffer[:self.part_size]))
+            del self.buffer[:self.part_size]
+
+    async def _upload_part(self, body: bytes) -> None:
+        """Upload the next part, starting the multipart upload if needed."""
+        if self.upload_id is None:
+            self.upload_id = await self.client.create_multipart_upload(
+                self.temp_key, self.content_type
+            )
+        self.etags.append(
+            await self.client.upload_part(self.temp_key, self.upload_id, len(self.etags) + 1, body)
+        )
+
+    async def store(self, key: str, exists: bool) -> None:
+        """Finish the upload at `key`, writing nothing new if it already exists."""
+        if self.upload_id is None:
+            if not exists:
+                await self.client.put_object(key, bytes(self.buffer), self.content_type)
+            return
+
+        if self.buffer:
+            await self._upload_part(bytes(self.buffer))
+        await self.client.complete_multipart_upload(self.temp_key, self.upload_id, self.etags)
+        self.upload_id = None
+        try:
+            if not exists:
+                await self.client.copy_object(self.temp_key, key)
+        finally:
+            await self.client.delete_object(self.temp_key)
+
+    async def abort(self) -> None:
+        """Discard an unfinished multipart upload, if any."""
+        if self.upload_id is None:
+            return
+        try:
+            await self.client.abort_multipart_upload(self.temp_key, self.upload_id)
+        except S3Error as e:
+            logger.warning(f"Failed to abort multipart upload {self.upload_id}: {e}")
+
+
+class S3StorageService(IStorageService):
+    """S3-compatible object storage service.
+
+    Uploads up to one part in size are sent as a single PUT straight to the
+    blob key, skipped when that blob already exists. Larger uploads are
+    streamed as a multipart upload to a temporary key (the hash, and so the
+    blob key, is only known after the last part), then copied server-side to
+    the blob key unless it already exists, and the temporary key deleted.
+    Memory per upload is bounded by the part size.
+    """
+
+    def __init__(
+        self,
+        client: Optional[S3Client] = None,
+        part_size: Optional[int] = None,
+        url_expiry: Optional[int] = None,
+        chunk_size: int = UPLOAD_CHUNK_SIZE,
+    ):
+        self.client = client or S3Client(
+            bucket=settings.S3_BUCKET_NAME,
+            region=settings.S3_REGION,
+            access_key=settings.S3_ACCESS_KEY,
+            secret_key=settings.S3_SECRET_KEY,
+            endpoint_url=settings.S3_ENDPOINT_URL or None,
+        )
+        self.part_size = part_size or max(
+            settings.S3_MULTIPART_PART_SIZE_MB * 1024 * 1024, MIN_PART_SIZE
+        )
+        self.url_expiry = url_expiry or settings.S3_PRESIGNED_URL_EXPIRY_SECONDS
+        self.chunk_size = chunk_size
+
+    async def close(self) -> None:
+        """Close the S3 connection pool."""
+        await self.client.close()
+
+    async def upload_file(
+        self,
+        file: UploadSource,
+        file_name: str,
+        file_type: str,
+        grievance_id: str,
+    ) -> StorageResult:
+        """Upload file to S3.
+
+        Args:
+            file: File object
+            file_name: Original name
+            file_type: MIME type
+            grievance_id: Grievance ID
+
+        Returns:
+            StorageResult with a presigned file URL
+        """
+        if not validate_file_type(file_type):
+            return StorageResult(
+                success=False,
+                error=f"File type not allowed: {file_type}. Allowed: {settings.ALLOWED_FILE_TYPES}",
+            )
+
+        upload = _S3Upload(
+            self.client, f"{TEMP_DIR_NAME}/{uuid4().hex}", file_type, self.part_size
+        )
+        try:
+            file_hash, file_size = await self._stream(file, upload)
+            storage_path = generate_blob_path(file_hash)
+            deduplicated = await self.client.object_exists(storage_path)
+            await upload.store(storage_path, exists=deduplicated)
+
+        except FileTooLargeError as e:
+            await upload.abort()
+            return StorageResult(success=False, error=str(e), too_large=True)
+        except Exception as e:
+            logger.error(f"File upload failed: {e}")
+            await upload.abort()
+            return StorageResult(
+                success=False,
+                error=str(e),
+            )
+
+        logger.info(
+            f"File uploaded to S3: {storage_path} ({file_size} bytes"
+            f"{', deduplicated' if deduplicated else ''})"
+        )
+
+        return StorageResult(
+            success=True,
+            file_path=storage_path,
+            file_url=self.presigned_url(storage_path),
+            file_hash=file_hash,
+            file_size_bytes=file_size,
+            file_name=file_name,
+            file_type=file_type,
+            deduplicated=deduplicated,
+        )
+
+    async def _stream(self, file: UploadSource, upload: "_S3Upload") -> Tuple[str, int]:
+        """Feed a file to an upload, hashing and size-checking as it goes.
+
+        Returns:
+            (hex SHA-256, size in bytes)
+
+        Raises:
+            FileTooLargeError: Content exceeded MAX_FILE_SIZE_MB
+        """
+        digest = hashlib.sha256()
+        size = 0
+        async for chunk in read_chunks(file, self.chunk_size):
+            size += len(chunk)
+            if not validate_file_size(size):
+                raise FileTooLargeError()
+            digest.update(chunk)
+            await upload.write(chunk)
+        return digest.hexdigest(), size
+
+    def presigned_url(self, file_path: str) -> str:
+        """Presigned download URL, signed locally without a request.
+
+        Args:
+            file_path: Stored file path (object key)
+
+        Returns:
+            Presigned GET URL valid for S3_PRESIGNED_URL_EXPIRY_SECONDS
+        """
+        return self.client.presign_get(file_path, self.url_expiry)
+
+    async def get_file_url(self, file_path: str) -> Optional[str]:
+        """Get a presigned download URL.
+
+        The URL is signed without checking the object exists.
+
+        Args:
+            file_path: Stored file path (object key)
+
+        Returns:
+            Presigned GET URL valid for S3_PRESIGNED_URL_EXPIRY_SECONDS
+        """
+        return self.presigned_url(file_path)
+
+    async def file_exists(self, file_path: str) -> bool:
+        """Check whether an object exists.
+
+        Args:
+            file_path: Stored file path (object key)
+
+        Returns:
+            True if the object exists
+        """
+        return await self.client.object_exists(file_path)
+
+    async def delete_file(self, file_path: str) -> bool:
+        """Delete object from S3.
+
+        Args:
+            file_path: Path to delete
+
+        Returns:
+            True if deleted (or already absent)
+        """
+        try:
+            await self.client.delete_object(file_path)
+            logger.info(f"File deleted from S3: {file_path}")
+            return True
+        except S3Error as e:
+            logger.error(f"File delete failed: {e}")
+            return False
+
+    async def health_check(self) -> Dict[str, Any]:
+        """Check the bucket is reachable."""
+        try:
+            await self.client.head_bucket()
+            return {
+                "status": "healthy",
+                "backend": "s3",
+                **self.client.stats(),
+            }
+
+        except S3Error as e:
+            return {
+                "status": "unhealthy",
+                "backend": "s3",
+                "error": str(e),
+                **self.client.stats(),
+            }
+
+
 class MockStorageService(IStorageService):
     """Mock storage service for testing."""
 
     def __init__(self) -> None:
         self.uploaded_files: List[StorageResult] = []
         self.deleted_files: List[str] = []
+        self.stored_paths: Set[str] = set()
 
     async def upload_file(
         self,
-        file: BinaryIO,
+        file: UploadSource,
         file_name: str,
         file_type: str,
         grievance_id: str,
@@ -337,17 +811,22 @@ class MockStorageService(IStorageService):
                 error=f"File type not allowed: {file_type}",
             )
 
-        content = file.read()
-        file_size = len(content)
-
-        if not validate_file_size(file_size):
-            return StorageResult(
-                success=False,
-                error="File too large",
-            )
+        digest = hashlib.sha256()
+        file_size = 0
+        async for chunk in read_chunks(file):
+            file_size += len(chunk)
+            if not validate_file_size(file_size):
+                return StorageResult(
+                    success=False,
+                    error="File too large",
+                    too_large=True,
+                )
+            digest.update(chunk)
 
-        storage_path = generate_storage_path(grievance_id, file_name)
-        file_hash = generate_file_hash(content)
+        file_hash = digest.hexdigest()
+        existing = find_blob(self.stored_paths, file_hash)
+        deduplicated = existing is not None
+        storage_path = existing or generate_blob_path(file_hash, blob_extension(file_name))
 
         result = StorageResult(
             success=True,
@@ -357,9 +836,11 @@ class MockStorageService(IStorageService):
             file_size_bytes=file_size,
             file_name=file_name,
             file_type=file_type,
+            deduplicated=deduplicated,
         )
 
         self.uploaded_files.append(result)
+        self.stored_paths.add(storage_path)
         return result
 
     async def get_file_url(self, file_path: str) -> Optional[str]:
@@ -369,9 +850,14 @@ class MockStorageService(IStorageService):
                 return result.file_url
         return None
 
+    async def file_exists(self, file_path: str) -> bool:
+        """Check a mock file is stored."""
+        return file_path in self.stored_paths
+
     async def delete_file(self, file_path: str) -> bool:
         """Mock file delete."""
         self.deleted_files.append(file_path)
+        self.stored_paths.discard(file_path)
         return True
 
     async def health_check(self) -> Dict[str, Any]:
@@ -396,10 +882,10 @@ def get_storage_service() -> IStorageService:
     global _storage_service
 
     if _storage_service is None:
-        if settings.STORAGE_BACKEND == "local":
-            _storage_service = LocalStorageService()
+        if settings.STORAGE_BACKEND == "s3":
+            _storage_service = S3StorageService()
         else:
-            # Default to local for now (S3 would be added here)
+            # Default to local
             _storage_service = LocalStorageService()
 
     return _storage_service
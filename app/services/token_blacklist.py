@@ -8,20 +8,36 @@ Security Features:
 - TTL matches token expiry to auto-cleanup expired entries
 - Graceful degradation when Redis unavailable (logs warning)
 - In-memory fallback for development/testing
+
+Local negative lookups:
+Almost no presented token is ever revoked, so each worker keeps a snapshot
+of the revoked token hashes (mirrored in a Redis sorted set) tagged with a
+revocation counter that every blacklist_token increments. At most once per
+TOKEN_BLACKLIST_SYNC_INTERVAL the worker reads the counter and reloads the
+snapshot only if it moved. A token absent from a fresh snapshot is resolved
+locally; a possible hit, or any check while Redis is unreachable, goes to
+Redis as before.
 """
 
+import asyncio
 import hashlib
 import logging
 import time
 from abc import ABC, abstractmethod
-from collections import defaultdict
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Set
 
 from app.config import settings
+from app.services.redis_manager import CheckedRedisClient
 
 logger = logging.getLogger(__name__)
 
+# Sorted set of revoked token hashes, scored by token expiry (unix seconds)
+REVOKED_TOKENS_KEY = "blacklist:tokens"
+
+# Incremented on every revocation; workers reload their snapshot when it moves
+REVOCATION_VERSION_KEY = "blacklist:version"
+
 
 class ITokenBlacklist(ABC):
     """Interface for token blacklist service."""
@@ -114,36 +130,35 @@ class RedisTokenBlacklist(ITokenBlacklist):
     Uses Redis SET with expiry for efficient blacklist checking.
     Keys are stored as: blacklist:token:{hash}
     User blacklist keys: blacklist:user:{user_id}
+
+    With local_cache, non-revoked tokens are resolved from a per-process
+    snapshot of REVOKED_TOKENS_KEY (see module docstring).
     """
 
-    def __init__(self, redis_url: Optional[str] = None):
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        local_cache: Optional[bool] = None,
+        sync_interval: Optional[float] = None,
+    ):
         self.redis_url = redis_url or settings.REDIS_URL
-        self._client = None
-        self._connection_error = False
+        self._redis = CheckedRedisClient("token blacklist", url=self.redis_url)
 
-    async def _get_client(self) -> Any:
-        """Get or create Redis client."""
-        if self._client is None:
-            try:
-                import redis.asyncio as redis
-
-                self._client = redis.from_url(
-                    self.redis_url,
-                    encoding="utf-8",
-                    decode_responses=True,
-                    socket_connect_timeout=5,
-                    socket_timeout=5,
-                )
-                # Test connection
-                await self._client.ping()
-                self._connection_error = False
-            except Exception as e:
-                logger.error(f"Redis connection failed for token blacklist: {e}")
-                self._connection_error = True
-                self._client = None
-                raise
+        self.local_cache = (
+            settings.TOKEN_BLACKLIST_LOCAL_CACHE if local_cache is None else local_cache
+        )
+        self.sync_interval = (
+            settings.TOKEN_BLACKLIST_SYNC_INTERVAL if sync_interval is None else sync_interval
+        )
+        self._revoked: Set[str] = set()
+        self._version: Optional[str] = None  # None until the first sync
+        self._synced_at = 0.0
+        self._sync_lock = asyncio.Lock()
 
-        return self._client
+        # Metrics
+        self.local_resolutions = 0
+        self.remote_resolutions = 0
+        self.snapshot_reloads = 0
 
     async def blacklist_token(
         self,
@@ -154,7 +169,7 @@ class RedisTokenBlacklist(ITokenBlacklist):
     ) -> bool:
         """Add token to Redis blacklist with TTL."""
         try:
-            client = await self._get_client()
+            client = await self._redis.get()
 
             # Calculate TTL (how long until token expires)
             now = datetime.now(timezone.utc)
@@ -172,8 +187,15 @@ class RedisTokenBlacklist(ITokenBlacklist):
             # Store with metadata
             value = f"{user_id or 'unknown'}:{reason}:{int(now.timestamp())}"
 
-            # Set with expiry
-            await client.setex(key, ttl_seconds, value)
+            # Set with expiry, mirror into the revocation set (dropping
+            # expired members) and bump the version for other workers
+            pipe = client.pipeline(transaction=True)
+            pipe.setex(key, ttl_seconds, value)
+            pipe.zadd(REVOKED_TOKENS_KEY, {token_hash: int(expires_at.timestamp())})
+            pipe.zremrangebyscore(REVOKED_TOKENS_KEY, "-inf", int(now.timestamp()))
+            pipe.incr(REVOCATION_VERSION_KEY)
+            await pipe.execute()
+            self._revoked.add(token_hash)
 
             logger.info(
                 f"Token blacklisted: user={user_id}, reason={reason}, "
@@ -186,12 +208,60 @@ class RedisTokenBlacklist(ITokenBlacklist):
             logger.error(f"Failed to blacklist token: {e}")
             return False
 
+    async def _snapshot_is_fresh(self) -> bool:
+        """Re-sync the local revocation snapshot if due.
+
+        Returns:
+            True if the snapshot is current to within sync_interval
+        """
+        if self._version is not None and time.monotonic() - self._synced_at < self.sync_interval:
+            return True
+
+        async with self._sync_lock:
+            # Another request may have synced while we waited
+            if self._version is not None and time.monotonic() - self._synced_at < self.sync_interval:
+                return True
+
+            try:
+                client = await self._redis.get()
+                version = await client.get(REVOCATION_VERSION_KEY) or "0"
+
+                if version != self._version:
+                    # Read after the version, so the set covers at least that version
+                    revoked = await client.zrangebyscore(
+                        REVOKED_TOKENS_KEY, int(time.time()), "+inf"
+                    )
+                    self._revoked = set(revoked)
+                    self._version = version
+                    self.snapshot_reloads += 1
+
+                self._synced_at = time.monotonic()
+                return True
+
+            except Exception as e:
+                logger.warning(f"Revocation snapshot sync failed: {e}")
+                return False
+
     async def is_blacklisted(self, token: str) -> bool:
-        """Check if token is in Redis blacklist."""
+        """Check if token is blacklisted.
+
+        Resolved locally when the token is absent from a fresh snapshot,
+        otherwise by a Redis lookup.
+        """
+        token_hash = _get_token_hash(token)
+
+        if (
+            self.local_cache
+            and await self._snapshot_is_fresh()
+            and token_hash not in self._revoked
+        ):
+            self.local_resolutions += 1
+            return False
+
+        self.remote_resolutions += 1
         try:
-            client = await self._get_client()
+            client = await self._redis.get()
 
-            token_hash = _get_token_hash(token)
             key = f"blacklist:token:{token_hash}"
 
             exists = await client.exists(key)
@@ -213,7 +283,7 @@ class RedisTokenBlacklist(ITokenBlacklist):
         Sets a marker that invalidates all tokens issued before now.
         """
         try:
-            client = await self._get_client()
+            client = await self._redis.get()
 
             # Store timestamp - all tokens issued before this are invalid
             key = f"blacklist:user:{user_id}"
@@ -245,7 +315,7 @@ class RedisTokenBlacklist(ITokenBlacklist):
             True if token is valid, False if all tokens were revoked after issuance
         """
         try:
-            client = await self._get_client()
+            client = await self._redis.get()
 
             key = f"blacklist:user:{user_id}"
             revoked_at = await client.get(key)
@@ -266,7 +336,7 @@ class RedisTokenBlacklist(ITokenBlacklist):
     async def get_blacklist_stats(self) -> Dict[str, Any]:
         """Get blacklist statistics from Redis."""
         try:
-            client = await self._get_client()
+            client = await self._redis.get()
 
             # Count blacklisted tokens
             token_keys = []
@@ -282,23 +352,37 @@ class RedisTokenBlacklist(ITokenBlacklist):
                 "blacklisted_tokens": len(token_keys),
                 "blacklisted_users": len(user_keys),
                 "backend": "redis",
+                "local_cache": self._local_cache_stats(),
             }
 
         except Exception as e:
             return {
                 "error": str(e),
                 "backend": "redis",
+                "local_cache": self._local_cache_stats(),
             }
 
+    def _local_cache_stats(self) -> Dict[str, Any]:
+        """Local snapshot state and local/remote resolution counts."""
+        return {
+            "enabled": self.local_cache,
+            "revoked_tokens": len(self._revoked),
+            "version": self._version,
+            "local_resolutions": self.local_resolutions,
+            "remote_resolutions": self.remote_resolutions,
+            "snapshot_reloads": self.snapshot_reloads,
+        }
+
     async def health_check(self) -> Dict[str, Any]:
         """Check Redis connection health."""
         try:
-            client = await self._get_client()
+            client = await self._redis.get()
             await client.ping()
 
             return {
                 "status": "healthy",
                 "backend": "redis",
+                "local_cache": self._local_cache_stats(),
             }
 
         except Exception as e:
@@ -309,10 +393,8 @@ class RedisTokenBlacklist(ITokenBlacklist):
             }
 
     async def close(self) -> None:
-        """Close Redis connection."""
-        if self._client is not None:
-            await self._client.close()
-            self._client = None
+        """Release the Redis client."""
+        self._redis.release()
 
 
 class InMemoryTokenBlacklist(ITokenBlacklist):
@@ -0,0 +1,215 @@
+"""Async client for the Twilio Messages API.
+
+Talks to the Twilio REST API over a pooled httpx client instead of the
+synchronous Twilio SDK, so sends never block the event loop or tie up
+executor threads. Each client bounds its in-flight requests with a
+semaphore (one client per provider channel: SMS, WhatsApp) and retries
+throttling, 5xx and connection errors with exponential backoff; the
+semaphore is released while backing off.
+"""
+
+import asyncio
+import logging
+import random
+from typing import Any, Dict, Optional
+
+import httpx
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+API_VERSION = "2010-04-01"
+
+
+class TwilioError(Exception):
+    """A Twilio request failed (after any retries)."""
+
+    def __init__(
+        self,
+        message: str,
+        status_code: Optional[int] = None,
+        code: Optional[int] = None,
+        retryable: bool = False,
+        retry_after: Optional[float] = None,
+    ):
+        super().__init__(message)
+        self.status_code = status_code
+        self.code = code
+        self.retryable = retryable
+        self.retry_after = retry_after
+        self.attempts = 0
+
+
+class TwilioMessage:
+    """A message accepted by Twilio."""
+
+    def __init__(self, sid: str, status: Optional[str], attempts: int = 1):
+        self.sid = sid
+        self.status = status
+        self.attempts = attempts
+
+
+class TwilioMessagesClient:
+    """Pooled, concurrency-bounded async client for Twilio Messages."""
+
+    def __init__(
+        self,
+        account_sid: str,
+        auth_token: str,
+        max_concurrency: int,
+        name: str = "twilio",
+        base_url: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ):
+        self.account_sid = account_sid
+        self.auth_token = auth_token
+        self.max_concurrency = max_concurrency
+        self.name = name
+        self.base_url = base_url or settings.TWILIO_API_BASE_URL
+        self.timeout = timeout or settings.TWILIO_HTTP_TIMEOUT
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._in_flight = 0
+
+        self.sent = 0
+        self.failed = 0
+        self.retries = 0
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get or create the pooled HTTP client."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                auth=(self.account_sid, self.auth_token),
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency,
+                    keepalive_expiry=settings.TWILIO_HTTP_KEEPALIVE_EXPIRY,
+                ),
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """Close the HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _request(self, method: str, path: str, **kwargs: Any) -> Dict[str, Any]:
+        """Make one API call within the concurrency bound.
+
+        Raises:
+            TwilioError: Non-2xx response or connection failure
+        """
+        async with self._semaphore:
+            self._in_flight += 1
+            try:
+                response = await self._get_client().request(method, path, **kwargs)
+            except httpx.RequestError as e:
+                raise TwilioError(f"Twilio request failed: {e}", retryable=True)
+            finally:
+                self._in_flight -= 1
+
+        if response.status_code >= 400:
+            try:
+                body = response.json()
+            except ValueError:
+                body = {}
+            retry_after = response.headers.get("Retry-After")
+            raise TwilioError(
+                body.get("message") or f"Twilio returned HTTP {response.status_code}",
+                status_code=response.status_code,
+                code=body.get("code"),
+                retryable=response.status_code == 429 or response.status_code >= 500,
+                retry_after=float(retry_after) if retry_after and retry_after.isdigit() else None,
+            )
+
+        try:
+            result: Dict[str, Any] = response.json()
+        except ValueError:
+            raise TwilioError(
+                f"Twilio returned a non-JSON body (HTTP {response.status_code})",
+                status_code=response.status_code,
+            )
+        return result
+
+    def _backoff(self, attempt: int, error: TwilioError) -> float:
+        """Delay before retry `attempt + 1`: exponential with jitter."""
+        delay = min(
+            settings.TWILIO_RETRY_BASE_SECONDS * 2**attempt,
+            settings.TWILIO_RETRY_MAX_SECONDS,
+        )
+        delay *= random.uniform(0.5, 1.0)
+        if error.retry_after is not None:
+            delay = max(delay, min(error.retry_after, settings.TWILIO_RETRY_MAX_SECONDS))
+        return delay
+
+    async def send_message(
+        self,
+        to: str,
+        from_: str,
+        body: str,
+        retry_count: int = 3,
+    ) -> TwilioMessage:
+        """Create a message, retrying transient failures.
+
+        Args:
+            to: Recipient ("+91..." or "whatsapp:+91...")
+            from_: Sender in the same format
+            body: Message text
+            retry_count: Total attempts
+
+        Returns:
+            TwilioMessage with sid and status
+
+        Raises:
+            TwilioError: Last error once attempts are exhausted, or at once
+                for a non-retryable error (e.g. invalid number)
+        """
+        path = f"/{API_VERSION}/Accounts/{self.account_sid}/Messages.json"
+        attempts = max(1, retry_count)
+
+        attempt = 0
+        while True:
+            try:
+                data = await self._request(
+                    "POST", path, data={"To": to, "From": from_, "Body": body}
+                )
+                if not data.get("sid"):
+                    raise TwilioError("Twilio response has no message sid")
+                self.sent += 1
+                return TwilioMessage(data["sid"], data.get("status"), attempt + 1)
+
+            except TwilioError as e:
+                e.attempts = attempt + 1
+                if not e.retryable or e.attempts >= attempts:
+                    self.failed += 1
+                    raise
+                delay = self._backoff(attempt, e)
+                self.retries += 1
+                logger.warning(
+                    f"{self.name} send attempt {e.attempts}/{attempts} failed: {e}; "
+                    f"retrying in {delay:.2f}s"
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    async def fetch_account(self) -> Dict[str, Any]:
+        """Fetch the account resource (used as a health check).
+
+        Raises:
+            TwilioError: Request failed
+        """
+        return await self._request("GET", f"/{API_VERSION}/Accounts/{self.account_sid}.json")
+
+    def stats(self) -> Dict[str, Any]:
+        """Get send counters and current concurrency."""
+        return {
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self._in_flight,
+            "sent": self.sent,
+            "failed": self.failed,
+            "retries": self.retries,
+        }
@@ -14,6 +14,7 @@ from typing import List, Optional, Tuple
 from sqlalchemy import and_, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.department import Department
 from app.models.district import District
 from app.models.grievance import Grievance
 from app.models.verifier_activity import VerifierActivity
@@ -78,34 +79,45 @@ class VerifierService:
         Returns:
             VerificationQueueResponse with queue items
         """
-        # Base query: resolved grievances awaiting verification
-        query = (
-            select(Grievance)
-            .where(
-                and_(
-                    Grievance.status == "resolved",
-                    Grievance.resolved_at.isnot(None),
-                    Grievance.deleted_at.is_(None),
-                )
-            )
-            .order_by(Grievance.resolved_at.asc())
+        # Base filter: resolved grievances awaiting verification
+        queue_filter = and_(
+            Grievance.status == "resolved",
+            Grievance.resolved_at.isnot(None),
+            Grievance.deleted_at.is_(None),
         )
 
         # Count total items
-        count_query = select(func.count()).select_from(query.subquery())
+        count_query = select(func.count()).select_from(Grievance).where(queue_filter)
         total_result = await self.db.execute(count_query)
         total = total_result.scalar() or 0
 
-        # Apply pagination
-        query = query.limit(limit).offset(offset)
+        # Project only the queue columns; district/department names are joined
+        # in the same statement instead of loading the related ORM objects
+        query = (
+            select(
+                Grievance.grievance_id,
+                Grievance.subject,
+                Grievance.citizen_phone,
+                Grievance.priority,
+                Grievance.resolved_at,
+                District.district_name,
+                Department.dept_name,
+            )
+            .outerjoin(District, District.id == Grievance.district_id)
+            .outerjoin(Department, Department.id == Grievance.department_id)
+            .where(queue_filter)
+            .order_by(Grievance.resolved_at.asc())
+            .limit(limit)
+            .offset(offset)
+        )
 
         # Execute query
         result = await self.db.execute(query)
-        grievances = result.scalars().all()
+        rows = result.all()
 
         # Build response items
         items = []
-        for g in grievances:
+        for g in rows:
             # Calculate days since resolution
             days_since = 0
             if g.resolved_at:
@@ -118,8 +130,8 @@ class VerifierService:
                 GrievanceQueueItem(
                     grievance_id=g.grievance_id,
                     subject=g.subject or "No subject",
-                    district_name=g.district.district_name if g.district else "Unknown",
-                    department_name=g.department.dept_name if g.department else "Unknown",
+                    district_name=g.district_name or "Unknown",
+                    department_name=g.dept_name or "Unknown",
                     resolved_at=g.resolved_at,
                     days_since_resolution=days_since,
                     priority=g.priority or "normal",
@@ -1,6 +1,8 @@
 """WhatsApp Service for sending messages via Twilio WhatsApp API.
 
 Provides WhatsApp messaging with fallback to SMS on failure.
+TwilioWhatsAppService sends through the async Messages API client
+(app.services.twilio_client).
 """
 
 import logging
@@ -9,6 +11,7 @@ from typing import Any, Dict, List, Optional, Union
 
 from app.config import settings
 from app.services.sms_service import SMSResult, get_sms_service
+from app.services.twilio_client import TwilioError, TwilioMessagesClient
 
 logger = logging.getLogger(__name__)
 
@@ -95,11 +98,19 @@ class IWhatsAppService(ABC):
         """Check WhatsApp service health."""
         pass
 
+    async def close(self) -> None:
+        """Release connections held by the service (called on shutdown).
+
+        No-op by default; implementations holding connections override it.
+        """
+        pass
+
 
 class TwilioWhatsAppService(IWhatsAppService):
     """Production WhatsApp service using Twilio.
 
-    Sends WhatsApp messages via Twilio API.
+    Sends WhatsApp messages via the Twilio Messages API, at most
+    TWILIO_WHATSAPP_MAX_CONCURRENCY requests in flight.
     Falls back to SMS if WhatsApp fails.
     """
 
@@ -112,19 +123,24 @@ class TwilioWhatsAppService(IWhatsAppService):
         self.account_sid = account_sid or settings.TWILIO_ACCOUNT_SID
         self.auth_token = auth_token or settings.TWILIO_AUTH_TOKEN
         self.from_number = from_number or settings.TWILIO_WHATSAPP_NUMBER
-        self._client = None
+        self._client: Optional[TwilioMessagesClient] = None
 
-    def _get_client(self) -> Any:
-        """Get or create Twilio client."""
+    def _get_client(self) -> TwilioMessagesClient:
+        """Get or create the Twilio Messages client."""
         if self._client is None:
-            try:
-                from twilio.rest import Client
-
-                self._client = Client(self.account_sid, self.auth_token)
-            except ImportError:
-                raise RuntimeError("Twilio library not installed")
+            self._client = TwilioMessagesClient(
+                self.account_sid,
+                self.auth_token,
+                max_concurrency=settings.TWILIO_WHATSAPP_MAX_CONCURRENCY,
+                name="whatsapp",
+            )
         return self._client
 
+    async def close(self) -> None:
+        """Close the Twilio HTTP client."""
+        if self._client is not None:
+            await self._client.close()
+
     async def send_message(
         self,
         to_phone: str,
@@ -167,23 +183,13 @@ class TwilioWhatsAppService(IWhatsAppService):
                 error="Twilio WhatsApp credentials not configured",
             )
 
-        import asyncio
-
         try:
-            client = self._get_client()
-
-            # Format WhatsApp numbers
-            wa_from = f"whatsapp:{self.from_number}"
-            wa_to = f"whatsapp:{to_phone}"
-
-            loop = asyncio.get_event_loop()
-            message_obj = await loop.run_in_executor(
-                None,
-                lambda: client.messages.create(
-                    body=message,
-                    from_=wa_from,
-                    to=wa_to,
-                ),
+            # Format WhatsApp numbers; one attempt, failures fall back to SMS
+            message_obj = await self._get_client().send_message(
+                to=f"whatsapp:{to_phone}",
+                from_=f"whatsapp:{self.from_number}",
+                body=message,
+                retry_count=1,
             )
 
             return WhatsAppResult(
@@ -193,7 +199,7 @@ class TwilioWhatsAppService(IWhatsAppService):
                 status=message_obj.status,
             )
 
-        except Exception as e:
+        except TwilioError as e:
             logger.error(f"WhatsApp send failed: {e}")
 
             # Try SMS fallback
@@ -255,11 +261,12 @@ class TwilioWhatsAppService(IWhatsAppService):
 
         try:
             # Just verify client can be created
-            self._get_client()
+            client = self._get_client()
             return {
                 "status": "healthy",
                 "enabled": True,
                 "from_number": self.from_number,
+                "transport": client.stats(),
             }
 
         except Exception as e:
@@ -8,7 +8,7 @@ This module contains:
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 from sqlalchemy import and_, select
 
@@ -16,6 +16,7 @@ from app.celery_app import celery_app
 from app.config import settings
 from app.database.session import get_db
 from app.models.citizen_empowerment import CitizenEmpowermentPreference
+from app.models.department import Department
 from app.models.grievance import Grievance
 from app.services.citizen_empowerment_service import CitizenEmpowermentService
 
@@ -104,53 +105,42 @@ def retry_ask_later_citizens() -> Dict[str, Any]:
             result = await db.execute(stmt)
             preferences = result.scalars().all()
 
-            service = CitizenEmpowermentService(db)
-            retried = 0
-            failed = 0
-
-            for pref in preferences:
-                # Find an active grievance for this citizen
-                grievance_stmt = select(Grievance).where(
+            # One active grievance per citizen, with its department name
+            by_phone = {pref.citizen_phone: pref for pref in preferences}
+            grievance_stmt = (
+                select(Grievance.citizen_phone, Grievance.grievance_id, Department.dept_name)
+                .outerjoin(Department, Grievance.department_id == Department.id)
+                .where(
                     and_(
-                        Grievance.citizen_phone == pref.citizen_phone,
+                        Grievance.citizen_phone.in_(list(by_phone)),
                         Grievance.status.in_(["assigned", "in_progress"]),
                     )
-                ).limit(1)
-
-                grievance_result = await db.execute(grievance_stmt)
-                grievance = grievance_result.scalar_one_or_none()
-
-                if grievance:
-                    # Get department name
-                    dept_name = "Government"
-                    if grievance.department:
-                        dept_name = (
-                            grievance.department.name
-                            if hasattr(grievance.department, 'name')
-                            else str(grievance.department)
-                        )
-
-                    # Re-send opt-in prompt
-                    try:
-                        success = await service.send_opt_in_prompt(
-                            grievance_id=grievance.grievance_id,
-                            citizen_phone=pref.citizen_phone,
-                            department=dept_name,
-                            language=pref.preferred_language,
-                        )
-
-                        if success:
-                            # Update ask_later_count
-                            pref.ask_later_count += 1
-                            pref.last_ask_later_at = datetime.utcnow()
-                            retried += 1
-                        else:
-                            failed += 1
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to retry opt-in for {pref.citizen_phone}: {e}"
-                        )
-                        failed += 1
+                )
+            )
+            grievance_result = await db.execute(grievance_stmt)
+            active: Dict[str, Tuple[str, str]] = {}
+            for phone, grievance_id, dept_name in grievance_result.all():
+                active.setdefault(phone, (grievance_id, dept_name or "Government"))
+
+            # Re-send opt-in prompts as one batch
+            prompts = [
+                (grievance_id, phone, dept_name, by_phone[phone].preferred_language)
+                for phone, (grievance_id, dept_name) in active.items()
+            ]
+            service = CitizenEmpowermentService(db)
+            report = await service.send_opt_in_prompts(prompts)
+
+            retried = 0
+            failed = 0
+            for outcome in report.results:
+                if outcome.status == "sent":
+                    # Update ask_later_count
+                    pref = by_phone[outcome.notification.phone]
+                    pref.ask_later_count += 1
+                    pref.last_ask_later_at = datetime.utcnow()
+                    retried += 1
+                elif outcome.status == "failed":
+                    failed += 1
 
             await db.commit()
 
@@ -4,7 +4,8 @@ All messages must be < 1024 characters for WhatsApp.
 Supports Telugu (te) and English (en) languages.
 """
 
-from typing import Any, List
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, Tuple
 
 
 # ============================================
@@ -101,6 +102,41 @@ Want to know your rights?
 [2] Contact officer"""
 
 
+# ============================================
+# Template Registry
+# ============================================
+
+# Template name -> (Telugu, English). Proactive names match trigger types.
+MESSAGE_TEMPLATES: Dict[str, Tuple[str, str]] = {
+    "OPT_IN_PROMPT": (OPT_IN_PROMPT_TE, OPT_IN_PROMPT_EN),
+    "RIGHTS_LEVEL_1": (RIGHTS_LEVEL_1_TE, RIGHTS_LEVEL_1_EN),
+    "LEVEL_UP_AVAILABLE": (LEVEL_UP_AVAILABLE_TE, LEVEL_UP_AVAILABLE_EN),
+    "SLA_50_PERCENT": (PROACTIVE_SLA_50_TE, PROACTIVE_SLA_50_EN),
+    "SLA_APPROACHING": (PROACTIVE_SLA_APPROACHING_TE, PROACTIVE_SLA_APPROACHING_EN),
+    "NO_UPDATE_7_DAYS": (PROACTIVE_NO_UPDATE_TE, PROACTIVE_NO_UPDATE_EN),
+}
+
+
+@lru_cache(maxsize=None)
+def get_template(name: str, language: str) -> str:
+    """Get a registered template for language (English unless "te").
+
+    Raises:
+        KeyError: Unknown template name
+    """
+    telugu, english = MESSAGE_TEMPLATES[name]
+    return telugu if language == "te" else english
+
+
+def render_template(name: str, language: str, params: Mapping[str, Any]) -> str:
+    """Render a registered template with params.
+
+    Raises:
+        KeyError: Unknown template name or missing param
+    """
+    return get_template(name, language).format(**params)
+
+
 # ============================================
 # Helper Functions
 # ============================================
@@ -76,12 +76,17 @@ async def db_session() -> AsyncGenerator[AsyncSession, None]:
 async def test_client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     """Create test client with database session override."""
     from app.main import app
-    from app.database.connection import get_db_session
+    from app.database.connection import get_db_session, get_read_db_session
+    from app.services.principal_cache import reset_principal_cache
+
+    # Users are recreated per test; never serve one cached by another test
+    reset_principal_cache()
 
     async def override_get_db():
         yield db_session
 
     app.dependency_overrides[get_db_session] = override_get_db
+    app.dependency_overrides[get_read_db_session] = override_get_db
 
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as client:
@@ -0,0 +1,173 @@
+"""Tests for attachment blob reference counting."""
+
+import io
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql.dml import Delete, Insert, Update
+from sqlalchemy.sql.selectable import Select
+
+from app.services.attachment_blobs import (
+    acquire_blob,
+    blob_needs_rewrite,
+    release_blob,
+    repoint_blob,
+    remove_unreferenced_blob,
+)
+from app.services.storage_service import MockStorageService, StorageResult
+
+FILE_HASH = "ab" * 32
+
+
+def upload(deduplicated: bool = False) -> StorageResult:
+    return StorageResult(
+        success=True,
+        file_path=f"blobs/ab/ab/{FILE_HASH}",
+        file_hash=FILE_HASH,
+        file_size_bytes=1024,
+        deduplicated=deduplicated,
+    )
+
+
+class FakeBlobSession:
+    """AsyncSession stand-in emulating the attachment_blobs statements."""
+
+    def __init__(self):
+        self.rows: dict = {}
+        self.commits = 0
+
+    async def commit(self):
+        self.commits += 1
+
+    async def execute(self, stmt):
+        result = MagicMock()
+        if isinstance(stmt, Select) and stmt.whereclause is not None:
+            found = stmt.whereclause.right.value in self.rows
+            result.first.return_value = (stmt.whereclause.right.value,) if found else None
+        elif isinstance(stmt, Insert):
+            params = stmt.compile(dialect=postgresql.dialect()).params
+            row = self.rows.setdefault(
+                params["file_hash"], {"file_path": params["file_path"], "ref_count": 0}
+            )
+            row["ref_count"] += 1
+            result.scalar_one.return_value = row["ref_count"]
+        elif isinstance(stmt, Update):
+            row = self.rows.get(stmt.whereclause.right.value)
+            params = stmt.compile(dialect=postgresql.dialect()).params
+            if "file_path" in params:
+                row["file_path"] = params["file_path"]
+            elif row is not None:
+                row["ref_count"] -= 1
+                result.one_or_none.return_value = (row["ref_count"], row["file_path"])
+            else:
+                result.one_or_none.return_value = None
+        elif isinstance(stmt, Delete):
+            self.rows.pop(stmt.whereclause.right.value, None)
+        return result
+
+
+class TestBlobReferenceCounting:
+    """Tests for acquire_blob and release_blob."""
+
+    @pytest.mark.asyncio
+    async def test_blob_removed_with_last_reference(self):
+        """Test only the last release returns the blob path."""
+        db = FakeBlobSession()
+
+        assert await acquire_blob(db, upload()) == 1
+        assert await acquire_blob(db, upload(deduplicated=True)) == 2
+
+        assert await release_blob(db, FILE_HASH) is None
+        assert db.rows[FILE_HASH]["ref_count"] == 1
+        assert await release_blob(db, FILE_HASH) == f"blobs/ab/ab/{FILE_HASH}"
+        assert FILE_HASH not in db.rows
+
+    @pytest.mark.asyncio
+    async def test_release_unknown_hash(self):
+        """Test releasing a hash without a blob row removes nothing."""
+        assert await release_blob(FakeBlobSession(), FILE_HASH) is None
+
+
+class TestRemoveUnreferencedBlob:
+    """Tests for remove_unreferenced_blob."""
+
+    @pytest.mark.asyncio
+    @patch('app.services.storage_service.settings')
+    async def test_removed_after_last_release(self, mock_settings):
+        """Test the blob file goes once its last reference is committed."""
+        mock_settings.ALLOWED_FILE_TYPES = ["application/pdf"]
+        mock_settings.MAX_FILE_SIZE_MB = 10
+        storage = MockStorageService()
+        stored = await storage.upload_file(io.BytesIO(b"scan"), "a.pdf", "application/pdf", "PGRS-1")
+        db = FakeBlobSession()
+        await acquire_blob(db, stored)
+
+        blob_path = await release_blob(db, stored.file_hash)
+
+        assert await storage.file_exists(blob_path) is True
+        assert await remove_unreferenced_blob(db, storage, stored.file_hash, blob_path) is True
+        assert await storage.file_exists(blob_path) is False
+        assert db.commits == 1
+
+    @pytest.mark.asyncio
+    @patch('app.services.storage_service.settings')
+    async def test_kept_when_reacquired_before_removal(self, mock_settings):
+        """Test an upload taking a new reference after the delete commits keeps the file."""
+        mock_settings.ALLOWED_FILE_TYPES = ["application/pdf"]
+        mock_settings.MAX_FILE_SIZE_MB = 10
+        storage = MockStorageService()
+        stored = await storage.upload_file(io.BytesIO(b"scan"), "a.pdf", "application/pdf", "PGRS-1")
+        db = FakeBlobSession()
+        await acquire_blob(db, stored)
+        blob_path = await release_blob(db, stored.file_hash)
+
+        again = await storage.upload_file(io.BytesIO(b"scan"), "b.pdf", "application/pdf", "PGRS-2")
+        await acquire_blob(db, again)
+
+        assert await remove_unreferenced_blob(db, storage, stored.file_hash, blob_path) is False
+        assert await storage.file_exists(blob_path) is True
+
+
+class TestBlobNeedsRewrite:
+    """Tests for blob_needs_rewrite."""
+
+    @pytest.mark.asyncio
+    @patch('app.services.storage_service.settings')
+    async def test_deduplicated_blob_deleted_concurrently(self, mock_settings):
+        """Test a first reference on a vanished blob asks for a rewrite."""
+        mock_settings.ALLOWED_FILE_TYPES = ["application/pdf"]
+        mock_settings.MAX_FILE_SIZE_MB = 10
+        storage = MockStorageService()
+        stored = await storage.upload_file(io.BytesIO(b"scan"), "a.pdf", "application/pdf", "PGRS-1")
+        again = await storage.upload_file(io.BytesIO(b"scan"), "b.pdf", "application/pdf", "PGRS-2")
+        assert again.deduplicated is True
+
+        assert await blob_needs_rewrite(storage, again, ref_count=1) is False
+        await storage.delete_file(stored.file_path)
+        assert await blob_needs_rewrite(storage, again, ref_count=1) is True
+        assert await blob_needs_rewrite(storage, again, ref_count=2) is False
+
+    @pytest.mark.asyncio
+    async def test_fresh_upload_never_rewritten(self):
+        """Test an upload that wrote its blob needs no check."""
+        assert await blob_needs_rewrite(MockStorageService(), upload(), ref_count=1) is False
+
+    @pytest.mark.asyncio
+    @patch('app.services.storage_service.settings')
+    async def test_rewrite_under_another_extension_repoints_row(self, mock_settings):
+        """Test the blob row follows a rewrite stored under the new upload's extension."""
+        mock_settings.ALLOWED_FILE_TYPES = ["application/pdf"]
+        mock_settings.MAX_FILE_SIZE_MB = 10
+        storage = MockStorageService()
+        stored = await storage.upload_file(io.BytesIO(b"scan"), "a.pdf", "application/pdf", "PGRS-1")
+        again = await storage.upload_file(io.BytesIO(b"scan"), "b.PNG", "application/pdf", "PGRS-2")
+        await storage.delete_file(stored.file_path)
+        db = FakeBlobSession()
+        assert await acquire_blob(db, again) == 1
+
+        rewritten = await storage.upload_file(io.BytesIO(b"scan"), "b.PNG", "application/pdf", "PGRS-2")
+        await repoint_blob(db, rewritten)
+
+        assert rewritten.file_path.endswith(f"{rewritten.file_hash}.png")
+        assert await release_blob(db, rewritten.file_hash) == rewritten.file_path
@@ -153,6 +153,51 @@ class TestLoginEndpoint:
         msg = data.get("message", data.get("detail", "")).lower()
         assert "disabled" in msg
 
+    @pytest.mark.asyncio
+    async def test_login_rehashes_outdated_hash(
+        self,
+        test_client: AsyncClient,
+        db_session: AsyncSession,
+    ):
+        """Test that a hash with other rounds is upgraded on login."""
+        from uuid import uuid4
+        import random
+
+        from app.config import settings
+        from app.utils.password import needs_rehash, pwd_context
+
+        unique_id = uuid4().hex[:8]
+        phone_start = random.choice([6, 7, 8, 9])
+        phone_rest = ''.join([str(random.randint(0, 9)) for _ in range(9)])
+        username = f"rehash_{unique_id}"
+
+        password = "TestPassword123!"
+        old_rounds = 4 if settings.PASSWORD_HASH_ROUNDS != 4 else 5
+        old_hash = pwd_context.hash(password, rounds=old_rounds)
+        user = User(
+            username=username,
+            password_hash=old_hash,
+            mobile_number=f"+91{phone_start}{phone_rest}",
+            full_name="Rehash User",
+            role="officer",
+            is_active=True,
+        )
+        db_session.add(user)
+        await db_session.commit()
+
+        response = await test_client.post(
+            "/api/v1/auth/login",
+            data={
+                "username": username,
+                "password": password,
+            },
+        )
+
+        assert response.status_code == 200
+        await db_session.refresh(user)
+        assert user.password_hash != old_hash
+        assert needs_rehash(user.password_hash) is False
+
     @pytest.mark.asyncio
     async def test_login_missing_credentials(self, test_client: AsyncClient):
         """Test login with missing credentials."""
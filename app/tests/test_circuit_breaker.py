@@ -0,0 +1,105 @@
+"""Tests for the circuit breaker."""
+
+from unittest.mock import patch
+
+from app.services.circuit_breaker import CircuitBreaker, CircuitState
+
+CLOCK = "app.services.circuit_breaker.time.monotonic"
+
+
+def _breaker(**kwargs) -> CircuitBreaker:
+    defaults = dict(
+        window_size=10,
+        min_calls=4,
+        error_rate_threshold=0.5,
+        latency_threshold_ms=1000,
+        open_seconds=30,
+    )
+    return CircuitBreaker("test", **{**defaults, **kwargs})
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker state transitions."""
+
+    def test_stays_closed_below_min_calls(self):
+        """Test failures below min_calls do not trip the circuit."""
+        breaker = _breaker()
+        for _ in range(3):
+            breaker.record_failure()
+
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.allow_request()
+
+    def test_trips_on_error_rate(self):
+        """Test the circuit opens once the error rate reaches the threshold."""
+        breaker = _breaker()
+        breaker.record_success(10)
+        breaker.record_success(10)
+        breaker.record_failure()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.trips == 1
+        assert breaker.last_trip_reason == "error rate 50%"
+
+    def test_trips_on_latency_percentile(self):
+        """Test slow successes trip the circuit via the latency percentile."""
+        breaker = _breaker()
+        for _ in range(4):
+            breaker.record_success(1500)
+
+        assert breaker.state == CircuitState.OPEN
+        assert "latency" in breaker.last_trip_reason
+
+    def test_open_circuit_fails_fast(self):
+        """Test requests are rejected while open."""
+        breaker = _breaker()
+        for _ in range(4):
+            breaker.record_failure()
+
+        assert breaker.allow_request() is False
+        assert breaker.allow_request() is False
+        assert breaker.rejected == 2
+
+    def test_half_open_success_closes(self):
+        """Test a fast trial call after open_seconds closes the circuit."""
+        breaker = _breaker()
+        with patch(CLOCK, return_value=100.0):
+            for _ in range(4):
+                breaker.record_failure()
+
+        with patch(CLOCK, return_value=131.0):
+            assert breaker.state == CircuitState.HALF_OPEN
+            assert breaker.allow_request() is True
+            assert breaker.allow_request() is False  # one trial at a time
+            breaker.record_success(50)
+
+            assert breaker.state == CircuitState.CLOSED
+            assert breaker.stats()["window_calls"] == 0
+
+    def test_half_open_failure_reopens(self):
+        """Test a failed trial call opens the circuit again."""
+        breaker = _breaker()
+        with patch(CLOCK, return_value=100.0):
+            for _ in range(4):
+                breaker.record_failure()
+
+        with patch(CLOCK, return_value=131.0):
+            assert breaker.allow_request()
+            breaker.record_failure()
+
+            assert breaker.state == CircuitState.OPEN
+            assert breaker.trips == 2
+            assert breaker.stats()["retry_in_seconds"] == 30
+
+    def test_stats(self):
+        """Test stats report state and window metrics."""
+        breaker = _breaker()
+        breaker.record_success(100)
+        breaker.record_failure(300)
+
+        stats = breaker.stats()
+
+        assert stats["state"] == "closed"
+        assert stats["error_rate"] == 0.5
+        assert stats["latency_percentile_ms"] == 300
@@ -0,0 +1,169 @@
+"""Tests for the NLP classification cache."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services.classification_cache import (
+    ClassificationCache,
+    classification_cache_key,
+    normalize_text,
+)
+from app.services.nlp_service import CachedNLPService, ClassificationResult, MockNLPService
+
+
+class FakeRedis:
+    """Minimal async Redis stand-in (GET/SET)."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    async def close(self):
+        pass
+
+
+class TestCacheKey:
+    """Tests for text normalization and key hashing."""
+
+    def test_normalization_ignores_case_and_whitespace(self):
+        """Test templated messages differing only in spacing/case share a key."""
+        assert normalize_text("  No WATER\n supply\t ") == "no water supply"
+        assert classification_cache_key("No water  supply", "en") == classification_cache_key(
+            "no water supply", "en"
+        )
+
+    def test_language_and_district_are_part_of_key(self):
+        """Test the same text in another language or district is a different key."""
+        base = classification_cache_key("water", "en", "05")
+
+        assert base != classification_cache_key("water", "te", "05")
+        assert base != classification_cache_key("water", "en", "07")
+
+
+class TestClassificationCache:
+    """Tests for the two-tier ClassificationCache."""
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        """Test least recently used entries are evicted past max_entries."""
+        cache = ClassificationCache(max_entries=2, ttl_seconds=60, redis_enabled=False)
+        await cache.set("a", {"v": 1})
+        await cache.set("b", {"v": 2})
+        await cache.get("a")  # a is now most recent
+        await cache.set("c", {"v": 3})
+
+        assert await cache.get("b") is None
+        assert await cache.get("a") == {"v": 1}
+        assert cache.evictions == 1
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry(self):
+        """Test expired entries are misses."""
+        cache = ClassificationCache(max_entries=10, ttl_seconds=60, redis_enabled=False)
+        with patch("app.services.classification_cache.time.monotonic", return_value=1000.0):
+            await cache.set("a", {"v": 1})
+        with patch("app.services.classification_cache.time.monotonic", return_value=1061.0):
+            assert await cache.get("a") is None
+
+    @pytest.mark.asyncio
+    async def test_model_version_change_invalidates(self):
+        """Test a new model version clears entries and namespaces Redis keys."""
+        cache = ClassificationCache(max_entries=10, ttl_seconds=60, redis_enabled=True)
+        cache._redis.client = FakeRedis()
+        with patch("app.services.redis_manager.get_redis_manager") as manager:
+            manager.return_value.client.return_value = cache._redis.client
+            cache.observe_model_version("v1")
+            await cache.set("a", {"v": 1})
+
+            assert cache.observe_model_version("v1") is False
+            assert cache.observe_model_version("v2") is True
+            assert await cache.get("a") is None
+        assert cache.stats()["invalidations"] == 1
+        assert list(cache._redis.client.data) == ["nlp:classification:v1:a"]
+
+    @pytest.mark.asyncio
+    async def test_redis_tier_shared_between_workers(self):
+        """Test an entry written by one worker is a Redis hit for another."""
+        redis = FakeRedis()
+        writer = ClassificationCache(max_entries=10, ttl_seconds=60, redis_enabled=True)
+        reader = ClassificationCache(max_entries=10, ttl_seconds=60, redis_enabled=True)
+        writer._redis.client = reader._redis.client = redis
+
+        with patch("app.services.redis_manager.get_redis_manager") as manager:
+            manager.return_value.client.return_value = redis
+            await writer.set("a", {"v": 1})
+
+            assert await reader.get("a") == {"v": 1}
+            assert reader.redis_hits == 1
+            assert await reader.get("a") == {"v": 1}  # now served locally
+            assert reader.redis_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_keeps_local_tier(self):
+        """Test Redis errors degrade to the in-process tier."""
+        cache = ClassificationCache(max_entries=10, ttl_seconds=60, redis_enabled=True)
+        with patch.object(cache._redis, "get", AsyncMock(side_effect=ConnectionError("down"))):
+            await cache.set("a", {"v": 1})
+            assert await cache.get("a") == {"v": 1}
+            assert await cache.get("b") is None
+
+
+class TestCachedNLPService:
+    """Tests for CachedNLPService."""
+
+    @pytest.fixture
+    def service(self):
+        """Cached mock NLP service with a local-only cache."""
+        cache = ClassificationCache(max_entries=100, ttl_seconds=60, redis_enabled=False)
+        return CachedNLPService(MockNLPService(), cache)
+
+    @pytest.mark.asyncio
+    async def test_repeated_text_served_from_cache(self, service):
+        """Test a resubmitted text does not reach the NLP service."""
+        first = await service.classify_text("Road is broken", "en", "05")
+        second = await service.classify_text("road is  BROKEN", "en", "05")
+
+        assert service.service.call_count == 1
+        assert second.department_code == first.department_code == "PWD"
+        assert second.fallback_used is False
+
+    @pytest.mark.asyncio
+    async def test_fallback_results_not_cached(self, service):
+        """Test failures are retried instead of cached."""
+        service.service.should_fail = True
+        await service.classify_text("Road is broken", "en")
+        await service.classify_text("Road is broken", "en")
+
+        assert service.service.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_model_version_from_results_invalidates(self, service):
+        """Test a result from a new model version clears older entries."""
+        service.service.classify_text = AsyncMock(
+            side_effect=lambda text, *a: ClassificationResult(
+                department_id=1, confidence=0.9, model_version=text.split()[0]
+            )
+        )
+        await service.classify_text("v1 water", "en")
+        await service.classify_text("v2 road", "en")
+
+        assert service.cache.model_version == "v2"
+        assert service.cache.stats()["entries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_health_check_reports_cache_stats(self, service):
+        """Test health_check includes hit/miss counters."""
+        await service.classify_text("Water problem", "en")
+        await service.classify_text("Water problem", "en")
+
+        health = await service.health_check()
+
+        assert health["status"] == "healthy"
+        assert health["cache"]["hits"] == 1
+        assert health["cache"]["misses"] == 1
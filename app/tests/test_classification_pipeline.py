@@ -0,0 +1,313 @@
+"""Tests for the background grievance classification pipeline."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.services.classification_pipeline import (
+    ClassificationJob,
+    ClassificationPipeline,
+    classify_department,
+)
+from app.config import settings
+from app.services import local_nlp_service
+from app.services.local_nlp_service import LocalNLPService
+from app.services.nlp_service import ClassificationResult, MockNLPService, TieredNLPService
+
+
+class FakeSession:
+    """AsyncSession stand-in that resolves one department and records UPDATEs."""
+
+    def __init__(self, department=None, rowcount: int = 1):
+        self.department = department
+        self.rowcount = rowcount
+        self.updates = []
+
+    async def execute(self, stmt):
+        result = MagicMock()
+        if stmt.is_select:
+            result.scalar_one_or_none.return_value = self.department
+        else:
+            self.updates.append(stmt)
+            result.rowcount = self.rowcount
+        return result
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+def make_department(sla_days: int = 3):
+    department = MagicMock()
+    department.id = uuid4()
+    department.dept_code = "HLTH"
+    department.sla_days = sla_days
+    return department
+
+
+def make_job() -> ClassificationJob:
+    return ClassificationJob(
+        grievance_id=uuid4(),
+        text="The government hospital has no doctors available for three days.",
+        language="en",
+        district_code="05",
+        submitted_at=datetime(2025, 11, 27, 10, 0, tzinfo=timezone.utc),
+    )
+
+
+def confident(code: str = "HLTH") -> ClassificationResult:
+    return ClassificationResult(department_id=1, confidence=0.9, department_code=code)
+
+
+class TestClassifyDepartment:
+    """Tests for classify_department."""
+
+    @pytest.mark.asyncio
+    async def test_confident_result_resolves_department(self):
+        """Test a confident classification returns the matching department."""
+        department = make_department()
+        with patch(
+            "app.services.classification_pipeline.classify_grievance",
+            AsyncMock(return_value=confident()),
+        ):
+            result = await classify_department(FakeSession(department), "text", "en")
+
+        assert result is department
+
+    @pytest.mark.asyncio
+    async def test_low_confidence_needs_manual_assignment(self):
+        """Test a low-confidence classification returns None."""
+        low = ClassificationResult(department_id=1, confidence=0.1, department_code="HLTH")
+        with patch(
+            "app.services.classification_pipeline.classify_grievance",
+            AsyncMock(return_value=low),
+        ):
+            result = await classify_department(FakeSession(make_department()), "text", "en")
+
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_local_fallback_prediction_is_routed(self):
+        """Test a local-tier prediction during an outage assigns a department."""
+        department = make_department()
+        department.dept_code = "HEALTH"
+        local = LocalNLPService(executor="thread", max_workers=1)
+        service = TieredNLPService(MockNLPService(should_fail=True), local)
+
+        with patch.object(local_nlp_service, "predict", lambda texts: [("Health", 0.18)]), \
+                patch.object(settings, "NLP_ENABLED", True), \
+                patch.object(settings, "NLP_LOCAL_CONFIDENCE_THRESHOLD", 0.15), \
+                patch("app.services.nlp_service.get_nlp_service", return_value=service):
+            session = FakeSession(department)
+            result = await classify_department(session, "Hospital has no doctor", "en")
+        await local.close()
+
+        assert result is department
+        assert service.fallback_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_nlp_error_needs_manual_assignment(self):
+        """Test an NLP exception is contained and returns None."""
+        with patch(
+            "app.services.classification_pipeline.classify_grievance",
+            AsyncMock(side_effect=RuntimeError("boom")),
+        ):
+            result = await classify_department(FakeSession(make_department()), "text", "en")
+
+        assert result is None
+
+
+class TestClassificationPipeline:
+    """Tests for ClassificationPipeline."""
+
+    @pytest.mark.asyncio
+    async def test_process_assigns_department_and_sla(self):
+        """Test processing updates department, SLA and due date from submission."""
+        department = make_department(sla_days=3)
+        session = FakeSession(department)
+        pipeline = ClassificationPipeline(workers=1, max_queue_size=10, session_provider=lambda: session)
+        job = make_job()
+
+        with patch(
+            "app.services.classification_pipeline.classify_grievance",
+            AsyncMock(return_value=confident()),
+        ):
+            assert await pipeline.process(job) is True
+
+        params = session.updates[0].compile().params
+        assert params["department_id"] == department.id
+        assert params["sla_days"] == 3
+        assert params["due_date"] == job.submitted_at + timedelta(days=3)
+        assert pipeline.stats()["classified"] == 1
+
+    @pytest.mark.asyncio
+    async def test_process_does_not_override_manual_assignment(self):
+        """Test the UPDATE only touches still-unassigned submitted grievances."""
+        session = FakeSession(make_department(), rowcount=0)
+        pipeline = ClassificationPipeline(workers=1, max_queue_size=10, session_provider=lambda: session)
+
+        with patch(
+            "app.services.classification_pipeline.classify_grievance",
+            AsyncMock(return_value=confident()),
+        ):
+            assert await pipeline.process(make_job()) is False
+
+        sql = str(session.updates[0])
+        assert "grievances.department_id IS NULL" in sql
+        assert "grievances.status = " in sql
+        assert pipeline.stats()["unclassified"] == 1
+
+    @pytest.mark.asyncio
+    async def test_workers_drain_queue(self):
+        """Test started workers process every submitted job."""
+        pipeline = ClassificationPipeline(
+            workers=2,
+            max_queue_size=10,
+            session_provider=lambda: FakeSession(make_department()),
+        )
+
+        with patch(
+            "app.services.classification_pipeline.classify_grievance",
+            AsyncMock(return_value=confident()),
+        ):
+            await pipeline.start()
+            for _ in range(5):
+                assert pipeline.submit(make_job()) is True
+            await pipeline.join()
+            await pipeline.stop()
+
+        stats = pipeline.stats()
+        assert stats["enqueued"] == 5
+        assert stats["classified"] == 5
+        assert stats["queue_depth"] == 0
+        assert stats["status"] == "stopped"
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects_with_backpressure(self):
+        """Test submit refuses jobs beyond capacity instead of blocking."""
+        release = asyncio.Event()
+
+        async def slow_classify(**kwargs):
+            await release.wait()
+            return confident()
+
+        pipeline = ClassificationPipeline(
+            workers=1,
+            max_queue_size=1,
+            session_provider=lambda: FakeSession(make_department()),
+        )
+
+        with patch("app.services.classification_pipeline.classify_grievance", slow_classify):
+            await pipeline.start()
+            assert pipeline.submit(make_job()) is True
+            await asyncio.sleep(0)  # worker picks up the first job
+            assert pipeline.submit(make_job()) is True
+            assert pipeline.submit(make_job()) is False
+
+            stats = pipeline.stats()
+            assert stats["status"] == "saturated"
+            assert stats["in_flight"] == 1
+            assert stats["rejected"] == 1
+
+            release.set()
+            await pipeline.stop()
+
+    @pytest.mark.asyncio
+    async def test_worker_survives_failures(self):
+        """Test a failing job is counted and the worker keeps going."""
+        pipeline = ClassificationPipeline(
+            workers=1,
+            max_queue_size=10,
+            session_provider=MagicMock(side_effect=RuntimeError("db down")),
+        )
+
+        await pipeline.start()
+        pipeline.submit(make_job())
+        pipeline.submit(make_job())
+        await pipeline.join()
+        await pipeline.stop()
+
+        assert pipeline.stats()["failed"] == 2
+
+    def test_submit_when_stopped_is_rejected(self):
+        """Test jobs are rejected (left for manual triage) when not running."""
+        pipeline = ClassificationPipeline(workers=1, max_queue_size=10)
+
+        assert pipeline.submit(make_job()) is False
+        assert pipeline.stats()["rejected"] == 1
+
+
+class RecoverySession(FakeSession):
+    """FakeSession whose SELECTs return unassigned grievance rows."""
+
+    def __init__(self, rows):
+        super().__init__()
+        self.rows = rows
+        self.selects = []
+
+    async def execute(self, stmt):
+        self.selects.append(stmt)
+        result = MagicMock()
+        result.all.return_value = self.rows
+        return result
+
+
+def unassigned_row():
+    row = MagicMock()
+    row.id = uuid4()
+    row.grievance_text = "Street lights not working for two weeks."
+    row.language = "en"
+    row.district_code = "05"
+    row.submitted_at = datetime.now(timezone.utc) - timedelta(hours=1)
+    return row
+
+
+class TestClassificationRecovery:
+    """Tests for the recovery sweep of lost classification jobs."""
+
+    @pytest.mark.asyncio
+    async def test_recover_requeues_unassigned_grievances_once(self):
+        """Test lost jobs are re-queued and excluded from later sweeps."""
+        rows = [unassigned_row(), unassigned_row()]
+        session = RecoverySession(rows)
+        pipeline = ClassificationPipeline(
+            workers=1, max_queue_size=10, session_provider=lambda: session
+        )
+        low = ClassificationResult(department_id=None, confidence=0.0, fallback_used=True)
+
+        with patch(
+            "app.services.classification_pipeline.classify_grievance",
+            AsyncMock(return_value=low),
+        ):
+            await pipeline.start()
+            assert await pipeline.recover() == 2
+            await pipeline.join()
+            session.rows = []
+            assert await pipeline.recover() == 0
+            await pipeline.stop()
+
+        first, second = (str(stmt) for stmt in session.selects)
+        assert "grievances.department_id IS NULL" in first
+        assert "grievances.status = " in first
+        assert "NOT IN" not in first
+        assert "NOT IN" in second
+        params = session.selects[1].compile().params.values()
+        excluded = [value for value in params if isinstance(value, list)]
+        assert [set(value) for value in excluded] == [{row.id for row in rows}]
+        stats = pipeline.stats()
+        assert stats["recovered"] == 2
+        assert stats["unclassified"] == 2
+
+    @pytest.mark.asyncio
+    async def test_recover_when_stopped_is_noop(self):
+        """Test a stopped pipeline does not query for lost jobs."""
+        session = RecoverySession([unassigned_row()])
+        pipeline = ClassificationPipeline(workers=1, max_queue_size=10, session_provider=lambda: session)
+
+        assert await pipeline.recover() == 0
+        assert session.selects == []
@@ -0,0 +1,118 @@
+"""Tests for the block-allocating grievance ID generator."""
+
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.services.grievance_id_generator import GrievanceIdGenerator, format_grievance_id
+
+NOW = datetime(2025, 11, 27, 10, 0, tzinfo=timezone.utc)
+
+
+class FakeCounterSession:
+    """AsyncSession stand-in emulating the grievance_id_counters upsert."""
+
+    bind = None  # not an AsyncEngine: reserve on this session
+
+    def __init__(self, start: int = 1):
+        self.counters: dict = {}
+        self.start = start
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        params = stmt.compile(dialect=postgresql.dialect()).params
+        key = (params["year"], params["district_code"])
+        block = params["next_value"] - 1
+        self.counters[key] = self.counters.get(key, self.start) + block
+        result = MagicMock()
+        result.scalar_one.return_value = self.counters[key]
+        await asyncio.sleep(0)  # let other allocations interleave
+        return result
+
+
+class TestFormatGrievanceId:
+    """Tests for format_grievance_id."""
+
+    def test_five_digit_padding(self):
+        """Test numbers are zero-padded to PGRS-YYYY-DD-NNNNN."""
+        assert format_grievance_id(2025, "05", 42) == "PGRS-2025-05-00042"
+
+    def test_grows_past_five_digits(self):
+        """Test the numeric part widens instead of wrapping."""
+        assert format_grievance_id(2025, "05", 123456) == "PGRS-2025-05-123456"
+
+
+class TestGrievanceIdGenerator:
+    """Tests for GrievanceIdGenerator."""
+
+    @pytest.mark.asyncio
+    async def test_sequential_within_block(self):
+        """Test IDs count up from 1 and one block needs one round-trip."""
+        db = FakeCounterSession()
+        generator = GrievanceIdGenerator(block_size=5)
+
+        ids = [await generator.next_id(db, "05", now=NOW) for _ in range(5)]
+
+        assert ids == [f"PGRS-2025-05-0000{i}" for i in range(1, 6)]
+        assert len(db.statements) == 1
+
+    @pytest.mark.asyncio
+    async def test_reserves_next_block_when_exhausted(self):
+        """Test a new block is reserved after the current one is used up."""
+        db = FakeCounterSession()
+        generator = GrievanceIdGenerator(block_size=2)
+
+        ids = [await generator.next_id(db, "05", now=NOW) for _ in range(3)]
+
+        assert ids[-1] == "PGRS-2025-05-00003"
+        assert len(db.statements) == 2
+
+    @pytest.mark.asyncio
+    async def test_districts_and_years_are_independent(self):
+        """Test each (year, district) has its own numbering."""
+        db = FakeCounterSession()
+        generator = GrievanceIdGenerator(block_size=10)
+
+        assert await generator.next_id(db, "05", now=NOW) == "PGRS-2025-05-00001"
+        assert await generator.next_id(db, "07", now=NOW) == "PGRS-2025-07-00001"
+        next_year = NOW.replace(year=2026)
+        assert await generator.next_id(db, "05", now=next_year) == "PGRS-2026-05-00001"
+
+    @pytest.mark.asyncio
+    async def test_workers_never_share_numbers(self):
+        """Test concurrent allocations across workers yield unique IDs."""
+        db = FakeCounterSession()
+        workers = [GrievanceIdGenerator(block_size=3) for _ in range(4)]
+
+        ids = await asyncio.gather(*(
+            workers[i % 4].next_id(db, "05", now=NOW) for i in range(100)
+        ))
+
+        assert len(set(ids)) == 100
+
+    @pytest.mark.asyncio
+    async def test_continues_above_seeded_counter(self):
+        """Test allocation continues above legacy IDs (counter seeded high)."""
+        db = FakeCounterSession(start=99999)
+        generator = GrievanceIdGenerator(block_size=5)
+
+        assert await generator.next_id(db, "05", now=NOW) == "PGRS-2025-05-99999"
+        assert await generator.next_id(db, "05", now=NOW) == "PGRS-2025-05-100000"
+
+    @pytest.mark.asyncio
+    async def test_reservation_is_single_upsert(self):
+        """Test a block is reserved with one INSERT ... ON CONFLICT ... RETURNING."""
+        db = FakeCounterSession()
+        generator = GrievanceIdGenerator(block_size=20)
+
+        await generator.next_id(db, "05", now=NOW)
+        sql = str(db.statements[0].compile(dialect=postgresql.dialect()))
+
+        assert sql.startswith("INSERT INTO grievance_id_counters")
+        assert "ON CONFLICT (year, district_code) DO UPDATE SET next_value = " in sql
+        assert "grievance_id_counters.next_value + " in sql
+        assert sql.endswith("RETURNING grievance_id_counters.next_value")
@@ -0,0 +1,235 @@
+"""Tests for streaming grievance bulk ingest."""
+
+import json
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.services.grievance_ingest import (
+    GrievanceIngestor,
+    IngestReport,
+    iter_csv_records,
+    iter_lines,
+    iter_ndjson_records,
+    iter_records,
+)
+
+DISTRICT_ID = uuid4()
+DEPT_ID = uuid4()
+
+VALID_ROW = {
+    "citizen_name": "Rajesh Kumar",
+    "citizen_phone": "+919876543210",
+    "citizen_address": "Plot 123, MG Road, Vijayawada",
+    "district_code": "05",
+    "grievance_text": "No water supply in our colony for the last five days.",
+    "language": "te",
+    "channel": "voice",
+}
+
+
+async def _chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+async def _collect(aiter):
+    return [item async for item in aiter]
+
+
+class FakeIngestSession:
+    """AsyncSession stand-in recording inserts; rows listed in `bad_ids` fail."""
+
+    def __init__(self, bad_grievance_ids=()):
+        self.bad_grievance_ids = set(bad_grievance_ids)
+        self.inserted = []
+        self.commits = 0
+        self.insert_calls = 0
+
+    async def execute(self, stmt):
+        params = stmt.compile().params
+        ids = [v for k, v in params.items() if k.startswith("grievance_id")]
+        self.insert_calls += 1
+        if self.bad_grievance_ids.intersection(ids):
+            raise Exception("duplicate key value violates unique constraint\nSQL: ...")
+        self.inserted.extend(ids)
+        return MagicMock()
+
+    def begin_nested(self):
+        savepoint = MagicMock()
+        savepoint.__aenter__ = AsyncMock(return_value=savepoint)
+        savepoint.__aexit__ = AsyncMock(return_value=False)
+        return savepoint
+
+    async def commit(self):
+        self.commits += 1
+
+
+def _ingestor(db, **kwargs) -> GrievanceIngestor:
+    """Ingestor with reference maps preloaded (load_reference_maps stubbed)."""
+    ingestor = GrievanceIngestor(db, **kwargs)
+    ingestor._districts = {"05": DISTRICT_ID}
+    ingestor._departments_by_code = {"HEALTH": (DEPT_ID, 3)}
+    ingestor._departments_by_id = {DEPT_ID: 3}
+    ingestor.load_reference_maps = AsyncMock()
+    return ingestor
+
+
+@pytest.fixture
+def id_generator():
+    """Deterministic grievance IDs (PGRS-2025-05-00001, ...)."""
+    counter = iter(range(1, 10_000))
+    generator = MagicMock()
+    generator.next_id = AsyncMock(side_effect=lambda *a, **k: f"PGRS-2025-05-{next(counter):05d}")
+    with patch("app.services.grievance_ingest.get_grievance_id_generator", return_value=generator):
+        yield generator
+
+
+class TestParsing:
+    """Tests for line splitting and NDJSON/CSV record parsing."""
+
+    @pytest.mark.asyncio
+    async def test_lines_span_chunk_boundaries(self):
+        """Test lines split across chunks are reassembled, BOM and CR stripped."""
+        lines = await _collect(iter_lines(_chunks(b"\xef\xbb\xbfab", b"c\r\nde", b"f\ngh")))
+
+        assert lines == ["abc", "def", "gh"]
+
+    @pytest.mark.asyncio
+    async def test_ndjson_reports_bad_lines(self):
+        """Test invalid JSON and non-objects are errors; blank lines are skipped."""
+        body = b'{"a": 1}\n\n{broken\n[1, 2]\n{"b": 2}\n'
+        records = await _collect(iter_records("ndjson", _chunks(body)))
+
+        assert records[0] == (1, {"a": 1}, None)
+        assert records[1][0] == 3 and records[1][2].startswith("Invalid JSON")
+        assert records[2] == (4, None, "Expected a JSON object")
+        assert records[3] == (5, {"b": 2}, None)
+
+    @pytest.mark.asyncio
+    async def test_ndjson_line_numbers_include_blank_lines(self):
+        """Test whitespace-only lines are skipped but still counted."""
+        body = b'\n   \n{"a": 1}\n\t\n"text"\n'
+        records = await _collect(iter_ndjson_records(iter_lines(_chunks(body))))
+
+        assert records == [(3, {"a": 1}, None), (5, None, "Expected a JSON object")]
+
+    @pytest.mark.asyncio
+    async def test_csv_multiline_quoted_field(self):
+        """Test quoted fields may contain newlines and empty cells are dropped."""
+        body = b'name,text,subject\nRavi,"line one\nline two",\nSita,short,Roads\n'
+        records = await _collect(iter_csv_records(iter_lines(_chunks(body))))
+
+        assert records == [
+            (2, {"name": "Ravi", "text": "line one\nline two"}, None),
+            (4, {"name": "Sita", "text": "short", "subject": "Roads"}, None),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_csv_column_mismatch(self):
+        """Test rows with the wrong number of columns are errors."""
+        records = await _collect(iter_records("csv", _chunks(b"a,b\n1,2,3\n")))
+
+        assert records == [(2, None, "Expected 2 columns, got 3")]
+
+    def test_unknown_format(self):
+        """Test an unsupported format raises ValueError."""
+        with pytest.raises(ValueError):
+            iter_records("xml", _chunks(b""))
+
+
+class TestGrievanceIngestor:
+    """Tests for GrievanceIngestor validation and batching."""
+
+    @pytest.mark.asyncio
+    async def test_build_row_resolves_department_code(self, id_generator):
+        """Test department codes map to the department and its SLA."""
+        ingestor = _ingestor(FakeIngestSession())
+        submitted = datetime(2024, 3, 1, 9, 30)
+
+        row, error = await ingestor._build_row(
+            {**VALID_ROW, "department_code": "HEALTH", "submitted_at": submitted.isoformat()}
+        )
+
+        assert error is None
+        assert row["district_id"] == DISTRICT_ID
+        assert row["department_id"] == DEPT_ID
+        assert row["sla_days"] == 3
+        assert row["submitted_at"] == submitted.replace(tzinfo=timezone.utc)
+        assert (row["due_date"] - row["submitted_at"]).days == 3
+        assert row["subject"] == VALID_ROW["grievance_text"][:100]
+
+    @pytest.mark.asyncio
+    async def test_build_row_rejects_invalid_and_unknown(self, id_generator):
+        """Test validation errors and unknown codes are reported without an ID."""
+        ingestor = _ingestor(FakeIngestSession())
+
+        _, error = await ingestor._build_row({**VALID_ROW, "citizen_phone": "12345"})
+        assert error.startswith("citizen_phone:")
+
+        _, error = await ingestor._build_row({**VALID_ROW, "district_code": "07"})
+        assert error == "Unknown district code '07'"
+
+        _, error = await ingestor._build_row({**VALID_ROW, "department_code": "NOPE"})
+        assert error == "Unknown department code 'NOPE'"
+
+        id_generator.next_id.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_batches_and_commits(self, id_generator):
+        """Test valid rows are inserted in batches, each committed."""
+        db = FakeIngestSession()
+        ingestor = _ingestor(db, batch_size=2)
+        body = "\n".join(['{"x": 1}'] + [json.dumps(VALID_ROW)] * 5).encode()
+
+        report = await ingestor.ingest(iter_records("ndjson", _chunks(body)))
+
+        assert report.total_rows == 6
+        assert report.inserted == 5
+        assert report.failed == 1 and report.errors[0]["line"] == 1
+        assert db.insert_calls == 3
+        assert db.commits == 3
+
+    @pytest.mark.asyncio
+    async def test_invalid_utf8_midway_reports_partial_ingest(self, id_generator):
+        """Test a decode error stops reading but keeps and reports earlier rows."""
+        db = FakeIngestSession()
+        ingestor = _ingestor(db, batch_size=2)
+        good = (json.dumps(VALID_ROW) + "\n").encode()
+
+        report = await ingestor.ingest(
+            iter_records("ndjson", _chunks(good * 3, b'{"bad": "\xff"}\n', good))
+        )
+
+        assert report.inserted == 3
+        assert report.total_rows == 3
+        assert report.stopped_at_line == 4
+        assert report.stop_error == "Line 4 is not valid UTF-8"
+        assert db.commits == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_retried_per_row(self, id_generator):
+        """Test a database error isolates the bad row and keeps the rest."""
+        db = FakeIngestSession(bad_grievance_ids={"PGRS-2025-05-00002"})
+        ingestor = _ingestor(db, batch_size=10)
+        rows = [(line, (await ingestor._build_row(VALID_ROW))[0]) for line in (1, 2, 3)]
+
+        await ingestor._flush(rows)
+
+        assert db.inserted == ["PGRS-2025-05-00001", "PGRS-2025-05-00003"]
+        assert ingestor.report.inserted == 2
+        assert ingestor.report.errors == [
+            {"line": 2, "error": "duplicate key value violates unique constraint"}
+        ]
+
+    def test_report_truncates_errors(self):
+        """Test errors beyond max_errors are counted but not listed."""
+        report = IngestReport(max_errors=2)
+        for line in range(5):
+            report.add_error(line, "bad")
+
+        assert report.failed == 5
+        assert len(report.errors) == 2
+        assert report.errors_truncated
@@ -0,0 +1,81 @@
+"""Tests for grievance text search query building."""
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.models.grievance import Grievance
+from app.services.grievance_search import GrievanceSearch, _escape_like
+
+
+def compile_pg(clause) -> str:
+    """Compile a clause for PostgreSQL with parameters inlined as binds."""
+    return str(clause.compile(dialect=postgresql.dialect()))
+
+
+class TestFromQuery:
+    """Tests for GrievanceSearch.from_query normalization."""
+
+    @pytest.mark.parametrize("raw", [None, "", "   ", "\t\n"])
+    def test_blank_is_no_search(self, raw):
+        """Test missing or blank search parameters disable search."""
+        assert GrievanceSearch.from_query(raw) is None
+
+    def test_whitespace_is_collapsed(self):
+        """Test surrounding and repeated whitespace is normalized."""
+        search = GrievanceSearch.from_query("  water   supply ")
+
+        assert search is not None
+        assert search.term == "water supply"
+
+    def test_telugu_term_preserved(self):
+        """Test Telugu-script input is kept as-is."""
+        search = GrievanceSearch.from_query("నీటి సరఫరా")
+
+        assert search is not None
+        assert search.term == "నీటి సరఫరా"
+
+
+class TestEscapeLike:
+    """Tests for LIKE wildcard escaping."""
+
+    def test_wildcards_escaped(self):
+        """Test % and _ in user input are matched literally."""
+        assert _escape_like("50%_off") == "50\\%\\_off"
+
+    def test_backslash_escaped(self):
+        """Test the escape character itself is escaped."""
+        assert _escape_like("a\\b") == "a\\\\b"
+
+
+class TestSearchClauses:
+    """Tests for the generated predicate and rank expressions."""
+
+    def test_predicate_uses_fulltext_and_trigram_paths(self):
+        """Test predicate ORs the tsvector match with both ILIKE matches."""
+        sql = compile_pg(GrievanceSearch("water").predicate())
+
+        assert "grievances.search_vector @@ websearch_to_tsquery('simple'::regconfig" in sql
+        assert "grievances.subject ILIKE" in sql
+        assert "grievances.grievance_text ILIKE" in sql
+        assert " OR " in sql
+
+    def test_predicate_escapes_pattern(self):
+        """Test the ILIKE pattern carries escaped user input."""
+        compiled = GrievanceSearch("100%").predicate().compile(dialect=postgresql.dialect())
+
+        assert "%100\\%%" in compiled.params.values()
+
+    def test_rank_is_double_precision(self):
+        """Test rank is cast to FLOAT so it round-trips through cursors."""
+        sql = compile_pg(GrievanceSearch("water").rank())
+
+        assert sql.startswith("CAST(coalesce(ts_rank_cd(")
+        assert "similarity(" in sql
+        assert sql.endswith("AS FLOAT)")
+
+    def test_search_vector_not_loaded_by_default(self):
+        """Test ORM selects of Grievance skip the deferred search_vector."""
+        sql = compile_pg(select(Grievance))
+
+        assert "search_vector" not in sql
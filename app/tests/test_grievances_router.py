@@ -4,12 +4,15 @@ import pytest
 from datetime import datetime, timedelta, timezone
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
+from unittest.mock import patch
 from uuid import uuid4
 
+from app.models.attachment import Attachment
 from app.models.department import Department
 from app.models.district import District
 from app.models.grievance import Grievance
 from app.models.user import User
+from app.services.storage_service import LocalStorageService
 from app.utils.jwt import create_access_token
 from app.utils.password import hash_password
 
@@ -150,6 +153,36 @@ class TestCreateGrievanceEndpoint:
                 # Should return same grievance
                 assert grievance_id1 == grievance_id2
 
+    @pytest.mark.asyncio
+    async def test_create_grievance_in_flight_key_conflicts(
+        self,
+        test_client: AsyncClient,
+    ):
+        """Test a retry while the original is still processing gets 409."""
+        from app.services.idempotency_store import get_idempotency_store
+
+        idempotency_key = f"test-key-{uuid4().hex}"
+        claim = await get_idempotency_store().claim(idempotency_key)
+        grievance_data = {
+            "citizen_name": "Concurrent Citizen",
+            "citizen_phone": "+919876543210",
+            "district_code": "05",
+            "grievance_text": "This is a test grievance for concurrent retry testing with sufficient length.",
+            "language": "en",
+            "channel": "web",
+        }
+
+        try:
+            response = await test_client.post(
+                "/api/v1/grievances",
+                json=grievance_data,
+                headers={"Idempotency-Key": idempotency_key},
+            )
+        finally:
+            await get_idempotency_store().release(claim)
+
+        assert response.status_code == 409
+
     @pytest.mark.asyncio
     async def test_create_grievance_missing_required_fields(
         self,
@@ -258,6 +291,56 @@ class TestGetGrievanceEndpoint:
 
         assert response.status_code == 404
 
+    @pytest.mark.asyncio
+    async def test_get_grievance_with_missing_attachment_file(
+        self,
+        test_client: AsyncClient,
+        db_session: AsyncSession,
+        test_officer: User,
+        test_district: District,
+        test_department: Department,
+        sample_grievance_data: dict,
+        tmp_path,
+    ):
+        """Test attachments get their /uploads/ URL even if the file is not on this instance."""
+        grievance = Grievance(
+            **sample_grievance_data,
+            district_id=test_district.id,
+            department_id=test_department.id,
+        )
+        db_session.add(grievance)
+        await db_session.flush()
+        db_session.add(Attachment(
+            grievance_id=grievance.id,
+            file_name="photo.jpg",
+            file_path="blobs/ab/cd/abcd",
+            file_type="image/jpeg",
+            file_size=1024,
+            file_hash="abcd",
+        ))
+        await db_session.commit()
+
+        token = create_access_token(
+            user_id=test_officer.id,
+            role=test_officer.role,
+            username=test_officer.username,
+            department_id=test_officer.department_id,
+            district_id=test_officer.district_id,
+        )
+
+        with patch(
+            "app.routers.grievances.get_storage_service",
+            return_value=LocalStorageService(upload_dir=str(tmp_path)),
+        ):
+            response = await test_client.get(
+                f"/api/v1/grievances/{grievance.grievance_id}",
+                headers={"Authorization": f"Bearer {token}"},
+            )
+
+        assert response.status_code == 200
+        attachments = response.json()["attachments"]
+        assert [a["file_url"] for a in attachments] == ["/uploads/blobs/ab/cd/abcd"]
+
 
 class TestUpdateGrievanceEndpoint:
     """Tests for PATCH /api/v1/grievances/{grievance_id} endpoint."""
@@ -483,23 +566,191 @@ class TestBulkUpdateGrievancesEndpoint:
         else:
             assert response.status_code == 404
 
+    @pytest.mark.asyncio
+    async def test_bulk_update_reports_per_id_and_audits(
+        self,
+        test_client: AsyncClient,
+        db_session: AsyncSession,
+        test_district: District,
+        sample_grievance_data: dict,
+    ):
+        """Test bulk update applies changes, reports each ID and writes audit rows."""
+        from sqlalchemy import select
 
-class TestGrievanceIdGeneration:
-    """Tests for grievance ID generation helper."""
+        from app.models.audit_log import AuditLog
 
-    def test_generate_grievance_id_format(self):
-        """Test generated grievance ID has correct format."""
-        from app.routers.grievances import _generate_grievance_id
+        supervisor_user = User(
+            username=f"supervisor_{uuid4().hex[:8]}",
+            password_hash=hash_password("SuperPass123!"),
+            mobile_number=f"+91{9}{uuid4().hex[:9][:9]}",
+            email=f"supervisor_{uuid4().hex[:8]}@gov.in",
+            full_name="Supervisor User",
+            role="supervisor",
+            is_active=True,
+        )
+        grievance = Grievance(**sample_grievance_data, district_id=test_district.id)
+        db_session.add_all([supervisor_user, grievance])
+        await db_session.commit()
 
-        grievance_id = _generate_grievance_id("05")
+        token = create_access_token(
+            user_id=supervisor_user.id,
+            role="supervisor",
+            username=supervisor_user.username,
+            department_id=None,
+            district_id=None,
+        )
 
-        assert grievance_id.startswith("PGRS-")
-        parts = grievance_id.split("-")
-        assert len(parts) == 4
-        assert parts[0] == "PGRS"
-        assert len(parts[1]) == 4  # Year
-        assert parts[2] == "05"  # District code
-        assert len(parts[3]) == 5  # Unique number
+        response = await test_client.patch(
+            "/api/v1/grievances/bulk",
+            json={
+                "grievance_ids": [grievance.grievance_id, "PGRS-2025-01-99999"],
+                "updates": {"status": "assigned"},
+            },
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["updated_count"] == 1
+        assert data["failed_count"] == 1
+        assert data["results"] == [
+            {"grievance_id": grievance.grievance_id, "status": "success"},
+            {"grievance_id": "PGRS-2025-01-99999", "status": "failed", "error": "Not found"},
+        ]
+
+        await db_session.refresh(grievance)
+        assert grievance.status == "assigned"
+        logs = (await db_session.execute(
+            select(AuditLog).where(AuditLog.grievance_id == grievance.id)
+        )).scalars().all()
+        assert [log.action for log in logs] == ["bulk_update"]
+        assert logs[0].user_id == supervisor_user.id
+
+
+class TestBulkUpdateStatements:
+    """Tests for the set-based bulk update helpers."""
+
+    def test_update_is_single_statement_with_returning(self):
+        """Test bulk update binds all IDs as one array and returns matches."""
+        from sqlalchemy.dialects import postgresql
+
+        from app.routers.grievances import _bulk_update_statement, _bulk_update_values
+
+        values = _bulk_update_values({"status": "assigned"})
+        stmt = _bulk_update_statement(["PGRS-2025-01-00001", "PGRS-2025-01-00002"], values)
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        sql = str(compiled)
+
+        assert sql.startswith("UPDATE grievances SET status=")
+        assert "grievances.grievance_id = ANY (%(ids)s::VARCHAR[])" in sql
+        assert "grievances.deleted_at IS NULL" in sql
+        assert sql.endswith("RETURNING grievances.id, grievances.grievance_id")
+        assert compiled.params["ids"] == ["PGRS-2025-01-00001", "PGRS-2025-01-00002"]
+
+    def test_reassignment_sets_assigned_at(self):
+        """Test officer reassignment also stamps assigned_at."""
+        from app.routers.grievances import _bulk_update_values
+
+        officer_id = uuid4()
+        values = _bulk_update_values({
+            "assigned_officer_id": str(officer_id),
+            "audit_reason": "Reassigned due to officer leave",
+        })
+
+        assert values["assigned_officer_id"] == officer_id
+        assert "assigned_at" in values
+        assert "audit_reason" not in values
+
+    @pytest.mark.parametrize(
+        "updates",
+        [{"status": "archived"}, {"assigned_officer_id": "not-a-uuid"}],
+    )
+    def test_invalid_updates_rejected(self, updates):
+        """Test invalid update values fail the request up front."""
+        from fastapi import HTTPException
+
+        from app.routers.grievances import _bulk_update_values
+
+        with pytest.raises(HTTPException) as exc_info:
+            _bulk_update_values(updates)
+
+        assert exc_info.value.status_code == 422
+
+    def test_audit_hash_chains_previous_entry(self):
+        """Test audit hashes depend on the previous entry's hash."""
+        from app.models.audit_log import AuditLog
+
+        args = (uuid4(), uuid4(), "bulk_update", '{"status": "assigned"}', datetime.now(timezone.utc))
+
+        first = AuditLog.compute_hash(None, *args)
+
+        assert len(first) == 64
+        assert AuditLog.compute_hash(first, *args) != first
+        assert AuditLog.compute_hash(None, *args) == first
+
+
+class TestGrievanceListProjection:
+    """Tests for the list-mode projection query and row builder."""
+
+    def test_list_query_joins_names_in_one_statement(self):
+        """Test list query selects columns and joins district/department."""
+        from sqlalchemy.dialects import postgresql
+
+        from app.routers.grievances import _grievance_list_query
+
+        sql = str(_grievance_list_query().compile(dialect=postgresql.dialect()))
+
+        assert "JOIN districts" in sql
+        assert "LEFT OUTER JOIN departments" in sql
+        # Heavy columns/collections stay out of the list projection
+        assert "resolution_notes" not in sql
+        assert "attachments" not in sql
+        assert "audit_logs" not in sql
+
+    def test_build_list_item_without_department(self):
+        """Test unclassified grievances render department as None."""
+        from types import SimpleNamespace
+
+        from app.routers.grievances import _build_grievance_list_item
+
+        now = datetime.now(timezone.utc)
+        row = SimpleNamespace(
+            id=uuid4(),
+            grievance_id="PGRS-2025-05-00001",
+            citizen_name="Test Citizen",
+            citizen_phone="+919876543210",
+            citizen_email=None,
+            citizen_address="123 Test Street, Test City",
+            status="submitted",
+            priority="normal",
+            district_id=uuid4(),
+            department_id=None,
+            assigned_officer_id=None,
+            sla_days=7,
+            due_date=now + timedelta(days=7),
+            grievance_text="Water supply has been erratic for a week.",
+            language="en",
+            channel="web",
+            created_at=now,
+            updated_at=now,
+            resolved_at=None,
+            verified_at=None,
+            district_code="05",
+            district_name="Krishna",
+            dept_code=None,
+            dept_name=None,
+            dept_name_telugu=None,
+        )
+
+        item = _build_grievance_list_item(row)
+
+        assert item["department"] is None
+        assert item["district"] == {
+            "id": str(row.district_id),
+            "code": "05",
+            "name": "Krishna",
+        }
+        assert item["assigned_officer"] is None
 
 
 class TestDuplicateDetection:
@@ -747,6 +998,149 @@ class TestGrievancePagination:
         # page_size > 100 should fail validation
         assert response.status_code == 422
 
+    @pytest.mark.asyncio
+    async def test_cursor_pagination_walks_all_pages(
+        self,
+        test_client: AsyncClient,
+        db_session: AsyncSession,
+        test_officer: User,
+        test_district: District,
+        test_department: Department,
+        sample_grievance_data: dict,
+    ):
+        """Test following next_cursor visits every grievance exactly once."""
+        for i in range(5):
+            data = dict(sample_grievance_data)
+            data["grievance_id"] = f"PGRS-2025-{test_district.district_code}-9{i:04d}"
+            db_session.add(Grievance(
+                **data,
+                district_id=test_district.id,
+                department_id=test_department.id,
+            ))
+        await db_session.commit()
+
+        token = create_access_token(
+            user_id=test_officer.id,
+            role=test_officer.role,
+            username=test_officer.username,
+            department_id=test_officer.department_id,
+            district_id=test_officer.district_id,
+        )
+        headers = {"Authorization": f"Bearer {token}"}
+
+        seen = []
+        url = f"/api/v1/grievances?page_size=2&department_id={test_department.id}"
+        response = await test_client.get(url, headers=headers)
+        while True:
+            assert response.status_code == 200
+            body = response.json()
+            seen.extend(item["grievance_id"] for item in body["data"])
+            cursor = body["pagination"]["next_cursor"]
+            if cursor is None:
+                assert body["pagination"]["has_more"] is False
+                break
+            response = await test_client.get(f"{url}&cursor={cursor}", headers=headers)
+
+        assert len(seen) == 5
+        assert len(set(seen)) == 5
+
+    @pytest.mark.asyncio
+    async def test_cursor_mode_skips_count_by_default(
+        self,
+        test_client: AsyncClient,
+        test_officer: User,
+    ):
+        """Test cursor mode does not compute a total unless asked."""
+        from app.database.pagination import encode_cursor
+
+        token = create_access_token(
+            user_id=test_officer.id,
+            role=test_officer.role,
+            username=test_officer.username,
+            department_id=test_officer.department_id,
+            district_id=test_officer.district_id,
+        )
+        cursor = encode_cursor(datetime.now(timezone.utc), uuid4())
+
+        response = await test_client.get(
+            f"/api/v1/grievances?cursor={cursor}",
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+        assert response.status_code == 200
+        pagination = response.json()["pagination"]
+        assert pagination["total_items"] is None
+        assert "page" not in pagination
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_returns_400(
+        self,
+        test_client: AsyncClient,
+        test_officer: User,
+    ):
+        """Test a malformed cursor is rejected."""
+        token = create_access_token(
+            user_id=test_officer.id,
+            role=test_officer.role,
+            username=test_officer.username,
+            department_id=test_officer.department_id,
+            district_id=test_officer.district_id,
+        )
+
+        response = await test_client.get(
+            "/api/v1/grievances?cursor=garbage",
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_unranked_cursor_rejected_for_search(
+        self,
+        test_client: AsyncClient,
+        test_officer: User,
+    ):
+        """Test a cursor from a plain listing cannot continue a search."""
+        from app.database.pagination import encode_cursor
+
+        token = create_access_token(
+            user_id=test_officer.id,
+            role=test_officer.role,
+            username=test_officer.username,
+            department_id=test_officer.department_id,
+            district_id=test_officer.district_id,
+        )
+        cursor = encode_cursor(datetime.now(timezone.utc), uuid4())
+
+        response = await test_client.get(
+            f"/api/v1/grievances?search=water&cursor={cursor}",
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_invalid_count_mode_fails_validation(
+        self,
+        test_client: AsyncClient,
+        test_officer: User,
+    ):
+        """Test unknown count modes are rejected."""
+        token = create_access_token(
+            user_id=test_officer.id,
+            role=test_officer.role,
+            username=test_officer.username,
+            department_id=test_officer.department_id,
+            district_id=test_officer.district_id,
+        )
+
+        response = await test_client.get(
+            "/api/v1/grievances?count=approximate",
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+        assert response.status_code == 422
+
 
 class TestGrievanceValidation:
     """Tests for grievance validation edge cases."""
@@ -1,5 +1,7 @@
 """Test health check endpoint."""
 
+from unittest.mock import AsyncMock, patch
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -91,3 +93,35 @@ def test_health_check_includes_version() -> None:
     assert response.status_code == 200
     data = response.json()
     assert "version" in data
+
+
+@pytest.mark.integration
+def test_full_health_reports_nlp_circuit() -> None:
+    """Test /health/full exposes NLP circuit breaker state."""
+    nlp_health = {"status": "circuit_open", "circuit": {"state": "open", "trips": 3}}
+
+    with patch("app.routers.health.get_nlp_service") as mock_get_nlp_service:
+        mock_get_nlp_service.return_value.health_check = AsyncMock(return_value=nlp_health)
+        client = TestClient(app)
+        response = client.get("/health/full")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["nlp"]["circuit"] == {"state": "open", "trips": 3}
+    assert data["status"] in ["degraded", "unhealthy"]
+
+
+@pytest.mark.asyncio
+async def test_shutdown_continues_after_failing_close() -> None:
+    """Test one failing close() does not skip the database and Redis."""
+    from app.main import _shutdown
+
+    with patch("app.main.get_nlp_service") as mock_nlp, \
+            patch("app.main.close_db", new=AsyncMock()) as mock_close_db, \
+            patch("app.main.get_redis_manager") as mock_redis:
+        mock_nlp.return_value.close = AsyncMock(side_effect=RuntimeError("boom"))
+        mock_redis.return_value.close = AsyncMock()
+        await _shutdown()
+
+    mock_close_db.assert_awaited_once()
+    mock_redis.return_value.close.assert_awaited_once()
@@ -0,0 +1,218 @@
+"""Tests for idempotency store service."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services.idempotency_store import (
+    ClaimState,
+    InMemoryIdempotencyStore,
+    RedisIdempotencyStore,
+    get_idempotency_store,
+    reset_idempotency_store,
+)
+
+
+class TestInMemoryIdempotencyStore:
+    """Tests for in-memory idempotency store."""
+
+    @pytest.fixture
+    def store(self):
+        """Create a fresh store for each test."""
+        return InMemoryIdempotencyStore(max_entries=3, ttl_seconds=60, in_flight_ttl_seconds=10)
+
+    @pytest.mark.asyncio
+    async def test_first_claim_acquires(self, store):
+        """Test the first claim on a key owns it."""
+        claim = await store.claim("key-1")
+
+        assert claim.acquired
+        assert claim.token is not None
+
+    @pytest.mark.asyncio
+    async def test_second_claim_sees_in_flight(self, store):
+        """Test a concurrent claim is refused while the first is processing."""
+        await store.claim("key-1")
+
+        claim = await store.claim("key-1")
+
+        assert claim.state == ClaimState.IN_FLIGHT
+        assert claim.response is None
+
+    @pytest.mark.asyncio
+    async def test_completed_claim_replays_response(self, store):
+        """Test a retry after completion gets the stored response."""
+        claim = await store.claim("key-1")
+        await store.complete(claim, {"grievance_id": "PGRS-2025-05-00001"})
+
+        replay = await store.claim("key-1")
+
+        assert replay.state == ClaimState.COMPLETED
+        assert replay.response == {"grievance_id": "PGRS-2025-05-00001"}
+
+    @pytest.mark.asyncio
+    async def test_parallel_claims_single_winner(self, store):
+        """Test only one of many parallel claims acquires the key."""
+        claims = await asyncio.gather(*(store.claim("key-1") for _ in range(10)))
+
+        assert sum(1 for c in claims if c.acquired) == 1
+
+    @pytest.mark.asyncio
+    async def test_release_allows_retry(self, store):
+        """Test releasing a failed claim lets the next request proceed."""
+        claim = await store.claim("key-1")
+
+        assert await store.release(claim) is True
+        assert (await store.claim("key-1")).acquired
+
+    @pytest.mark.asyncio
+    async def test_release_ignores_foreign_claim(self, store):
+        """Test a stale claim cannot release a marker it no longer owns."""
+        stale = await store.claim("key-1")
+        await store.release(stale)
+        await store.claim("key-1")
+
+        assert await store.release(stale) is False
+        assert (await store.claim("key-1")).state == ClaimState.IN_FLIGHT
+
+    @pytest.mark.asyncio
+    async def test_bounded_with_lru_eviction(self, store):
+        """Test the least recently used entry is evicted at capacity."""
+        for key in ("a", "b", "c"):
+            await store.complete(await store.claim(key), {"key": key})
+        await store.claim("a")  # touch "a" so "b" is least recently used
+
+        await store.claim("d")
+
+        health = await store.health_check()
+        assert health["entries"] == 3
+        assert health["evictions"] == 1
+        assert (await store.claim("b")).acquired
+        assert (await store.claim("a")).state == ClaimState.COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_entries_expire(self, store):
+        """Test entries are dropped once their TTL elapses."""
+        claim = await store.claim("key-1")
+        await store.complete(claim, {"ok": True})
+
+        with patch("app.services.idempotency_store.time.monotonic", return_value=10**9):
+            assert (await store.claim("key-1")).acquired
+
+    @pytest.mark.asyncio
+    async def test_in_flight_marker_expires(self, store):
+        """Test a crashed request's marker does not block the key forever."""
+        await store.claim("key-1")
+
+        with patch("app.services.idempotency_store.time.monotonic", return_value=10**9):
+            assert (await store.claim("key-1")).acquired
+
+
+class TestRedisIdempotencyStore:
+    """Tests for Redis idempotency store."""
+
+    @pytest.fixture
+    def client(self):
+        """Create a mock Redis client."""
+        return AsyncMock()
+
+    @pytest.fixture
+    def store(self, client):
+        """Create a Redis store wired to the mock client."""
+        store = RedisIdempotencyStore(redis_url="redis://localhost:6379/0")
+        store._redis.client = client
+        with patch('app.services.redis_manager.get_redis_manager') as manager:
+            manager.return_value.client.return_value = client
+            yield store
+
+    @pytest.mark.asyncio
+    async def test_claim_uses_set_nx_with_ttl(self, store, client):
+        """Test claim writes the in-flight marker atomically with expiry."""
+        client.set.return_value = True
+
+        claim = await store.claim("key-1")
+
+        assert claim.acquired
+        client.set.assert_awaited_once_with(
+            "idempotency:key-1",
+            claim.token,
+            nx=True,
+            ex=store.in_flight_ttl_seconds,
+        )
+
+    @pytest.mark.asyncio
+    async def test_claim_sees_in_flight(self, store, client):
+        """Test a held marker is reported as in flight."""
+        client.set.return_value = None
+        client.get.return_value = "inflight:abc"
+
+        claim = await store.claim("key-1")
+
+        assert claim.state == ClaimState.IN_FLIGHT
+
+    @pytest.mark.asyncio
+    async def test_claim_replays_response(self, store, client):
+        """Test a stored response is decoded and returned."""
+        client.set.return_value = None
+        client.get.return_value = json.dumps({"grievance_id": "PGRS-2025-05-00001"})
+
+        claim = await store.claim("key-1")
+
+        assert claim.state == ClaimState.COMPLETED
+        assert claim.response == {"grievance_id": "PGRS-2025-05-00001"}
+
+    @pytest.mark.asyncio
+    async def test_complete_stores_with_ttl(self, store, client):
+        """Test complete overwrites the marker with the response and TTL."""
+        client.set.return_value = True
+        claim = await store.claim("key-1")
+
+        await store.complete(claim, {"ok": True})
+
+        client.set.assert_awaited_with("idempotency:key-1", '{"ok": true}', ex=store.ttl_seconds)
+
+    @pytest.mark.asyncio
+    async def test_release_is_compare_and_delete(self, store, client):
+        """Test release only deletes the marker carrying our token."""
+        client.set.return_value = True
+        client.eval.return_value = 1
+        claim = await store.claim("key-1")
+
+        assert await store.release(claim) is True
+        args = client.eval.await_args.args
+        assert args[1:] == (1, "idempotency:key-1", claim.token)
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_memory_when_unavailable(self):
+        """Test claims still de-duplicate when Redis is unreachable."""
+        store = RedisIdempotencyStore(redis_url="redis://nonexistent:6379/0")
+
+        first = await store.claim("key-1")
+        second = await store.claim("key-1")
+
+        assert first.acquired
+        assert second.state == ClaimState.IN_FLIGHT
+
+    @pytest.mark.asyncio
+    async def test_health_check_degraded_when_unavailable(self):
+        """Test health check reports fallback when Redis unreachable."""
+        store = RedisIdempotencyStore(redis_url="redis://nonexistent:6379/0")
+
+        health = await store.health_check()
+
+        assert health["status"] == "degraded"
+        assert health["fallback"]["backend"] == "in_memory"
+
+
+class TestIdempotencyStoreFactory:
+    """Tests for get_idempotency_store singleton."""
+
+    def test_singleton(self):
+        """Test the same instance is returned until reset."""
+        reset_idempotency_store()
+        try:
+            assert get_idempotency_store() is get_idempotency_store()
+        finally:
+            reset_idempotency_store()
@@ -0,0 +1,147 @@
+"""Tests for the in-process local classifier and the tiered NLP service."""
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.config import settings
+from app.services import local_nlp_service
+from app.services.local_nlp_service import MODEL_LABEL_DEPT_CODES, LocalNLPService
+from app.services.nlp_service import ClassificationResult, MockNLPService, TieredNLPService
+
+
+@pytest.fixture
+async def local_service():
+    """Local classifier on the bundled artifacts (thread pool)."""
+    service = LocalNLPService(executor="thread", max_workers=2)
+    yield service
+    await service.close()
+
+
+class TestLocalNLPService:
+    """Tests for LocalNLPService."""
+
+    @pytest.mark.asyncio
+    async def test_classifies_with_bundled_model(self, local_service):
+        """Test the bundled model yields a mapped department and confidence."""
+        result = await local_service.classify_text(
+            "Government hospital has no doctor and no medicines", "en"
+        )
+
+        assert result.fallback_used is False
+        assert result.department_name in MODEL_LABEL_DEPT_CODES
+        assert result.department_code == MODEL_LABEL_DEPT_CODES[result.department_name]
+        assert 0.0 < result.confidence <= 1.0
+        assert result.model_version == "local:telugu_classifier_v2"
+
+    @pytest.mark.asyncio
+    async def test_inference_runs_off_the_event_loop(self, local_service):
+        """Test predict() executes in a pool thread, not the loop thread."""
+        threads = []
+        real_predict = local_nlp_service.predict
+
+        def recording_predict(texts):
+            threads.append(threading.current_thread().name)
+            return real_predict(texts)
+
+        with patch.object(local_nlp_service, "predict", recording_predict):
+            await local_service.classify_text("Road is damaged near the school", "en")
+
+        assert threads and threads[0].startswith("local-nlp")
+        assert threads[0] != threading.current_thread().name
+
+    @pytest.mark.asyncio
+    async def test_saturated_pool_rejects(self, local_service):
+        """Test requests beyond max_pending fail fast with a fallback."""
+        await local_service.start()
+        local_service.max_pending = 1
+        local_service._pending = 1
+
+        result = await local_service.classify_text("Water problem", "en")
+
+        assert result.fallback_used is True
+        assert result.error == "Local classifier busy"
+        assert local_service.rejected == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_artifacts_degrade(self, tmp_path):
+        """Test missing model files give fallback results and unhealthy status."""
+        service = LocalNLPService(model_dir=str(tmp_path), executor="thread")
+        with patch.object(local_nlp_service, "_model", None):
+            result = await service.classify_text("Water problem", "en")
+            health = await service.health_check()
+        await service.close()
+
+        assert result.fallback_used is True
+        assert "unavailable" in result.error
+        assert health["status"] == "unhealthy"
+
+    @pytest.mark.asyncio
+    async def test_health_reports_latency(self, local_service):
+        """Test health_check reports request counts and latency percentiles."""
+        await asyncio.gather(*(
+            local_service.classify_text(f"Pension not received {i}", "en") for i in range(5)
+        ))
+
+        health = await local_service.health_check()
+
+        assert health["status"] == "healthy"
+        assert health["loaded"] is True
+        assert health["requests"] == 5
+        assert health["p95_latency_ms"] > 0
+
+
+class TestTieredNLPService:
+    """Tests for TieredNLPService."""
+
+    @pytest.mark.asyncio
+    async def test_primary_result_used_when_available(self):
+        """Test the fallback tier is not called when the primary answers."""
+        fallback = MockNLPService()
+        service = TieredNLPService(MockNLPService(), fallback)
+
+        with patch.object(settings, "NLP_ENABLED", True):
+            result = await service.classify_text("Road is broken", "en")
+
+        assert result.department_code == "PWD"
+        assert fallback.call_count == 0
+
+    @pytest.mark.asyncio
+    async def test_fallback_tier_used_on_primary_failure(self):
+        """Test a primary fallback result is replaced by the second tier."""
+        local = MockNLPService(default_confidence=0.8)
+        service = TieredNLPService(MockNLPService(should_fail=True), local)
+
+        with patch.object(settings, "NLP_ENABLED", True):
+            result = await service.classify_text("Hospital has no doctor", "en")
+
+        assert result.fallback_used is False
+        assert result.department_code == "HLTH"
+        assert service.fallback_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_both_tiers_failing_returns_primary_error(self):
+        """Test the primary's error is kept when both tiers fail."""
+        primary = MockNLPService(should_fail=True)
+        fallback = MockNLPService()
+        fallback.classify_text = AsyncMock(return_value=ClassificationResult(
+            department_id=None, confidence=0.0, fallback_used=True, error="busy"
+        ))
+        service = TieredNLPService(primary, fallback)
+
+        with patch.object(settings, "NLP_ENABLED", True):
+            result = await service.classify_text("Text", "en")
+
+        assert result.error == "Mock failure"
+
+    @pytest.mark.asyncio
+    async def test_health_degraded_when_only_fallback_healthy(self):
+        """Test status is degraded (not unhealthy) while the fallback covers."""
+        service = TieredNLPService(MockNLPService(should_fail=True), MockNLPService())
+
+        health = await service.health_check()
+
+        assert health["status"] == "degraded"
+        assert health["fallback"]["status"] == "healthy"
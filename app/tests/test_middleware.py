@@ -0,0 +1,171 @@
+"""Tests for the pure ASGI request ID, rate limit and deprecation middleware."""
+
+import pytest
+from unittest.mock import patch
+
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+
+from app.middleware import deprecation
+from app.middleware.deprecation import DeprecationMiddleware
+from app.middleware.rate_limit import EndpointLimits, RateLimitMiddleware
+from app.middleware.request_id import RequestIDMiddleware
+from app.services.rate_limiter import InMemoryRateLimiter
+
+
+def create_app() -> FastAPI:
+    """Small app wired with the same middleware order as app.main."""
+    app = FastAPI()
+
+    @app.get("/echo")
+    async def echo(request: Request) -> dict:
+        return {"request_id": request.state.request_id}
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks():
+            for i in range(3):
+                yield f"chunk-{i}\n".encode()
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    @app.get("/health")
+    async def health() -> dict:
+        return {"status": "healthy"}
+
+    app.add_middleware(RequestIDMiddleware)
+    app.add_middleware(RateLimitMiddleware)
+    app.add_middleware(DeprecationMiddleware)
+    return app
+
+
+@pytest.fixture
+def client():
+    """HTTP client for the test app with an in-memory limiter."""
+    limiter = InMemoryRateLimiter()
+    with patch('app.middleware.rate_limit.get_rate_limiter', return_value=limiter), \
+            patch('app.middleware.rate_limit.settings') as mock_settings, \
+            patch('app.services.rate_limiter.settings') as limiter_settings:
+        mock_settings.RATE_LIMIT_ENABLED = True
+        limiter_settings.RATE_LIMIT_ENABLED = True
+        transport = ASGITransport(app=create_app())
+        yield AsyncClient(transport=transport, base_url="http://test")
+
+
+class TestRequestIDMiddleware:
+    """Tests for RequestIDMiddleware."""
+
+    @pytest.mark.asyncio
+    async def test_generates_request_id(self, client):
+        """Test a request ID is generated and exposed on request.state."""
+        response = await client.get("/echo")
+
+        assert response.headers["X-Request-ID"]
+        assert response.json()["request_id"] == response.headers["X-Request-ID"]
+
+    @pytest.mark.asyncio
+    async def test_propagates_client_request_id(self, client):
+        """Test a client-supplied X-Request-ID is reused."""
+        response = await client.get("/echo", headers={"X-Request-ID": "abc-123"})
+
+        assert response.headers["X-Request-ID"] == "abc-123"
+        assert response.json()["request_id"] == "abc-123"
+
+
+class TestRateLimitMiddleware:
+    """Tests for RateLimitMiddleware."""
+
+    @pytest.mark.asyncio
+    async def test_adds_rate_limit_headers(self, client):
+        """Test X-RateLimit-* headers are added to responses."""
+        with patch('app.middleware.rate_limit.get_endpoint_limits', return_value=(5, 60)):
+            response = await client.get("/echo")
+
+        assert response.headers["X-RateLimit-Limit"] == "5"
+        assert response.headers["X-RateLimit-Remaining"] == "4"
+
+    @pytest.mark.asyncio
+    async def test_returns_429_when_exceeded(self, client):
+        """Test requests over the limit get 429 with Retry-After."""
+        with patch('app.middleware.rate_limit.get_endpoint_limits', return_value=(2, 60)):
+            for _ in range(2):
+                await client.get("/echo")
+            response = await client.get("/echo")
+
+        assert response.status_code == 429
+        assert response.json()["error"] == "Too Many Requests"
+        assert response.headers["Retry-After"] == "30"
+
+    @pytest.mark.asyncio
+    async def test_health_exempt(self, client):
+        """Test health checks are not rate limited."""
+        response = await client.get("/health")
+
+        assert "X-RateLimit-Limit" not in response.headers
+
+    @pytest.mark.asyncio
+    async def test_streaming_response_passes_through(self, client):
+        """Test streamed bodies arrive intact with headers added."""
+        response = await client.get("/stream")
+
+        assert response.text == "chunk-0\nchunk-1\nchunk-2\n"
+        assert "X-RateLimit-Limit" in response.headers
+        assert response.headers["X-API-Version"] == "v1"
+
+
+class TestEndpointLimits:
+    """Tests for the precompiled endpoint limit lookup."""
+
+    @pytest.fixture
+    def limits(self):
+        return EndpointLimits(
+            {
+                "POST:/api/v1/grievances": (10, 3600),
+                "POST:/api/v1/grievances/public/": (3, 300),
+                "POST:/api/v1/auth/login": (10, 300),
+            },
+            default=(100, 60),
+        )
+
+    def test_exact_match(self, limits):
+        assert limits.lookup("POST", "/api/v1/grievances") == (10, 3600)
+
+    def test_longest_prefix_wins(self, limits):
+        assert limits.lookup("POST", "/api/v1/grievances/public/track") == (3, 300)
+        assert limits.lookup("POST", "/api/v1/grievances/GRV-1/feedback") == (10, 3600)
+
+    def test_method_is_part_of_key(self, limits):
+        assert limits.lookup("GET", "/api/v1/grievances") == (100, 60)
+
+    def test_default(self, limits):
+        assert limits.lookup("GET", "/api/v1/districts") == (100, 60)
+
+    def test_empty_table(self):
+        assert EndpointLimits({}, default=(1, 2)).lookup("GET", "/") == (1, 2)
+
+
+class TestDeprecationMiddleware:
+    """Tests for DeprecationMiddleware."""
+
+    @pytest.mark.asyncio
+    async def test_deprecated_endpoint_headers(self, client):
+        """Test deprecation headers on a deprecated endpoint."""
+        with patch.dict(deprecation.DEPRECATED_ENDPOINTS, {
+            "GET:/echo": (None, "/v2/echo", "Use /v2/echo."),
+        }):
+            response = await client.get("/echo")
+
+        assert response.headers["Deprecation"] == "true"
+        assert response.headers["Warning"] == '299 - "Use /v2/echo."'
+        assert response.headers["Link"] == '</v2/echo>; rel="successor-version"'
+        assert "Sunset" not in response.headers
+
+    @pytest.mark.asyncio
+    async def test_sunset_endpoint_gone(self, client):
+        """Test sunset endpoints return 410 Gone."""
+        with patch.dict(deprecation.SUNSET_ENDPOINTS, {"GET:/echo": "Removed."}):
+            response = await client.get("/echo")
+
+        assert response.status_code == 410
+        assert response.json()["message"] == "Removed."
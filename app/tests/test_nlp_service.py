@@ -7,13 +7,17 @@ Tests cover:
 - Service factory and singleton behavior
 - Multi-language classification
 - Error handling and graceful degradation
+- Micro-batching of concurrent classifications
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 import httpx
 
 from app.services.nlp_service import (
+    ClassificationBatcher,
     ClassificationResult,
     MockNLPService,
     IndicBERTNLPService,
@@ -73,6 +77,19 @@ class TestClassificationResult:
         )
         assert result_below.is_confident() is False
 
+    def test_result_with_own_threshold_and_code_only(self):
+        """Test a code-only result is judged against its own threshold."""
+        result = ClassificationResult(
+            department_id=None,
+            confidence=0.2,
+            department_code="HEALTH",
+            confidence_threshold=0.15,
+        )
+
+        assert result.is_confident() is True
+        assert result.is_confident(threshold=0.5) is False
+        assert ClassificationResult(department_id=None, confidence=0.9).is_confident() is False
+
     def test_to_dict(self):
         """Test ClassificationResult to_dict method."""
         result = ClassificationResult(
@@ -762,3 +779,200 @@ class TestINLPServiceInterface:
         assert isinstance(service, INLPService)
         assert hasattr(service, "classify_text")
         assert hasattr(service, "health_check")
+
+
+class TestClassificationBatcher:
+    """Tests for ClassificationBatcher coalescing and fan-out."""
+
+    @staticmethod
+    def _echo_sender():
+        """Batch sender returning each payload's text as department_code."""
+        calls = []
+
+        async def send(payloads):
+            calls.append([p["text"] for p in payloads])
+            return [
+                ClassificationResult(department_id=1, confidence=0.9, department_code=p["text"])
+                for p in payloads
+            ]
+
+        return send, calls
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_batch(self):
+        """Test calls within the wait window go out as one batch, results in order."""
+        send, calls = self._echo_sender()
+        batcher = ClassificationBatcher(send, max_size=10, max_wait_ms=5)
+
+        results = await asyncio.gather(*(batcher.submit({"text": f"t{i}"}) for i in range(4)))
+
+        assert calls == [["t0", "t1", "t2", "t3"]]
+        assert [r.department_code for r in results] == ["t0", "t1", "t2", "t3"]
+        assert batcher.stats()["avg_batch_size"] == 4
+
+    @pytest.mark.asyncio
+    async def test_full_batch_sent_without_waiting(self):
+        """Test reaching max_size dispatches immediately."""
+        send, calls = self._echo_sender()
+        batcher = ClassificationBatcher(send, max_size=2, max_wait_ms=10_000)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(*(batcher.submit({"text": f"t{i}"}) for i in range(4))), timeout=1
+        )
+
+        assert calls == [["t0", "t1"], ["t2", "t3"]]
+        assert len(results) == 4
+
+    @pytest.mark.asyncio
+    async def test_sender_error_falls_back_for_every_caller(self):
+        """Test a failed batch resolves all callers with fallback results."""
+        batcher = ClassificationBatcher(
+            AsyncMock(side_effect=RuntimeError("boom")), max_size=10, max_wait_ms=1
+        )
+
+        results = await asyncio.gather(*(batcher.submit({"text": "x"}) for _ in range(3)))
+
+        assert all(r.fallback_used and r.error == "boom" for r in results)
+
+    @pytest.mark.asyncio
+    async def test_result_count_mismatch_falls_back(self):
+        """Test a short batch response is not misattributed to callers."""
+        batcher = ClassificationBatcher(
+            AsyncMock(return_value=[ClassificationResult(department_id=1, confidence=0.9)]),
+            max_size=10,
+            max_wait_ms=1,
+        )
+
+        results = await asyncio.gather(*(batcher.submit({"text": "x"}) for _ in range(2)))
+
+        assert all(r.fallback_used for r in results)
+
+
+class TestIndicBERTNLPServiceBatching:
+    """Tests for IndicBERTNLPService with batching enabled."""
+
+    @pytest.fixture
+    def service(self):
+        """Create a batching IndicBERTNLPService."""
+        return IndicBERTNLPService(base_url="http://test:8000", timeout=5, batching=True)
+
+    @pytest.mark.asyncio
+    async def test_batch_request_and_fan_out(self, service):
+        """Test concurrent classify_text calls become one batch POST."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "results": [
+                {"department_id": 3, "confidence": 0.92, "department_code": "WRDS"},
+                {"department_id": 2, "confidence": 0.81, "department_code": "PWD"},
+            ]
+        }
+
+        with patch.object(service, "_get_client") as mock_get_client:
+            mock_client = AsyncMock()
+            mock_client.post = AsyncMock(return_value=mock_response)
+            mock_get_client.return_value = mock_client
+
+            with patch.object(settings, "NLP_ENABLED", True):
+                water, road = await asyncio.gather(
+                    service.classify_text("Water issue", "en", district_code="05"),
+                    service.classify_text("Road issue", "te"),
+                )
+
+        mock_client.post.assert_called_once()
+        args, kwargs = mock_client.post.call_args
+        assert args[0] == "/api/nlp/classify/batch"
+        assert kwargs["json"] == {
+            "items": [
+                {"text": "Water issue", "language": "en", "district_code": "05"},
+                {"text": "Road issue", "language": "te"},
+            ]
+        }
+        assert water.department_code == "WRDS"
+        assert road.department_code == "PWD"
+
+    @pytest.mark.asyncio
+    async def test_batch_timeout_falls_back(self, service):
+        """Test a batch timeout degrades every caller gracefully."""
+        with patch.object(service, "_get_client") as mock_get_client:
+            mock_client = AsyncMock()
+            mock_client.post = AsyncMock(side_effect=httpx.TimeoutException("Timeout"))
+            mock_get_client.return_value = mock_client
+
+            with patch.object(settings, "NLP_ENABLED", True):
+                results = await asyncio.gather(
+                    *(service.classify_text(f"Text {i}", "en") for i in range(3))
+                )
+
+        assert all(r.fallback_used and r.error == "Service timeout" for r in results)
+
+    @pytest.mark.asyncio
+    async def test_client_has_pool_limits(self, service):
+        """Test the HTTP client is created with explicit pool limits."""
+        with patch("httpx.AsyncClient") as mock_async_client:
+            mock_async_client.return_value = MagicMock(is_closed=False)
+            await service._get_client()
+
+        limits = mock_async_client.call_args[1]["limits"]
+        assert limits.max_connections == settings.NLP_HTTP_MAX_CONNECTIONS
+        assert limits.max_keepalive_connections == settings.NLP_HTTP_MAX_KEEPALIVE
+
+
+class TestIndicBERTNLPServiceCircuitBreaker:
+    """Tests for the circuit breaker around IndicBERTNLPService."""
+
+    @pytest.fixture
+    def service(self):
+        """Create IndicBERTNLPService instance."""
+        return IndicBERTNLPService(base_url="http://test:8000", timeout=5, batching=False)
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_returns_fallback_without_calling(self, service):
+        """Test repeated failures open the circuit and later calls fail fast."""
+        with patch.object(service, "_get_client") as mock_get_client:
+            mock_client = AsyncMock()
+            mock_client.post = AsyncMock(side_effect=httpx.ConnectError("Connection refused"))
+            mock_get_client.return_value = mock_client
+
+            with patch.object(settings, "NLP_ENABLED", True):
+                for _ in range(settings.NLP_CIRCUIT_MIN_CALLS):
+                    await service.classify_text("Text", "en")
+                result = await service.classify_text("Text", "en")
+
+        assert mock_client.post.call_count == settings.NLP_CIRCUIT_MIN_CALLS
+        assert result.fallback_used is True
+        assert result.error == "Circuit open"
+        assert service.circuit.stats()["trips"] == 1
+
+    @pytest.mark.asyncio
+    async def test_client_errors_do_not_trip(self, service):
+        """Test 4xx responses are not counted as service failures."""
+        mock_response = MagicMock()
+        mock_response.status_code = 422
+        mock_response.text = "Unprocessable"
+
+        with patch.object(service, "_get_client") as mock_get_client:
+            mock_client = AsyncMock()
+            mock_client.post = AsyncMock(return_value=mock_response)
+            mock_get_client.return_value = mock_client
+
+            with patch.object(settings, "NLP_ENABLED", True):
+                for _ in range(settings.NLP_CIRCUIT_MIN_CALLS + 1):
+                    await service.classify_text("Text", "en")
+
+        assert service.circuit.stats()["state"] == "closed"
+
+    @pytest.mark.asyncio
+    async def test_health_check_skips_call_when_open(self, service):
+        """Test health_check reports the open circuit without a network call."""
+        for _ in range(settings.NLP_CIRCUIT_MIN_CALLS):
+            service.circuit.record_failure()
+
+        with patch.object(service, "_get_client") as mock_get_client:
+            with patch.object(settings, "NLP_ENABLED", True):
+                health = await service.health_check()
+
+        mock_get_client.assert_not_called()
+        assert health["status"] == "circuit_open"
+        assert health["circuit"]["state"] == "open"
+        assert health["circuit"]["trips"] == 1
@@ -0,0 +1,194 @@
+"""Tests for the bulk notification dispatcher."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.schemas.citizen_empowerment import InteractionType
+from app.services.notification_dispatcher import (
+    DeliveryResult,
+    Notification,
+    NotificationDispatcher,
+    RateShaper,
+)
+from app.services.sms_service import MockSMSService
+from app.services.whatsapp_service import MockWhatsAppService
+from app.templates.empowerment_messages import OPT_IN_PROMPT_EN, render_template
+
+
+def make_db(already_sent=()):
+    """Mock session whose de-duplication query returns already_sent."""
+    db = AsyncMock()
+    result = MagicMock()
+    result.all.return_value = list(already_sent)
+    db.execute = AsyncMock(return_value=result)
+    db.commit = AsyncMock()
+    return db
+
+
+def prompt(phone: str, case_id: str = "PGRS-2025-GTR-00001") -> Notification:
+    return Notification(
+        phone=phone,
+        template="OPT_IN_PROMPT",
+        params={"case_id": case_id, "department": "Revenue"},
+        language="en",
+        interaction_type=InteractionType.OPT_IN_PROMPT,
+        grievance_id=case_id,
+    )
+
+
+class TestTemplates:
+    """Tests for the template registry."""
+
+    def test_render_template(self):
+        """Test a registered template renders with params."""
+        message = render_template(
+            "OPT_IN_PROMPT", "en", {"case_id": "PGRS-1", "department": "Revenue"}
+        )
+        assert message == OPT_IN_PROMPT_EN.format(case_id="PGRS-1", department="Revenue")
+
+    def test_registered_template_overrides(self):
+        """Test templates registered on the dispatcher take precedence."""
+        dispatcher = NotificationDispatcher(make_db())
+        dispatcher.register_template("SLA_50_PERCENT", te="te {case_id}", en="en {case_id}")
+
+        notification = Notification(
+            phone="+919876543210",
+            template="SLA_50_PERCENT",
+            params={"case_id": "PGRS-1"},
+            language="en",
+        )
+        assert dispatcher.render(notification) == "en PGRS-1"
+
+
+class TestNotificationDispatcher:
+    """Tests for NotificationDispatcher."""
+
+    @pytest.mark.asyncio
+    async def test_dispatch_sends_and_records_in_one_insert(self):
+        """Test a batch is sent and all results are logged in one insert."""
+        db = make_db()
+        whatsapp = MockWhatsAppService()
+        dispatcher = NotificationDispatcher(
+            db, whatsapp=whatsapp, rates={"whatsapp": 0, "sms": 0}
+        )
+
+        report = await dispatcher.dispatch(
+            [prompt(f"+9198765432{i:02d}") for i in range(20)]
+        )
+
+        assert report.sent == 20
+        assert len(whatsapp.sent_messages) == 20
+        # One de-duplication query, one bulk insert, one commit
+        assert db.execute.await_count == 2
+        rows = db.execute.await_args_list[1].args[1]
+        assert len(rows) == 20
+        assert rows[0]["delivery_status"] == "sent"
+        assert rows[0]["channel"] == "whatsapp"
+        assert rows[0]["interaction_type"] == "OPT_IN_PROMPT"
+        db.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_dedup_per_phone_and_day(self):
+        """Test duplicates in the batch and earlier today are skipped."""
+        db = make_db(already_sent=[("+919876543211", "OPT_IN_PROMPT")])
+        whatsapp = MockWhatsAppService()
+        dispatcher = NotificationDispatcher(
+            db, whatsapp=whatsapp, rates={"whatsapp": 0, "sms": 0}
+        )
+
+        report = await dispatcher.dispatch([
+            prompt("+919876543210", "PGRS-A"),
+            prompt("+919876543210", "PGRS-B"),  # same phone, same day
+            prompt("+919876543211"),  # prompted earlier today
+        ])
+
+        assert [r.status for r in report.results] == ["sent", "skipped", "skipped"]
+        assert len(whatsapp.sent_messages) == 1
+        rows = db.execute.await_args_list[1].args[1]
+        assert len(rows) == 1
+
+    @pytest.mark.asyncio
+    async def test_sms_channel_and_failures(self):
+        """Test SMS sends and failed sends are recorded as failed."""
+        db = make_db()
+        sms = MockSMSService(should_fail=True)
+        dispatcher = NotificationDispatcher(db, sms=sms, rates={"whatsapp": 0, "sms": 0})
+        notification = prompt("+919876543210")
+        notification.channel = "sms"
+
+        report = await dispatcher.dispatch([notification])
+
+        assert report.failed == 1
+        row = db.execute.await_args_list[1].args[1][0]
+        assert row["channel"] == "sms"
+        assert row["delivery_status"] == "failed"
+        assert row["delivery_error"] == "Mock failure"
+
+    @pytest.mark.asyncio
+    async def test_template_error_fails_without_sending(self):
+        """Test a missing template parameter fails only that notification."""
+        db = make_db()
+        whatsapp = MockWhatsAppService()
+        dispatcher = NotificationDispatcher(
+            db, whatsapp=whatsapp, rates={"whatsapp": 0, "sms": 0}
+        )
+        broken = prompt("+919876543210")
+        broken.params = {}
+
+        report = await dispatcher.dispatch([broken, prompt("+919876543211")])
+
+        assert [r.status for r in report.results] == ["failed", "sent"]
+        assert len(whatsapp.sent_messages) == 1
+
+    @pytest.mark.asyncio
+    async def test_unrendered_result_fails_without_sending(self):
+        """Test a result with no message is marked failed, not sent."""
+        whatsapp = MockWhatsAppService()
+        dispatcher = NotificationDispatcher(
+            make_db(), whatsapp=whatsapp, rates={"whatsapp": 0, "sms": 0}
+        )
+        result = DeliveryResult(prompt("+919876543210"), status="pending")
+
+        await dispatcher._send_one(result)
+
+        assert result.status == "failed"
+        assert result.error == "No rendered message"
+        assert whatsapp.sent_messages == []
+
+    @pytest.mark.asyncio
+    async def test_empty_batch(self):
+        """Test an empty batch touches nothing."""
+        db = make_db()
+        report = await NotificationDispatcher(db).dispatch([])
+
+        assert report.results == []
+        db.execute.assert_not_awaited()
+
+
+class TestRateShaper:
+    """Tests for RateShaper."""
+
+    @pytest.mark.asyncio
+    async def test_spaces_concurrent_callers(self):
+        """Test concurrent acquires are spread at the configured rate."""
+        shaper = RateShaper(rate=100)
+
+        start = time.monotonic()
+        await asyncio.gather(*(shaper.acquire() for _ in range(11)))
+        elapsed = time.monotonic() - start
+
+        # First slot is immediate, the other ten are 10ms apart
+        assert elapsed >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_zero_rate_is_unshaped(self):
+        """Test a zero rate never waits."""
+        shaper = RateShaper(rate=0)
+
+        start = time.monotonic()
+        await asyncio.gather(*(shaper.acquire() for _ in range(100)))
+
+        assert time.monotonic() - start < 0.05
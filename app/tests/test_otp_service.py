@@ -1,11 +1,19 @@
 """Tests for OTP service."""
 
+import asyncio
+
 import pytest
+from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 from app.services.otp_service import (
+    OTP_INVALID,
+    OTP_LOCKED,
+    OTP_NOT_FOUND,
+    OTP_VERIFIED,
     InMemoryOTPService,
     OTPResult,
+    RedisOTPService,
     get_otp_service,
 )
 from app.config import settings
@@ -342,3 +350,124 @@ class TestOTPRateLimiting:
         # New OTP should work
         verify_result = await otp_service.verify_otp(identifier, phone, new_otp)
         assert verify_result.success is True
+
+
+class TestRedisOTPServiceScripts:
+    """Tests for the Lua-scripted RedisOTPService."""
+
+    @pytest.fixture
+    def redis_client(self):
+        """Mock Redis client whose scripts are AsyncMocks."""
+        client = MagicMock()
+        client.register_script.side_effect = lambda source: AsyncMock()
+        return client
+
+    @pytest.mark.asyncio
+    async def test_generate_is_one_script_call(self, redis_client):
+        """Test generate stores the OTP and attempts in one script call."""
+        service = RedisOTPService(redis_client=redis_client)
+
+        result = await service.generate_otp("GRV-1", "+919876543210")
+
+        generate_script, verify_script = service._get_scripts(redis_client)
+        generate_script.assert_awaited_once_with(
+            keys=["otp:GRV-1", "otp_attempts:GRV-1"],
+            args=[f"+919876543210:{result.otp}", settings.OTP_EXPIRY_SECONDS],
+        )
+        verify_script.assert_not_awaited()
+        assert result.success is True
+        assert redis_client.register_script.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_verify_is_one_script_call(self, redis_client):
+        """Test verify checks, counts and consumes in one script call."""
+        service = RedisOTPService(redis_client=redis_client)
+        _, verify_script = service._get_scripts(redis_client)
+        verify_script.return_value = [OTP_VERIFIED, 0]
+
+        result = await service.verify_otp("GRV-1", "+919876543210", "123456")
+
+        verify_script.assert_awaited_once_with(
+            keys=["otp:GRV-1", "otp_attempts:GRV-1"],
+            args=["+919876543210", "123456", settings.OTP_MAX_ATTEMPTS],
+        )
+        assert result.success is True
+        redis_client.get.assert_not_called()
+        redis_client.delete.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "status,remaining,error",
+        [
+            (OTP_NOT_FOUND, 0, "OTP not found"),
+            (OTP_LOCKED, 0, "Max attempts exceeded"),
+            (OTP_INVALID, 2, "Invalid OTP"),
+        ],
+    )
+    async def test_verify_status_mapping(self, redis_client, status, remaining, error):
+        """Test script statuses map to the existing OTPResult errors."""
+        service = RedisOTPService(redis_client=redis_client)
+        _, verify_script = service._get_scripts(redis_client)
+        verify_script.return_value = [status, remaining]
+
+        result = await service.verify_otp("GRV-1", "+919876543210", "000000")
+
+        assert result.success is False
+        assert result.error == error
+        if status != OTP_NOT_FOUND:
+            assert result.attempts_remaining == remaining
+
+
+class TestOTPConcurrentVerification:
+    """Attempt limits must hold under parallel verification."""
+
+    async def _parallel_wrong_then_correct(self, otp_service):
+        """Fire many wrong guesses at once, then try the correct OTP."""
+        identifier = str(uuid4())
+        phone = "+919876543210"
+        gen_result = await otp_service.generate_otp(identifier, phone)
+        wrong = "0" * settings.OTP_LENGTH
+        if gen_result.otp == wrong:
+            wrong = "1" * settings.OTP_LENGTH
+
+        results = await asyncio.gather(*(
+            otp_service.verify_otp(identifier, phone, wrong)
+            for _ in range(settings.OTP_MAX_ATTEMPTS * 5)
+        ))
+        counted = [r for r in results if r.error == "Invalid OTP"]
+        final = await otp_service.verify_otp(identifier, phone, gen_result.otp)
+        return counted, final
+
+    @pytest.mark.asyncio
+    async def test_in_memory_attempt_limit_holds(self):
+        """Test the in-memory service under parallel wrong guesses."""
+        counted, final = await self._parallel_wrong_then_correct(InMemoryOTPService())
+
+        assert len(counted) == settings.OTP_MAX_ATTEMPTS
+        assert final.success is False
+
+    @pytest.mark.asyncio
+    async def test_redis_attempt_limit_holds(self):
+        """Test the Redis scripts under parallel wrong guesses."""
+        import redis.asyncio as aioredis
+
+        client = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
+        try:
+            await client.ping()
+        except Exception:
+            await client.connection_pool.disconnect()
+            pytest.skip("Redis not available")
+
+        try:
+            counted, final = await self._parallel_wrong_then_correct(
+                RedisOTPService(redis_client=client)
+            )
+        finally:
+            await client.connection_pool.disconnect()
+
+        # Exactly OTP_MAX_ATTEMPTS guesses were evaluated, each with its own count
+        assert len(counted) == settings.OTP_MAX_ATTEMPTS
+        assert sorted(r.attempts_remaining for r in counted) == list(
+            range(settings.OTP_MAX_ATTEMPTS)
+        )
+        assert final.success is False
@@ -0,0 +1,79 @@
+"""Tests for keyset pagination helpers."""
+
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.database.pagination import (
+    InvalidCursorError,
+    _ExplainJSON,
+    decode_cursor,
+    encode_cursor,
+)
+from app.models.grievance import Grievance
+
+
+class TestCursorEncoding:
+    """Tests for encode_cursor / decode_cursor."""
+
+    def test_round_trip(self):
+        """Test a cursor decodes to the position it was built from."""
+        created_at = datetime(2025, 11, 24, 10, 30, 15, 123456, tzinfo=timezone.utc)
+        record_id = uuid4()
+
+        cursor = encode_cursor(created_at, record_id)
+
+        assert decode_cursor(cursor) == (created_at, record_id, None)
+
+    def test_ranked_round_trip(self):
+        """Test a ranked cursor preserves the exact relevance score."""
+        created_at = datetime.now(timezone.utc)
+        record_id = uuid4()
+        rank = 0.30000000000000004
+
+        position = decode_cursor(encode_cursor(created_at, record_id, rank=rank))
+
+        assert position.rank == rank
+        assert position.record_id == record_id
+
+    def test_cursor_is_url_safe(self):
+        """Test cursor can be passed as a query parameter unescaped."""
+        cursor = encode_cursor(datetime.now(timezone.utc), uuid4())
+
+        assert "=" not in cursor
+        assert "+" not in cursor
+        assert "/" not in cursor
+
+    @pytest.mark.parametrize(
+        "cursor",
+        [
+            "",
+            "not-a-cursor",
+            "eyJjIjoieCJ9",  # {"c":"x"} - missing id, bad timestamp
+            "eyJjIjoiMjAyNS0xMS0yNFQxMDozMDowMCIsImkiOiJub3QtYS11dWlkIn0",  # bad uuid
+        ],
+    )
+    def test_invalid_cursor_raises(self, cursor: str):
+        """Test malformed cursors raise InvalidCursorError."""
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor)
+
+    def test_invalid_cursor_is_value_error(self):
+        """Test InvalidCursorError can be caught as ValueError."""
+        assert issubclass(InvalidCursorError, ValueError)
+
+
+class TestEstimatedCount:
+    """Tests for the EXPLAIN wrapper used by count_estimated."""
+
+    def test_explain_compiles_with_bind_params(self):
+        """Test EXPLAIN wraps the statement and keeps its parameters."""
+        stmt = select(Grievance).where(Grievance.status == "submitted")
+
+        compiled = _ExplainJSON(stmt).compile(dialect=postgresql.dialect())
+
+        assert str(compiled).startswith("EXPLAIN (FORMAT JSON) SELECT")
+        assert "submitted" in compiled.params.values()
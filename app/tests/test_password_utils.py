@@ -3,9 +3,17 @@
 import pytest
 
 from app.utils.password import (
+    PasswordHashBusyError,
+    PasswordHashPool,
+    get_password_hash_pool,
     hash_password,
-    verify_password,
+    hash_password_async,
     needs_rehash,
+    pwd_context,
+    reset_password_hash_pool,
+    verify_and_update_password,
+    verify_password,
+    verify_password_async,
 )
 
 
@@ -191,3 +199,105 @@ class TestPasswordIntegration:
         # All bcrypt hashes should have the same length (60 characters)
         assert len(hash_lengths) == 1
         assert 60 in hash_lengths
+
+
+class TestPasswordHashPool:
+    """Tests for PasswordHashPool and the async hashing helpers."""
+
+    @pytest.mark.asyncio
+    async def test_run_off_event_loop_thread(self):
+        """Test that hashing functions run on a pool thread."""
+        import threading
+
+        pool = PasswordHashPool(max_workers=1, max_pending=4)
+        try:
+            name = await pool.run(lambda: threading.current_thread().name)
+        finally:
+            await pool.close()
+
+        assert name.startswith("password-hash")
+        assert pool.stats()["completed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_rejects_beyond_max_pending(self):
+        """Test that calls beyond max_pending raise PasswordHashBusyError."""
+        import asyncio
+        import threading
+
+        release = threading.Event()
+        pool = PasswordHashPool(max_workers=1, max_pending=2)
+        try:
+            blocked = [asyncio.create_task(pool.run(release.wait)) for _ in range(2)]
+            await asyncio.sleep(0.05)
+
+            stats = pool.stats()
+            assert stats["pending"] == 2
+            assert stats["queued"] == 1
+
+            with pytest.raises(PasswordHashBusyError):
+                await pool.run(release.wait)
+
+            release.set()
+            await asyncio.gather(*blocked)
+        finally:
+            release.set()
+            await pool.close()
+
+        stats = pool.stats()
+        assert stats["rejected"] == 1
+        assert stats["completed"] == 2
+        assert stats["pending"] == 0
+        assert stats["peak_pending"] == 2
+
+    @pytest.mark.asyncio
+    async def test_async_hash_and_verify(self):
+        """Test hash_password_async and verify_password_async round trip."""
+        reset_password_hash_pool()
+        try:
+            hashed = await hash_password_async("asyncpassword")
+            assert await verify_password_async("asyncpassword", hashed) is True
+            assert await verify_password_async("wrongpassword", hashed) is False
+        finally:
+            await get_password_hash_pool().close()
+            reset_password_hash_pool()
+
+
+class TestVerifyAndUpdatePassword:
+    """Tests for verify_and_update_password (rehash on login)."""
+
+    @pytest.mark.asyncio
+    async def test_current_hash_not_replaced(self):
+        """Test that a hash with the configured rounds is kept."""
+        hashed = hash_password("currentpassword")
+
+        valid, new_hash = await verify_and_update_password("currentpassword", hashed)
+
+        assert valid is True
+        assert new_hash is None
+
+    @pytest.mark.asyncio
+    async def test_outdated_rounds_rehashed(self):
+        """Test that a hash with other rounds is replaced on a valid login."""
+        from app.config import settings
+
+        old_rounds = 4 if settings.PASSWORD_HASH_ROUNDS != 4 else 5
+        old_hash = pwd_context.hash("oldpassword", rounds=old_rounds)
+        assert needs_rehash(old_hash) is True
+
+        valid, new_hash = await verify_and_update_password("oldpassword", old_hash)
+
+        assert valid is True
+        assert new_hash is not None
+        assert f"${settings.PASSWORD_HASH_ROUNDS:02d}$" in new_hash
+        assert needs_rehash(new_hash) is False
+        assert verify_password("oldpassword", new_hash) is True
+
+    @pytest.mark.asyncio
+    async def test_wrong_password_not_rehashed(self):
+        """Test that an invalid password never produces a new hash."""
+        old_hash = pwd_context.hash("oldpassword", rounds=4)
+
+        valid, new_hash = await verify_and_update_password("wrongpassword", old_hash)
+
+        assert valid is False
+        assert new_hash is None
@@ -0,0 +1,244 @@
+"""Tests for the principal cache used by get_current_user."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+from fastapi import HTTPException
+from sqlalchemy import inspect
+
+from app.dependencies.auth import get_current_user, get_optional_user
+from app.models.department import Department
+from app.models.user import User
+from app.services.principal_cache import (
+    PRINCIPAL_INVALIDATION_CHANNEL,
+    PrincipalCache,
+    _collect_user_changes,
+    _invalidate_committed_user_changes,
+    get_principal_cache,
+    reset_principal_cache,
+)
+from app.utils.jwt import create_access_token
+
+
+def make_user(**overrides) -> User:
+    """Build an unsaved officer with a department."""
+    department = Department(id=uuid4(), dept_code="HLTH", dept_name="Health", sla_days=7)
+    fields = {
+        "id": uuid4(),
+        "username": "officer1",
+        "mobile_number": "+919876543210",
+        "full_name": "Test Officer",
+        "role": "officer",
+        "is_active": True,
+        "department": department,
+        "district": None,
+    }
+    fields.update(overrides)
+    return User(**fields)
+
+
+@pytest.fixture
+def cache():
+    return PrincipalCache(ttl_seconds=30, max_entries=2, enabled=True)
+
+
+class TestPrincipalCache:
+    """Tests for PrincipalCache."""
+
+    def test_miss_then_hit(self, cache):
+        """Test a stored user is served until it expires."""
+        user = make_user()
+
+        assert cache.get(user.id) is None
+        cache.put(user)
+        cached = cache.get(user.id)
+
+        assert cached is not None
+        assert cached.role == "officer"
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_snapshot_is_detached_copy(self, cache):
+        """Test cached users are detached copies with department loaded."""
+        user = make_user()
+        cache.put(user)
+
+        cached = cache.get(user.id)
+
+        assert cached is not user
+        assert inspect(cached).detached
+        assert cached.department.dept_code == "HLTH"
+        assert cached.district is None
+
+    def test_ttl_expiry(self, cache):
+        """Test entries expire after the TTL."""
+        user = make_user()
+        with patch('app.services.principal_cache.time.monotonic', return_value=1000.0):
+            cache.put(user)
+        with patch('app.services.principal_cache.time.monotonic', return_value=1031.0):
+            assert cache.get(user.id) is None
+
+    def test_lru_eviction(self, cache):
+        """Test the least recently used entry is evicted at capacity."""
+        users = [make_user(), make_user(), make_user()]
+        cache.put(users[0])
+        cache.put(users[1])
+        cache.get(users[0].id)
+        cache.put(users[2])
+
+        assert cache.get(users[1].id) is None
+        assert cache.get(users[0].id) is not None
+        assert cache.evictions == 1
+
+    def test_disabled(self):
+        """Test a disabled cache never stores anything."""
+        cache = PrincipalCache(enabled=False)
+        user = make_user()
+        cache.put(user)
+
+        assert cache.get(user.id) is None
+
+    def test_handle_message_invalidates(self, cache):
+        """Test a broadcast from another worker drops the entry."""
+        user = make_user()
+        cache.put(user)
+
+        cache.handle_message({"type": "message", "data": str(user.id)})
+
+        assert cache.get(user.id) is None
+        assert cache.invalidations == 1
+
+    def test_handle_message_ignores_other_messages(self, cache):
+        """Test subscribe confirmations and malformed payloads are ignored."""
+        user = make_user()
+        cache.put(user)
+
+        cache.handle_message({"type": "subscribe", "data": 1})
+        cache.handle_message({"type": "message", "data": "not-a-uuid"})
+
+        assert cache.get(user.id) is not None
+
+    @pytest.mark.asyncio
+    async def test_invalidate_broadcasts(self, cache):
+        """Test invalidate drops locally and publishes the user ID."""
+        user = make_user()
+        cache.put(user)
+        client = AsyncMock()
+
+        with patch('app.services.principal_cache.get_redis_manager') as manager:
+            manager.return_value.client.return_value = client
+            await cache.invalidate(user.id)
+
+        assert cache.get(user.id) is None
+        client.publish.assert_awaited_once_with(
+            PRINCIPAL_INVALIDATION_CHANNEL, str(user.id)
+        )
+
+    @pytest.mark.asyncio
+    async def test_invalidate_survives_redis_failure(self, cache):
+        """Test a failed broadcast still drops the local entry."""
+        user = make_user()
+        cache.put(user)
+        client = AsyncMock()
+        client.publish.side_effect = ConnectionError("down")
+
+        with patch('app.services.principal_cache.get_redis_manager') as manager:
+            manager.return_value.client.return_value = client
+            await cache.invalidate(user.id)
+
+        assert cache.get(user.id) is None
+
+
+class TestUserChangeEvents:
+    """Tests for ORM commit hooks that invalidate changed users."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_singleton(self):
+        reset_principal_cache()
+        yield
+        reset_principal_cache()
+
+    def test_committed_user_change_invalidates(self):
+        """Test a flushed and committed user change drops the cache entry."""
+        user = make_user()
+        cache = get_principal_cache()
+        cache.put(user)
+
+        session = MagicMock()
+        session.info = {}
+        session.dirty = [user]
+        session.deleted = []
+        session.is_modified.return_value = True
+
+        _collect_user_changes(session, None)
+        _invalidate_committed_user_changes(session)
+
+        assert cache.get(user.id) is None
+
+    def test_unmodified_user_kept(self):
+        """Test users without changes are not invalidated."""
+        user = make_user()
+        cache = get_principal_cache()
+        cache.put(user)
+
+        session = MagicMock()
+        session.info = {}
+        session.dirty = [user]
+        session.deleted = []
+        session.is_modified.return_value = False
+
+        _collect_user_changes(session, None)
+        _invalidate_committed_user_changes(session)
+
+        assert cache.get(user.id) is not None
+
+
+class TestAuthDependencies:
+    """Tests for the cache in get_current_user / get_optional_user."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_singleton(self):
+        reset_principal_cache()
+        yield
+        reset_principal_cache()
+
+    @pytest.fixture
+    def user(self):
+        return make_user()
+
+    @pytest.fixture
+    def token(self, user):
+        return create_access_token(user_id=user.id, role=user.role, username=user.username)
+
+    @pytest.fixture
+    def db(self, user):
+        db = AsyncMock()
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = user
+        db.execute.return_value = result
+        return db
+
+    @pytest.mark.asyncio
+    @patch('app.dependencies.auth.is_token_blacklisted', new_callable=AsyncMock, return_value=False)
+    async def test_second_request_served_from_cache(self, _blacklisted, token, db, user):
+        """Test the user query runs once for repeated requests."""
+        first = await get_current_user(token=token, db=db)
+        second = await get_current_user(token=token, db=db)
+
+        assert first is user
+        assert second.id == user.id
+        db.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @patch('app.dependencies.auth.is_token_blacklisted', new_callable=AsyncMock, return_value=False)
+    async def test_cached_inactive_user_rejected(self, _blacklisted, token, db, user):
+        """Test a cached but deactivated user is still refused."""
+        user.is_active = False
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_user(token=token, db=db)
+        assert exc_info.value.status_code == 403
+
+        assert await get_optional_user(token=token, db=db) is None
+        db.execute.assert_awaited_once()
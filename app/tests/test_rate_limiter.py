@@ -7,6 +7,7 @@ from app.services.rate_limiter import (
     RateLimitResult,
     InMemoryRateLimiter,
     RedisRateLimiter,
+    gcra,
     get_rate_limiter,
     check_rate_limit,
 )
@@ -87,6 +88,44 @@ class TestRateLimitResult:
         assert headers["X-RateLimit-Remaining"] == "0"
 
 
+class TestGCRA:
+    """Tests for the gcra() step function."""
+
+    def test_burst_up_to_limit_then_denied(self):
+        """Test a fresh key admits `limit` requests at once, then denies."""
+        tat = 0.0
+        for expected_remaining in (4, 3, 2, 1, 0):
+            allowed, tat, remaining, _, _ = gcra(tat, 100.0, 5, 60)
+            assert allowed is True
+            assert remaining == expected_remaining
+
+        allowed, new_tat, remaining, retry_after, _ = gcra(tat, 100.0, 5, 60)
+        assert allowed is False
+        assert new_tat == tat
+        assert retry_after == pytest.approx(12.0)
+
+    def test_allowance_refills_one_interval_at_a_time(self):
+        """Test one request is admitted per window/limit after a burst."""
+        tat = 0.0
+        for _ in range(5):
+            _, tat, _, _, _ = gcra(tat, 100.0, 5, 60)
+
+        assert gcra(tat, 111.0, 5, 60)[0] is False
+        assert gcra(tat, 112.0, 5, 60)[0] is True
+
+    def test_no_double_burst_across_window_edge(self):
+        """Test a burst at the end of one window blocks a burst in the next."""
+        tat = 0.0
+        admitted = 0
+        for now in (59.9,) * 5 + (60.1,) * 5:
+            allowed, tat_next, _, _, _ = gcra(tat, now, 5, 60)
+            if allowed:
+                tat = tat_next
+                admitted += 1
+
+        assert admitted == 5
+
+
 class TestInMemoryRateLimiter:
     """Tests for InMemoryRateLimiter."""
 
@@ -211,6 +250,36 @@ class TestInMemoryRateLimiter:
 
         assert health["enabled"] is False
 
+    @pytest.mark.asyncio
+    @patch('app.services.rate_limiter.settings')
+    async def test_retry_after_is_one_emission_interval(self, mock_settings, limiter):
+        """Test denied requests wait for one slot, not the whole window."""
+        mock_settings.RATE_LIMIT_ENABLED = True
+
+        for _ in range(5):
+            await limiter.check_rate_limit("test_user", 5, 60)
+        result = await limiter.check_rate_limit("test_user", 5, 60)
+
+        assert result.allowed is False
+        assert result.retry_after == 12
+
+    @pytest.mark.asyncio
+    @patch('app.services.rate_limiter.settings')
+    async def test_idle_keys_evicted(self, mock_settings):
+        """Test the sweep drops idle keys and keeps active ones."""
+        mock_settings.RATE_LIMIT_ENABLED = True
+        with patch('app.services.rate_limiter.time.monotonic', return_value=1000.0):
+            limiter = InMemoryRateLimiter(sweep_interval=0)
+            await limiter.check_rate_limit("idle", 10, 1)
+            await limiter.check_rate_limit("active", 10, 600)
+
+        with patch('app.services.rate_limiter.time.monotonic', return_value=1002.0):
+            await limiter.check_rate_limit("active", 10, 600)
+
+        health = await limiter.health_check()
+        assert health["tracked_keys"] == 1
+        assert health["evicted_keys"] == 1
+
 
 class TestRedisRateLimiter:
     """Tests for RedisRateLimiter."""
@@ -247,6 +316,45 @@ class TestRedisRateLimiter:
 
         assert health["status"] == "unhealthy"
 
+    @pytest.mark.asyncio
+    @patch('app.services.rate_limiter.settings')
+    async def test_single_script_call_per_check(self, mock_settings):
+        """Test a check is one script call on a single key."""
+        mock_settings.RATE_LIMIT_ENABLED = True
+
+        limiter = RedisRateLimiter(redis_url="redis://localhost:6379/0")
+        limiter._redis.client = AsyncMock()
+        limiter._script = AsyncMock(return_value=[1, 9, 0, 6000])
+
+        with patch('app.services.redis_manager.get_redis_manager') as manager:
+            manager.return_value.client.return_value = limiter._redis.client
+            result = await limiter.check_rate_limit("test_user", 10, 60)
+
+        limiter._script.assert_awaited_once_with(
+            keys=["rate:test_user"], args=[6000.0, 60000]
+        )
+        assert result.allowed is True
+        assert result.remaining == 9
+        assert result.reset_seconds == 6
+
+    @pytest.mark.asyncio
+    @patch('app.services.rate_limiter.settings')
+    async def test_script_denial_maps_retry_after(self, mock_settings):
+        """Test a denied script result sets Retry-After in whole seconds."""
+        mock_settings.RATE_LIMIT_ENABLED = True
+
+        limiter = RedisRateLimiter(redis_url="redis://localhost:6379/0")
+        limiter._redis.client = AsyncMock()
+        limiter._script = AsyncMock(return_value=[0, 0, 5500, 60000])
+
+        with patch('app.services.redis_manager.get_redis_manager') as manager:
+            manager.return_value.client.return_value = limiter._redis.client
+            result = await limiter.check_rate_limit("test_user", 10, 60)
+
+        assert result.allowed is False
+        assert result.retry_after == 6
+        assert result.reset_seconds == 60
+
 
 class TestGetRateLimiter:
     """Tests for get_rate_limiter factory function."""
@@ -0,0 +1,127 @@
+"""Tests for read-replica routing in PostgreSQLDatabaseService."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app.database.connection import PostgreSQLDatabaseService
+
+
+class FakeSession:
+    """Minimal AsyncSession stand-in usable as an async context manager."""
+
+    def __init__(self, name: str, lag: float | None = 0.0, error: Exception | None = None):
+        self.name = name
+        self.lag = lag
+        self.error = error
+        self.execute = AsyncMock(side_effect=self._execute)
+        self.close = AsyncMock()
+
+    async def _execute(self, stmt):
+        if self.error is not None:
+            raise self.error
+        result = MagicMock()
+        result.scalar.return_value = self.lag
+        return result
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+def make_service(replica: FakeSession | None) -> PostgreSQLDatabaseService:
+    """Build a service wired to fake session factories (no real engines)."""
+    service = PostgreSQLDatabaseService(
+        "postgresql+asyncpg://u:p@primary/db",
+        replica_url="postgresql+asyncpg://u:p@replica/db" if replica else None,
+    )
+    primary = FakeSession("primary")
+    service.async_session_factory = MagicMock(return_value=primary)
+    if replica is not None:
+        service.replica_session_factory = MagicMock(return_value=replica)
+    return service
+
+
+async def read_session_name(service: PostgreSQLDatabaseService) -> str:
+    async with service.get_read_session() as session:
+        return session.name
+
+
+class TestReadReplicaRouting:
+    """Tests for get_read_session routing decisions."""
+
+    @pytest.mark.asyncio
+    async def test_no_replica_uses_primary(self):
+        """Test reads go to primary when no replica is configured."""
+        service = make_service(replica=None)
+
+        assert await read_session_name(service) == "primary"
+        assert service.replica_status() == {"configured": False}
+
+    @pytest.mark.asyncio
+    async def test_healthy_replica_is_used(self):
+        """Test reads go to a reachable replica within the lag budget."""
+        service = make_service(replica=FakeSession("replica", lag=0.5))
+
+        assert await read_session_name(service) == "replica"
+        assert service.replica_available is True
+        assert service.replica_lag_seconds == 0.5
+
+    @pytest.mark.asyncio
+    async def test_lagging_replica_falls_back_to_primary(self):
+        """Test reads go to primary when replica lag exceeds the threshold."""
+        service = make_service(replica=FakeSession("replica", lag=120.0))
+
+        with patch("app.database.connection.settings") as mock_settings:
+            mock_settings.DATABASE_REPLICA_MAX_LAG_SECONDS = 10
+            mock_settings.DATABASE_REPLICA_CHECK_INTERVAL = 5
+            assert await read_session_name(service) == "primary"
+
+        assert service.replica_available is False
+        assert service.replica_lag_seconds == 120.0
+
+    @pytest.mark.asyncio
+    async def test_unreachable_replica_falls_back_to_primary(self):
+        """Test reads go to primary when the lag probe fails."""
+        service = make_service(
+            replica=FakeSession("replica", error=ConnectionRefusedError("refused"))
+        )
+
+        assert await read_session_name(service) == "primary"
+        assert service.replica_available is False
+        assert "refused" in service.replica_last_error
+
+    @pytest.mark.asyncio
+    async def test_probe_is_cached_between_checks(self):
+        """Test the lag probe runs once per check interval, not per request."""
+        replica = FakeSession("replica", lag=0.0)
+        service = make_service(replica=replica)
+
+        for _ in range(3):
+            assert await read_session_name(service) == "replica"
+
+        assert replica.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_connection_error_during_read_marks_replica_down(self):
+        """Test a replica connection failure mid-request stops routing to it."""
+        service = make_service(replica=FakeSession("replica", lag=0.0))
+
+        with pytest.raises(OperationalError):
+            async with service.get_read_session():
+                raise OperationalError("SELECT 1", {}, Exception("connection lost"))
+
+        assert service.replica_available is False
+        assert await read_session_name(service) == "primary"
+
+    @pytest.mark.asyncio
+    async def test_not_connected_raises(self):
+        """Test get_read_session requires connect() first."""
+        service = PostgreSQLDatabaseService("postgresql+asyncpg://u:p@primary/db")
+
+        with pytest.raises(RuntimeError):
+            async with service.get_read_session():
+                pass
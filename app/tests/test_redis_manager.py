@@ -0,0 +1,168 @@
+"""Tests for the shared Redis connection pools."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from redis.asyncio import BlockingConnectionPool
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.services.redis_manager import (
+    CheckedRedisClient,
+    RedisClientManager,
+    get_redis_manager,
+    redis_db_url,
+    reset_redis_manager,
+)
+
+
+class TestRedisDbUrl:
+    """Tests for redis_db_url."""
+
+    def test_default_db(self):
+        assert redis_db_url(url="redis://localhost:6379/0") == "redis://localhost:6379/0"
+
+    def test_replaces_db(self):
+        assert redis_db_url(2, "redis://:secret@cache:6380/0") == "redis://:secret@cache:6380/2"
+
+
+class TestRedisClientManager:
+    """Tests for RedisClientManager."""
+
+    @pytest.fixture
+    def manager(self):
+        return RedisClientManager(max_connections=4, pool_timeout=0.5)
+
+    @pytest.mark.asyncio
+    async def test_client_shared_per_db(self, manager):
+        """Test services asking for the same DB share one client and pool."""
+        first = manager.client(url="redis://localhost:6379/0")
+        second = manager.client(url="redis://localhost:6379/0")
+        other = manager.client(db=1, url="redis://localhost:6379/0")
+
+        assert first is second
+        assert other is not first
+        assert other.connection_pool is not first.connection_pool
+
+    @pytest.mark.asyncio
+    async def test_pool_is_bounded(self, manager):
+        """Test pools are blocking pools capped at max_connections."""
+        pool = manager.client(url="redis://localhost:6379/0").connection_pool
+
+        assert pool.max_connections == 4
+        assert pool.timeout == 0.5
+        assert isinstance(pool, BlockingConnectionPool)
+
+    @pytest.mark.asyncio
+    async def test_unreachable_redis_fails_fast(self):
+        """Test a refused connect raises at once and frees its slot."""
+        manager = RedisClientManager(max_connections=1, pool_timeout=5)
+        client = manager.client(url="redis://127.0.0.1:1/0")
+
+        for _ in range(2):
+            with pytest.raises(RedisConnectionError) as exc_info:
+                await asyncio.wait_for(client.ping(), 2)
+            assert "No connection available" not in str(exc_info.value)
+
+        assert manager.stats()["pools"]["127.0.0.1:1/0"]["in_use"] == 0
+
+    @pytest.mark.asyncio
+    async def test_stats(self, manager):
+        """Test stats report per-pool usage without credentials."""
+        manager.client(url="redis://:secret@localhost:6379/3")
+
+        stats = manager.stats()
+
+        assert stats["max_connections_per_pool"] == 4
+        assert stats["pools"] == {
+            "localhost:6379/3": {"in_use": 0, "idle": 0, "created": 0, "max_connections": 4}
+        }
+
+    def test_new_event_loop_gets_new_pools(self, manager):
+        """Test pools are not reused across event loops (e.g. Celery tasks)."""
+        async def get_client():
+            return manager.client(url="redis://localhost:6379/0")
+
+        first = asyncio.run(get_client())
+        second = asyncio.run(get_client())
+
+        assert first is not second
+        assert len(manager.stats()["pools"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_close_drops_pools(self, manager):
+        """Test close disconnects and forgets every pool."""
+        client = manager.client(url="redis://localhost:6379/0")
+
+        await manager.close()
+
+        assert manager.stats()["pools"] == {}
+        assert manager.client(url="redis://localhost:6379/0") is not client
+
+    @pytest.mark.asyncio
+    async def test_start_tolerates_unreachable_redis(self):
+        """Test startup only logs when Redis is down."""
+        manager = RedisClientManager(max_connections=1, pool_timeout=0.1)
+
+        with patch('app.services.redis_manager.settings') as mock_settings:
+            mock_settings.REDIS_URL = "redis://127.0.0.1:1/0"
+            await manager.start()
+
+
+class TestCheckedRedisClient:
+    """Tests for CheckedRedisClient."""
+
+    @pytest.fixture
+    def client(self):
+        client = AsyncMock()
+        client.register_script = MagicMock()
+        with patch('app.services.redis_manager.get_redis_manager') as manager:
+            manager.return_value.client.return_value = client
+            yield client
+
+    @pytest.mark.asyncio
+    async def test_pings_once_per_client(self, client):
+        """Test a client is checked on first use only, then on_connect runs."""
+        checked = CheckedRedisClient("test", on_connect=lambda c: c.register_script("s"))
+
+        assert await checked.get() is client
+        assert await checked.get() is client
+
+        client.ping.assert_awaited_once()
+        client.register_script.assert_called_once_with("s")
+
+    @pytest.mark.asyncio
+    async def test_backs_off_after_failure(self, client):
+        """Test a failed ping skips Redis until the retry interval passes."""
+        client.ping.side_effect = RedisConnectionError("refused")
+        checked = CheckedRedisClient("test", retry_interval=30)
+
+        with patch('app.services.redis_manager.time.monotonic', return_value=100.0):
+            with pytest.raises(RedisConnectionError):
+                await checked.get()
+            with pytest.raises(ConnectionError, match="retry pending"):
+                await checked.get()
+        assert client.ping.await_count == 1
+
+        client.ping.side_effect = None
+        with patch('app.services.redis_manager.time.monotonic', return_value=131.0):
+            assert await checked.get() is client
+        assert client.ping.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_release_rechecks(self, client):
+        """Test a released client is pinged again on next use."""
+        checked = CheckedRedisClient("test")
+        await checked.get()
+
+        checked.release()
+        await checked.get()
+
+        assert client.ping.await_count == 2
+
+
+def test_singleton():
+    """Test get_redis_manager returns one instance until reset."""
+    reset_redis_manager()
+    assert get_redis_manager() is get_redis_manager()
+    reset_redis_manager()
@@ -1,5 +1,6 @@
 """Tests for storage service."""
 
+import hashlib
 import io
 import os
 import tempfile
@@ -11,6 +12,10 @@ from app.services.storage_service import (
     StorageResult,
     MockStorageService,
     LocalStorageService,
+    TEMP_DIR_NAME,
+    blob_extension,
+    find_local_blob,
+    generate_blob_path,
     generate_file_hash,
     generate_storage_path,
     validate_file_size,
@@ -52,6 +57,7 @@ class TestStorageResult:
 
         assert result.success is False
         assert result.error == "File type not allowed"
+        assert result.too_large is False
         assert result.file_path is None
 
     def test_to_dict(self):
@@ -236,6 +242,7 @@ class TestMockStorageService:
         )
 
         assert result.success is False
+        assert result.too_large is True
         assert "too large" in result.error.lower()
 
     @pytest.mark.asyncio
@@ -415,6 +422,158 @@ class TestLocalStorageService:
         assert health["backend"] == "local"
 
 
+class EndlessFile:
+    """File object that never reaches EOF and counts bytes handed out."""
+
+    def __init__(self) -> None:
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        self.bytes_read += size
+        return b"x" * size
+
+
+class AsyncFile:
+    """File object with an async read(), like UploadFile."""
+
+    def __init__(self, content: bytes) -> None:
+        self._buffer = io.BytesIO(content)
+
+    async def read(self, size: int = -1) -> bytes:
+        return self._buffer.read(size)
+
+
+class TestLocalStorageStreaming:
+    """Tests for chunked uploads in LocalStorageService."""
+
+    @pytest.fixture
+    def upload_dir(self, tmp_path):
+        return str(tmp_path / "uploads")
+
+    @pytest.mark.asyncio
+    @patch('app.services.storage_service.settings')
+    async def test_hash_matches_across_chunks(self, mock_settings, upload_dir):
+        """Test the incremental hash and size match the whole content."""
+        mock_settings.ALLOWED_FILE_TYPES = ["application/pdf"]
+        mock_settings.MAX_FILE_SIZE_MB = 1
+        content = os.urandom(10_000)
+        service = LocalStorageService(upload_dir=upload_dir, chunk_size=1024)
+
+        result = await service.upload_file(
+            file=io.BytesIO(content),
+            file_name="scan.pdf",
+            file_type="application/pdf",
+            grievance_id="PGRS-001",
+        )
+
+        assert result.success is True
+        assert result.file_hash == hashlib.sha256(content).hexdigest()
+        assert result.file_size_bytes == len(content)
+        with open(os.path.join(upload_dir, result.file_path), "rb") as f:
+            assert f.read() == content
+        assert os.listdir(os.path.join(upload_dir, TEMP_DIR_NAME)) == []
+
+    @pytest.mark.asyncio
+    @patch('app.services.storage_service.settings')
+    async def test_too_large_aborts_while_streaming(self, mock_settings, upload_dir):
+        """Test reading stops just past the limit and nothing is left behind."""
+        mock_settings.ALLOWED_FILE_TYPES = ["application/pdf"]
+        mock_settings.MAX_FILE_SIZE_MB = 1
+        service = LocalStorageService(upload_dir=upload_dir, chunk_size=64 * 1024)
+        source = EndlessFile()
+
+        result = await service.upload_file(
+            file=source,
+            file_name="huge.pdf",
+            file_type="application/pdf",
+            grievance_id="PGRS-001",
+        )
+
+        assert result.success is False
+        assert result.too_large is True
+        assert "too large" in result.error.lower()
+        assert source.bytes_read <= 1024 * 1024 + 64 * 1024
+        assert os.listdir(upload_dir) == [TEMP_DIR_NAME]
+        assert os.listdir(os.path.join(upload_dir, TEMP_DIR_NAME)) == []
+
+    @pytest.mark.asyncio
+    @patch('app.services.storage_service.settings')
+    async def test_async_file_object(self, mock_settings, upload_dir):
+        """Test files with an async read() are streamed too."""
+        mock_settings.ALLOWED_FILE_TYPES = ["image/png"]
+        mock_settings.MAX_FILE_SIZE_MB = 1
+        content = b"\x89PNG" + b"0" * 5000
+        service = LocalStorageService(upload_dir=upload_dir, chunk_size=1000)
+
+        result = await service.upload_file(
+            file=AsyncFile(content),
+            file_name="photo.png",
+            file_type="image/png",
+            grievance_id="PGRS-001",
+        )
+
+        assert result.success is True
+        assert result.file_hash == hashlib.sha256(content).hexdigest()
+
+
+class TestLocalStorageDeduplication:
+    """Tests for content-addressed uploads in LocalStorageService."""
+
+    @pytest.mark.asyncio
+    @patch('app.services.storage_service.settings')
+    async def test_same_content_stored_once(self, mock_settings, tmp_path):
+        """Test identical uploads share one blob and the second skips the write."""
+        mock_settings.ALLOWED_FILE_TYPES = ["image/jpeg"]
+        mock_settings.MAX_FILE_SIZE_MB = 10
+        upload_dir = str(tmp_path / "uploads")
+        service = LocalStorageService(upload_dir=upload_dir)
+        content = b"same photo for a mass complaint"
+
+        first = await service.upload_file(
+            io.BytesIO(content), "a.jpg", "image/jpeg", "PGRS-2025-05-00001"
+        )
+        second = await service.upload_file(
+            io.BytesIO(content), "b.jpg", "image/jpeg", "PGRS-2025-05-00002"
+        )
+
+        assert first.deduplicated is False
+        assert second.deduplicated is True
+        assert first.file_path == second.file_path == generate_blob_path(first.file_hash, ".jpg")
+        blob_dir = os.path.join(upload_dir, os.path.dirname(first.file_path))
+        assert os.listdir(blob_dir) == [f"{first.file_hash}.jpg"]
+        assert os.listdir(os.path.join(upload_dir, TEMP_DIR_NAME)) == []
+        assert await service.file_exists(first.file_path) is True
+
+    @pytest.mark.asyncio
+    @patch('app.services.storage_service.settings')
+    async def test_blob_keeps_first_extension(self, mock_settings, tmp_path):
+        """Test the blob takes the first name's extension and later names reuse it."""
+        mock_settings.ALLOWED_FILE_TYPES = ["image/jpeg"]
+        mock_settings.MAX_FILE_SIZE_MB = 10
+        upload_dir = str(tmp_path / "uploads")
+        service = LocalStorageService(upload_dir=upload_dir)
+        content = b"scanned letter"
+
+        first = await service.upload_file(io.BytesIO(content), "Letter.JPEG", "image/jpeg", "PGRS-1")
+        second = await service.upload_file(io.BytesIO(content), "scan", "image/jpeg", "PGRS-2")
+
+        assert first.file_path.endswith(f"{first.file_hash}.jpeg")
+        assert second.deduplicated is True
+        assert second.file_path == first.file_path
+        assert find_local_blob(upload_dir, first.file_hash) == first.file_path
+
+    @pytest.mark.parametrize("file_name,extension", [
+        ("photo.JPG", ".jpg"),
+        ("report.final.pdf", ".pdf"),
+        ("noext", ""),
+        ("odd.tar gz", ""),
+        (None, ""),
+    ])
+    def test_blob_extension(self, file_name, extension):
+        """Test only short alphanumeric extensions are kept, lower-cased."""
+        assert blob_extension(file_name) == extension
+
+
 class TestGetStorageService:
     """Tests for storage service factory."""
 
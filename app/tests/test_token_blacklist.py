@@ -2,7 +2,7 @@
 
 import pytest
 from datetime import datetime, timedelta, timezone
-from unittest.mock import patch, AsyncMock
+from unittest.mock import patch, AsyncMock, MagicMock
 from uuid import uuid4
 
 from app.services.token_blacklist import (
@@ -191,6 +191,121 @@ class TestRedisTokenBlacklist:
         assert health["status"] == "unhealthy"
 
 
+class TestRedisTokenBlacklistLocalCache:
+    """Tests for the local revocation snapshot in front of Redis."""
+
+    @pytest.fixture
+    def client(self):
+        """Mock Redis client with no revocations."""
+        client = AsyncMock()
+        client.get.return_value = "0"
+        client.zrangebyscore.return_value = []
+        client.exists.return_value = 0
+        return client
+
+    @pytest.fixture
+    def blacklist(self, client):
+        blacklist = RedisTokenBlacklist(
+            redis_url="redis://localhost:6379/0",
+            local_cache=True,
+            sync_interval=60,
+        )
+        blacklist._redis.client = client
+        with patch('app.services.redis_manager.get_redis_manager') as manager:
+            manager.return_value.client.return_value = client
+            yield blacklist
+
+    @pytest.mark.asyncio
+    async def test_unrevoked_token_resolved_locally(self, blacklist, client):
+        """Test checks after the first sync skip the Redis lookup."""
+        for _ in range(5):
+            assert await blacklist.is_blacklisted("some_token") is False
+
+        client.exists.assert_not_called()
+        client.get.assert_awaited_once()
+        assert blacklist.local_resolutions == 5
+        assert blacklist.remote_resolutions == 0
+
+    @pytest.mark.asyncio
+    async def test_possible_hit_confirmed_in_redis(self, blacklist, client):
+        """Test a token in the snapshot is confirmed with Redis."""
+        client.zrangebyscore.return_value = [_get_token_hash("revoked_token")]
+        client.exists.return_value = 1
+
+        assert await blacklist.is_blacklisted("revoked_token") is True
+        client.exists.assert_awaited_once()
+        assert blacklist.remote_resolutions == 1
+
+    @pytest.mark.asyncio
+    async def test_snapshot_reloads_when_version_moves(self, blacklist, client):
+        """Test a revocation on another worker is seen after the sync interval."""
+        await blacklist.is_blacklisted("token")
+        assert blacklist.snapshot_reloads == 1
+
+        client.get.return_value = "1"
+        client.zrangebyscore.return_value = [_get_token_hash("token")]
+        client.exists.return_value = 1
+        blacklist._synced_at = 0.0  # Sync interval elapsed
+
+        assert await blacklist.is_blacklisted("token") is True
+        assert blacklist.snapshot_reloads == 2
+
+    @pytest.mark.asyncio
+    async def test_unchanged_version_skips_reload(self, blacklist, client):
+        """Test an unchanged version costs one GET and no reload."""
+        await blacklist.is_blacklisted("token")
+        blacklist._synced_at = 0.0
+
+        await blacklist.is_blacklisted("token")
+
+        assert client.get.await_count == 2
+        client.zrangebyscore.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_own_revocation_visible_immediately(self, blacklist, client):
+        """Test blacklist_token updates the local snapshot and bumps the version."""
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[True, 1, 0, 1])
+        client.pipeline = MagicMock(return_value=pipe)
+        await blacklist.is_blacklisted("token")
+
+        expires = datetime.now(timezone.utc) + timedelta(hours=1)
+        assert await blacklist.blacklist_token("token", expires) is True
+        client.exists.return_value = 1
+
+        assert await blacklist.is_blacklisted("token") is True
+        pipe.incr.assert_called_once_with("blacklist:version")
+
+    @pytest.mark.asyncio
+    async def test_sync_failure_falls_back_to_redis_lookup(self, blacklist, client):
+        """Test checks go to Redis while the snapshot cannot be synced."""
+        client.get.side_effect = ConnectionError("down")
+
+        assert await blacklist.is_blacklisted("token") is False
+        client.exists.assert_awaited_once()
+        assert blacklist.remote_resolutions == 1
+
+    @pytest.mark.asyncio
+    async def test_local_cache_disabled(self, blacklist, client):
+        """Test every check goes to Redis when the local cache is off."""
+        blacklist.local_cache = False
+
+        await blacklist.is_blacklisted("token")
+
+        client.get.assert_not_called()
+        client.exists.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_health_check_reports_resolution_metrics(self, blacklist):
+        """Test health check exposes local/remote resolution counts."""
+        await blacklist.is_blacklisted("token")
+
+        health = await blacklist.health_check()
+
+        assert health["local_cache"]["local_resolutions"] == 1
+        assert health["local_cache"]["remote_resolutions"] == 0
+
+
 class TestTokenBlacklistFactory:
     """Tests for blacklist factory function."""
 
@@ -0,0 +1,174 @@
+"""Tests for the async Twilio Messages client."""
+
+import asyncio
+from typing import Callable, List
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from app.config import settings
+from app.services.sms_service import TwilioSMSService
+from app.services.twilio_client import TwilioError, TwilioMessagesClient
+
+
+def make_client(
+    handler: Callable[[httpx.Request], httpx.Response],
+    max_concurrency: int = 5,
+) -> TwilioMessagesClient:
+    """Client whose HTTP calls go to `handler`."""
+    client = TwilioMessagesClient("ACtest", "token", max_concurrency=max_concurrency)
+    client._client = httpx.AsyncClient(
+        base_url="https://api.twilio.test",
+        transport=httpx.MockTransport(handler),
+    )
+    return client
+
+
+def created(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(201, json={"sid": "SM123", "status": "queued"})
+
+
+class TestTwilioMessagesClient:
+    """Tests for TwilioMessagesClient."""
+
+    @pytest.mark.asyncio
+    async def test_send_message_posts_form(self):
+        """Test a message is one form POST to the Messages resource."""
+        requests: List[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return created(request)
+
+        client = make_client(handler)
+        message = await client.send_message("+919876543210", "+14155550100", "hello")
+        await client.close()
+
+        assert message.sid == "SM123"
+        assert message.status == "queued"
+        assert message.attempts == 1
+        assert len(requests) == 1
+        assert requests[0].url.path == "/2010-04-01/Accounts/ACtest/Messages.json"
+        assert b"To=%2B919876543210" in requests[0].content
+        assert client.stats()["sent"] == 1
+
+    @pytest.mark.asyncio
+    async def test_retries_throttling_with_backoff(self):
+        """Test 429 and 5xx are retried with non-blocking backoff."""
+        responses = [
+            httpx.Response(429, json={"code": 20429, "message": "Too Many Requests"}),
+            httpx.Response(503, json={"message": "Service Unavailable"}),
+        ]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return responses.pop(0) if responses else created(request)
+
+        client = make_client(handler)
+        with patch("app.services.twilio_client.asyncio.sleep", new=AsyncMock()) as sleep:
+            message = await client.send_message("+919876543210", "+14155550100", "hi")
+
+        assert message.attempts == 3
+        assert sleep.await_count == 2
+        first, second = (call.args[0] for call in sleep.await_args_list)
+        assert first <= settings.TWILIO_RETRY_BASE_SECONDS
+        assert second <= 2 * settings.TWILIO_RETRY_BASE_SECONDS
+        assert client.stats()["retries"] == 2
+
+    @pytest.mark.asyncio
+    async def test_client_error_not_retried(self):
+        """Test a 4xx other than 429 fails at once."""
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(
+                400, json={"code": 21211, "message": "Invalid 'To' Phone Number"}
+            )
+
+        client = make_client(handler)
+        with pytest.raises(TwilioError) as exc_info:
+            await client.send_message("+91000", "+14155550100", "hi", retry_count=3)
+
+        assert calls == 1
+        assert exc_info.value.code == 21211
+        assert exc_info.value.attempts == 1
+        assert client.stats()["failed"] == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("response", [
+        httpx.Response(201, content=b"<html>gateway</html>"),
+        httpx.Response(201, json={"status": "queued"}),
+    ])
+    async def test_malformed_success_raises_twilio_error(self, response):
+        """Test a 2xx without a JSON message sid fails as TwilioError, not retried."""
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return response
+
+        client = make_client(handler)
+        with pytest.raises(TwilioError):
+            await client.send_message("+919876543210", "+14155550100", "hi", retry_count=3)
+
+        assert calls == 1
+        assert client.stats()["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        """Test no more than max_concurrency requests are in flight."""
+        in_flight = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return created(request)
+
+        client = make_client(handler, max_concurrency=3)
+        await asyncio.gather(*(
+            client.send_message(f"+91987654{i:04d}", "+14155550100", "hi")
+            for i in range(12)
+        ))
+
+        assert peak == 3
+        assert client.stats()["sent"] == 12
+
+
+class TestTwilioSMSServiceTransport:
+    """Tests for TwilioSMSService on the async client."""
+
+    @pytest.mark.asyncio
+    async def test_send_sms_success(self):
+        """Test a sent message maps to a successful SMSResult."""
+        service = TwilioSMSService("ACtest", "token", "+14155550100")
+        service._client = make_client(created)
+
+        with patch.object(settings, "SMS_ENABLED", True):
+            result = await service.send_otp("+919876543210", "123456")
+
+        assert result.success is True
+        assert result.message_sid == "SM123"
+        assert result.retry_count == 0
+
+    @pytest.mark.asyncio
+    async def test_send_sms_failure_after_retries(self):
+        """Test exhausted retries map to a failed SMSResult."""
+        service = TwilioSMSService("ACtest", "token", "+14155550100")
+        service._client = make_client(
+            lambda request: httpx.Response(500, json={"message": "Internal Server Error"})
+        )
+
+        with patch.object(settings, "SMS_ENABLED", True), \
+                patch("app.services.twilio_client.asyncio.sleep", new=AsyncMock()):
+            result = await service.send_sms("+919876543210", "hello", retry_count=2)
+
+        assert result.success is False
+        assert result.error == "Internal Server Error"
+        assert result.retry_count == 2
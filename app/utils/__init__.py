@@ -6,12 +6,19 @@ This module contains utility functions for:
 """
 
 from app.utils.jwt import create_access_token, decode_token, TokenData
-from app.utils.password import hash_password, verify_password
+from app.utils.password import (
+    hash_password,
+    hash_password_async,
+    verify_password,
+    verify_password_async,
+)
 
 __all__ = [
     "create_access_token",
     "decode_token",
     "TokenData",
     "hash_password",
+    "hash_password_async",
     "verify_password",
+    "verify_password_async",
 ]
@@ -2,12 +2,28 @@
 
 Provides secure password hashing and verification functions.
 Uses passlib with bcrypt backend for industry-standard security.
+
+bcrypt at PASSWORD_HASH_ROUNDS=12 takes ~250ms of CPU per call. Async code
+(the login endpoint) must use the *_async functions, which run bcrypt on a
+bounded thread pool (PasswordHashPool) so the event loop keeps serving
+other requests; bcrypt releases the GIL while hashing.
 """
 
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Optional, Tuple, TypeVar
+
 from passlib.context import CryptContext
 
 from app.config import settings
 
+T = TypeVar("T")
+
+# Recent wait/hash times kept for the pool's latency stats
+LATENCY_WINDOW = 1000
+
 # Configure passlib with bcrypt
 # Using bcrypt with configurable rounds (default 12)
 pwd_context = CryptContext(
@@ -76,6 +92,175 @@ def needs_rehash(hashed_password: str) -> bool:
     return bool(pwd_context.needs_update(hashed_password))
 
 
+class PasswordHashBusyError(RuntimeError):
+    """Raised when the password hashing pool has too many pending calls."""
+
+
+class PasswordHashPool:
+    """Bounded thread pool running bcrypt off the event loop.
+
+    At most max_pending calls are queued or running; beyond that callers
+    get PasswordHashBusyError instead of queueing behind a login storm.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+    ):
+        self.max_workers = max_workers or settings.PASSWORD_HASH_WORKERS
+        self.max_pending = max_pending or settings.PASSWORD_HASH_MAX_PENDING
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending = 0
+
+        # Time queued before a worker picked the call up, and time hashing
+        self._wait_ms: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._hash_ms: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self.completed = 0
+        self.rejected = 0
+        self.peak_pending = 0
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a hashing function on the pool.
+
+        Raises:
+            PasswordHashBusyError: max_pending calls already in flight
+        """
+        if self._pending >= self.max_pending:
+            self.rejected += 1
+            raise PasswordHashBusyError("Password hashing pool is saturated")
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="password-hash",
+            )
+
+        submitted = time.monotonic()
+
+        def timed() -> Tuple[T, float, float]:
+            started = time.monotonic()
+            result = func(*args)
+            return result, started - submitted, time.monotonic() - started
+
+        self._pending += 1
+        self.peak_pending = max(self.peak_pending, self._pending)
+        try:
+            loop = asyncio.get_running_loop()
+            result, waited, hashed = await loop.run_in_executor(self._executor, timed)
+        finally:
+            self._pending -= 1
+
+        self.completed += 1
+        self._wait_ms.append(waited * 1000)
+        self._hash_ms.append(hashed * 1000)
+        return result
+
+    async def close(self) -> None:
+        """Shut down the pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Get queue depth and latency statistics.
+
+        Returns:
+            Dict with pending/queued calls, counters and wait/hash times
+        """
+        waits = sorted(self._wait_ms)
+
+        def average(values: Deque[float]) -> float:
+            return round(sum(values) / len(values), 2) if values else 0.0
+
+        return {
+            "workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "pending": self._pending,
+            "queued": max(0, self._pending - self.max_workers),
+            "peak_pending": self.peak_pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avg_wait_ms": average(self._wait_ms),
+            "p95_wait_ms": round(waits[int(0.95 * (len(waits) - 1))], 2) if waits else 0.0,
+            "avg_hash_ms": average(self._hash_ms),
+            "rounds": settings.PASSWORD_HASH_ROUNDS,
+        }
+
+
+# Singleton instance
+_password_hash_pool: Optional[PasswordHashPool] = None
+
+
+def get_password_hash_pool() -> PasswordHashPool:
+    """Get the password hashing pool instance.
+
+    Returns:
+        PasswordHashPool for this worker process
+    """
+    global _password_hash_pool
+
+    if _password_hash_pool is None:
+        _password_hash_pool = PasswordHashPool()
+
+    return _password_hash_pool
+
+
+def reset_password_hash_pool() -> None:
+    """Reset the password hashing pool singleton (for testing)."""
+    global _password_hash_pool
+    _password_hash_pool = None
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password on the hashing pool (see hash_password).
+
+    Raises:
+        PasswordHashBusyError: Hashing pool is saturated
+    """
+    return await get_password_hash_pool().run(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on the hashing pool (see verify_password).
+
+    Raises:
+        PasswordHashBusyError: Hashing pool is saturated
+    """
+    return await get_password_hash_pool().run(verify_password, plain_password, hashed_password)
+
+
+async def verify_and_update_password(
+    plain_password: str,
+    hashed_password: str,
+) -> Tuple[bool, Optional[str]]:
+    """Verify a password and rehash it if the stored hash is outdated.
+
+    The stored hash is outdated when it was made with a different number of
+    rounds than PASSWORD_HASH_ROUNDS (or a deprecated scheme). Both steps
+    run in one call on the hashing pool.
+
+    Args:
+        plain_password: Plain text password to verify
+        hashed_password: Stored hash
+
+    Returns:
+        (valid, new_hash); new_hash is None unless the password is valid
+        and the stored hash should be replaced with it
+
+    Raises:
+        PasswordHashBusyError: Hashing pool is saturated
+
+    Example:
+        >>> valid, new_hash = await verify_and_update_password(password, user.password_hash)
+        >>> if valid and new_hash:
+        ...     user.password_hash = new_hash
+    """
+    valid, new_hash = await get_password_hash_pool().run(
+        pwd_context.verify_and_update, plain_password, hashed_password
+    )
+    return bool(valid), new_hash
+
+
 def generate_temporary_password(length: int = 12) -> str:
     """Generate a secure temporary password.
 
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Benchmark the middleware stack: BaseHTTPMiddleware versus pure ASGI.
+
+Builds two copies of a small app wired like app.main - request ID, rate
+limiting (in-memory limiter) and deprecation headers - one with the previous
+BaseHTTPMiddleware layers and one with the pure ASGI middleware in
+app.middleware, then drives each in-process through httpx's ASGI transport.
+
+Usage:
+    python scripts/benchmark_middleware.py
+    python scripts/benchmark_middleware.py --requests 20000 --concurrency 100
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, List
+from uuid import uuid4
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.config import settings
+from app.middleware import rate_limit
+from app.middleware.deprecation import DeprecationMiddleware
+from app.middleware.rate_limit import RateLimitMiddleware, get_rate_limit_key
+from app.middleware.request_id import RequestIDMiddleware
+from app.services.rate_limiter import InMemoryRateLimiter
+
+CallNext = Callable[[Request], Awaitable[Response]]
+
+
+async def legacy_request_id(request: Request, call_next: CallNext) -> Response:
+    """The previous @app.middleware("http") request ID layer."""
+    request_id = request.headers.get("X-Request-ID", str(uuid4()))
+    request.state.request_id = request_id
+    response = await call_next(request)
+    response.headers["X-Request-ID"] = request_id
+    return response
+
+
+async def legacy_rate_limit(request: Request, call_next: CallNext) -> Response:
+    """The previous RateLimitMiddleware.dispatch (prefix scan included)."""
+    key = f"{request.method}:{request.url.path}"
+    limits = rate_limit.ENDPOINT_RATE_LIMITS.get(key)
+    if limits is None:
+        limits = next(
+            (v for k, v in rate_limit.ENDPOINT_RATE_LIMITS.items() if key.startswith(k)),
+            (settings.RATE_LIMIT_DEFAULT_REQUESTS, settings.RATE_LIMIT_DEFAULT_WINDOW),
+        )
+    result = await rate_limit.get_rate_limiter().check_rate_limit(
+        get_rate_limit_key(request), *limits
+    )
+    response = await call_next(request)
+    for name, value in result.to_headers().items():
+        response.headers[name] = value
+    return response
+
+
+async def legacy_deprecation(request: Request, call_next: CallNext) -> Response:
+    """The previous DeprecationMiddleware.dispatch for a non-deprecated path."""
+    response = await call_next(request)
+    response.headers["X-API-Version"] = "v1"
+    return response
+
+
+def create_app(pure_asgi: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping(request: Request) -> dict:
+        return {"request_id": request.state.request_id}
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks():
+            for _ in range(8):
+                yield b"x" * 1024
+
+        return StreamingResponse(chunks())
+
+    if pure_asgi:
+        app.add_middleware(RequestIDMiddleware)
+        app.add_middleware(RateLimitMiddleware)
+        app.add_middleware(DeprecationMiddleware)
+    else:
+        for dispatch in (legacy_request_id, legacy_rate_limit, legacy_deprecation):
+            app.add_middleware(BaseHTTPMiddleware, dispatch=dispatch)
+    return app
+
+
+async def run(app: FastAPI, path: str, total: int, concurrency: int) -> dict:
+    """Send `total` GETs to `path` with at most `concurrency` outstanding."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        async def one(i: int) -> None:
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.get(path)
+                response.raise_for_status()
+                latencies.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(total)))
+        elapsed = time.perf_counter() - start
+
+    return {
+        "throughput": total / elapsed,
+        "p50": statistics.median(latencies),
+    }
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    settings.RATE_LIMIT_ENABLED = True
+    # Every request must be admitted; this measures middleware cost, not limiting
+    settings.RATE_LIMIT_DEFAULT_REQUESTS = args.requests * 10
+    rate_limit._endpoint_limits = rate_limit.EndpointLimits(
+        {}, (args.requests * 10, 60)
+    )
+    limiter = InMemoryRateLimiter()
+    rate_limit.get_rate_limiter = lambda: limiter
+
+    print(f"\n{args.requests} requests per run, concurrency {args.concurrency}")
+    print(f"{'stack':<16} {'path':<10} {'req/s':>10} {'p50 ms':>10}")
+
+    for path in ("/ping", "/stream"):
+        for label, pure_asgi in (("BaseHTTP", False), ("pure ASGI", True)):
+            stats = await run(create_app(pure_asgi), path, args.requests, args.concurrency)
+            print(f"{label:<16} {path:<10} {stats['throughput']:>10.1f} {stats['p50']:>10.2f}")
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark middleware stacks")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark IndicBERTNLPService with and without micro-batching.
+
+Starts the stand-in model server (scripts/nlp_stub_server.py) in-process and
+fires concurrent classify_text calls at it through the real service client.
+
+Usage:
+    python scripts/benchmark_nlp_batching.py
+    python scripts/benchmark_nlp_batching.py --requests 2000 --concurrency 200
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+# Add backend and scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+import uvicorn
+
+from app.config import settings
+from app.services.nlp_service import IndicBERTNLPService
+from nlp_stub_server import create_app
+
+TEXTS = [
+    "No water supply in our colony for five days",
+    "Road near the bus stand is full of potholes",
+    "Government hospital has no doctor at night",
+    "Electricity cut every evening for three hours",
+]
+
+
+async def run(service: IndicBERTNLPService, total: int, concurrency: int) -> dict:
+    """Send `total` classifications with at most `concurrency` outstanding."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    failures = 0
+
+    async def one(i: int) -> None:
+        nonlocal failures
+        async with semaphore:
+            start = time.perf_counter()
+            result = await service.classify_text(TEXTS[i % len(TEXTS)], "en")
+            latencies.append((time.perf_counter() - start) * 1000)
+            failures += result.fallback_used
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(total)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "throughput": total / elapsed,
+        "p50": statistics.median(latencies),
+        "p95": latencies[int(len(latencies) * 0.95) - 1],
+        "failures": failures,
+    }
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    config = uvicorn.Config(
+        create_app(args.overhead_ms, args.per_item_ms),
+        host="127.0.0.1",
+        port=args.port,
+        log_level="warning",
+    )
+    server = uvicorn.Server(config)
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    # Requests queue behind one another at the model; don't time out while waiting
+    settings.NLP_ENABLED = True
+    base_url = f"http://127.0.0.1:{args.port}"
+    timeout = 600
+
+    print(f"\n{args.requests} requests, concurrency {args.concurrency}, "
+          f"model cost {args.overhead_ms}ms + {args.per_item_ms}ms/text")
+    print(f"{'mode':<12} {'req/s':>10} {'p50 ms':>10} {'p95 ms':>10} {'failed':>8}")
+
+    try:
+        for label, batching in (("single", False), ("batched", True)):
+            service = IndicBERTNLPService(base_url=base_url, timeout=timeout, batching=batching)
+            stats = await run(service, args.requests, args.concurrency)
+            await service.close()
+            print(f"{label:<12} {stats['throughput']:>10.1f} {stats['p50']:>10.1f} "
+                  f"{stats['p95']:>10.1f} {stats['failures']:>8}")
+    finally:
+        server.should_exit = True
+        await server_task
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark NLP micro-batching")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--overhead-ms", type=float, default=20.0)
+    parser.add_argument("--per-item-ms", type=float, default=1.0)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
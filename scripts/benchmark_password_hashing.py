@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark event loop responsiveness during a login storm.
+
+Fires a burst of concurrent password verifications, the bcrypt step of
+POST /api/v1/auth/login, while a heartbeat task ticks every few milliseconds
+on the same loop. Compares calling verify_password inline (the previous
+login handler) with verify_and_update_password on the PasswordHashPool,
+reporting login throughput and how late the heartbeat ticks ran.
+
+Usage:
+    python scripts/benchmark_password_hashing.py
+    python scripts/benchmark_password_hashing.py --logins 100 --workers 4
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.utils.password import (
+    PasswordHashBusyError,
+    PasswordHashPool,
+    hash_password,
+    verify_password,
+)
+
+HEARTBEAT_INTERVAL = 0.005
+
+
+async def heartbeat(lags: List[float], stop: asyncio.Event) -> None:
+    """Record how late each tick runs relative to HEARTBEAT_INTERVAL."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(HEARTBEAT_INTERVAL)
+        lags.append((time.perf_counter() - start - HEARTBEAT_INTERVAL) * 1000)
+
+
+async def run(mode: str, stored_hash: str, password: str, args: argparse.Namespace) -> dict:
+    """Run one login storm in `mode` ("inline" or "pool")."""
+    pool = PasswordHashPool(max_workers=args.workers, max_pending=args.max_pending)
+    lags: List[float] = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(heartbeat(lags, stop))
+    rejected = 0
+
+    async def login() -> None:
+        nonlocal rejected
+        if mode == "inline":
+            assert verify_password(password, stored_hash)
+            return
+        try:
+            valid = await pool.run(verify_password, password, stored_hash)
+            assert valid
+        except PasswordHashBusyError:
+            rejected += 1
+
+    # Let the heartbeat settle before the storm starts
+    await asyncio.sleep(0.05)
+    start = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(args.logins)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await ticker
+    stats = pool.stats()
+    await pool.close()
+
+    lags.sort()
+    return {
+        "throughput": (args.logins - rejected) / elapsed,
+        "rejected": rejected,
+        "ticks": len(lags),
+        "lag_p50": statistics.median(lags) if lags else 0.0,
+        "lag_max": lags[-1] if lags else 0.0,
+        "peak_pending": stats["peak_pending"],
+    }
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    password = "BenchmarkPassword123!"
+    stored_hash = hash_password(password)
+
+    print(f"\n{args.logins} concurrent logins, {args.workers} hashing workers, "
+          f"max pending {args.max_pending}")
+    print(f"{'mode':<8} {'logins/s':>10} {'rejected':>9} {'ticks':>7} "
+          f"{'lag p50 ms':>11} {'lag max ms':>11}")
+
+    for mode in ("inline", "pool"):
+        stats = await run(mode, stored_hash, password, args)
+        print(f"{mode:<8} {stats['throughput']:>10.1f} {stats['rejected']:>9} "
+              f"{stats['ticks']:>7} {stats['lag_p50']:>11.2f} {stats['lag_max']:>11.2f}")
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark login hashing under load")
+    parser.add_argument("--logins", type=int, default=40)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--max-pending", type=int, default=64)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
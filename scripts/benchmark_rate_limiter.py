@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Benchmark the rate limiters under concurrent load.
+
+Compares the previous fixed-window limiter (INCR + EXPIRE pipeline) with the
+GCRA limiter (one EVALSHA) against a local Redis, plus the in-memory GCRA
+limiter. Each mode hammers a small pool of keys for a fixed duration and
+reports checks/s, latency and the most requests any one key got through in
+a sliding window - the fixed window lets up to 2x the limit through across
+a window edge, GCRA never more than the limit.
+
+Start a throwaway Redis first, e.g.:
+    docker run --rm -p 6379:6379 redis:7-alpine
+
+Usage:
+    python scripts/benchmark_rate_limiter.py
+    python scripts/benchmark_rate_limiter.py --duration 10 --concurrency 200
+"""
+
+import argparse
+import asyncio
+import bisect
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import redis.asyncio as redis
+
+from app.config import settings
+from app.services.rate_limiter import (
+    InMemoryRateLimiter,
+    IRateLimiter,
+    RateLimitResult,
+    RedisRateLimiter,
+)
+
+
+class FixedWindowRateLimiter(RedisRateLimiter):
+    """The limiter GCRA replaced: INCR + EXPIRE on a per-window key."""
+
+    async def check_rate_limit(
+        self,
+        key: str,
+        limit: int,
+        window_seconds: int,
+    ) -> RateLimitResult:
+        client = await self._redis.get()
+        window = int(time.time()) // window_seconds
+        pipe = client.pipeline()
+        pipe.incr(f"rate:fixed:{key}:{window}")
+        pipe.expire(f"rate:fixed:{key}:{window}", window_seconds)
+        count, _ = await pipe.execute()
+        return RateLimitResult(
+            allowed=count <= limit,
+            limit=limit,
+            remaining=max(0, limit - count),
+            reset_seconds=(window + 1) * window_seconds - int(time.time()),
+        )
+
+
+def max_in_window(timestamps: List[float], window_seconds: float) -> int:
+    """Most timestamps falling in any half-open span of window_seconds."""
+    timestamps.sort()
+    return max(
+        (bisect.bisect_left(timestamps, ts + window_seconds) - i
+         for i, ts in enumerate(timestamps)),
+        default=0,
+    )
+
+
+async def run(limiter: IRateLimiter, args: argparse.Namespace) -> Dict[str, Any]:
+    """Run `concurrency` workers against `keys` keys for `duration` seconds."""
+    latencies: List[float] = []
+    admitted: Dict[str, List[float]] = {f"bench:{i}": [] for i in range(args.keys)}
+    checks = 0
+    deadline = time.perf_counter() + args.duration
+
+    async def worker(n: int) -> None:
+        nonlocal checks
+        key = f"bench:{n % args.keys}"
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            result = await limiter.check_rate_limit(key, args.limit, args.window)
+            end = time.perf_counter()
+            latencies.append((end - start) * 1000)
+            checks += 1
+            if result.allowed:
+                admitted[key].append(end)
+            else:
+                # Back off like a client would, but keep pressure on the edge
+                await asyncio.sleep(0.001)
+
+    for key in admitted:
+        await limiter.reset_limit(key)
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(n) for n in range(args.concurrency)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "throughput": checks / elapsed,
+        "p50": statistics.median(latencies),
+        "p95": latencies[int(len(latencies) * 0.95) - 1],
+        "peak": max(max_in_window(ts, args.window) for ts in admitted.values()),
+    }
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    settings.RATE_LIMIT_ENABLED = True
+    client = redis.from_url(args.redis_url)
+    try:
+        await client.ping()
+    except Exception as e:
+        sys.exit(f"Redis not reachable at {args.redis_url}: {e}")
+    finally:
+        await client.close()
+
+    print(f"\n{args.concurrency} workers on {args.keys} keys for {args.duration}s, "
+          f"limit {args.limit}/{args.window}s")
+    print(f"{'mode':<14} {'checks/s':>10} {'p50 ms':>10} {'p95 ms':>10} "
+          f"{'peak/window':>12}")
+
+    modes = (
+        ("fixed-window", FixedWindowRateLimiter(args.redis_url)),
+        ("gcra-redis", RedisRateLimiter(args.redis_url)),
+        ("gcra-memory", InMemoryRateLimiter()),
+    )
+    for label, limiter in modes:
+        stats = await run(limiter, args)
+        if isinstance(limiter, RedisRateLimiter):
+            await limiter.close()
+        print(f"{label:<14} {stats['throughput']:>10.1f} {stats['p50']:>10.2f} "
+              f"{stats['p95']:>10.2f} {stats['peak']:>12}")
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark rate limiters")
+    parser.add_argument("--redis-url", default="redis://localhost:6379/15")
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--keys", type=int, default=10)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--window", type=int, default=2)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
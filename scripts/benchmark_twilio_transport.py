@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Benchmark SMS sending through the async Twilio transport.
+
+Starts the stand-in Twilio server (scripts/twilio_stub_server.py) in-process
+and sends a burst of OTP messages through TwilioSMSService. For comparison,
+"executor" sends the same burst the way the Twilio SDK did: a blocking HTTP
+call per message on the default thread pool. A heartbeat task on the event
+loop records how late its ticks run during each burst.
+
+Usage:
+    python scripts/benchmark_twilio_transport.py
+    python scripts/benchmark_twilio_transport.py --messages 2000 --latency-ms 150
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, List
+
+# Add backend and scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+import httpx
+import uvicorn
+
+from app.config import settings
+from app.services.sms_service import TwilioSMSService
+from app.services.twilio_client import API_VERSION
+from twilio_stub_server import create_app
+
+ACCOUNT_SID = "ACbenchmark"
+FROM_NUMBER = "+14155550100"
+HEARTBEAT_INTERVAL = 0.005
+
+
+async def heartbeat(lags: List[float], stop: asyncio.Event) -> None:
+    """Record how late each tick runs relative to HEARTBEAT_INTERVAL."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(HEARTBEAT_INTERVAL)
+        lags.append((time.perf_counter() - start - HEARTBEAT_INTERVAL) * 1000)
+
+
+async def run(send: Callable[[int], Awaitable[bool]], total: int) -> dict:
+    """Send `total` messages at once while the heartbeat runs."""
+    lags: List[float] = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(heartbeat(lags, stop))
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(send(i) for i in range(total)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await ticker
+
+    return {
+        "throughput": sum(results) / elapsed,
+        "failed": total - sum(results),
+        "lag_p50": statistics.median(lags) if lags else 0.0,
+        "lag_max": max(lags) if lags else 0.0,
+    }
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    config = uvicorn.Config(
+        create_app(args.latency_ms, args.server_concurrency),
+        host="127.0.0.1",
+        port=args.port,
+        log_level="warning",
+    )
+    server = uvicorn.Server(config)
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    base_url = f"http://127.0.0.1:{args.port}"
+    settings.SMS_ENABLED = True
+    settings.TWILIO_API_BASE_URL = base_url
+    settings.TWILIO_SMS_MAX_CONCURRENCY = args.concurrency
+    settings.TWILIO_RETRY_BASE_SECONDS = 0.1
+
+    # The SDK path: one blocking request per message on the default executor
+    sync_client = httpx.Client(base_url=base_url, auth=(ACCOUNT_SID, "token"))
+    path = f"/{API_VERSION}/Accounts/{ACCOUNT_SID}/Messages.json"
+
+    async def send_executor(i: int) -> bool:
+        loop = asyncio.get_running_loop()
+        response = await loop.run_in_executor(
+            None,
+            lambda: sync_client.post(
+                path, data={"To": f"+9190000{i:05d}", "From": FROM_NUMBER, "Body": "OTP 123456"}
+            ),
+        )
+        return response.status_code == 201
+
+    service = TwilioSMSService(ACCOUNT_SID, "token", FROM_NUMBER)
+
+    async def send_async(i: int) -> bool:
+        result = await service.send_otp(f"+9190000{i:05d}", "123456")
+        return result.success
+
+    print(f"\n{args.messages} messages, Twilio latency {args.latency_ms}ms, "
+          f"transport concurrency {args.concurrency}")
+    print(f"{'transport':<10} {'msg/s':>10} {'failed':>8} {'lag p50 ms':>11} {'lag max ms':>11}")
+
+    try:
+        for label, send in (("executor", send_executor), ("async", send_async)):
+            stats = await run(send, args.messages)
+            print(f"{label:<10} {stats['throughput']:>10.1f} {stats['failed']:>8} "
+                  f"{stats['lag_p50']:>11.2f} {stats['lag_max']:>11.2f}")
+    finally:
+        sync_client.close()
+        await service.close()
+        server.should_exit = True
+        await server_task
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark the Twilio transport")
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--server-concurrency", type=int, default=100)
+    parser.add_argument("--latency-ms", type=float, default=100.0)
+    parser.add_argument("--port", type=int, default=8766)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Move existing attachment uploads into the content-addressed blob layout.
+
+Attachments stored before de-duplication live under per-grievance paths
+(YYYY/MM/DD/<grievance_id>/<uuid>.<ext>) with no file_hash. For each such
+attachment this script hashes the file, links it to
+blobs/ab/cd/<sha256>.<ext> keeping the legacy extension (or drops it if the
+content is already stored as a blob), points the attachment at the blob, and adds the references to attachment_blobs. Legacy files are
+unlinked only after each batch commits.
+
+A final sweep removes legacy files that no attachment points at any more
+but whose content is already stored as a blob: the files an interrupted
+run committed but did not get to unlink. Running the script again
+therefore finishes the cleanup. Other files with no attachment row are
+left alone.
+
+Usage:
+    python scripts/dedupe_uploads.py --dry-run
+    python scripts/dedupe_uploads.py --upload-dir /var/dhruva/uploads --batch-size 500
+    python scripts/dedupe_uploads.py --sweep-only
+"""
+
+import argparse
+import asyncio
+import hashlib
+import os
+import shutil
+import sys
+from collections import Counter
+from itertools import islice
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+from uuid import UUID
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.config import settings
+from app.models.attachment import Attachment
+from app.models.attachment_blob import AttachmentBlob
+from app.services.storage_service import (
+    BLOB_DIR_NAME,
+    TEMP_DIR_NAME,
+    UPLOAD_CHUNK_SIZE,
+    blob_extension,
+    find_local_blob,
+    generate_blob_path,
+)
+
+
+@dataclass
+class DedupeReport:
+    """Outcome of a de-duplication run."""
+
+    attachments: int = 0
+    blobs_written: int = 0
+    duplicates: int = 0
+    bytes_saved: int = 0
+    missing: int = 0
+    leftovers_removed: int = 0
+
+
+def hash_file(path: str) -> Tuple[str, int]:
+    """SHA-256 and size of a file, read in chunks."""
+    digest = hashlib.sha256()
+    size = 0
+    with open(path, "rb") as f:
+        while chunk := f.read(UPLOAD_CHUNK_SIZE):
+            digest.update(chunk)
+            size += len(chunk)
+    return digest.hexdigest(), size
+
+
+def link_blob(source: str, blob: str) -> None:
+    """Make `blob` a copy of `source`, hard-linking when possible."""
+    os.makedirs(os.path.dirname(blob), exist_ok=True)
+    try:
+        os.link(source, blob)
+    except OSError:
+        shutil.copy2(source, blob)
+
+
+async def dedupe_batch(
+    session: AsyncSession,
+    upload_dir: str,
+    rows: List[Tuple[UUID, str]],
+    known: Dict[str, str],
+    report: DedupeReport,
+    dry_run: bool,
+) -> None:
+    """Move one batch of attachments into blobs and record their references."""
+    updates: List[Dict[str, object]] = []
+    refs: Counter = Counter()
+    blobs: Dict[str, Tuple[str, int]] = {}
+    legacy: List[str] = []
+
+    for attachment_id, file_path in rows:
+        full_path = os.path.join(upload_dir, file_path)
+        if not os.path.isfile(full_path):
+            print(f"    missing: {file_path} (attachment {attachment_id})")
+            report.missing += 1
+            continue
+
+        file_hash, size = await asyncio.to_thread(hash_file, full_path)
+        blob_path = known.get(file_hash) or find_local_blob(upload_dir, file_hash)
+
+        if blob_path is not None:
+            report.duplicates += 1
+            report.bytes_saved += size
+        else:
+            blob_path = generate_blob_path(file_hash, blob_extension(file_path))
+            if not dry_run:
+                await asyncio.to_thread(
+                    link_blob, full_path, os.path.join(upload_dir, blob_path)
+                )
+            report.blobs_written += 1
+        known[file_hash] = blob_path
+
+        report.attachments += 1
+        updates.append({"id": attachment_id, "file_path": blob_path, "file_hash": file_hash})
+        refs[file_hash] += 1
+        blobs[file_hash] = (blob_path, size)
+        legacy.append(full_path)
+
+    if dry_run or not updates:
+        return
+
+    await session.execute(update(Attachment), updates)
+    for file_hash, count in refs.items():
+        blob_path, size = blobs[file_hash]
+        await session.execute(
+            insert(AttachmentBlob)
+            .values(file_hash=file_hash, file_path=blob_path, file_size=size, ref_count=count)
+            .on_conflict_do_update(
+                index_elements=[AttachmentBlob.file_hash],
+                set_={"ref_count": AttachmentBlob.ref_count + count},
+            )
+        )
+    await session.commit()
+
+    for path in legacy:
+        try:
+            os.remove(path)
+        except OSError as e:
+            print(f"    could not remove {path}: {e}")
+
+
+def legacy_files(upload_dir: str) -> Iterator[str]:
+    """Paths (relative to upload_dir) of files outside the blob and temp dirs."""
+    for root, dirs, files in os.walk(upload_dir):
+        if root == upload_dir:
+            dirs[:] = [d for d in dirs if d not in (BLOB_DIR_NAME, TEMP_DIR_NAME)]
+        for name in files:
+            yield os.path.relpath(os.path.join(root, name), upload_dir).replace(os.sep, "/")
+
+
+async def sweep_legacy(
+    session: AsyncSession,
+    upload_dir: str,
+    batch_size: int,
+    report: DedupeReport,
+    dry_run: bool,
+) -> None:
+    """Remove unreferenced legacy files whose content is already a blob."""
+    paths = legacy_files(upload_dir)
+    while batch := list(islice(paths, batch_size)):
+        stmt = select(Attachment.file_path).where(Attachment.file_path.in_(batch))
+        referenced = set((await session.execute(stmt)).scalars())
+
+        for path in batch:
+            if path in referenced:
+                continue
+            full_path = os.path.join(upload_dir, path)
+            file_hash, _ = await asyncio.to_thread(hash_file, full_path)
+            if find_local_blob(upload_dir, file_hash) is None:
+                continue
+            report.leftovers_removed += 1
+            if dry_run:
+                continue
+            try:
+                os.remove(full_path)
+            except OSError as e:
+                print(f"    could not remove {path}: {e}")
+
+
+async def dedupe(
+    upload_dir: str,
+    batch_size: int,
+    dry_run: bool,
+    sweep_only: bool = False,
+) -> DedupeReport:
+    """De-duplicate every attachment that has no file_hash yet, then sweep leftovers."""
+    engine = create_async_engine(settings.DATABASE_URL, echo=False)
+    async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    report = DedupeReport()
+    known: Dict[str, str] = {}
+    last_id: Optional[UUID] = None
+
+    try:
+        async with async_session() as session:
+            while not sweep_only:
+                stmt = (
+                    select(Attachment.id, Attachment.file_path)
+                    .where(Attachment.file_hash.is_(None))
+                    .order_by(Attachment.id)
+                    .limit(batch_size)
+                )
+                if last_id is not None:
+                    stmt = stmt.where(Attachment.id > last_id)
+                rows = [(row.id, row.file_path) for row in (await session.execute(stmt)).all()]
+                if not rows:
+                    break
+                last_id = rows[-1][0]
+                await dedupe_batch(session, upload_dir, rows, known, report, dry_run)
+            await sweep_legacy(session, upload_dir, batch_size, report, dry_run)
+    finally:
+        await engine.dispose()
+
+    return report
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Move uploads into de-duplicated blob storage")
+    parser.add_argument("--upload-dir", default=settings.UPLOAD_DIR, help="Upload root")
+    parser.add_argument("--batch-size", type=int, default=500, help="Attachments per commit")
+    parser.add_argument("--dry-run", action="store_true", help="Report without changing anything")
+    parser.add_argument(
+        "--sweep-only", action="store_true", help="Only remove legacy files left by an interrupted run"
+    )
+    args = parser.parse_args()
+
+    print(f"\nDe-duplicating uploads in {args.upload_dir}{' (dry run)' if args.dry_run else ''}...")
+    report = asyncio.run(dedupe(args.upload_dir, args.batch_size, args.dry_run, args.sweep_only))
+
+    print(f"[+] Attachments:   {report.attachments}")
+    print(f"[+] Blobs written: {report.blobs_written}")
+    print(f"[+] Duplicates:    {report.duplicates} ({report.bytes_saved / 1024 / 1024:.1f} MB saved)")
+    print(f"[+] Missing files: {report.missing}")
+    print(f"[+] Leftovers removed: {report.leftovers_removed}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Bulk-ingest grievances from an NDJSON or CSV file.
+
+Uses the same validation and batched inserts as POST /api/v1/grievances/ingest
+(app.services.grievance_ingest), writing directly to DATABASE_URL.
+
+Usage:
+    python scripts/ingest_grievances.py exports/callcenter_2025-11-27.ndjson
+    python scripts/ingest_grievances.py legacy.csv --batch-size 1000
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+from typing import AsyncIterator
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.config import settings
+from app.services.grievance_ingest import INGEST_FORMATS, GrievanceIngestor, iter_records
+
+CHUNK_SIZE = 64 * 1024
+
+
+async def read_chunks(path: Path) -> AsyncIterator[bytes]:
+    """Yield a file in fixed-size chunks."""
+    with path.open("rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            yield chunk
+
+
+async def ingest_file(path: Path, fmt: str, batch_size: int | None) -> int:
+    """Ingest one file and print the report.
+
+    Returns:
+        Process exit code (0 if every row was inserted)
+    """
+    engine = create_async_engine(settings.DATABASE_URL, echo=False)
+    async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    try:
+        async with async_session() as session:
+            ingestor = GrievanceIngestor(session, batch_size=batch_size)
+            report = await ingestor.ingest(iter_records(fmt, read_chunks(path)))
+    finally:
+        await engine.dispose()
+
+    print(f"[+] Rows read:     {report.total_rows}")
+    print(f"[+] Inserted:      {report.inserted}")
+    print(f"[+] Failed:        {report.failed}")
+    for error in report.errors:
+        print(f"    line {error['line']}: {error['error']}")
+    if report.errors_truncated:
+        print(f"    ... {report.failed - len(report.errors)} more errors not shown")
+    if report.stopped_at_line is not None:
+        print(f"[!] Stopped at line {report.stopped_at_line}: {report.stop_error}")
+        print("    Rows before it were ingested; fix the file and resume from that line")
+
+    return 0 if report.failed == 0 and report.stopped_at_line is None else 1
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Bulk-ingest grievances from NDJSON or CSV")
+    parser.add_argument("path", type=Path, help="Input file")
+    parser.add_argument(
+        "--format",
+        choices=INGEST_FORMATS,
+        help="Input format (default: from file extension, .csv or NDJSON)",
+    )
+    parser.add_argument("--batch-size", type=int, default=None, help="Rows per INSERT")
+    args = parser.parse_args()
+
+    fmt = args.format or ("csv" if args.path.suffix.lower() == ".csv" else "ndjson")
+
+    print(f"\nIngesting {args.path} as {fmt}...")
+    print(f"Database URL: {settings.DATABASE_URL[:50]}...")
+
+    try:
+        exit_code = asyncio.run(ingest_file(args.path, fmt, args.batch_size))
+    except Exception as e:
+        print(f"\n[ERROR] Ingest failed: {e}")
+        sys.exit(2)
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Stand-in NLP model server for local development and benchmarks.
+
+Serves the same API as the IndicBERT classification service
+(/health, /api/nlp/classify, /api/nlp/classify/batch) with keyword
+classification and a simulated model: one forward pass runs at a time and
+costs a fixed overhead plus a per-text cost, so batching behaves as it does
+on a real GPU-backed server.
+
+Usage:
+    python scripts/nlp_stub_server.py --port 8001
+    python scripts/nlp_stub_server.py --overhead-ms 20 --per-item-ms 1
+"""
+
+import argparse
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from fastapi import FastAPI
+from pydantic import BaseModel
+
+MODEL_VERSION = "stub-1"
+
+KEYWORDS = {
+    "hospital": (1, "HLTH", "Health Department"),
+    "doctor": (1, "HLTH", "Health Department"),
+    "road": (2, "PWD", "Public Works Department"),
+    "water": (3, "WRDS", "Water Resources Department"),
+    "electricity": (4, "APSPDCL", "Electricity Department"),
+    "school": (5, "EDU", "Education Department"),
+    "police": (6, "POL", "Police Department"),
+    "land": (7, "REV", "Revenue Department"),
+}
+
+
+class ClassifyRequest(BaseModel):
+    text: str
+    language: str = "te"
+    district_code: Optional[str] = None
+
+
+class BatchClassifyRequest(BaseModel):
+    items: List[ClassifyRequest]
+
+
+def classify(text: str) -> Dict[str, Any]:
+    """Keyword classification in the model server's response format."""
+    lowered = text.lower()
+    for keyword, (dept_id, code, name) in KEYWORDS.items():
+        if keyword in lowered:
+            return {
+                "department_id": dept_id,
+                "confidence": 0.9,
+                "department_code": code,
+                "department_name": name,
+                "model_version": MODEL_VERSION,
+            }
+    return {
+        "department_id": None,
+        "confidence": 0.3,
+        "department_code": None,
+        "department_name": None,
+        "model_version": MODEL_VERSION,
+    }
+
+
+def create_app(overhead_ms: float = 20.0, per_item_ms: float = 1.0) -> FastAPI:
+    """Create the stub server.
+
+    Args:
+        overhead_ms: Simulated cost of one forward pass
+        per_item_ms: Simulated extra cost per text in the pass
+    """
+    app = FastAPI(title="NLP stub server")
+    model_lock = asyncio.Lock()
+
+    async def run_model(texts: List[str]) -> List[Dict[str, Any]]:
+        async with model_lock:
+            await asyncio.sleep((overhead_ms + per_item_ms * len(texts)) / 1000)
+        return [classify(text) for text in texts]
+
+    @app.get("/health")
+    async def health() -> Dict[str, str]:
+        return {"status": "healthy", "model_version": MODEL_VERSION}
+
+    @app.post("/api/nlp/classify")
+    async def classify_one(request: ClassifyRequest) -> Dict[str, Any]:
+        return (await run_model([request.text]))[0]
+
+    @app.post("/api/nlp/classify/batch")
+    async def classify_batch(request: BatchClassifyRequest) -> Dict[str, Any]:
+        return {"results": await run_model([item.text for item in request.items])}
+
+    return app
+
+
+def main() -> None:
+    """Main entry point."""
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Stand-in NLP model server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--overhead-ms", type=float, default=20.0)
+    parser.add_argument("--per-item-ms", type=float, default=1.0)
+    args = parser.parse_args()
+
+    uvicorn.run(
+        create_app(args.overhead_ms, args.per_item_ms),
+        host=args.host,
+        port=args.port,
+        log_level="warning",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Stand-in Twilio Messages API for local development and benchmarks.
+
+Serves the two endpoints the app uses (create message, fetch account) with
+a fixed simulated latency. Like Twilio, it answers 429 once an account has
+more than --max-concurrency requests in flight, and can inject 500s at
+--error-rate to exercise retries.
+
+Point the app at it with TWILIO_API_BASE_URL=http://127.0.0.1:8002.
+
+Usage:
+    python scripts/twilio_stub_server.py --port 8002
+    python scripts/twilio_stub_server.py --latency-ms 150 --error-rate 0.05
+"""
+
+import argparse
+import asyncio
+import random
+from typing import Any, Dict
+from uuid import uuid4
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+
+def create_app(
+    latency_ms: float = 100.0,
+    max_concurrency: int = 100,
+    error_rate: float = 0.0,
+) -> FastAPI:
+    """Create the stub server.
+
+    Args:
+        latency_ms: Simulated time to accept a message
+        max_concurrency: In-flight requests per account before 429
+        error_rate: Fraction of message requests answered with 500
+    """
+    app = FastAPI(title="Twilio stub server")
+    in_flight: Dict[str, int] = {}
+    app.state.messages = 0
+
+    @app.post("/2010-04-01/Accounts/{account_sid}/Messages.json")
+    async def create_message(account_sid: str, request: Request) -> JSONResponse:
+        if in_flight.get(account_sid, 0) >= max_concurrency:
+            return JSONResponse(
+                {"code": 20429, "message": "Too Many Requests", "status": 429},
+                status_code=429,
+                headers={"Retry-After": "1"},
+            )
+        in_flight[account_sid] = in_flight.get(account_sid, 0) + 1
+        try:
+            form = await request.form()
+            await asyncio.sleep(latency_ms / 1000)
+            if random.random() < error_rate:
+                return JSONResponse(
+                    {"code": 20500, "message": "Internal Server Error", "status": 500},
+                    status_code=500,
+                )
+            app.state.messages += 1
+            return JSONResponse(
+                {
+                    "sid": f"SM{uuid4().hex}",
+                    "status": "queued",
+                    "to": form.get("To"),
+                    "from": form.get("From"),
+                    "body": form.get("Body"),
+                },
+                status_code=201,
+            )
+        finally:
+            in_flight[account_sid] -= 1
+
+    @app.get("/2010-04-01/Accounts/{account_sid}.json")
+    async def fetch_account(account_sid: str) -> Dict[str, Any]:
+        return {"sid": account_sid, "status": "active"}
+
+    return app
+
+
+def main() -> None:
+    """Main entry point."""
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Stand-in Twilio Messages API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8002)
+    parser.add_argument("--latency-ms", type=float, default=100.0)
+    parser.add_argument("--max-concurrency", type=int, default=100)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    uvicorn.run(
+        create_app(args.latency_ms, args.max_concurrency, args.error_rate),
+        host=args.host,
+        port=args.port,
+        log_level="warning",
+    )
+
+
+if __name__ == "__main__":
+    main()